@@ -90,6 +90,9 @@ def register():
     nmv.logger.info('Copyrights (c) Blue Brain Project (BBP) / (EPFL)')
     nmv.logger.info('Principal Author: Marwan Abdellah')
 
+    # Register the jobs
+    nmv.interface.ui.register_jobs()
+
     # Register panels
     nmv.interface.ui.io_panel.register_panel()
     nmv.interface.ui.analysis_panel.register_panel()
@@ -123,6 +126,9 @@ def unregister():
     nmv.interface.ui.mesh_panel.unregister_panel()
     nmv.interface.ui.about_panel.unregister_panel()
 
+    # Un-register the jobs
+    nmv.interface.ui.unregister_jobs()
+
 
 ####################################################################################################
 # __main__
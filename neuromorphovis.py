@@ -32,7 +32,7 @@ import sys
 import subprocess
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
-import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm']
+import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm', 'nmv/utilities']
 for import_path in import_paths:
     sys.path.append(('%s/%s' % (os.path.dirname(os.path.realpath(__file__)), import_path)))
     
@@ -40,6 +40,7 @@ for import_path in import_paths:
 import arguments_parser
 import file_ops
 import slurm
+import progress
 
 
 ####################################################################################################
@@ -147,6 +148,14 @@ def run_local_neuromorphovis(arguments):
             print('ERROR: Empty circuit configuration file or target')
             exit(0)
 
+        # Process all the morphologies in a single process per task with prefetching
+        if arguments.prefetch_depth > 0:
+            shell_commands = create_shell_commands_for_local_execution(
+                arguments, arguments_parser.get_arguments_string(arguments=arguments))
+            for shell_command in shell_commands:
+                subprocess.call(shell_command, shell=True)
+            return
+
         # Import BluePy
         try:
             import bluepy.v2
@@ -232,6 +241,14 @@ def run_local_neuromorphovis(arguments):
             print('ERROR: The directory [%s] does NOT contain any morphology files' %
                   arguments.morphology_directory)
 
+        # Process all the morphologies in a single process per task with prefetching
+        if arguments.prefetch_depth > 0:
+            shell_commands = create_shell_commands_for_local_execution(
+                arguments, arguments_parser.get_arguments_string(arguments=arguments))
+            for shell_command in shell_commands:
+                subprocess.call(shell_command, shell=True)
+            return
+
         # A list of all the commands to be executed
         shell_commands = list()
 
@@ -344,6 +361,11 @@ if __name__ == "__main__":
     # Parse the command line arguments
     arguments = arguments_parser.parse_command_line_arguments()
 
+    # Configure the progress reporting, the workers inherit it from the environment
+    progress.configure_progress(interval=arguments.progress_interval,
+                                quiet=arguments.quiet_progress,
+                                events_file=arguments.progress_events)
+
     # Verify the output directory before screwing things !
     if not file_ops.path_exists(arguments.output_directory):
         print('ERROR: Please set the output directory to a valid path')
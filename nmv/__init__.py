@@ -20,10 +20,36 @@ import sys
 
 # Internal imports
 import nmv.file
+from nmv.utilities.lazy_imports import lazy_package
 
 # Create the logger
 logger = nmv.file.Logger()
 
+# The sub-packages are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'analysis',
+    'bbox',
+    'bmeshi',
+    'builders',
+    'consts',
+    'edit',
+    'enums',
+    'file',
+    'geometry',
+    'interface',
+    'lod',
+    'mesh',
+    'neurorender',
+    'options',
+    'physics',
+    'rendering',
+    'scene',
+    'shading',
+    'simulation',
+    'skeleton',
+    'utilities',
+))
+
 
 ####################################################################################################
 # @kill
@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .kernels import *
-from .structs import *
-from .plotting import *
-from .analysis_items import *
-from .analysis_distributions import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'kernels',
+    'structs',
+    'plotting',
+    'analysis_items',
+    'analysis_distributions',
+))
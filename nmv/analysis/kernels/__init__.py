@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .arbor import *
-from .morphology import *
-from .section import *
-from .functional import *
-from .distributions import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'arbor',
+    'morphology',
+    'section',
+    'functional',
+    'distributions',
+))
@@ -15,11 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .angle_ops import *
-from .area_ops import *
-from .lengths_ops import *
-from .samples_ops import *
-from .volume_ops import *
-from .structure_ops import *
-
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'angle_ops',
+    'area_ops',
+    'lengths_ops',
+    'samples_ops',
+    'volume_ops',
+    'structure_ops',
+))
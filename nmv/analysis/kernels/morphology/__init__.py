@@ -15,12 +15,18 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .area_ops import *
-from .lengths_ops import *
-from .samples_ops import *
-from .volume_ops import *
-from .global_ops import *
-from .structure_ops import *
-from .soma_ops import *
-from .angle_ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'common',
+    'area_ops',
+    'lengths_ops',
+    'samples_ops',
+    'volume_ops',
+    'global_ops',
+    'structure_ops',
+    'soma_ops',
+    'angle_ops',
+))
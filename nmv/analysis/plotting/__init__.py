@@ -15,5 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .distributions import *
-from .ops import *
\ No newline at end of file
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'distributions',
+    'ops',
+))
@@ -15,7 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_item import *
-from .analysis_data import *
-from .analysis_distribution import *
-from .morphology_analysis_result import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'analysis_item',
+    'analysis_data',
+    'analysis_distribution',
+    'morphology_analysis_result',
+))
@@ -15,6 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .bounding_box import *
-from .ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'bounding_box',
+    'extents',
+    'ops',
+))
@@ -0,0 +1,303 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Blender imports
+from mathutils import Vector
+
+# Internal imports
+import nmv.bbox
+
+
+####################################################################################################
+# @ObjectExtents
+####################################################################################################
+class ObjectExtents:
+    """The extents of a single object in the world space.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 p_min,
+                 p_max,
+                 radial_center,
+                 radial_extent):
+        """Constructor
+
+        :param p_min:
+            The minimum point of the axis-aligned bounding box of the object, numpy array.
+        :param p_max:
+            The maximum point of the axis-aligned bounding box of the object, numpy array.
+        :param radial_center:
+            The XZ center of the circle that bounds the object around the Y-axis.
+        :param radial_extent:
+            The radius of the circle that bounds the object around the Y-axis.
+        """
+
+        # Axis-aligned bounding box
+        self.p_min = p_min
+        self.p_max = p_max
+
+        # A circle in the XZ plane that bounds the object for any rotation around the Y-axis
+        self.radial_center = radial_center
+        self.radial_extent = radial_extent
+
+
+####################################################################################################
+# @ExtentsCache
+####################################################################################################
+class ExtentsCache:
+    """A cache of the extents of the objects in the scene.
+
+    The extents are computed in bulk from the vertex arrays of the objects and are only updated
+    when the geometry or the transformation of an object changes.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # Object name -> (signature, ObjectExtents)
+        self.entries = dict()
+
+    ################################################################################################
+    # @get_signature
+    ################################################################################################
+    @staticmethod
+    def get_signature(scene_object):
+        """Gets a cheap signature of the geometry and transformation of an object that changes
+        whenever the object changes.
+
+        :param scene_object:
+            A given object in the scene.
+        :return:
+            A tuple that identifies the current state of the object.
+        """
+
+        # The local bounding box is updated by Blender when the geometry changes
+        local_box = tuple(tuple(corner) for corner in scene_object.bound_box)
+        matrix = tuple(tuple(row) for row in scene_object.matrix_world)
+
+        # The data block and its size
+        data_pointer = scene_object.data.as_pointer() if scene_object.data is not None else 0
+        number_vertices = len(scene_object.data.vertices) if scene_object.type == 'MESH' else 0
+
+        return data_pointer, number_vertices, local_box, matrix
+
+    ################################################################################################
+    # @get_world_vertices
+    ################################################################################################
+    @staticmethod
+    def get_world_vertices(scene_object):
+        """Gets the vertices of an object in the world space as a numpy array.
+
+        Meshes use all their vertices, while the other object types, e.g. curves, use the corners
+        of their local bounding boxes.
+
+        :param scene_object:
+            A given object in the scene.
+        :return:
+            An Nx3 array of the vertices of the object in the world space.
+        """
+
+        # Read all the vertices of the mesh in a single call
+        if scene_object.type == 'MESH' and len(scene_object.data.vertices) > 0:
+            vertices = numpy.empty(len(scene_object.data.vertices) * 3, dtype=numpy.float64)
+            scene_object.data.vertices.foreach_get('co', vertices)
+            vertices.shape = (-1, 3)
+
+        # Otherwise, use the corners of the bounding box
+        else:
+            vertices = numpy.array([tuple(corner) for corner in scene_object.bound_box],
+                                   dtype=numpy.float64)
+
+        # Transform the vertices to the world space
+        matrix = numpy.array(scene_object.matrix_world, dtype=numpy.float64)
+        return vertices @ matrix[:3, :3].T + matrix[:3, 3]
+
+    ################################################################################################
+    # @compute_object_extents
+    ################################################################################################
+    @staticmethod
+    def compute_object_extents(scene_object):
+        """Computes the extents of a given object.
+
+        :param scene_object:
+            A given object in the scene.
+        :return:
+            The extents of the object, ObjectExtents.
+        """
+
+        vertices = ExtentsCache.get_world_vertices(scene_object)
+
+        # Axis-aligned bounding box
+        p_min = vertices.min(axis=0)
+        p_max = vertices.max(axis=0)
+
+        # Bounding circle around the Y-axis, centered at the center of the box
+        radial_center = 0.5 * (p_min[[0, 2]] + p_max[[0, 2]])
+        radial_distances = numpy.hypot(vertices[:, 0] - radial_center[0],
+                                       vertices[:, 2] - radial_center[1])
+
+        return ObjectExtents(p_min, p_max, radial_center, float(radial_distances.max()))
+
+    ################################################################################################
+    # @get_object_extents
+    ################################################################################################
+    def get_object_extents(self,
+                           scene_object):
+        """Gets the extents of an object from the cache, or computes them if the object has
+        changed since they were cached.
+
+        :param scene_object:
+            A given object in the scene.
+        :return:
+            The extents of the object, ObjectExtents.
+        """
+
+        signature = self.get_signature(scene_object)
+
+        # Cache hit
+        entry = self.entries.get(scene_object.name)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        # Cache miss or a modified object
+        extents = self.compute_object_extents(scene_object)
+        self.entries[scene_object.name] = (signature, extents)
+        return extents
+
+    ################################################################################################
+    # @invalidate
+    ################################################################################################
+    def invalidate(self,
+                   scene_object=None):
+        """Removes the extents of an object from the cache, or clears the whole cache.
+
+        :param scene_object:
+            A given object in the scene. If None, the whole cache is cleared.
+        """
+
+        if scene_object is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(scene_object.name, None)
+
+    ################################################################################################
+    # @compute_bounding_box
+    ################################################################################################
+    def compute_bounding_box(self,
+                             objects):
+        """Computes the bounding box of a group of objects.
+
+        :param objects:
+            A list of objects in the scene.
+        :return:
+            The bounding box of the objects.
+        """
+
+        # Empty list, empty box
+        if len(objects) == 0:
+            return nmv.bbox.BoundingBox(p_min=Vector((0.0, 0.0, 0.0)),
+                                        p_max=Vector((0.0, 0.0, 0.0)))
+
+        extents = [self.get_object_extents(scene_object) for scene_object in objects]
+        p_min = numpy.min([extent.p_min for extent in extents], axis=0)
+        p_max = numpy.max([extent.p_max for extent in extents], axis=0)
+
+        return nmv.bbox.BoundingBox(p_min=Vector(p_min.tolist()), p_max=Vector(p_max.tolist()))
+
+    ################################################################################################
+    # @compute_360_bounding_box
+    ################################################################################################
+    def compute_360_bounding_box(self,
+                                 objects,
+                                 rotation_center=Vector((0.0, 0.0, 0.0))):
+        """Computes a bounding box that contains a group of objects for any rotation around the
+        Y-axis passing through a given center.
+
+        The box is derived analytically from the cached bounding circles of the objects, and
+        therefore it is valid for all the frames of a 360 sequence.
+
+        :param objects:
+            A list of objects in the scene.
+        :param rotation_center:
+            The center of rotation, typically the center of the soma.
+        :return:
+            The 360 bounding box of the objects.
+        """
+
+        extents = [self.get_object_extents(scene_object) for scene_object in objects]
+        center = numpy.array([rotation_center[0], rotation_center[2]])
+
+        # The largest distance of any vertex from the axis of rotation
+        radial_centers = numpy.array([extent.radial_center for extent in extents])
+        radial_extents = numpy.array([extent.radial_extent for extent in extents])
+        radius = float(numpy.max(
+            numpy.hypot(radial_centers[:, 0] - center[0], radial_centers[:, 1] - center[1]) +
+            radial_extents))
+
+        # The Y bounds do not change with the rotation
+        y_min = float(min(extent.p_min[1] for extent in extents))
+        y_max = float(max(extent.p_max[1] for extent in extents))
+
+        p_min = Vector((center[0] - radius, y_min, center[1] - radius))
+        p_max = Vector((center[0] + radius, y_max, center[1] + radius))
+        return nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
+
+
+# A single cache shared by all the rendering entry points
+extents_cache = ExtentsCache()
+
+
+####################################################################################################
+# @get_extents_cache
+####################################################################################################
+def get_extents_cache():
+    """Gets the extents cache that is shared by all the rendering entry points.
+
+    :return:
+        A reference to the shared ExtentsCache.
+    """
+
+    return extents_cache
+
+
+####################################################################################################
+# @compute_objects_360_bounding_box
+####################################################################################################
+def compute_objects_360_bounding_box(objects,
+                                     rotation_center=Vector((0.0, 0.0, 0.0))):
+    """Computes a bounding box that contains a group of objects for any rotation around the
+    Y-axis passing through a given center, using the shared extents cache.
+
+    :param objects:
+        A list of objects in the scene.
+    :param rotation_center:
+        The center of rotation, typically the center of the soma.
+    :return:
+        The 360 bounding box of the objects.
+    """
+
+    return extents_cache.compute_360_bounding_box(objects, rotation_center)
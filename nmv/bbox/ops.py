@@ -19,7 +19,6 @@
 import math
 
 # Blender imports
-import bpy
 from mathutils import Vector
 
 # Internal imports
@@ -161,18 +160,9 @@ def get_objects_bounding_box(objects):
         The bounding box of a group of objects.
     """
 
-    # Get a list of all the bounding boxes of the given objects in the scene
-    objects_bboxes_list = list()
-
-    for scene_object in objects:
-        bbox = confirm_object_bounding_box(scene_object)
-        objects_bboxes_list.append(bbox)
-
-    # Compute the largest bounding box of all the given ones
-    objects_bounding_box = extend_bounding_boxes(objects_bboxes_list)
-
-    # Return a reference to the union bounding box
-    return objects_bounding_box
+    # Use the shared extents cache, where the extents of the objects are computed in bulk and
+    # updated only if the objects are modified
+    return nmv.bbox.get_extents_cache().compute_bounding_box(objects)
 
 
 ####################################################################################################
@@ -186,6 +176,9 @@ def compute_scene_bounding_box_for_curves():
         A reference to the bounding box of the scene.
     """
 
+    # Blender is only needed when the scene is queried
+    import bpy
+
     # Select all the objects that are meshes or curves
     objects = list()
     for scene_object in bpy.data.objects:
@@ -210,6 +203,9 @@ def compute_scene_bounding_box_for_meshes():
         A reference to the bounding box of the scene.
     """
 
+    # Blender is only needed when the scene is queried
+    import bpy
+
     # Select all the objects that are meshes or curves
     objects = list()
     for scene_object in bpy.data.objects:
@@ -236,6 +232,9 @@ def compute_scene_bounding_box_for_curves_and_meshes():
         A reference to the bounding box of the scene.
     """
 
+    # Blender is only needed when the scene is queried
+    import bpy
+
     # Select all the objects that are meshes or curves
     objects = list()
     for scene_object in bpy.data.objects:
@@ -260,6 +259,9 @@ def compute_scene_bounding_box():
         A reference to the bounding box of the scene.
     """
 
+    # Blender is only needed when the scene is queried
+    import bpy
+
     # Select all the objects that are meshes or curves
     objects = list()
     for scene_object in bpy.data.objects:
@@ -388,6 +390,9 @@ def draw_scene_bounding_box():
         A reference to the bounding box of the scene.
     """
 
+    # Blender is needed to add the box to the scene
+    import bpy
+
     # Compute scene bounding box
     scene_bounding_box = compute_scene_bounding_box()
 
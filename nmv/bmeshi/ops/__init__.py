@@ -15,7 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .bmesh_face_ops import *
-from .bmesh_object_ops import *
-from .bmesh_vertex_ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'bmesh_face_ops',
+    'bmesh_object_ops',
+    'bmesh_vertex_ops',
+))
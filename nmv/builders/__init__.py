@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma import *
-from .nucleus import *
-from .morphology import *
-from .mesh import *
-from .spine import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'soma',
+    'nucleus',
+    'morphology',
+    'mesh',
+    'spine',
+))
@@ -15,8 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .meta_builder import *
-from .piecewise_builder import *
-from .union_builder import *
-from .skinning_builder import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'common',
+    'meta_builder',
+    'piecewise_builder',
+    'union_builder',
+    'skinning_builder',
+    'voxel_builder',
+))
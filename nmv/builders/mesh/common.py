@@ -42,18 +42,10 @@ def create_skeleton_materials(builder):
         An object of the builder that is used to reconstruct the neuron mesh.
     """
 
-    # Delete the old materials
-    for material in bpy.data.materials:
-        if 'soma_skeleton' in material.name or              \
-           'axon_skeleton' in material.name or              \
-           'basal_dendrites_skeleton' in material.name or   \
-           'apical_dendrite_skeleton' in material.name or   \
-           'spines' in material.name:
-
-            # Remove
-            nmv.utilities.disable_std_output()
-            bpy.data.materials.remove(material, do_unlink=True)
-            nmv.utilities.enable_std_output()
+    # Delete the old materials that are not used anymore
+    nmv.utilities.disable_std_output()
+    nmv.shading.remove_unused_materials()
+    nmv.utilities.enable_std_output()
 
     # Soma
     builder.soma_materials = nmv.shading.create_materials(
@@ -344,6 +336,35 @@ def smooth_arbors_to_soma_connections(builder):
     nmv.mesh.ops.deselect_all_vertices(mesh_object=builder.soma_mesh)
 
 
+####################################################################################################
+# @report_arbors_progress
+####################################################################################################
+def report_arbors_progress(builder,
+                           arbors_generator):
+    """Advances a generator that yields after every arbor that is built by a mesh builder, and
+    yields the fraction of the built arbors instead, as the morphology builders do, to report the
+    progress of the incremental reconstruction.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :param arbors_generator:
+        A generator that yields after every arbor is built.
+    :return:
+        A generator that yields the fraction of the built arbors, and returns the result of the
+        given generator.
+    """
+
+    number_arbors = nmv.builders.morphology.get_number_drawn_arbors(builder=builder)
+    built_arbors = 0
+    while True:
+        try:
+            next(arbors_generator)
+        except StopIteration as stop:
+            return stop.value
+        built_arbors += 1
+        yield float(built_arbors) / (number_arbors + 1)
+
+
 ####################################################################################################
 # @connect_arbors_to_soma
 ####################################################################################################
@@ -360,40 +381,40 @@ def connect_arbors_to_soma(builder):
         An object of the builder that is used to reconstruct the neuron mesh.
     """
 
-    # Determine the connection function
-    if builder.options.mesh.soma_type == \
-            nmv.enums.Soma.Representation.SOFT_BODY:
-        connection_function = nmv.skeleton.ops.connect_arbor_to_soft_body_soma
-    elif builder.options.mesh.soma_type == \
-            nmv.enums.Soma.Representation.META_BALLS:
-        connection_function = nmv.skeleton.ops.connect_arbor_to_meta_ball_soma
-    else:
+    # Only the soft-body and the meta-balls somata are connected
+    if builder.options.mesh.soma_type not in [nmv.enums.Soma.Representation.SOFT_BODY,
+                                              nmv.enums.Soma.Representation.META_BALLS]:
         nmv.logger.warning('No soma-to-arbor connection function is used')
         return
 
     if builder.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
         nmv.logger.info('Connecting arbors to soma')
 
-        # Connecting axons
+        # Collect the arbors in the order of the connection: axons, apical and basal dendrites
+        arbors = list()
         if not builder.options.morphology.ignore_axons:
             if builder.morphology.has_axons():
-                for arbor in builder.morphology.axons:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
-
-        # Connecting apical dendrites
+                arbors.extend(builder.morphology.axons)
         if not builder.options.morphology.ignore_apical_dendrites:
             if builder.morphology.has_apical_dendrites():
-                for arbor in builder.morphology.apical_dendrites:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
-
-        # Connecting basal dendrites
+                arbors.extend(builder.morphology.apical_dendrites)
         if not builder.options.morphology.ignore_basal_dendrites:
             if builder.morphology.has_basal_dendrites():
-                for arbor in builder.morphology.basal_dendrites:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
+                arbors.extend(builder.morphology.basal_dendrites)
+
+        # The soft-body soma is bridged to all the arbors in a single pass
+        if builder.options.mesh.soma_type == nmv.enums.Soma.Representation.SOFT_BODY:
+            for arbor in arbors:
+                nmv.logger.detail(arbor.label)
+            builder.soma_mesh = nmv.skeleton.ops.connect_arbors_to_soft_body_soma(
+                builder.soma_mesh, arbors)
+
+        # The meta-balls soma is united with every arbor
+        else:
+            for arbor in arbors:
+                nmv.logger.detail(arbor.label)
+                builder.soma_mesh = nmv.skeleton.ops.connect_arbor_to_meta_ball_soma(
+                    builder.soma_mesh, arbor)
 
         # Adjust the normals
         nmv.mesh.adjust_normals(mesh_object=builder.soma_mesh)
@@ -295,6 +295,9 @@ class MetaBuilder:
         """Builds the arbors of the neuron as tubes and AT THE END converts them into meshes.
         If you convert them during the building, the scene is getting crowded and the process is
         getting exponentially slower.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         # Header
@@ -309,6 +312,9 @@ class MetaBuilder:
                         root=arbor,
                         max_branching_order=self.options.morphology.apical_dendrite_branch_order)
 
+                    # The arbor is built
+                    yield
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
@@ -318,6 +324,9 @@ class MetaBuilder:
                         root=arbor,
                         max_branching_order=self.options.morphology.basal_dendrites_branch_order)
 
+                    # The arbor is built
+                    yield
+
         # Axons
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
@@ -327,6 +336,9 @@ class MetaBuilder:
                         root=arbor,
                         max_branching_order=self.options.morphology.axon_branch_order)
 
+                    # The arbor is built
+                    yield
+
     ################################################################################################
     # @initialize_meta_object
     ################################################################################################
@@ -668,10 +680,15 @@ class MetaBuilder:
         nmv.scene.set_active_object(self.meta_mesh)
 
     ################################################################################################
-    # @reconstruct_mesh
+    # @reconstruct_mesh_incrementally
     ################################################################################################
-    def reconstruct_mesh(self):
-        """Reconstructs the neuronal mesh using meta objects.
+    def reconstruct_mesh_incrementally(self):
+        """Reconstructs the neuronal mesh using meta objects, stage by stage and arbor by arbor,
+        to advance it in time slices as a main-thread step of a job.
+
+        :return:
+            A generator that yields after every stage and every arbor, and returns a reference to
+            the reconstructed mesh.
         """
 
         nmv.logger.header('Building Mesh: MetaBuilder')
@@ -679,12 +696,14 @@ class MetaBuilder:
         # Verify and repair the morphology, if required
         result, stats = nmv.utilities.profile_function(self.update_morphology_skeleton)
         self.profiling_statistics += stats
+        yield
 
         # Initialize the meta object
         # Note that self.label should be replaced by self.options.morphology.label
         result, stats = nmv.utilities.profile_function(
             self.initialize_meta_object, self.label)
         self.profiling_statistics += stats
+        yield
 
         if self.options.mesh.soma_type == nmv.enums.Soma.Representation.SOFT_BODY:
             soma_building_function = self.build_soma_from_soft_body_mesh
@@ -694,22 +713,28 @@ class MetaBuilder:
         # Build the soma
         result, stats = nmv.utilities.profile_function(soma_building_function)
         self.profiling_statistics += stats
+        yield
 
         # Build the arbors
-        result, stats = nmv.utilities.profile_function(self.build_arbors)
+        result, stats = yield from nmv.builders.mesh.common.report_arbors_progress(
+            self, nmv.utilities.profile_generator(self.build_arbors))
         self.profiling_statistics += stats
+        yield
 
         # Building the spines from morphologies
         result, stats = nmv.utilities.profile_function(self.build_spines)
         self.profiling_statistics += stats
+        yield
 
         # Finalize the meta object and construct a solid object
         result, stats = nmv.utilities.profile_function(self.finalize_meta_object)
         self.profiling_statistics += stats
+        yield
 
         # Surface roughness
         result, stats = nmv.utilities.profile_function(self.add_surface_roughness)
         self.profiling_statistics += stats
+        yield
 
         # Tessellation
         result, stats = nmv.utilities.profile_function(
@@ -720,6 +745,7 @@ class MetaBuilder:
             nmv.logger.info('Cleaning Mesh Non-manifold Edges & Vertices')
             nmv.mesh.clean_mesh_object(self.meta_mesh)
             self.profiling_statistics += stats
+        yield
 
         # NOTE: Before drawing the skeleton, create the materials once and for all to improve the
         # performance since this is way better than creating a new material per section or segment
@@ -732,10 +758,12 @@ class MetaBuilder:
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.common.transform_to_global_coordinates, self)
         self.profiling_statistics += stats
+        yield
 
         # Collect the stats. of the mesh
         result, stats = nmv.utilities.profile_function(nmv.builders.collect_mesh_stats, self)
         self.profiling_statistics += stats
+        yield
 
         # Report
         nmv.logger.statistics_overall(self.profiling_statistics)
@@ -745,3 +773,12 @@ class MetaBuilder:
 
         # Return a reference to the reconstructed mesh
         return self.meta_mesh
+
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    def reconstruct_mesh(self):
+        """Reconstructs the neuronal mesh using meta objects.
+        """
+
+        return nmv.utilities.run_generator(self.reconstruct_mesh_incrementally())
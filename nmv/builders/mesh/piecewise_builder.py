@@ -124,7 +124,7 @@ class PiecewiseBuilder:
             would allow us later to connect it to the nearest face on the soma create a
             watertight mesh.
         :return:
-            A list of all the individual meshes of the arbors.
+            A generator that yields after every arbor is built.
         """
 
         # Apical dendrites
@@ -160,6 +160,9 @@ class PiecewiseBuilder:
                         for arbor_object in arbor_objects:
                             nmv.scene.ops.convert_object_to_mesh(arbor_object)
 
+                    # The arbor is built
+                    yield
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
@@ -194,6 +197,9 @@ class PiecewiseBuilder:
                         for arbor_object in arbor_objects:
                             nmv.scene.ops.convert_object_to_mesh(arbor_object)
 
+                    # The arbor is built
+                    yield
+
         # Axons
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
@@ -228,11 +234,17 @@ class PiecewiseBuilder:
                         for arbor_object in arbor_objects:
                             nmv.scene.ops.convert_object_to_mesh(arbor_object)
 
+                    # The arbor is built
+                    yield
+
     ################################################################################################
     # @build_hard_edges_arbors
     ################################################################################################
     def build_hard_edges_arbors(self):
         """Reconstruct the meshes of the arbors of the neuron with HARD edges.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         # Create a bevel object that will be used to create the mesh
@@ -249,7 +261,8 @@ class PiecewiseBuilder:
             roots_connection = nmv.enums.Skeleton.Roots.CONNECT_CONNECTED_TO_ORIGIN
 
         # Create the arbors using this 16-side bevel object and CLOSED caps (no smoothing required)
-        self.build_arbors(bevel_object=bevel_object, caps=True, roots_connection=roots_connection)
+        yield from self.build_arbors(
+            bevel_object=bevel_object, caps=True, roots_connection=roots_connection)
 
         # Close the caps of the apical dendrites meshes
         for arbor_object in self.apical_dendrites_meshes:
@@ -271,6 +284,9 @@ class PiecewiseBuilder:
     ################################################################################################
     def build_soft_edges_arbors(self):
         """Reconstruct the meshes of the arbors of the neuron with SOFT edges.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
         # Create a bevel object that will be used to create the mesh with 4 sides only
         bevel_object = nmv.mesh.create_bezier_circle(radius=1.0, vertices=4, name='arbors_bevel')
@@ -283,7 +299,8 @@ class PiecewiseBuilder:
             roots_connection = nmv.enums.Skeleton.Roots.CONNECT_CONNECTED_TO_ORIGIN
 
         # Create the arbors using this 4-side bevel object and OPEN caps (for smoothing)
-        self.build_arbors(bevel_object=bevel_object, caps=False, roots_connection=roots_connection)
+        yield from self.build_arbors(
+            bevel_object=bevel_object, caps=False, roots_connection=roots_connection)
 
         # Smooth and close the faces of the apical dendrites meshes
         for mesh in self.apical_dendrites_meshes:
@@ -311,31 +328,39 @@ class PiecewiseBuilder:
         The other method creates a smoothed mesh with soft edges. In this method, we will use a
         simplified bevel object with only 'four' vertices and smooth it later using vertices
         smoothing to make 'sexy curves' for the mesh that reflect realistic arbors.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         nmv.logger.header('Reconstructing arbors')
 
         # Hard edges (less samples per branch)
         if self.options.mesh.edges == nmv.enums.Meshing.Edges.HARD:
-            self.build_hard_edges_arbors()
+            yield from self.build_hard_edges_arbors()
 
         # Smooth edges (more samples per branch)
         elif self.options.mesh.edges == nmv.enums.Meshing.Edges.SMOOTH:
-            self.build_soft_edges_arbors()
+            yield from self.build_soft_edges_arbors()
 
         else:
             nmv.logger.log('ERROR')
 
     ################################################################################################
-    # @reconstruct_mesh
+    # @reconstruct_mesh_incrementally
     ################################################################################################
-    def reconstruct_mesh(self):
-        """Reconstructs the neuronal mesh as a set of piecewise-watertight meshes.
+    def reconstruct_mesh_incrementally(self):
+        """Reconstructs the neuronal mesh as a set of piecewise-watertight meshes, stage by stage
+        and arbor by arbor, to advance it in time slices as a main-thread step of a job.
 
         The meshes are logically connected, but the different branches are intersecting,
         so they can be used perfectly for voxelization purposes, but they cannot be used for
         surface rendering with 'transparency'. For this purpose, we recommend to use the skinning
         builder.
+
+        :return:
+            A generator that yields after every stage and every arbor, and returns a list of all
+            the mesh objects in the scene.
         """
 
         nmv.logger.header('Building Mesh: PiecewiseBuilder')
@@ -348,6 +373,7 @@ class PiecewiseBuilder:
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.update_morphology_skeleton, self)
         self.profiling_statistics += stats
+        yield
 
         # Verify the connectivity of the arbors to the soma to filter the disconnected arbors,
         # for example, an axon that is emanating from a dendrite or two intersecting dendrites
@@ -357,46 +383,55 @@ class PiecewiseBuilder:
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Build the arbors
-        result, stats = nmv.utilities.profile_function(
-            self.reconstruct_arbors_meshes)
+        result, stats = yield from nmv.builders.mesh.common.report_arbors_progress(
+            self, nmv.utilities.profile_generator(self.reconstruct_arbors_meshes))
         self.profiling_statistics += stats
+        yield
 
         # Connect to the soma
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.connect_arbors_to_soma, self)
         self.profiling_statistics += stats
+        yield
 
         # Tessellation
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.decimate_neuron_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Surface roughness
         result, stats = nmv.utilities.profile_function(
             nmv.builders.add_surface_noise_to_arbor, self)
         self.profiling_statistics += stats
+        yield
 
         # Add the spines
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.add_spines_to_surface, self)
         self.profiling_statistics += stats
+        yield
 
         # Join all the objects into a single object
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.join_mesh_object_into_single_object, self)
         self.profiling_statistics += stats
+        yield
 
         # Transform to the global coordinates, if required
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.transform_to_global_coordinates, self)
         self.profiling_statistics += stats
+        yield
 
         # Collect the stats. of the mesh
         result, stats = nmv.utilities.profile_function(
             nmv.builders.collect_mesh_stats, self)
         self.profiling_statistics += stats
+        yield
 
         # Report
         nmv.logger.statistics(self.profiling_statistics)
@@ -407,3 +442,17 @@ class PiecewiseBuilder:
         # Return a list of all the mesh objects in the scene
         mesh_objects = nmv.builders.get_neuron_mesh_objects(builder=self)
         return mesh_objects
+
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    def reconstruct_mesh(self):
+        """Reconstructs the neuronal mesh as a set of piecewise-watertight meshes.
+
+        The meshes are logically connected, but the different branches are intersecting,
+        so they can be used perfectly for voxelization purposes, but they cannot be used for
+        surface rendering with 'transparency'. For this purpose, we recommend to use the skinning
+        builder.
+        """
+
+        return nmv.utilities.run_generator(self.reconstruct_mesh_incrementally())
@@ -418,6 +418,8 @@ class SkinningBuilder:
 
         :param connected_to_soma:
             If the arbor is connected to soma or not, by default False.
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         # Header
@@ -441,6 +443,9 @@ class SkinningBuilder:
                     self.morphology.apical_dendrites[i].mesh = arbor_mesh
                     self.neuron_meshes.append(arbor_mesh)
 
+                    # The arbor is built
+                    yield
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
@@ -459,6 +464,9 @@ class SkinningBuilder:
                     self.morphology.basal_dendrites[i].mesh = arbor_mesh
                     self.neuron_meshes.append(arbor_mesh)
 
+                    # The arbor is built
+                    yield
+
         # Axons
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
@@ -477,11 +485,19 @@ class SkinningBuilder:
                     self.morphology.axons[i].mesh = arbor_mesh
                     self.neuron_meshes.append(arbor_mesh)
 
+                    # The arbor is built
+                    yield
+
     ################################################################################################
-    # @reconstruct_mesh
+    # @reconstruct_mesh_incrementally
     ################################################################################################
-    def reconstruct_mesh(self):
-        """Reconstructs the neuronal mesh using the skinning modifiers in Blender.
+    def reconstruct_mesh_incrementally(self):
+        """Reconstructs the neuronal mesh using the skinning modifiers in Blender, stage by stage
+        and arbor by arbor, to advance it in time slices as a main-thread step of a job.
+
+        :return:
+            A generator that yields after every stage and every arbor, and returns a reference to
+            the neuron mesh.
         """
 
         nmv.logger.header('Building Mesh: SkinningBuilder')
@@ -494,6 +510,7 @@ class SkinningBuilder:
         result, stats = nmv.utilities.profile_function(
             nmv.builders.mesh.update_morphology_skeleton, self)
         self.profiling_statistics += stats
+        yield
 
         # Verify the connectivity of the arbors to the soma to filter the disconnected arbors,
         # for example, an axon that is emanating from a dendrite or two intersecting dendrites
@@ -502,24 +519,30 @@ class SkinningBuilder:
         # Build the soma, with the default parameters
         result, stats = nmv.utilities.profile_function(nmv.builders.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Build the arbors and connect them to the soma
         if self.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
 
             # Build the arbors
-            result, stats = nmv.utilities.profile_function(self.build_arbors, True)
+            result, stats = yield from nmv.builders.mesh.common.report_arbors_progress(
+                self, nmv.utilities.profile_generator(self.build_arbors, True))
             self.profiling_statistics += stats
+            yield
 
             # Connect to the soma
             result, stats = nmv.utilities.profile_function(
                 nmv.builders.connect_arbors_to_soma, self)
             self.profiling_statistics += stats
+            yield
 
         # Build the arbors only without any connection to the soma
         else:
             # Build the arbors
-            result, stats = nmv.utilities.profile_function(self.build_arbors, False)
+            result, stats = yield from nmv.builders.mesh.common.report_arbors_progress(
+                self, nmv.utilities.profile_generator(self.build_arbors, False))
             self.profiling_statistics += stats
+            yield
 
         # Details about the arbors building
         self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('extrusion',
@@ -555,29 +578,35 @@ class SkinningBuilder:
         # Tessellation
         result, stats = nmv.utilities.profile_function(nmv.builders.decimate_neuron_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Surface roughness
         result, stats = nmv.utilities.profile_function(
             nmv.builders.add_surface_noise_to_arbor, self)
         self.profiling_statistics += stats
+        yield
 
         # Add the spines
         result, stats = nmv.utilities.profile_function(nmv.builders.add_spines_to_surface, self)
         self.profiling_statistics += stats
+        yield
 
         # Join all the objects into a single object
         neuron_mesh, stats = nmv.utilities.profile_function(
             nmv.builders.join_mesh_object_into_single_object, self)
         self.profiling_statistics += stats
+        yield
 
         # Transform to the global coordinates, if required
         result, stats = nmv.utilities.profile_function(
             nmv.builders.transform_to_global_coordinates, self)
         self.profiling_statistics += stats
+        yield
 
         # Collect the stats. of the mesh
         result, stats = nmv.utilities.profile_function(nmv.builders.collect_mesh_stats, self)
         self.profiling_statistics += stats
+        yield
 
         # Done
         nmv.logger.statistics(self.profiling_statistics)
@@ -587,3 +616,12 @@ class SkinningBuilder:
 
         # Return a reference to the neuron mesh if joint
         return neuron_mesh
+
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    def reconstruct_mesh(self):
+        """Reconstructs the neuronal mesh using the skinning modifiers in Blender.
+        """
+
+        return nmv.utilities.run_generator(self.reconstruct_mesh_incrementally())
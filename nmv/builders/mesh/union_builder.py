@@ -199,7 +199,8 @@ class UnionBuilder:
             nmv.scene.ops.convert_object_to_mesh(arbor_poly_line_object)
 
         # Union all the mesh objects into a single object
-        arbor.mesh = nmv.mesh.ops.union_mesh_objects_in_list(arbor_poly_line_objects)
+        arbor.mesh = nmv.mesh.ops.union_mesh_objects_in_list(
+            arbor_poly_line_objects, number_processes=self.options.mesh.union_processes)
 
         # Rename the mesh
         arbor.mesh.name = name
@@ -239,6 +240,8 @@ class UnionBuilder:
             watertight mesh.
         :param soft:
             A flag indicating that the arbors will be smooth.
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         # Axons
@@ -254,6 +257,9 @@ class UnionBuilder:
                         name=arbor.label, material=self.axons_materials[0],
                         connection_to_soma=connection_to_soma, soft=soft)
 
+                    # The arbor is built
+                    yield
+
         # Apical dendrites
         if self.morphology.has_apical_dendrites():
             if not self.options.morphology.ignore_apical_dendrites:
@@ -268,6 +274,9 @@ class UnionBuilder:
                         material=self.apical_dendrites_materials[0],
                         connection_to_soma=connection_to_soma, soft=soft)
 
+                    # The arbor is built
+                    yield
+
         # Basal dendrites
         if self.morphology.has_basal_dendrites():
             if not self.options.morphology.ignore_basal_dendrites:
@@ -282,11 +291,17 @@ class UnionBuilder:
                         material=self.basal_dendrites_materials[0],
                         connection_to_soma=connection_to_soma, soft=soft)
 
+                    # The arbor is built
+                    yield
+
     ################################################################################################
     # @build_hard_edges_arbors
     ################################################################################################
     def build_hard_edges_arbors(self):
         """Reconstruct the meshes of the arbors of the neuron with HARD edges.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         # Create a bevel object that will be used to create the mesh
@@ -301,8 +316,8 @@ class UnionBuilder:
             connection_to_soma = False
 
         # Create the arbors using this 16-side bevel object and CLOSED caps (no smoothing required)
-        self.build_union_arbors(bevel_object=bevel_object, caps=True,
-                                connection_to_soma=connection_to_soma, soft=False)
+        yield from self.build_union_arbors(bevel_object=bevel_object, caps=True,
+                                           connection_to_soma=connection_to_soma, soft=False)
 
         # Delete the bevel object
         nmv.scene.ops.delete_object_in_scene(bevel_object)
@@ -312,6 +327,9 @@ class UnionBuilder:
     ################################################################################################
     def build_soft_edges_arbors(self):
         """Reconstruct the meshes of the arbors of the neuron with SOFT edges.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
         # Create a bevel object that will be used to create the mesh with 4 sides only
         bevel_object = nmv.mesh.create_bezier_circle(
@@ -325,8 +343,8 @@ class UnionBuilder:
             connection_to_soma = False
 
         # Create the arbors using this 4-side bevel object and OPEN caps (for smoothing)
-        self.build_union_arbors(bevel_object=bevel_object, caps=True,
-                                connection_to_soma=connection_to_soma, soft=True)
+        yield from self.build_union_arbors(bevel_object=bevel_object, caps=True,
+                                           connection_to_soma=connection_to_soma, soft=True)
 
         # Delete the bevel object
         nmv.scene.ops.delete_object_in_scene(bevel_object)
@@ -342,26 +360,33 @@ class UnionBuilder:
         # The other method creates a smoothed mesh with soft edges. In this method, we will use a
         # simplified bevel object with only 'four' vertices and smooth it later using vertices
         # smoothing to make 'sexy curves' for the mesh that reflect realistic arbors.
+
+        :return:
+            A generator that yields after every arbor is built.
         """
 
         nmv.logger.header('Reconstructing arbors')
 
         # Hard edges (less samples per branch)
         if self.options.mesh.edges == nmv.enums.Meshing.Edges.HARD:
-            self.build_hard_edges_arbors()
+            yield from self.build_hard_edges_arbors()
 
         # Smooth edges (more samples per branch)
         elif self.options.mesh.edges == nmv.enums.Meshing.Edges.SMOOTH:
-            self.build_soft_edges_arbors()
+            yield from self.build_soft_edges_arbors()
 
         else:
             nmv.logger.log('ERROR')
 
     ################################################################################################
-    # @reconstruct_mesh
+    # @reconstruct_mesh_incrementally
     ################################################################################################
-    def reconstruct_mesh(self):
-        """Reconstructs the mesh.
+    def reconstruct_mesh_incrementally(self):
+        """Reconstructs the mesh stage by stage and arbor by arbor, to advance it in time slices
+        as a main-thread step of a job.
+
+        :return:
+            A generator that yields after every stage and every arbor.
         """
 
         nmv.logger.header('Building Mesh: UnionBuilder')
@@ -373,11 +398,13 @@ class UnionBuilder:
         # Verify and repair the morphology, if required
         result, stats = nmv.utilities.profile_function(self.update_morphology_skeleton)
         self.profiling_statistics += stats
+        yield
 
         # Apply skeleton - based operation, if required, to slightly modify the skeleton
         result, stats = nmv.utilities.profile_function(
             nmv.builders.modify_morphology_skeleton, self)
         self.profiling_statistics += stats
+        yield
 
         # Resample the sections of the morphology skeleton
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
@@ -385,41 +412,51 @@ class UnionBuilder:
         # Build the soma, with the default parameters
         result, stats = nmv.utilities.profile_function(nmv.builders.reconstruct_soma_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Build the arbors
-        result, stats = nmv.utilities.profile_function(self.build_arbors)
+        result, stats = yield from nmv.builders.mesh.common.report_arbors_progress(
+            self, nmv.utilities.profile_generator(self.build_arbors))
         self.profiling_statistics += stats
+        yield
 
         # Connect to the soma
         result, stats = nmv.utilities.profile_function(nmv.builders.connect_arbors_to_soma, self)
         self.profiling_statistics += stats
+        yield
 
         # Tessellation
         result, stats = nmv.utilities.profile_function(nmv.builders.decimate_neuron_mesh, self)
         self.profiling_statistics += stats
+        yield
 
         # Add the spines
         result, stats = nmv.utilities.profile_function(nmv.builders.add_spines_to_surface, self)
         self.profiling_statistics += stats
+        yield
 
         # Surface roughness
         result, stats = nmv.utilities.profile_function(
             nmv.builders.add_surface_noise_to_arbor, self)
         self.profiling_statistics += stats
+        yield
 
         # Join all the objects into a single object
         result, stats = nmv.utilities.profile_function(
             nmv.builders.join_mesh_object_into_single_object, self)
         self.profiling_statistics += stats
+        yield
 
         # Transform to the global coordinates, if required
         result, stats = nmv.utilities.profile_function(
             nmv.builders.transform_to_global_coordinates, self)
         self.profiling_statistics += stats
+        yield
 
         # Collect the stats. of the mesh
         result, stats = nmv.utilities.profile_function(nmv.builders.collect_mesh_stats, self)
         self.profiling_statistics += stats
+        yield
 
         # Report
         nmv.logger.log(self.profiling_statistics)
@@ -427,3 +464,11 @@ class UnionBuilder:
         # Write the stats to file
         nmv.builders.write_statistics_to_file(builder=self, tag='union')
 
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    def reconstruct_mesh(self):
+        """Reconstructs the mesh.
+        """
+
+        return nmv.utilities.run_generator(self.reconstruct_mesh_incrementally())
@@ -0,0 +1,331 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import copy
+import os
+
+# Internal modules
+import nmv.builders
+import nmv.consts
+import nmv.enums
+import nmv
+import nmv.mesh
+import nmv.shading
+import nmv.utilities
+from . import voxel_meshing
+
+
+####################################################################################################
+# @VoxelBuilder
+####################################################################################################
+class VoxelBuilder:
+    """Mesh builder that creates watertight meshes by extracting the surface of the union of the
+    tapered segments of the skeleton and the soma on a sparse voxel grid.
+
+    The distance field of the neuron is only evaluated in the blocks of the grid that are close to
+    the skeleton, the blocks are meshed independently in parallel, and the resolution of the mesh
+    is controlled by the voxel size. The surface extraction itself does not use Blender, so the
+    surface can be exported directly with export_surface().
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 morphology,
+                 options,
+                 voxel_size=None,
+                 block_size=voxel_meshing.DEFAULT_BLOCK_SIZE,
+                 number_processes=None):
+        """Constructor
+
+        :param morphology:
+            A given morphology skeleton to create the mesh for.
+        :param options:
+            Loaded options from NeuroMorphoVis.
+        :param voxel_size:
+            The size of the voxels in microns. If None, the voxel size given in the options is
+            used, and if this is not set, it is derived from the radii of the morphology.
+        :param block_size:
+            The number of voxels along each side of a block of the sparse grid.
+        :param number_processes:
+            The number of processes used to evaluate the blocks. If None, the number given in the
+            options is used.
+        """
+
+        # Morphology
+        self.morphology = copy.deepcopy(morphology)
+
+        # Loaded options from NeuroMorphoVis
+        self.options = options
+
+        # Resolution
+        if voxel_size is None and options.mesh.voxel_size > 0.0:
+            voxel_size = options.mesh.voxel_size
+        self.voxel_size = voxel_size
+        self.block_size = block_size
+
+        # Parallelism
+        if number_processes is None:
+            number_processes = options.mesh.voxelization_processes
+        self.number_processes = number_processes
+
+        # A list of the colors/materials of the soma
+        self.soma_materials = None
+
+        # A list of the colors/materials of the axon
+        self.axons_materials = None
+
+        # A list of the colors/materials of the basal dendrites
+        self.basal_dendrites_materials = None
+
+        # A list of the colors/materials of the apical dendrite
+        self.apical_dendrites_materials = None
+
+        # A list of the colors/materials of the spines
+        self.spines_materials = None
+
+        # The extracted surface, arrays of vertices and triangles
+        self.vertices = None
+        self.triangles = None
+
+        # The reconstructed mesh object
+        self.mesh_object = None
+
+        # Statistics
+        self.profiling_statistics = 'VoxelBuilder Profiling Stats.: \n'
+
+        # Stats. about the morphology
+        self.morphology_statistics = 'Morphology: \n'
+
+        # Stats. about the mesh
+        self.mesh_statistics = 'VoxelBuilder Mesh: \n'
+
+    ################################################################################################
+    # @collect_arbor_capsules
+    ################################################################################################
+    @staticmethod
+    def collect_arbor_capsules(root,
+                               max_branching_order,
+                               capsules):
+        """Collects the tapered capsules of all the segments of a given arbor.
+
+        :param root:
+            The root section of the arbor.
+        :param max_branching_order:
+            The maximum branching order of the arbor.
+        :param capsules:
+            A list to append the capsules to, as [x0, y0, z0, r0, x1, y1, z1, r1].
+        """
+
+        sections = [root]
+        while len(sections) > 0:
+            section = sections.pop()
+
+            # Do not proceed if the branching order limit is hit
+            if section.branching_order > max_branching_order:
+                continue
+
+            samples = section.samples
+
+            # Connect the section to its parent to avoid any gaps at the bifurcations
+            if section.parent is not None and len(section.parent.samples) > 0 and \
+                    len(samples) > 0:
+                samples = [section.parent.samples[-1]] + samples
+
+            for i in range(len(samples) - 1):
+                p0 = samples[i].point
+                p1 = samples[i + 1].point
+                capsules.append([p0[0], p0[1], p0[2], samples[i].radius,
+                                 p1[0], p1[1], p1[2], samples[i + 1].radius])
+
+            sections.extend(section.children)
+
+    ################################################################################################
+    # @collect_primitives
+    ################################################################################################
+    def collect_primitives(self):
+        """Collects the primitives of the neuron, i.e. the capsules of the arbors and the soma.
+
+        :return:
+            A list of capsules and a list of spheres.
+        """
+
+        capsules = list()
+
+        # Apical dendrites
+        if not self.options.morphology.ignore_apical_dendrites:
+            if self.morphology.has_apical_dendrites():
+                for arbor in self.morphology.apical_dendrites:
+                    self.collect_arbor_capsules(
+                        arbor, self.options.morphology.apical_dendrite_branch_order, capsules)
+
+        # Basal dendrites
+        if not self.options.morphology.ignore_basal_dendrites:
+            if self.morphology.has_basal_dendrites():
+                for arbor in self.morphology.basal_dendrites:
+                    self.collect_arbor_capsules(
+                        arbor, self.options.morphology.basal_dendrites_branch_order, capsules)
+
+        # Axons
+        if not self.options.morphology.ignore_axons:
+            if self.morphology.has_axons():
+                for arbor in self.morphology.axons:
+                    self.collect_arbor_capsules(
+                        arbor, self.options.morphology.axon_branch_order, capsules)
+
+        # Soma
+        spheres = list()
+        if self.morphology.soma is not None:
+            centroid = self.morphology.soma.centroid
+            spheres.append([centroid[0], centroid[1], centroid[2],
+                            self.morphology.soma.mean_radius])
+
+        return capsules, spheres
+
+    ################################################################################################
+    # @build_surface
+    ################################################################################################
+    def build_surface(self):
+        """Extracts the surface of the neuron into arrays of vertices and triangles.
+
+        :return:
+            An Nx3 array of vertices and an Mx3 array of triangles.
+        """
+
+        import numpy
+
+        capsules, spheres = self.collect_primitives()
+        capsules = numpy.array(capsules, dtype=numpy.float64).reshape(-1, 8)
+        spheres = numpy.array(spheres, dtype=numpy.float64).reshape(-1, 4)
+
+        # Derive the voxel size from the thin branches of the morphology
+        if self.voxel_size is None:
+            if len(capsules) > 0:
+                radii = numpy.concatenate((capsules[:, 3], capsules[:, 7]))
+                self.voxel_size = max(
+                    0.5 * float(numpy.percentile(radii, 10)), nmv.consts.Meshing.MIN_VOXEL_SIZE)
+            else:
+                self.voxel_size = nmv.consts.Meshing.MIN_VOXEL_SIZE
+
+        # Every branch must be at least one voxel thick to be reconstructed without holes
+        capsules[:, 3] = numpy.maximum(capsules[:, 3], self.voxel_size)
+        capsules[:, 7] = numpy.maximum(capsules[:, 7], self.voxel_size)
+
+        nmv.logger.info('Voxelizing [%d] segments with a voxel size of [%f]' %
+                        (len(capsules), self.voxel_size))
+        self.vertices, self.triangles = voxel_meshing.extract_surface(
+            capsules=capsules, spheres=spheres, voxel_size=self.voxel_size,
+            block_size=self.block_size, number_processes=self.number_processes)
+
+        return self.vertices, self.triangles
+
+    ################################################################################################
+    # @export_surface
+    ################################################################################################
+    def export_surface(self,
+                       file_path):
+        """Exports the extracted surface to a .PLY or an .OBJ file without using Blender.
+
+        :param file_path:
+            The path to the output file, the format is selected by the extension.
+        """
+
+        if self.vertices is None:
+            self.build_surface()
+
+        if os.path.splitext(file_path)[1].lower() == nmv.consts.Meshing.OBJ_EXTENSION:
+            voxel_meshing.write_surface_to_obj(self.vertices, self.triangles, file_path)
+        else:
+            voxel_meshing.write_surface_to_ply(self.vertices, self.triangles, file_path)
+
+    ################################################################################################
+    # @create_mesh_object
+    ################################################################################################
+    def create_mesh_object(self):
+        """Creates the mesh object of the extracted surface in the scene.
+        """
+
+        self.mesh_object = nmv.mesh.create_mesh_from_arrays(
+            vertices=self.vertices, triangles=self.triangles, name=self.morphology.label)
+
+        # NOTE: Before drawing the skeleton, create the materials once and for all to improve the
+        # performance since this is way better than creating a new material per section or segment
+        nmv.builders.mesh.common.create_skeleton_materials(builder=self)
+
+        # Assign the material to the mesh
+        nmv.shading.set_material_to_object(self.mesh_object, self.soma_materials[0])
+
+        # Update the UV mapping
+        nmv.shading.adjust_material_uv(self.mesh_object)
+
+    ################################################################################################
+    # @reconstruct_mesh
+    ################################################################################################
+    def reconstruct_mesh(self):
+        """Reconstructs the neuronal mesh using the voxelization of the skeleton.
+        """
+
+        nmv.logger.header('Building Mesh: VoxelBuilder')
+
+        # Extract the surface
+        result, stats = nmv.utilities.profile_function(self.build_surface)
+        self.profiling_statistics += stats
+
+        # Create the mesh object and finalize it
+        return self.complete_mesh()
+
+    ################################################################################################
+    # @complete_mesh
+    ################################################################################################
+    def complete_mesh(self):
+        """Creates the mesh object from the extracted surface and finalizes it.
+
+        The surface extraction does not access the Blender API, and therefore the UI can run
+        build_surface in the background and only this function on the main thread.
+
+        :return:
+            A reference to the reconstructed mesh.
+        """
+
+        # Create the mesh object
+        result, stats = nmv.utilities.profile_function(self.create_mesh_object)
+        self.profiling_statistics += stats
+
+        # Tessellation
+        result, stats = nmv.utilities.profile_function(
+            nmv.builders.mesh.common.decimate_neuron_mesh, self)
+        self.profiling_statistics += stats
+
+        # Transform to the global coordinates, if required
+        result, stats = nmv.utilities.profile_function(
+            nmv.builders.mesh.common.transform_to_global_coordinates, self)
+        self.profiling_statistics += stats
+
+        # Collect the stats. of the mesh
+        result, stats = nmv.utilities.profile_function(nmv.builders.collect_mesh_stats, self)
+        self.profiling_statistics += stats
+
+        # Report
+        nmv.logger.statistics_overall(self.profiling_statistics)
+
+        # Write the stats to file
+        nmv.builders.write_statistics_to_file(builder=self, tag='voxel')
+
+        # Return a reference to the reconstructed mesh
+        return self.mesh_object
@@ -0,0 +1,649 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import itertools
+import multiprocessing
+
+# External imports
+import numpy
+
+
+# The number of voxels along each side of a block of the sparse grid
+DEFAULT_BLOCK_SIZE = 32
+
+# The number of capsules evaluated at once in a block, bounds the memory of the evaluation
+CAPSULES_CHUNK_SIZE = 32
+
+# The edges of a tetrahedron as pairs of local vertex indices
+TETRAHEDRON_EDGES = numpy.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+
+# The six tetrahedra of the Kuhn decomposition of a cube, as paths from the corner (0, 0, 0) to
+# the corner (1, 1, 1) along the axes. The corners are encoded by their bits (x = 1, y = 2, z = 4)
+# and the decomposition is consistent between neighbouring cubes, so the surface is watertight.
+CUBE_TETRAHEDRA = numpy.array(
+    [[0, 1 << a, (1 << a) | (1 << b), 7] for a, b, _ in itertools.permutations(range(3))])
+
+# The offset code of every edge of every tetrahedron, i.e. the bits of the upper corner of the
+# edge relative to the lower one. The edges of the tetrahedra are always monotone along the axes.
+TETRAHEDRA_EDGE_OFFSETS = CUBE_TETRAHEDRA[:, TETRAHEDRON_EDGES[:, 1]] ^ \
+                          CUBE_TETRAHEDRA[:, TETRAHEDRON_EDGES[:, 0]]
+
+# The offset code of the vertices that are snapped to a grid point lying exactly on the surface,
+# which is not used by any edge
+GRID_POINT_OFFSET = 7
+
+
+####################################################################################################
+# @create_triangles_table
+####################################################################################################
+def create_triangles_table():
+    """Creates the table of the triangles of every case of the marching tetrahedra.
+
+    :return:
+        A 16x2x3 array of the local edges of the (up to two) triangles of every case, where the
+        missing triangles are set to -1.
+    """
+
+    edge_index = {tuple(edge): i for i, edge in enumerate(TETRAHEDRON_EDGES.tolist())}
+
+    def get_edge(i, j):
+        return edge_index[(min(i, j), max(i, j))]
+
+    table = numpy.full((16, 2, 3), -1, dtype=numpy.int64)
+    for case in range(16):
+        inside = [k for k in range(4) if case & (1 << k)]
+        outside = [k for k in range(4) if not case & (1 << k)]
+
+        # A single corner is separated from the other three
+        if len(inside) == 1 or len(outside) == 1:
+            corner = inside[0] if len(inside) == 1 else outside[0]
+            others = [k for k in range(4) if k != corner]
+            table[case, 0] = [get_edge(corner, k) for k in others]
+
+        # Two corners are separated from the other two, i.e. a quad
+        elif len(inside) == 2:
+            i, j = inside
+            k, l = outside
+            table[case, 0] = [get_edge(i, k), get_edge(i, l), get_edge(j, l)]
+            table[case, 1] = [get_edge(i, k), get_edge(j, l), get_edge(j, k)]
+
+    return table
+
+
+# The triangles of every case
+TRIANGLES_TABLE = create_triangles_table()
+
+
+####################################################################################################
+# @VoxelGrid
+####################################################################################################
+class VoxelGrid:
+    """A sparse voxel grid that is tiled into blocks.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 p_min,
+                 p_max,
+                 voxel_size,
+                 block_size=DEFAULT_BLOCK_SIZE):
+        """Constructor
+
+        :param p_min:
+            The minimum corner of the domain.
+        :param p_max:
+            The maximum corner of the domain.
+        :param voxel_size:
+            The size of a voxel, i.e. the resolution of the mesh.
+        :param block_size:
+            The number of voxels along each side of a block.
+        """
+
+        # Origin and resolution
+        self.origin = numpy.array(p_min, dtype=numpy.float64)
+        self.voxel_size = float(voxel_size)
+
+        # The number of grid points along each axis
+        extent = numpy.array(p_max, dtype=numpy.float64) - self.origin
+        self.dimensions = numpy.ceil(extent / self.voxel_size).astype(numpy.int64) + 1
+
+        # Blocks
+        self.block_size = block_size
+        self.number_blocks = (self.dimensions - 2) // block_size + 1
+
+    ################################################################################################
+    # @get_blocks_in_box
+    ################################################################################################
+    def get_blocks_in_box(self,
+                          p_min,
+                          p_max):
+        """Gets the indices of the blocks that intersect an axis-aligned box.
+
+        :param p_min:
+            The minimum corner of the box.
+        :param p_max:
+            The maximum corner of the box.
+        :return:
+            The minimum and maximum (inclusive) block indices along every axis.
+        """
+
+        block_extent = self.voxel_size * self.block_size
+        first = numpy.floor((numpy.asarray(p_min) - self.origin) / block_extent).astype(numpy.int64)
+        last = numpy.floor((numpy.asarray(p_max) - self.origin) / block_extent).astype(numpy.int64)
+        return numpy.clip(first, 0, self.number_blocks - 1), \
+            numpy.clip(last, 0, self.number_blocks - 1)
+
+    ################################################################################################
+    # @get_block_points
+    ################################################################################################
+    def get_block_points(self,
+                         block_index):
+        """Gets the grid points of a block, including the shared points on its upper faces.
+
+        :param block_index:
+            The index of the block along each axis.
+        :return:
+            The global index of the first point of the block, the number of points along each
+            axis and an Nx3 array of the positions of the points.
+        """
+
+        start = numpy.asarray(block_index, dtype=numpy.int64) * self.block_size
+        shape = numpy.minimum(start + self.block_size + 1, self.dimensions) - start
+        local = numpy.stack(numpy.meshgrid(numpy.arange(shape[0]), numpy.arange(shape[1]),
+                                           numpy.arange(shape[2]), indexing='ij'), axis=-1)
+        positions = self.origin + self.voxel_size * (local.reshape(-1, 3) + start)
+        return start, shape, positions
+
+
+####################################################################################################
+# @compute_round_cones_distance
+####################################################################################################
+def compute_round_cones_distance(points,
+                                 capsules):
+    """Computes the signed distance from a set of points to the union of a set of tapered
+    capsules, i.e. round cones that connect two spheres of different radii.
+
+    :param points:
+        An Nx3 array of points.
+    :param capsules:
+        A Cx8 array of capsules, where every capsule is [x0, y0, z0, r0, x1, y1, z1, r1].
+    :return:
+        An array of N distances, negative inside the capsules.
+    """
+
+    a = capsules[:, 0:3]
+    r1 = capsules[:, 3]
+    b = capsules[:, 4:7]
+    r2 = capsules[:, 7]
+
+    # Per-capsule terms
+    ba = b - a
+    l2 = numpy.maximum(numpy.einsum('ij,ij->i', ba, ba), 1e-12)
+    rr = r1 - r2
+    a2 = l2 - rr * rr
+    il2 = 1.0 / l2
+
+    # Per-point and per-capsule terms, NxC
+    pa = points[:, None, :] - a[None, :, :]
+    y = numpy.einsum('ncj,cj->nc', pa, ba)
+    z = y - l2
+    x = pa * l2[None, :, None] - ba[None, :, :] * y[:, :, None]
+    x2 = numpy.einsum('ncj,ncj->nc', x, x)
+    y2 = y * y * l2
+    z2 = z * z * l2
+    k = numpy.sign(rr) * rr * rr * x2
+
+    # The three regions of the round cone
+    distance = (numpy.sqrt(numpy.maximum(x2 * a2 * il2, 0.0)) + y * rr) * il2 - r1
+    near_a = numpy.sign(y) * a2 * y2 < k
+    distance = numpy.where(near_a, numpy.sqrt(x2 + y2) * il2 - r1, distance)
+    near_b = numpy.sign(z) * a2 * z2 > k
+    distance = numpy.where(near_b, numpy.sqrt(x2 + z2) * il2 - r2, distance)
+
+    # If a sphere contains the other one, the capsule is the larger sphere
+    degenerate = a2 <= 0.0
+    if numpy.any(degenerate):
+        sphere_a = numpy.linalg.norm(pa, axis=2) - r1
+        sphere_b = numpy.linalg.norm(points[:, None, :] - b[None, :, :], axis=2) - r2
+        distance = numpy.where(degenerate[None, :], numpy.minimum(sphere_a, sphere_b), distance)
+
+    return distance.min(axis=1)
+
+
+####################################################################################################
+# @evaluate_distance_field
+####################################################################################################
+def evaluate_distance_field(points,
+                            capsules,
+                            spheres,
+                            clamp):
+    """Evaluates the signed distance field of a union of capsules and spheres at a set of points.
+
+    The capsules are processed in chunks to bound the memory, and the field is clamped to a
+    given value, such that the field is identical for a point that is shared by two blocks
+    regardless of the capsules that were assigned to each block.
+
+    :param points:
+        An Nx3 array of points.
+    :param capsules:
+        A Cx8 array of capsules.
+    :param spheres:
+        An Sx4 array of spheres, [x, y, z, r].
+    :param clamp:
+        The maximum value of the field.
+    :return:
+        An array of N values.
+    """
+
+    field = numpy.full(len(points), clamp, dtype=numpy.float64)
+    for i in range(0, len(capsules), CAPSULES_CHUNK_SIZE):
+        field = numpy.minimum(
+            field, compute_round_cones_distance(points, capsules[i:i + CAPSULES_CHUNK_SIZE]))
+    for sphere in spheres:
+        field = numpy.minimum(field, numpy.linalg.norm(points - sphere[:3], axis=1) - sphere[3])
+
+    return field
+
+
+####################################################################################################
+# @march_tetrahedra
+####################################################################################################
+def march_tetrahedra(field,
+                     start,
+                     shape,
+                     grid):
+    """Extracts the zero iso-surface of a block of the field with vectorized marching tetrahedra.
+
+    Every cube is split into six tetrahedra, and all the active tetrahedra of the block are
+    processed at once. The vertices are identified by the global key of the edge of the grid they
+    lie on, which allows welding the vertices of the neighbouring blocks. The points where the
+    field is exactly zero are outside, and the vertices on their edges are snapped to the point
+    itself and share a single key.
+
+    :param field:
+        The values of the field at the points of the block, flattened.
+    :param start:
+        The global index of the first point of the block.
+    :param shape:
+        The number of points of the block along each axis.
+    :param grid:
+        The VoxelGrid.
+    :return:
+        The keys of the vertices, their positions and the triangles as indices into the vertices.
+    """
+
+    nx, ny, nz = (int(n) for n in shape)
+    values = field.reshape(nx, ny, nz)
+
+    # The corners of all the cubes, indexed by their bits
+    offsets = [((c & 1) * ny + ((c >> 1) & 1)) * nz + ((c >> 2) & 1) for c in range(8)]
+    inside = numpy.stack([values[(c & 1):nx - 1 + (c & 1),
+                                 ((c >> 1) & 1):ny - 1 + ((c >> 1) & 1),
+                                 ((c >> 2) & 1):nz - 1 + ((c >> 2) & 1)] < 0 for c in range(8)])
+    active = numpy.any(inside, axis=0) & ~numpy.all(inside, axis=0)
+    ix, iy, iz = numpy.nonzero(active)
+    if len(ix) == 0:
+        return numpy.zeros(0, dtype=numpy.int64), numpy.zeros((0, 3)), \
+            numpy.zeros((0, 3), dtype=numpy.int64)
+
+    # The local point index of the lower corner of every active cube
+    base = (ix * ny + iy) * nz + iz
+
+    # The points of the tetrahedra, (cubes x 6) x 4
+    corner_offsets = numpy.array(offsets)[CUBE_TETRAHEDRA]
+    tetrahedra = (base[:, None, None] + corner_offsets[None, :, :]).reshape(-1, 4)
+    tetrahedra_types = numpy.tile(numpy.arange(6), len(base))
+
+    # The case of every tetrahedron
+    tetrahedra_inside = values.ravel()[tetrahedra] < 0
+    cases = (tetrahedra_inside * numpy.array([1, 2, 4, 8])).sum(axis=1)
+
+    # Global keys of the points
+    local_points = numpy.stack(numpy.unravel_index(numpy.arange(nx * ny * nz), (nx, ny, nz)),
+                               axis=1)
+    global_points = local_points + start
+    point_keys = (global_points[:, 0] * grid.dimensions[1] + global_points[:, 1]) * \
+        grid.dimensions[2] + global_points[:, 2]
+    point_positions = grid.origin + grid.voxel_size * global_points
+
+    # The direction from the inside to the outside of every tetrahedron, used for orientation
+    inside_weights = tetrahedra_inside / numpy.maximum(
+        tetrahedra_inside.sum(axis=1, keepdims=True), 1)
+    outside_weights = ~tetrahedra_inside / numpy.maximum(
+        (~tetrahedra_inside).sum(axis=1, keepdims=True), 1)
+    corners = point_positions[tetrahedra]
+    outwards = numpy.einsum('tk,tkj->tj', outside_weights - inside_weights, corners)
+
+    all_keys = list()
+    all_lower = list()
+    all_upper = list()
+    all_outwards = list()
+    for slot in range(2):
+        edges = TRIANGLES_TABLE[cases, slot]
+        valid = edges[:, 0] >= 0
+        edges = edges[valid]
+        tetrahedra_slot = tetrahedra[valid]
+        types = tetrahedra_types[valid]
+        rows = numpy.arange(len(edges))[:, None]
+
+        lower = tetrahedra_slot[rows, TETRAHEDRON_EDGES[edges, 0]]
+        upper = tetrahedra_slot[rows, TETRAHEDRON_EDGES[edges, 1]]
+        all_keys.append(point_keys[lower] * 8 + TETRAHEDRA_EDGE_OFFSETS[types[:, None], edges])
+        all_lower.append(lower)
+        all_upper.append(upper)
+        all_outwards.append(outwards[valid])
+
+    keys = numpy.concatenate(all_keys)
+    lower = numpy.concatenate(all_lower)
+    upper = numpy.concatenate(all_upper)
+    outwards = numpy.concatenate(all_outwards)
+
+    # Snap the vertices to the outside points of their edges that lie exactly on the surface
+    outside = numpy.where(values.ravel()[lower] < 0, upper, lower)
+    snapped = values.ravel()[outside] == 0.0
+    keys[snapped] = point_keys[outside[snapped]] * 8 + GRID_POINT_OFFSET
+
+    # Weld the vertices of the block
+    vertex_keys, first, triangles = numpy.unique(keys.ravel(), return_index=True,
+                                                 return_inverse=True)
+    triangles = triangles.reshape(-1, 3)
+
+    # Interpolate the positions of the vertices along their edges
+    vertex_lower = lower.ravel()[first]
+    vertex_upper = upper.ravel()[first]
+    v0 = values.ravel()[vertex_lower]
+    v1 = values.ravel()[vertex_upper]
+    t = (v0 / (v0 - v1))[:, None]
+    positions = point_positions[vertex_lower] + \
+        t * (point_positions[vertex_upper] - point_positions[vertex_lower])
+    vertex_snapped = snapped.ravel()[first]
+    positions[vertex_snapped] = point_positions[outside.ravel()[first][vertex_snapped]]
+
+    # Orient the triangles outwards
+    p0 = positions[triangles[:, 0]]
+    normals = numpy.cross(positions[triangles[:, 1]] - p0, positions[triangles[:, 2]] - p0)
+    flipped = numpy.einsum('ij,ij->i', normals, outwards) < 0
+    triangles[flipped] = triangles[flipped][:, [0, 2, 1]]
+
+    return vertex_keys, positions, triangles
+
+
+# The data shared with the worker processes
+worker_data = dict()
+
+
+####################################################################################################
+# @process_block
+####################################################################################################
+def process_block(task):
+    """Evaluates the field of a single block and extracts its surface.
+
+    :param task:
+        A tuple of the index of the block and the indices of the capsules that overlap it.
+    :return:
+        The keys of the vertices, their positions and the triangles of the block.
+    """
+
+    block_index, capsule_indices = task
+    grid = worker_data['grid']
+
+    start, shape, points = grid.get_block_points(block_index)
+    field = evaluate_distance_field(points, worker_data['capsules'][capsule_indices],
+                                    worker_data['spheres'], worker_data['clamp'])
+    return march_tetrahedra(field, start, shape, grid)
+
+
+####################################################################################################
+# @initialize_worker
+####################################################################################################
+def initialize_worker(grid,
+                      capsules,
+                      spheres,
+                      clamp):
+    """Shares the data of the domain with a worker process.
+
+    :param grid:
+        The VoxelGrid.
+    :param capsules:
+        A Cx8 array of capsules.
+    :param spheres:
+        An Sx4 array of spheres.
+    :param clamp:
+        The maximum value of the field.
+    """
+
+    worker_data['grid'] = grid
+    worker_data['capsules'] = capsules
+    worker_data['spheres'] = spheres
+    worker_data['clamp'] = clamp
+
+
+####################################################################################################
+# @assign_capsules_to_blocks
+####################################################################################################
+def assign_capsules_to_blocks(grid,
+                              capsules,
+                              spheres,
+                              margin):
+    """Finds the active blocks of the sparse grid and the capsules that overlap every block.
+
+    :param grid:
+        The VoxelGrid.
+    :param capsules:
+        A Cx8 array of capsules.
+    :param spheres:
+        An Sx4 array of spheres.
+    :param margin:
+        The margin added to the bounding box of every primitive.
+    :return:
+        A dictionary that maps every active block to a list of capsule indices.
+    """
+
+    blocks = dict()
+
+    # The bounding boxes of the capsules
+    radii = numpy.maximum(capsules[:, 3], capsules[:, 7])[:, None] + margin
+    p_min = numpy.minimum(capsules[:, 0:3], capsules[:, 4:7]) - radii
+    p_max = numpy.maximum(capsules[:, 0:3], capsules[:, 4:7]) + radii
+    for i in range(len(capsules)):
+        first, last = grid.get_blocks_in_box(p_min[i], p_max[i])
+        for block in itertools.product(*[range(first[k], last[k] + 1) for k in range(3)]):
+            blocks.setdefault(block, list()).append(i)
+
+    # The spheres are evaluated in every block they overlap
+    for sphere in spheres:
+        first, last = grid.get_blocks_in_box(sphere[:3] - sphere[3] - margin,
+                                             sphere[:3] + sphere[3] + margin)
+        for block in itertools.product(*[range(first[k], last[k] + 1) for k in range(3)]):
+            blocks.setdefault(block, list())
+
+    return blocks
+
+
+####################################################################################################
+# @extract_surface
+####################################################################################################
+def extract_surface(capsules,
+                    spheres,
+                    voxel_size,
+                    block_size=DEFAULT_BLOCK_SIZE,
+                    number_processes=None):
+    """Extracts a watertight surface of the union of a set of tapered capsules and spheres.
+
+    The domain is tiled into blocks, and only the blocks that overlap the primitives are
+    evaluated. The blocks are processed independently, in parallel if requested, and every worker
+    only returns the surface of its block, so the memory is bounded by the size of a block and the
+    size of the surface. Finally, the vertices on the shared faces of the blocks are welded.
+
+    :param capsules:
+        A Cx8 array of capsules, where every capsule is [x0, y0, z0, r0, x1, y1, z1, r1].
+    :param spheres:
+        An Sx4 array of spheres, [x, y, z, r].
+    :param voxel_size:
+        The size of a voxel, which controls the resolution of the surface.
+    :param block_size:
+        The number of voxels along each side of a block.
+    :param number_processes:
+        The number of worker processes, by default the number of cores. Use 1 for serial.
+    :return:
+        An Nx3 array of vertices and an Mx3 array of triangles.
+    """
+
+    capsules = numpy.asarray(capsules, dtype=numpy.float64).reshape(-1, 8)
+    spheres = numpy.asarray(spheres, dtype=numpy.float64).reshape(-1, 4)
+
+    # The field is clamped at a distance that guarantees that all the primitives that may
+    # affect the surface are evaluated at every point close to it
+    margin = 2.0 * voxel_size
+
+    # The domain
+    lower = numpy.concatenate((capsules[:, 0:3] - capsules[:, 3:4],
+                               capsules[:, 4:7] - capsules[:, 7:8],
+                               spheres[:, :3] - spheres[:, 3:4]))
+    upper = numpy.concatenate((capsules[:, 0:3] + capsules[:, 3:4],
+                               capsules[:, 4:7] + capsules[:, 7:8],
+                               spheres[:, :3] + spheres[:, 3:4]))
+    if len(lower) == 0:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int64)
+    grid = VoxelGrid(lower.min(axis=0) - 2 * margin, upper.max(axis=0) + 2 * margin,
+                     voxel_size, block_size)
+
+    # The sparse blocks
+    blocks = assign_capsules_to_blocks(grid, capsules, spheres, margin)
+    tasks = [(block, numpy.array(indices, dtype=numpy.int64))
+             for block, indices in blocks.items()]
+
+    # Process the blocks
+    if number_processes is None:
+        number_processes = multiprocessing.cpu_count()
+    if number_processes > 1 and len(tasks) > 1 and \
+            'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        with context.Pool(processes=number_processes, initializer=initialize_worker,
+                          initargs=(grid, capsules, spheres, margin)) as pool:
+            results = list(pool.imap_unordered(process_block, tasks, chunksize=4))
+    else:
+        initialize_worker(grid, capsules, spheres, margin)
+        results = [process_block(task) for task in tasks]
+
+    # Weld the vertices that are shared between the blocks
+    results = [result for result in results if len(result[0]) > 0]
+    if len(results) == 0:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int64)
+
+    vertex_offsets = numpy.cumsum([0] + [len(result[0]) for result in results[:-1]])
+    keys = numpy.concatenate([result[0] for result in results])
+    positions = numpy.concatenate([result[1] for result in results])
+    triangles = numpy.concatenate([result[2] + offset
+                                   for result, offset in zip(results, vertex_offsets)])
+
+    unique_keys, first, inverse = numpy.unique(keys, return_index=True, return_inverse=True)
+    return remove_degenerate_triangles(positions[first], inverse.ravel()[triangles])
+
+
+####################################################################################################
+# @remove_degenerate_triangles
+####################################################################################################
+def remove_degenerate_triangles(vertices,
+                                triangles):
+    """Removes the triangles that are collapsed by the snapped vertices and the coincident pairs of
+    triangles, and then the vertices that are not used anymore.
+
+    The coincident triangles are created on both sides of a face of the grid whose points all lie
+    exactly on the surface with the inside on both sides, so they are internal and both removed.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        An Mx3 array of triangles.
+    :return:
+        An Nx3 array of vertices and an Mx3 array of triangles.
+    """
+
+    # Collapsed triangles
+    collapsed = (triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2]) | \
+        (triangles[:, 0] == triangles[:, 2])
+    triangles = triangles[~collapsed]
+
+    # Coincident triangles, regardless of their orientation
+    _, inverse, counts = numpy.unique(numpy.sort(triangles, axis=1), axis=0,
+                                      return_inverse=True, return_counts=True)
+    triangles = triangles[counts[inverse.ravel()] == 1]
+
+    # Unused vertices
+    used, triangles = numpy.unique(triangles, return_inverse=True)
+    return vertices[used], triangles.reshape(-1, 3)
+
+
+####################################################################################################
+# @write_surface_to_ply
+####################################################################################################
+def write_surface_to_ply(vertices,
+                         triangles,
+                         file_path):
+    """Writes a surface to a binary .PLY file.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        An Mx3 array of triangles.
+    :param file_path:
+        The path to the output file.
+    """
+
+    header = 'ply\n' \
+             'format binary_little_endian 1.0\n' \
+             'element vertex %d\n' \
+             'property float x\n' \
+             'property float y\n' \
+             'property float z\n' \
+             'element face %d\n' \
+             'property list uchar int vertex_indices\n' \
+             'end_header\n' % (len(vertices), len(triangles))
+
+    faces = numpy.empty(len(triangles), dtype=[('count', 'u1'), ('indices', '<i4', (3,))])
+    faces['count'] = 3
+    faces['indices'] = triangles
+
+    with open(file_path, 'wb') as file_handle:
+        file_handle.write(header.encode('ascii'))
+        file_handle.write(numpy.ascontiguousarray(vertices, dtype='<f4').tobytes())
+        file_handle.write(faces.tobytes())
+
+
+####################################################################################################
+# @write_surface_to_obj
+####################################################################################################
+def write_surface_to_obj(vertices,
+                         triangles,
+                         file_path):
+    """Writes a surface to an .OBJ file.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        An Mx3 array of triangles.
+    :param file_path:
+        The path to the output file.
+    """
+
+    with open(file_path, 'w') as file_handle:
+        numpy.savetxt(file_handle, vertices, fmt='v %.6f %.6f %.6f')
+        numpy.savetxt(file_handle, triangles + 1, fmt='f %d %d %d')
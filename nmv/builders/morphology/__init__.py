@@ -15,10 +15,16 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .dendrogram_builder import *
-from .disconnected_sections_builder import *
-from .disconnected_segments_builder import *
-from .samples_builder import *
-from .connected_sections_builder import *
-from .progressive_builder import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'common',
+    'dendrogram_builder',
+    'disconnected_sections_builder',
+    'disconnected_segments_builder',
+    'samples_builder',
+    'connected_sections_builder',
+    'progressive_builder',
+))
@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Blender imports
-import bpy
-
 # Internal imports
 import nmv.enums
 import nmv.shading
@@ -39,18 +36,10 @@ def create_skeleton_materials_and_illumination(builder):
         A given skeleton builder.
     """
 
-    # Clear all the materials that are already present in the scene
-    for material in bpy.data.materials:
-        if 'soma_skeleton' in material.name or \
-           'axon_skeleton' in material.name or \
-           'basal_dendrites_skeleton' in material.name or \
-           'apical_dendrite_skeleton' in material.name or \
-           'articulation' in material.name or \
-           'gray' in material.name:
-
-            nmv.utilities.disable_std_output()
-            bpy.data.materials.remove(material, do_unlink=True)
-            nmv.utilities.enable_std_output()
+    # Clear the old materials that are not used anymore
+    nmv.utilities.disable_std_output()
+    nmv.shading.remove_unused_materials()
+    nmv.utilities.enable_std_output()
 
     # Soma
     builder.soma_materials = nmv.skeleton.ops.create_skeleton_materials(
@@ -128,22 +117,92 @@ def resample_skeleton_sections(builder):
     if builder.options.morphology.resampling_method == \
             nmv.enums.Skeleton.Resampling.ADAPTIVE_RELAXED:
         nmv.logger.detail('Relaxed Adaptive Resampling')
-        nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively_relaxed])
     elif builder.options.morphology.resampling_method == \
             nmv.enums.Skeleton.Resampling.ADAPTIVE_PACKED:
         nmv.logger.detail('Packed (or Overlapping) Adaptive Resampling')
-        nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.resample_section_adaptively])
     elif builder.options.morphology.resampling_method == \
             nmv.enums.Skeleton.Resampling.FIXED_STEP:
         nmv.logger.detail('Fixed Step Resampling with step of [%f] um' %
                           builder.options.morphology.resampling_step)
-        nmv.skeleton.ops.apply_operation_to_morphology(
-            *[builder.morphology, nmv.skeleton.ops.resample_section_at_fixed_step,
-              builder.options.morphology.resampling_step])
     else:
-        pass
+        simplify_skeleton_sections(builder)
+        return
+
+    # Resample all the sections of the morphology at once
+    nmv.skeleton.ops.resample_morphology_sections(
+        morphology=builder.morphology,
+        resampling_method=builder.options.morphology.resampling_method,
+        sampling_step=builder.options.morphology.resampling_step)
+
+    # Simplify the resampled skeleton
+    simplify_skeleton_sections(builder)
+
+
+####################################################################################################
+# @simplify_skeleton_sections
+####################################################################################################
+def simplify_skeleton_sections(builder):
+    """Simplifies the sections of the morphology skeleton before drawing it, within the positional
+    and radial tolerances given in the morphology options.
+
+    NOTE: The first and last samples of every section are left intact.
+
+    :param builder:
+        A given skeleton builder.
+    """
+
+    if builder.options.morphology.simplification_method == \
+            nmv.enums.Skeleton.Simplification.NONE:
+        return
+
+    nmv.logger.info('Simplifying skeleton')
+    keep = nmv.skeleton.ops.simplify_morphology_sections(
+        morphology=builder.morphology,
+        simplification_method=builder.options.morphology.simplification_method,
+        tolerance=builder.options.morphology.simplification_tolerance,
+        radius_tolerance=builder.options.morphology.simplification_radius_tolerance)
+    if keep is None:
+        return
+
+    number_samples = len(keep)
+    number_kept_samples = int(keep.sum())
+    nmv.logger.detail('Samples reduced from [%d] to [%d] (%2.1f%% removed)' %
+                      (number_samples, number_kept_samples,
+                       100.0 * (number_samples - number_kept_samples) / max(number_samples, 1)))
+
+
+####################################################################################################
+# @get_number_drawn_arbors
+####################################################################################################
+def get_number_drawn_arbors(builder):
+    """Gets the number of the arbors that are drawn by the builder, i.e. the arbors that are not
+    ignored in the morphology options. This number is used to report the progress of the
+    incremental reconstruction.
+
+    :param builder:
+        A given skeleton builder.
+    :return:
+        The number of the drawn arbors.
+    """
+
+    number_arbors = 0
+
+    # Apical dendrites
+    if not builder.options.morphology.ignore_apical_dendrites:
+        if builder.morphology.has_apical_dendrites():
+            number_arbors += len(builder.morphology.apical_dendrites)
+
+    # Axons
+    if not builder.options.morphology.ignore_axons:
+        if builder.morphology.has_axons():
+            number_arbors += len(builder.morphology.axons)
+
+    # Basal dendrites
+    if not builder.options.morphology.ignore_basal_dendrites:
+        if builder.morphology.has_basal_dendrites():
+            number_arbors += len(builder.morphology.basal_dendrites)
+
+    return number_arbors
 
 
 ####################################################################################################
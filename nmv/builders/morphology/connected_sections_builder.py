@@ -152,6 +152,8 @@ class ConnectedSectionsBuilder:
 
         :param bevel_object:
             Bevel object used to extrude the arbors.
+        :return:
+            A generator that yields every arbor after it is drawn.
         """
 
         nmv.logger.info('Reconstructing arbors')
@@ -165,6 +167,9 @@ class ConnectedSectionsBuilder:
                         arbor=arbor, bevel_object=bevel_object, arbor_name=arbor.label,
                         max_branching_order=self.options.morphology.apical_dendrite_branch_order)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
@@ -174,6 +179,9 @@ class ConnectedSectionsBuilder:
                         arbor=arbor, bevel_object=bevel_object, arbor_name=arbor.label,
                         max_branching_order=self.options.morphology.basal_dendrites_branch_order)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Axons
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
@@ -183,6 +191,9 @@ class ConnectedSectionsBuilder:
                         arbor=arbor, bevel_object=bevel_object, arbor_name=arbor.label,
                         max_branching_order=self.options.morphology.axon_branch_order)
 
+                    # The arbor is drawn
+                    yield arbor
+
     ################################################################################################
     # @create_all_arbors_as_single_component
     ################################################################################################
@@ -613,13 +624,15 @@ class ConnectedSectionsBuilder:
         return pdf_file_path
 
     ################################################################################################
-    # @draw_morphology_skeleton
+    # @draw_morphology_skeleton_incrementally
     ################################################################################################
-    def draw_morphology_skeleton(self):
-        """Reconstruct and draw the morphological skeleton.
+    def draw_morphology_skeleton_incrementally(self):
+        """Reconstructs and draws the morphological skeleton arbor by arbor, to advance it in
+        time slices as a main-thread step of a job.
 
         :return
-            A list of all the drawn morphology objects including the soma and arbors.
+            A generator that yields the fraction of the skeleton that is drawn after every arbor,
+            and returns a list of all the drawn morphology objects including the soma and arbors.
         """
 
         nmv.logger.header('Building Skeleton: ConnectedSectionsBuilder')
@@ -651,7 +664,10 @@ class ConnectedSectionsBuilder:
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
         # Create each arbor as a separate component
-        self.create_each_arbor_as_separate_component(bevel_object=bevel_object)
+        number_arbors = nmv.builders.morphology.get_number_drawn_arbors(builder=self)
+        for i, _ in enumerate(self.create_each_arbor_as_separate_component(
+                bevel_object=bevel_object)):
+            yield float(i + 1) / (number_arbors + 1)
 
         # TODO: Add an option to handle this.
         # Create all the arbors as a single component
@@ -665,3 +681,15 @@ class ConnectedSectionsBuilder:
 
         # Return the list of the drawn morphology objects
         return self.morphology_objects
+
+    ################################################################################################
+    # @draw_morphology_skeleton
+    ################################################################################################
+    def draw_morphology_skeleton(self):
+        """Reconstruct and draw the morphological skeleton.
+
+        :return
+            A list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        return nmv.utilities.run_generator(self.draw_morphology_skeleton_incrementally())
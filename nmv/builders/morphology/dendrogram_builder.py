@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Blender imports
-import bpy
-
 # System imports
 import copy
 
@@ -117,18 +114,10 @@ class DendrogramBuilder:
 
         nmv.logger.info('Creating materials')
 
-        # Clear all the materials that are already present in the scene
-        for material in bpy.data.materials:
-            if 'soma_skeleton' in material.name or \
-                    'axon_skeleton' in material.name or \
-                    'basal_dendrites_skeleton' in material.name or \
-                    'apical_dendrite_skeleton' in material.name or \
-                    'articulation' in material.name or \
-                    'gray' in material.name:
-
-                nmv.utilities.disable_std_output()
-                bpy.data.materials.remove(material, do_unlink=True)
-                nmv.utilities.enable_std_output()
+        # Clear the old materials that are not used anymore
+        nmv.utilities.disable_std_output()
+        nmv.shading.remove_unused_materials()
+        nmv.utilities.enable_std_output()
 
         # Apical materials
         if self.morphology.has_apical_dendrites():
@@ -165,38 +154,18 @@ class DendrogramBuilder:
         self.skeleton_materials.extend(soma_materials)
 
     ################################################################################################
-    # @draw_morphology_skeleton
+    # @create_arbors_dendrogram_poly_lines
     ################################################################################################
-    def draw_morphology_skeleton(self):
-        """Reconstruct and draw the morphological skeleton.
-
-        :return
-            A list of all the drawn morphology objects including the soma and arbors.
+    def create_arbors_dendrogram_poly_lines(self,
+                                            skeleton_poly_lines):
+        """Creates the dendrogram poly-lines of each arbor.
+
+        :param skeleton_poly_lines:
+            A list where the created poly-lines are appended.
+        :return:
+            A generator that yields every arbor after its poly-lines are created.
         """
 
-        nmv.logger.header('Building Dendrogram')
-
-        # Create the skeleton materials
-        self.create_single_skeleton_materials_list()
-
-        # Resample the sections of the morphology skeleton
-        nmv.builders.morphology.resample_skeleton_sections(builder=self)
-
-        # Get the maximum radius to make it easy to compute the deltas
-        maximum_radius = nmv.analysis.kernel_maximum_sample_radius(
-            morphology=self.morphology).morphology_result
-
-        # Compute the dendrogram of the morphology
-        if self.options.morphology.dendrogram_type == nmv.enums.Dendrogram.Type.DETAILED:
-            nmv.skeleton.compute_morphology_dendrogram(
-                morphology=self.morphology, delta=maximum_radius * 8)
-        else:
-            nmv.skeleton.compute_morphology_dendrogram(
-                morphology=self.morphology, delta=8)
-
-        # A list of all the skeleton poly-lines
-        skeleton_poly_lines = list()
-
         if not self.options.morphology.ignore_apical_dendrites:
             if self.morphology.has_apical_dendrites():
                 for arbor in self.morphology.apical_dendrites:
@@ -206,6 +175,9 @@ class DendrogramBuilder:
                         max_branching_order=self.options.morphology.apical_dendrite_branch_order,
                         dendrogram_type=self.options.morphology.dendrogram_type)
 
+                    # The poly-lines of the arbor are created
+                    yield arbor
+
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
                 for arbor in self.morphology.axons:
@@ -215,6 +187,9 @@ class DendrogramBuilder:
                         max_branching_order=self.options.morphology.axon_branch_order,
                         dendrogram_type=self.options.morphology.dendrogram_type)
 
+                    # The poly-lines of the arbor are created
+                    yield arbor
+
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
                 for arbor in self.morphology.basal_dendrites:
@@ -224,6 +199,49 @@ class DendrogramBuilder:
                         max_branching_order=self.options.morphology.basal_dendrites_branch_order,
                         dendrogram_type=self.options.morphology.dendrogram_type)
 
+                    # The poly-lines of the arbor are created
+                    yield arbor
+
+    ################################################################################################
+    # @draw_morphology_skeleton_incrementally
+    ################################################################################################
+    def draw_morphology_skeleton_incrementally(self):
+        """Reconstructs and draws the morphological skeleton arbor by arbor, to advance it in
+        time slices as a main-thread step of a job.
+
+        :return
+            A generator that yields the fraction of the skeleton that is drawn after every arbor,
+            and returns a list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        nmv.logger.header('Building Dendrogram')
+
+        # Create the skeleton materials
+        self.create_single_skeleton_materials_list()
+
+        # Resample the sections of the morphology skeleton
+        nmv.builders.morphology.resample_skeleton_sections(builder=self)
+
+        # Get the maximum radius to make it easy to compute the deltas
+        maximum_radius = nmv.analysis.kernel_maximum_sample_radius(
+            morphology=self.morphology).morphology_result
+
+        # Compute the dendrogram of the morphology
+        if self.options.morphology.dendrogram_type == nmv.enums.Dendrogram.Type.DETAILED:
+            nmv.skeleton.compute_morphology_dendrogram(
+                morphology=self.morphology, delta=maximum_radius * 8)
+        else:
+            nmv.skeleton.compute_morphology_dendrogram(
+                morphology=self.morphology, delta=8)
+
+        # A list of all the skeleton poly-lines
+        skeleton_poly_lines = list()
+
+        # Create the poly-lines of each arbor
+        number_arbors = nmv.builders.morphology.get_number_drawn_arbors(builder=self)
+        for i, _ in enumerate(self.create_arbors_dendrogram_poly_lines(skeleton_poly_lines)):
+            yield float(i + 1) / (number_arbors + 1)
+
         # The soma to stems line
         center = nmv.skeleton.add_soma_to_stems_line(
             morphology=self.morphology, poly_lines_data=skeleton_poly_lines,
@@ -248,6 +266,18 @@ class DendrogramBuilder:
         # Return the list of the drawn morphology objects
         return self.morphology_objects
 
+    ################################################################################################
+    # @draw_morphology_skeleton
+    ################################################################################################
+    def draw_morphology_skeleton(self):
+        """Reconstruct and draw the morphological skeleton.
+
+        :return
+            A list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        return nmv.utilities.run_generator(self.draw_morphology_skeleton_incrementally())
+
     ################################################################################################
     # @draw_morphology_skeleton
     ################################################################################################
@@ -26,6 +26,7 @@ import nmv.consts
 import nmv.geometry
 import nmv.scene
 import nmv.shading
+import nmv.utilities
 
 
 ####################################################################################################
@@ -228,6 +229,8 @@ class DisconnectedSegmentsBuilder:
 
          :param bevel_object:
             Bevel object used to interpolate the polylines.
+        :return:
+            A generator that yields every arbor after it is drawn.
         """
 
         # Apical dendrites
@@ -253,6 +256,9 @@ class DisconnectedSegmentsBuilder:
                     # Append it to the morphology objects
                     self.morphology_objects.append(morphology_object)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Axons
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
@@ -275,6 +281,9 @@ class DisconnectedSegmentsBuilder:
                     # Append it to the morphology objects
                     self.morphology_objects.append(morphology_object)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
@@ -297,14 +306,19 @@ class DisconnectedSegmentsBuilder:
                     # Append it to the morphology objects
                     self.morphology_objects.append(morphology_object)
 
+                    # The arbor is drawn
+                    yield arbor
+
     ################################################################################################
-    # @draw_morphology_skeleton
+    # @draw_morphology_skeleton_incrementally
     ################################################################################################
-    def draw_morphology_skeleton(self):
-        """Reconstruct and draw the morphological skeleton.
+    def draw_morphology_skeleton_incrementally(self):
+        """Reconstructs and draws the morphological skeleton arbor by arbor, to advance it in
+        time slices as a main-thread step of a job.
 
         :return
-            A list of all the drawn morphology objects including the soma and arbors.
+            A generator that yields the fraction of the skeleton that is drawn after every arbor,
+            and returns a list of all the drawn morphology objects including the soma and arbors.
         """
 
         nmv.logger.header('Building Skeleton: DisconnectedSegmentsBuilder')
@@ -328,7 +342,9 @@ class DisconnectedSegmentsBuilder:
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
         # Draws each arbor in the morphology as a single object
-        self.draw_each_arbor_as_single_object(bevel_object=bevel_object)
+        number_arbors = nmv.builders.morphology.get_number_drawn_arbors(builder=self)
+        for i, _ in enumerate(self.draw_each_arbor_as_single_object(bevel_object=bevel_object)):
+            yield float(i + 1) / (number_arbors + 1)
 
         # Draw the soma
         nmv.builders.morphology.draw_soma(builder=self)
@@ -338,3 +354,15 @@ class DisconnectedSegmentsBuilder:
 
         # Return the list of the drawn morphology objects
         return self.morphology_objects
+
+    ################################################################################################
+    # @draw_morphology_skeleton
+    ################################################################################################
+    def draw_morphology_skeleton(self):
+        """Reconstruct and draw the morphological skeleton.
+
+        :return
+            A list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        return nmv.utilities.run_generator(self.draw_morphology_skeleton_incrementally())
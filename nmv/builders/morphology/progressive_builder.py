@@ -29,8 +29,8 @@ import nmv.skeleton
 import nmv.consts
 import nmv.geometry
 import nmv.scene
-import nmv.bmeshi
 import nmv.shading
+import nmv.utilities
 import nmv.analysis
 
 
@@ -81,8 +81,9 @@ class ProgressiveBuilder:
         # An aggregate list of all the materials of the skeleton
         self.skeleton_materials = list()
 
-        # A list of all the articulation spheres - to be converted from bmesh to mesh to save time
-        self.articulations_spheres = list()
+        # The centers and the radii of all the articulation spheres, created later as a single mesh
+        self.articulations_centers = list()
+        self.articulations_radii = list()
 
     ################################################################################################
     # @create_single_skeleton_materials_list
@@ -224,33 +225,15 @@ class ProgressiveBuilder:
             Section geometry.
         """
 
-        # Get the section data arranged in a poly-line format
-        section_data = nmv.skeleton.ops.get_section_poly_line(section)
-
-        # Access the last item
-        section_terminal = section_data[-1]
-
-        # Get a Vector(()) for the coordinates of the terminal
-        point = section_terminal[0]
-        point = Vector((point[0], point[1], point[2]))
-
-        # Get terminal radius
-        radius = section_terminal[1]
+        # The terminal sample of the section
+        point = section.samples[-1].point
+        radius = section.samples[-1].radius
 
         # Get the radius for the first samples of the children and use it if it's bigger than the
         # radius of the last sample of the parent terminal.
         for child in section.children:
-
-            # Get the first sample along the child section
-            child_data = nmv.skeleton.ops.get_section_poly_line(child)
-
-            # Verify the radius of the child
-            child_radius = child_data[0][1]
-
-            # If the radius of the child is bigger, then set the radius of the joint to the
-            # radius of the child
-            if child_radius > radius:
-                radius = child_radius
+            if child.samples[0].radius > radius:
+                radius = child.samples[0].radius
 
         # If we scale the morphology, we should account for that in the spheres to
         sphere_radius = radius
@@ -259,12 +242,9 @@ class ProgressiveBuilder:
         elif self.options.morphology.arbors_radii == nmv.enums.Skeleton.Radii.UNIFIED:
             sphere_radius = self.options.morphology.samples_unified_radii_value
 
-        # Create the sphere based on the largest radius
-        section_terminal_sphere = nmv.bmeshi.create_ico_sphere(
-            sphere_radius * 1.025, location=point, subdivisions=3)
-
-        # Add the created bmesh sphere to the list
-        self.articulations_spheres.append(section_terminal_sphere)
+        # Add a sphere based on the largest radius
+        self.articulations_centers.append(tuple(point))
+        self.articulations_radii.append(sphere_radius * 1.025)
 
     ################################################################################################
     # @draw_section_as_disconnected_segments
@@ -291,8 +271,8 @@ class ProgressiveBuilder:
             return
 
         # Draw the root sample as a sphere
-        self.articulations_spheres.append(nmv.bmeshi.create_ico_sphere(
-            root.samples[0].radius * 1.025, location=root.samples[0].point, subdivisions=3))
+        self.articulations_centers.append(tuple(root.samples[0].point))
+        self.articulations_radii.append(root.samples[0].radius * 1.025)
 
         # Increment the branching level
         branching_order += 1
@@ -320,12 +300,14 @@ class ProgressiveBuilder:
         """Links the articulation spheres to the scene.
         """
 
-        joint_bmesh = nmv.bmeshi.join_bmeshes_list(bmeshes_list=self.articulations_spheres)
+        # Nothing to draw
+        if len(self.articulations_centers) == 0:
+            return
 
-        # Link the bmesh spheres to the scene
-        articulations_spheres = \
-            nmv.bmeshi.ops.link_to_new_object_in_scene(
-                joint_bmesh, '%s_articulations' % self.morphology.label)
+        # Stamp a unit ico-sphere at every articulation, all at once
+        articulations_spheres = nmv.geometry.create_ico_spheres_mesh(
+            centers=self.articulations_centers, radii=self.articulations_radii,
+            name='%s_articulations' % self.morphology.label, subdivisions=3)
 
         # Smooth shading
         nmv.mesh.shade_smooth_object(articulations_spheres)
@@ -372,13 +354,16 @@ class ProgressiveBuilder:
         self.link_and_shade_articulation_spheres()
 
     ################################################################################################
-    # @draw_morphology_skeleton
+    # @draw_morphology_skeleton_incrementally
     ################################################################################################
-    def draw_morphology_skeleton(self):
-        """Reconstruct and draw the morphological skeleton.
+    def draw_morphology_skeleton_incrementally(self):
+        """Reconstructs and draws the morphological skeleton branching order by branching
+        order, to advance it in time slices as a main-thread step of a job.
 
         :return
-            A list of all the drawn morphology objects including the soma and arbors.
+            A generator that yields the fraction of the skeleton that is drawn after every
+            branching order, and returns a list of all the drawn morphology objects including the
+            soma and arbors.
         """
 
         nmv.logger.header('Building Skeleton: ProgressiveBuilder')
@@ -435,6 +420,9 @@ class ProgressiveBuilder:
 
                 bpy.context.scene.frame_end = ending_frame
 
+            # Return the control after every branching order
+            yield float(i) / morphology_maximum_branching_order
+
         # For the articulated sections, draw the spheres
         if self.options.morphology.reconstruction_method == \
                 nmv.enums.Skeleton.Method.ARTICULATED_SECTIONS:
@@ -448,3 +436,15 @@ class ProgressiveBuilder:
 
         # Return the list of the drawn morphology objects
         return self.morphology_objects
+
+    ################################################################################################
+    # @draw_morphology_skeleton
+    ################################################################################################
+    def draw_morphology_skeleton(self):
+        """Reconstruct and draw the morphological skeleton.
+
+        :return
+            A list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        return nmv.utilities.run_generator(self.draw_morphology_skeleton_incrementally())
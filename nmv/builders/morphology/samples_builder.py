@@ -25,7 +25,6 @@ import nmv.skeleton
 import nmv.consts
 import nmv.geometry
 import nmv.scene
-import nmv.bmeshi
 import nmv.shading
 import nmv.utilities
 
@@ -37,7 +36,8 @@ class SamplesBuilder:
     """Builds and draws the morphology as a series of samples where each sample is represented by
     a sphere.
 
-    NOTE: We use bmeshes to generate the spheres and then link them to the scene all at once.
+    NOTE: The spheres of every arbor are stamped from a single unit ico-sphere and created as a
+    single mesh all at once.
     """
 
     ################################################################################################
@@ -107,50 +107,42 @@ class SamplesBuilder:
         self.skeleton_materials.extend(self.axons_materials)
 
     ################################################################################################
-    # @draw_section_samples_as_spheres
+    # @get_section_samples_glyphs
     ################################################################################################
-    def draw_section_samples_as_spheres(self,
-                                        section):
-        """Draw the section samples as a set of spheres.
+    @staticmethod
+    def get_section_samples_glyphs(section):
+        """Gets the centers and the radii of the spheres of the samples of a section.
 
         :param section:
             A given section to draw.
         :return:
-            List of spheres of the section.
+            A list of the centers and a list of the radii of the spheres of the section.
         """
 
-        output = list()
-        for sample in section.samples:
-            sphere = nmv.bmeshi.create_ico_sphere(
-                radius=sample.radius, location=sample.point, subdivisions=3)
-            output.append(sphere)
-        return output
+        return [tuple(sample.point) for sample in section.samples], \
+            [sample.radius for sample in section.samples]
 
     ################################################################################################
     # @draw_sections_as_spheres
     ################################################################################################
     def draw_sections_as_spheres(self,
                                  root,
-                                 name,
-                                 material_list=[],
-                                 sphere_objects=[],
+                                 centers,
+                                 radii,
                                  branching_order=0,
                                  max_branching_order=nmv.consts.Math.INFINITY):
-        """Draw the section as a list of spheres.
+        """Collects the spheres of the samples of an arbor, to be drawn later as a single mesh.
 
         :param root:
             Root section of the tree to be drawn.
-        :param name:
-            Prefix for labeling the spheres.
-        :param material_list:
-            A list of materials specific to the type of arbor being drawn.
-        :param sphere_objects:
-            A list of the drawn spheres.
-         :param branching_order:
+        :param centers:
+            A list that collects the centers of the spheres.
+        :param radii:
+            A list that collects the radii of the spheres.
+        :param branching_order:
             Current branching level of the arbor.
         :param max_branching_order:
             The maximum branching level given by the user.
-        :return:
         """
 
         # Ignore the drawing if the root section is None
@@ -164,119 +156,47 @@ class SamplesBuilder:
         if branching_order > max_branching_order:
             return
 
-        # Make sure that the arbor exist
-        if root is not None:
-
-            section_name = '%s_%d' % (name, root.index)
-            drawn_spheres = self.draw_section_samples_as_spheres(root)
-
-            # Add the drawn segments to the 'segments_objects'
-            sphere_objects.extend(drawn_spheres)
+        # Add the spheres of the samples of the section
+        section_centers, section_radii = self.get_section_samples_glyphs(root)
+        centers.extend(section_centers)
+        radii.extend(section_radii)
 
-            # Draw the children sections
-            for child in root.children:
-                self.draw_sections_as_spheres(
-                    root=child,
-                    branching_order=branching_order,
-                    max_branching_order=max_branching_order,
-                    name=name,
-                    material_list=material_list,
-                    sphere_objects=sphere_objects)
-
-    ################################################################################################
-    # @link_and_shade_spheres_as_group
-    ################################################################################################
-    def link_and_shade_spheres_as_group(self,
-                                        sphere_list,
-                                        materials_list,
-                                        prefix):
-        """Links the added sphere to the scene.
-
-        :param sphere_list:
-            A list of sphere to be linked to the scene and shaded with the corresponding materials.
-        :param materials_list:
-            A list of materials to be applied to the spheres after being linked to the scene.
-        :param prefix:
-            Prefix to name each sphere object after linking it to the scene.
-        """
-
-        joint_bmesh = nmv.bmeshi.join_bmeshes_list(bmeshes_list=sphere_list)
-
-        # Link the bmesh spheres to the scene
-        sphere_mesh = nmv.bmeshi.ops.link_to_new_object_in_scene(joint_bmesh, prefix)
-
-        # Smooth shading
-        nmv.mesh.shade_smooth_object(sphere_mesh)
-
-        # Assign the material
-        nmv.shading.set_material_to_object(sphere_mesh, materials_list[0])
-
-        # Append the sphere mesh to the morphology objects
-        self.morphology_objects.append(sphere_mesh)
+        # Draw the children sections
+        for child in root.children:
+            self.draw_sections_as_spheres(
+                root=child,
+                centers=centers,
+                radii=radii,
+                branching_order=branching_order,
+                max_branching_order=max_branching_order)
 
     ################################################################################################
     # @link_and_shade_spheres
     ################################################################################################
     def link_and_shade_spheres(self,
-                               sphere_list,
+                               centers,
+                               radii,
                                materials_list,
                                prefix):
-        """Links the added sphere to the scene.
+        """Creates the spheres of an arbor as a single mesh, links it to the scene and shades it.
 
-        :param sphere_list:
-            A list of sphere to be linked to the scene and shaded with the corresponding materials.
+        :param centers:
+            A list of the centers of the spheres.
+        :param radii:
+            A list of the radii of the spheres.
         :param materials_list:
             A list of materials to be applied to the spheres after being linked to the scene.
         :param prefix:
-            Prefix to name each sphere object after linking it to the scene.
+            The name of the mesh of the spheres.
         """
 
-        # A list that will contain all the objects to be joint in a single mesh for performance
-        joint_objects = list()
-
-        # Iteration objects
-        iteration_objects = list()
-
-        for i, sphere in enumerate(sphere_list):
-
-            # Show progress
-            nmv.utilities.time_line.show_iteration_progress('Sample', i, len(sphere_list))
-
-            name = '%s_%d' % (prefix, i)
-
-            # Link the bmesh spheres to the scene
-            sphere_mesh = nmv.bmeshi.ops.link_to_new_object_in_scene(sphere, name)
-
-            # Add the sphere to the group
-            iteration_objects.append(sphere_mesh)
-
-            # Group every 100 objects into a single group
-            if i % 50 == 0:
-
-                # Join the meshes into a group
-                joint_object = nmv.mesh.join_mesh_objects(
-                    mesh_list=iteration_objects, name='group_%d' % (i % 100))
-
-                # Add to the joint objects list
-                joint_objects.append(joint_object)
-
-                # Clear the iteration objects
-                iteration_objects.clear()
-
-        # Join the meshes into a group, if @iteration_objects has more than one object
-        if len(iteration_objects) > 1:
-            joint_object = nmv.mesh.join_mesh_objects(
-                mesh_list=iteration_objects, name='group_%d' % (i % 100))
-
-            # Add to the joint objects
-            joint_objects.append(joint_object)
-
-        # Done
-        nmv.utilities.time_line.show_iteration_progress(
-            'Sample', len(sphere_list), len(sphere_list), done=True)
+        # Nothing to draw
+        if len(centers) == 0:
+            return
 
-        # Compile the arbor mesh
-        arbor_mesh = nmv.mesh.join_mesh_objects(mesh_list=joint_objects, name=prefix)
+        # Stamp a unit ico-sphere at every sample, all at once
+        arbor_mesh = nmv.geometry.create_ico_spheres_mesh(
+            centers=centers, radii=radii, name=prefix, subdivisions=3)
 
         # Smooth shading
         nmv.mesh.shade_smooth_object(arbor_mesh)
@@ -288,76 +208,98 @@ class SamplesBuilder:
         self.morphology_objects.append(arbor_mesh)
 
     ################################################################################################
-    # @draw_morphology_skeleton
+    # @draw_arbors_as_spheres
     ################################################################################################
-    def draw_morphology_skeleton(self):
-        """Reconstruct and draw the morphological skeleton.
+    def draw_arbors_as_spheres(self):
+        """Draws the samples of each arbor as spheres linked in a single object.
 
-        :return
-            A list of all the drawn morphology objects including the soma and arbors.
+        :return:
+            A generator that yields every arbor after it is drawn.
         """
 
-        nmv.logger.header('Building Skeleton: SamplesBuilder')
-
-        # Create the skeleton materials
-        self.create_single_skeleton_materials_list()
-
-        # Updating radii
-        nmv.skeleton.update_arbors_radii(self.morphology, self.options.morphology)
-
-        # Resample the sections of the morphology skeleton
-        nmv.builders.morphology.resample_skeleton_sections(builder=self)
-
         # Apical dendrite
         nmv.logger.info('Constructing spheres')
         if not self.options.morphology.ignore_apical_dendrites:
             if self.morphology.has_apical_dendrites():
                 for arbor in self.morphology.apical_dendrites:
                     nmv.logger.detail(arbor.label)
-                    apical_dendrite_spheres = list()
+                    centers, radii = list(), list()
                     self.draw_sections_as_spheres(
-                        root=arbor, name=arbor.label,
-                        max_branching_order=self.options.morphology.apical_dendrite_branch_order,
-                        material_list=self.apical_dendrites_materials,
-                        sphere_objects=apical_dendrite_spheres)
+                        root=arbor, centers=centers, radii=radii,
+                        max_branching_order=self.options.morphology.apical_dendrite_branch_order)
 
                     # Link the spheres and shade
-                    self.link_and_shade_spheres(sphere_list=apical_dendrite_spheres,
+                    self.link_and_shade_spheres(centers=centers, radii=radii,
                                                 materials_list=self.apical_dendrites_materials,
                                                 prefix=arbor.label)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Axon
         if not self.options.morphology.ignore_axons:
             if self.morphology.has_axons():
                 for arbor in self.morphology.axons:
                     nmv.logger.detail(arbor.label)
-                    axon_spheres = list()
+                    centers, radii = list(), list()
                     self.draw_sections_as_spheres(
-                        root=arbor, name=arbor.label,
-                        max_branching_order=self.options.morphology.axon_branch_order,
-                        material_list=self.axons_materials, sphere_objects=axon_spheres)
+                        root=arbor, centers=centers, radii=radii,
+                        max_branching_order=self.options.morphology.axon_branch_order)
 
                     # Link the spheres and shade
-                    self.link_and_shade_spheres(sphere_list=axon_spheres,
+                    self.link_and_shade_spheres(centers=centers, radii=radii,
                                                 materials_list=self.axons_materials,
                                                 prefix=arbor.label)
 
+                    # The arbor is drawn
+                    yield arbor
+
         # Basal dendrites
         if not self.options.morphology.ignore_basal_dendrites:
             if self.morphology.has_basal_dendrites():
                 for arbor in self.morphology.basal_dendrites:
                     nmv.logger.detail(arbor.label)
-                    basal_dendrites_spheres = list()
+                    centers, radii = list(), list()
                     self.draw_sections_as_spheres(
-                        root=arbor, name=arbor.label,
-                        max_branching_order=self.options.morphology.basal_dendrites_branch_order,
-                        material_list=self.basal_dendrites_materials,
-                        sphere_objects=basal_dendrites_spheres)
+                        root=arbor, centers=centers, radii=radii,
+                        max_branching_order=self.options.morphology.basal_dendrites_branch_order)
 
                     # Link the spheres and shade
-                    self.link_and_shade_spheres(sphere_list=basal_dendrites_spheres,
+                    self.link_and_shade_spheres(centers=centers, radii=radii,
                                                 materials_list=self.basal_dendrites_materials,
                                                 prefix=arbor.label)
+
+                    # The arbor is drawn
+                    yield arbor
+
+    ################################################################################################
+    # @draw_morphology_skeleton_incrementally
+    ################################################################################################
+    def draw_morphology_skeleton_incrementally(self):
+        """Reconstructs and draws the morphological skeleton arbor by arbor, to advance it in
+        time slices as a main-thread step of a job.
+
+        :return
+            A generator that yields the fraction of the skeleton that is drawn after every arbor,
+            and returns a list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        nmv.logger.header('Building Skeleton: SamplesBuilder')
+
+        # Create the skeleton materials
+        self.create_single_skeleton_materials_list()
+
+        # Updating radii
+        nmv.skeleton.update_arbors_radii(self.morphology, self.options.morphology)
+
+        # Resample the sections of the morphology skeleton
+        nmv.builders.morphology.resample_skeleton_sections(builder=self)
+
+        # Draw the samples of each arbor, and return the control after every arbor
+        number_arbors = nmv.builders.morphology.get_number_drawn_arbors(builder=self)
+        for i, _ in enumerate(self.draw_arbors_as_spheres()):
+            yield float(i + 1) / (number_arbors + 1)
+
         # Draw the soma
         nmv.builders.morphology.draw_soma(builder=self)
 
@@ -366,3 +308,15 @@ class SamplesBuilder:
 
         # Return the list of the drawn morphology objects
         return self.morphology_objects
+
+    ################################################################################################
+    # @draw_morphology_skeleton
+    ################################################################################################
+    def draw_morphology_skeleton(self):
+        """Reconstruct and draw the morphological skeleton.
+
+        :return
+            A list of all the drawn morphology objects including the soma and arbors.
+        """
+
+        return nmv.utilities.run_generator(self.draw_morphology_skeleton_incrementally())
@@ -15,6 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma_hybrid_builder import *
-from .soma_meta_builder import *
-from .soma_softbody_builder import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'soma_hybrid_builder',
+    'soma_meta_builder',
+    'soma_softbody_builder',
+))
@@ -423,12 +423,8 @@ class SomaSoftBodyBuilder:
         nmv.bmeshi.ops.rotate_face_from_center_to_point(
             connection_circle, 0, connection_rotation_target)
 
-        # Select the vertices that intersect with the extrusion sphere to prepare the face for
-        # the extrusion process
-        faces_indices = nmv.bmeshi.ops.get_indices_of_faces_intersecting_sphere(
-            initial_soma_sphere, connection_point_on_soma, extrusion_radius)
-
-        # Get the actual intersecting faces via their indices (this is for smoothing)
+        # Get the faces that intersect with the extrusion sphere to prepare the face for the
+        # extrusion process (this is for smoothing)
         faces_indices = nmv.bmeshi.ops.get_indices_of_faces_fully_intersecting_sphere(
             initial_soma_sphere, connection_point_on_soma, extrusion_radius)
 
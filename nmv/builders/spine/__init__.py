@@ -16,7 +16,13 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .spine_builder import *
-from .random_spine_builder import *
-from .circuit_spine_builder import *
-from .random_spine_builder_from_morphology import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'spine_builder',
+    'random_spine_builder',
+    'circuit_spine_builder',
+    'random_spine_builder_from_morphology',
+))
@@ -15,20 +15,26 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_consts import *
-from .skeleton_consts import *
-from .paths_consts import *
-from .color_consts import *
-from .dendrogram_consts import *
-from .drawing_consts import *
-from .image_consts import *
-from .math_consts import *
-from .meshing_consts import *
-from .messages_consts import *
-from .morphology_consts import *
-from .mtypes_consts import *
-from .simulation_consts import *
-from .soft_body_consts import *
-from .spines_consts import *
-from .suffix_consts import *
-from .meta_ball_consts import *
\ No newline at end of file
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'analysis_consts',
+    'skeleton_consts',
+    'paths_consts',
+    'color_consts',
+    'dendrogram_consts',
+    'drawing_consts',
+    'image_consts',
+    'math_consts',
+    'meshing_consts',
+    'messages_consts',
+    'morphology_consts',
+    'mtypes_consts',
+    'simulation_consts',
+    'soft_body_consts',
+    'spines_consts',
+    'suffix_consts',
+    'meta_ball_consts',
+))
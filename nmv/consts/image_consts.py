@@ -55,3 +55,12 @@ class Image:
 
     # Default samples per pixels
     DEFAULT_SPP = 8
+
+    # Number of frames in a 360 sequence
+    SEQUENCE_360_FRAMES = 360
+
+    # Number of frames in a progressive sequence
+    SEQUENCE_PROGRESSIVE_FRAMES = 100
+
+    # Frame rate of the movies that are assembled from the sequence frames
+    SEQUENCE_FRAME_RATE = 30
@@ -38,6 +38,9 @@ class Meshing:
     # Default sides of a bevel object
     BEVEL_OBJECT_SIDES = 16
 
+    # The smallest voxel size (in microns) derived automatically by the voxelization builder
+    MIN_VOXEL_SIZE = 0.1
+
     # The number of spines per micron to be added to the neuron
     NUMBER_SPINES_PER_MICRON = 10
 
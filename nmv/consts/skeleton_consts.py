@@ -137,3 +137,6 @@ class Skeleton:
 
     # The identifier of a section of type apical dendrite in an H5 file
     H5_APICAL_DENDRITE_SECTION_TYPE = 4
+
+    # The extension of the compact binary morphology files of NeuroMorphoVis
+    NMVB_EXTENSION = '.nmvb'
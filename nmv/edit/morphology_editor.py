@@ -16,10 +16,13 @@
 ####################################################################################################
 
 # System imports
-import copy
+import numpy
+
+# Blender imports
+from mathutils import Vector
 
 # Internal modules
-import nmv.bmeshi
+import nmv
 import nmv.mesh
 import nmv.scene
 
@@ -57,6 +60,18 @@ class MorphologyEditor:
         # A skeleton mesh that reflects the morphology
         self.skeleton_mesh = None
 
+        # The samples that are mapped to every vertex of the skeleton mesh
+        self.vertex_samples = None
+
+        # The coordinates of the vertices of the skeleton mesh after the last update, Vx3 array
+        self.coordinates = None
+
+        # The edges of the skeleton mesh, Ex2 array
+        self.edges = None
+
+        # A list of the edits, (vertex indices, old coordinates, new coordinates)
+        self.undo_log = list()
+
     ################################################################################################
     # @update_samples_indices_per_morphology_of_section
     ################################################################################################
@@ -153,97 +168,67 @@ class MorphologyEditor:
                     arbor, samples_global_morphology_index)
 
     ################################################################################################
-    # @add_soma_to_arbor_segment
+    # @get_morphology_roots
     ################################################################################################
-    def add_soma_to_arbor_segment(self,
-                                  arbor):
-        """Adds a little segment from the soma center (or the origin) to the first sample along the
-        arbor.
-        :param arbor:
-            A given arbor of the morphology.
-        """
-
-        nmv.bmeshi.ops.extrude_vertex_towards_point(self.skeleton_mesh, 0, arbor.samples[0].point)
+    def get_morphology_roots(self):
+        """Gets the roots of all the arbors of the morphology.
 
-    ################################################################################################
-    # @extrude_section
-    ################################################################################################
-    def extrude_section(self,
-                        section):
-        """Extrudes the section along its samples starting from the first one to the last one.
-        :param section:
-            A given section to extrude a mesh around it.
-        """
-
-        # Iterate over all the samples and extrude vertex by vertex
-        for i in range(len(section.samples) - 1):
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                self.skeleton_mesh, section.samples[i].morphology_idx, section.samples[i + 1].point)
-
-    ################################################################################################
-    # @extrude_branch
-    ################################################################################################
-    def extrude_branch(self,
-                       root):
-        """Extrude the given branch section by section recursively.
-        :param root:
-            The root of a given section.
-        """
-
-        # Extrude the section
-        self.extrude_section(root)
-
-        # Extrude the children sections recursively
-        for child in root.children:
-            self.extrude_branch(child)
-
-    ################################################################################################
-    # @extrude_arbor
-    ################################################################################################
-    def extrude_arbor(self,
-                      arbor):
-        """Creates a skeleton mesh of the given arbor recursively.
-        :param arbor:
-            A given arbor.
         :return:
-            A reference to the created skeleton mesh object.
+            A list of the root sections.
         """
 
-        # First of all, add an auxiliary segment from the soma center to the first sample
-        self.add_soma_to_arbor_segment(arbor=arbor)
-
-        # Extrude branch mesh
-        self.extrude_branch(root=arbor)
+        roots = list()
+        if self.morphology.has_apical_dendrites():
+            roots.extend(self.morphology.apical_dendrites)
+        if self.morphology.has_basal_dendrites():
+            roots.extend(self.morphology.basal_dendrites)
+        if self.morphology.has_axons():
+            roots.extend(self.morphology.axons)
+        return roots
 
     ################################################################################################
-    # @extrude_morphology_skeleton
+    # @build_vertex_map
     ################################################################################################
-    def extrude_morphology_skeleton(self):
-        """Creates the skeleton of the morphology as a single object such that we can control it
-        and update it during the repair operation.
-        NOTE: All the created objects are linked after their creation to the morphology itself.
-        """
+    def build_vertex_map(self):
+        """Builds the map between the samples of the morphology and the vertices of the skeleton
+        mesh, in addition to the coordinates and edges of the skeleton.
 
-        # Header
-        nmv.logger.header('Creating Morphology Skeleton for Repair')
-
-        # Apical dendrite
-        if self.morphology.has_apical_dendrites():
-            for arbor in self.morphology.apical_dendrites:
-                nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+        The vertex of a sample is its morphology_idx, where the first vertex is the soma at the
+        origin. The first sample of a child section shares the vertex of the last sample of its
+        parent, so a vertex may be mapped to more than one sample.
+        """
 
-        # Basal dendrites
-        if self.morphology.has_basal_dendrites():
-            for arbor in self.morphology.basal_dendrites:
-                nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+        # Updating the samples indices along the entire morphology
+        self.update_samples_indices_per_morphology_of_morphology()
 
-        # Axons
-        if self.morphology.has_axons():
-            for arbor in self.morphology.axons:
-                nmv.logger.detail(arbor.label)
-                self.extrude_arbor(arbor=arbor)
+        # Collect the samples and the edges of all the sections
+        vertex_samples = [list()]
+        edges = list()
+        for root in self.get_morphology_roots():
+
+            # A little segment from the soma center (or the origin) to the first sample
+            edges.append((0, root.samples[0].morphology_idx))
+
+            sections = [root]
+            while len(sections) > 0:
+                section = sections.pop()
+                for i, sample in enumerate(section.samples):
+                    while len(vertex_samples) <= sample.morphology_idx:
+                        vertex_samples.append(list())
+                    vertex_samples[sample.morphology_idx].append(sample)
+                    if i > 0:
+                        edges.append((section.samples[i - 1].morphology_idx,
+                                      sample.morphology_idx))
+                sections.extend(section.children)
+
+        self.vertex_samples = vertex_samples
+        self.edges = numpy.array(edges, dtype=numpy.int64).reshape(-1, 2)
+
+        # The coordinates of every vertex from its first sample
+        self.coordinates = numpy.zeros((len(vertex_samples), 3), dtype=numpy.float64)
+        for i in range(1, len(vertex_samples)):
+            if len(vertex_samples[i]) > 0:
+                self.coordinates[i] = vertex_samples[i][0].point[:]
 
     ################################################################################################
     # @sketch_morphology_skeleton
@@ -251,82 +236,133 @@ class MorphologyEditor:
     def sketch_morphology_skeleton(self):
         """Sketches the skeleton of the morphology as a single object such that we can control it
         and update it during the repair operation.
+
+        The sample to vertex map is built once, and the skeleton mesh is then created in bulk from
+        the current coordinates whenever the skeleton is sketched again.
         NOTE: The created object is linked after their creation to the morphology itself.
         """
 
-        # Updating the samples indices along the entire morphology
-        self.update_samples_indices_per_morphology_of_morphology()
+        # Build the map once
+        if self.vertex_samples is None:
+            self.build_vertex_map()
 
-        # Create an initial proxy mesh at the origin (reflecting the soma)
-        # self.skeleton_mesh = nmv.geometry.create_vertex_mesh(name=self.morphology.label)
-        self.skeleton_mesh = nmv.bmeshi.create_vertex()
-
-        # Extrude the morphology skeleton
-        self.extrude_morphology_skeleton()
-
-        # Convert the skeleton to a mesh
-        self.skeleton_mesh = nmv.bmeshi.convert_bmesh_to_mesh(self.skeleton_mesh, 'Skeleton')
+        # Create the skeleton mesh in a single step
+        self.skeleton_mesh = nmv.mesh.create_mesh_from_arrays(
+            vertices=self.coordinates, edges=self.edges, name='Skeleton')
 
         # Select the skeleton mesh for the edit
         nmv.scene.set_active_object(self.skeleton_mesh)
 
     ################################################################################################
-    # @update_section_coordinates
+    # @get_skeleton_coordinates
     ################################################################################################
-    def update_section_coordinates(self,
-                                   section):
-        """Updates the coordinates of the samples of the given section from the skeleton object.
-        :param section:
-            A given section to update the positions of its samples.
-        """
+    def get_skeleton_coordinates(self):
+        """Gets the coordinates of all the vertices of the skeleton mesh in a single call.
 
-        # On all the samples of the section
-        for i in range(0, len(section.samples)):
+        :return:
+            A Vx3 array of coordinates.
+        """
 
-            # Update the position
-            section.samples[i].point = copy.deepcopy(nmv.mesh.ops.get_vertex_position(
-                mesh_object=self.skeleton_mesh, vertex_index=section.samples[i].morphology_idx))
+        coordinates = numpy.empty(len(self.skeleton_mesh.data.vertices) * 3, dtype=numpy.float64)
+        self.skeleton_mesh.data.vertices.foreach_get('co', coordinates)
+        return coordinates.reshape(-1, 3)
 
     ################################################################################################
-    # @update_arbor_coordinates
+    # @set_samples_coordinates
     ################################################################################################
-    def update_arbor_coordinates(self,
-                                 root):
-        """"Updates the coordinates of the samples of the given arbor from the skeleton object.
-        :param root:
-            The root of a given section.
+    def set_samples_coordinates(self,
+                                vertices,
+                                coordinates):
+        """Sets the coordinates of the samples that are mapped to the given vertices.
+
+        :param vertices:
+            An array of vertex indices.
+        :param coordinates:
+            An array of the new coordinates of the vertices.
         """
 
-        # Update for the current section
-        self.update_section_coordinates(root)
-
-        # Update the children sections recursively
-        for child in root.children:
-            self.update_arbor_coordinates(child)
+        for vertex, coordinate in zip(vertices.tolist(), coordinates.tolist()):
+            for sample in self.vertex_samples[vertex]:
+                sample.point = Vector(coordinate)
+        self.coordinates[vertices] = coordinates
 
     ################################################################################################
-    # @update_arbor_coordinates
+    # @update_skeleton_coordinates
     ################################################################################################
     def update_skeleton_coordinates(self):
         """Update the coordinates of the skeleton.
+
+        Only the samples of the vertices that were moved in the skeleton mesh are updated, and the
+        edit is recorded in the undo log.
+
+        :return:
+            The number of updated vertices.
         """
 
         # Header
         nmv.logger.header('Updating Morphology Skeleton Coordinates')
 
-        # Apical dendrite
-        if self.morphology.has_apical_dendrites():
-            for arbor in self.morphology.apical_dendrites:
-                nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+        # Find the moved vertices
+        coordinates = self.get_skeleton_coordinates()
+        if len(coordinates) != len(self.coordinates):
+            nmv.logger.error('The topology of the skeleton has changed, cannot update')
+            return 0
 
-        if self.morphology.has_basal_dendrites():
-            for arbor in self.morphology.basal_dendrites:
-                nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+        # The mesh stores the coordinates in single precision, so compare at the same precision
+        reference = self.coordinates.astype(numpy.float32).astype(numpy.float64)
+        moved = numpy.nonzero(numpy.any(coordinates != reference, axis=1))[0]
 
-        # Create the apical dendrite mesh
-        if self.morphology.has_axons():
-            for arbor in self.morphology.axons:
-                nmv.logger.info(arbor.label)
-                self.update_arbor_coordinates(root=arbor)
+        # The soma vertex is not mapped to any sample
+        moved = moved[moved > 0]
+        if len(moved) == 0:
+            nmv.logger.info('No samples were moved')
+            return 0
+
+        # Record the edit
+        self.undo_log.append((moved.astype(numpy.int32), self.coordinates[moved].copy(),
+                              coordinates[moved].copy()))
+
+        # Patch the moved samples only
+        self.set_samples_coordinates(moved, coordinates[moved])
+        nmv.logger.info('Updated [%d] samples' % len(moved))
+        return len(moved)
+
+    ################################################################################################
+    # @undo_last_edit
+    ################################################################################################
+    def undo_last_edit(self):
+        """Reverts the last recorded edit of the samples coordinates, and the skeleton mesh if it
+        is still in the scene.
+
+        :return:
+            True if an edit was reverted, otherwise False.
+        """
+
+        if len(self.undo_log) == 0:
+            return False
+
+        vertices, old_coordinates, new_coordinates = self.undo_log.pop()
+        self.set_samples_coordinates(vertices, old_coordinates)
+
+        # Update the skeleton mesh
+        try:
+            if self.skeleton_mesh is not None:
+                self.skeleton_mesh.data.vertices.foreach_set(
+                    'co', self.coordinates.astype(numpy.float32).ravel())
+                self.skeleton_mesh.data.update()
+        except ReferenceError:
+            self.skeleton_mesh = None
+
+        return True
+
+    ################################################################################################
+    # @get_number_edits
+    ################################################################################################
+    def get_number_edits(self):
+        """Gets the number of the edits in the undo log.
+
+        :return:
+            The number of edits that can be reverted.
+        """
+
+        return len(self.undo_log)
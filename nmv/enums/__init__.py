@@ -15,14 +15,20 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_enums import *
-from .camera_enums import *
-from .color_enums import *
-from .dendrogram_enums import *
-from .image_enums import *
-from .input_enums import *
-from .meshing_enums import *
-from .rendering_enums import *
-from .shading_enums import *
-from .skeleton_enums import *
-from .soma_enums import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'analysis_enums',
+    'camera_enums',
+    'color_enums',
+    'dendrogram_enums',
+    'image_enums',
+    'input_enums',
+    'meshing_enums',
+    'rendering_enums',
+    'shading_enums',
+    'skeleton_enums',
+    'soma_enums',
+))
@@ -48,6 +48,9 @@ class Meshing:
         # Meta objects-based meshing
         META_OBJECTS = 'MESHING_TECHNIQUE_META_OBJECTS'
 
+        # Voxelization of the skeleton on a sparse grid
+        VOXELIZATION = 'MESHING_TECHNIQUE_VOXELIZATION'
+
         ############################################################################################
         # @__init__
         ############################################################################################
@@ -76,6 +79,10 @@ class Meshing:
             elif argument == 'meta-balls':
                 return Meshing.Technique.META_OBJECTS
 
+            # Voxelization
+            elif argument == 'voxelization':
+                return Meshing.Technique.VOXELIZATION
+
             # By default use piecewise-watertight
             else:
                 return Meshing.Technique.PIECEWISE_WATERTIGHT
@@ -109,3 +109,43 @@ class Rendering:
             # By default render at the specified resolution
             else:
                 return Rendering.Resolution.FIXED
+
+    ################################################################################################
+    # @Scheduler
+    ################################################################################################
+    class Scheduler:
+        """Frame scheduling options for rendering sequences
+        """
+
+        # Render all the frames in the current process
+        SERIAL = 'RENDER_SEQUENCE_SERIAL'
+
+        # Split the frames among multiple local Blender processes
+        LOCAL = 'RENDER_SEQUENCE_LOCAL'
+
+        # Split the frames among the tasks of a SLURM array job
+        SLURM = 'RENDER_SEQUENCE_SLURM'
+
+        ############################################################################################
+        # @__init__
+        ############################################################################################
+        def __init__(self):
+            pass
+
+        ############################################################################################
+        # @get_enum
+        ############################################################################################
+        @staticmethod
+        def get_enum(argument):
+
+            # Local worker processes
+            if argument == 'local':
+                return Rendering.Scheduler.LOCAL
+
+            # SLURM array tasks
+            elif argument == 'slurm':
+                return Rendering.Scheduler.SLURM
+
+            # By default, render the frames in the same process
+            else:
+                return Rendering.Scheduler.SERIAL
@@ -287,6 +287,46 @@ class Skeleton:
             else:
                 return Skeleton.Resampling.NONE
 
+    ################################################################################################
+    # @Simplification
+    ################################################################################################
+    class Simplification:
+        """Simplification method
+        """
+
+        # Do not simplify the sections
+        NONE = 'SIMPLIFICATION_NONE'
+
+        # Radius-aware Douglas-Peucker simplification
+        DOUGLAS_PEUCKER = 'SIMPLIFICATION_DOUGLAS_PEUCKER'
+
+        # Radius-aware Visvalingam-Whyatt simplification with bounded errors
+        VISVALINGAM = 'SIMPLIFICATION_VISVALINGAM'
+
+        ############################################################################################
+        # @__init__
+        ############################################################################################
+        def __init__(self):
+            pass
+
+        ############################################################################################
+        # @get_enum
+        ############################################################################################
+        @staticmethod
+        def get_enum(argument):
+
+            # Douglas-Peucker
+            if argument == 'douglas-peucker':
+                return Skeleton.Simplification.DOUGLAS_PEUCKER
+
+            # Visvalingam
+            elif argument == 'visvalingam':
+                return Skeleton.Simplification.VISVALINGAM
+
+            # By default none
+            else:
+                return Skeleton.Simplification.NONE
+
     ################################################################################################
     # @Radii
     ################################################################################################
@@ -15,7 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .ops import *
-from .readers import *
-from .writers import *
-from .logger import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'ops',
+    'readers',
+    'writers',
+    'logger',
+))
@@ -0,0 +1,238 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+import numpy
+
+
+# The signature and the version of the binary morphology format
+BINARY_MORPHOLOGY_MAGIC = b'NMVMORPH'
+BINARY_MORPHOLOGY_VERSION = 1
+
+# The tables of the file are aligned to this number of bytes
+BINARY_MORPHOLOGY_ALIGNMENT = 64
+
+# The fixed header of the file. All the values are little-endian.
+# The header is followed by the following tables, at the offsets given in the header:
+#   sections: int32 [S, 4], the first sample, the number of samples, the type and the index of
+#             every section, where the sections of every arbor are stored in depth-first order
+#   parents:  int32 [S], the row of the parent of every section, or -1 for the arbor roots
+#   points:   float32 [N, 3], the points of all the samples
+#   radii:    float32 [N], the radii of all the samples
+#   soma:     float32 [P + Q, 3], the profile points of the soma followed by the profile points
+#             of the soma on the arbors
+BINARY_MORPHOLOGY_HEADER = numpy.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('number_sections', '<u4'),
+    ('number_samples', '<u4'),
+    ('number_soma_profile_points', '<u4'),
+    ('number_arbors_profile_points', '<u4'),
+    ('number_stems', '<u4'),
+    ('original_center', '<f8', (3,)),
+    ('soma_centroid', '<f8', (3,)),
+    ('soma_mean_radius', '<f8'),
+    ('sections_offset', '<u8'),
+    ('parents_offset', '<u8'),
+    ('points_offset', '<u8'),
+    ('radii_offset', '<u8'),
+    ('soma_offset', '<u8'),
+    ('file_size', '<u8')])
+
+
+####################################################################################################
+# @align_binary_morphology_offset
+####################################################################################################
+def align_binary_morphology_offset(offset):
+    """Aligns an offset in a binary morphology file to the alignment of the tables.
+
+    :param offset:
+        A given offset in bytes.
+    :return:
+        The smallest aligned offset that is not less than the given one.
+    """
+
+    alignment = BINARY_MORPHOLOGY_ALIGNMENT
+    return (offset + alignment - 1) // alignment * alignment
+
+
+####################################################################################################
+# @compute_binary_morphology_layout
+####################################################################################################
+def compute_binary_morphology_layout(number_sections,
+                                     number_samples,
+                                     number_soma_points):
+    """Computes the offsets of the tables of a binary morphology file.
+
+    :param number_sections:
+        The number of sections.
+    :param number_samples:
+        The number of samples.
+    :param number_soma_points:
+        The number of profile points of the soma, including those on the arbors.
+    :return:
+        A dictionary of the offsets of the tables and the size of the file, in bytes.
+    """
+
+    layout = dict()
+    offset = align_binary_morphology_offset(BINARY_MORPHOLOGY_HEADER.itemsize)
+    for name, size in (('sections_offset', number_sections * 4 * 4),
+                       ('parents_offset', number_sections * 4),
+                       ('points_offset', number_samples * 3 * 4),
+                       ('radii_offset', number_samples * 4),
+                       ('soma_offset', number_soma_points * 3 * 4)):
+        layout[name] = offset
+        offset = align_binary_morphology_offset(offset + size)
+    layout['file_size'] = offset
+    return layout
+
+
+####################################################################################################
+# @write_binary_morphology
+####################################################################################################
+def write_binary_morphology(file_path,
+                            sections,
+                            parents,
+                            points,
+                            radii,
+                            soma_points,
+                            number_arbors_profile_points=0,
+                            original_center=None,
+                            soma_centroid=None,
+                            soma_mean_radius=-1.0,
+                            number_stems=0):
+    """Writes the arrays of a morphology to a binary morphology file.
+
+    The file is written to a temporary file first and then moved to its final path, so a file
+    that is being converted is never read partially.
+
+    :param file_path:
+        The path of the output file.
+    :param sections:
+        An Sx4 array of the first sample, the number of samples, the type and the index of every
+        section.
+    :param parents:
+        An array of the rows of the parents of the S sections, -1 for the roots.
+    :param points:
+        An Nx3 array of the points of the samples.
+    :param radii:
+        An array of the N radii of the samples.
+    :param soma_points:
+        A Px3 array of the profile points of the soma followed by its profile points on the arbors.
+    :param number_arbors_profile_points:
+        The number of the profile points of the soma on the arbors, at the end of soma_points.
+    :param original_center:
+        The original center of the morphology, or None if unknown.
+    :param soma_centroid:
+        The centroid of the soma, or None if the morphology has no soma.
+    :param soma_mean_radius:
+        The mean radius of the soma, or a negative value if the morphology has no soma.
+    :param number_stems:
+        The number of stems as reported in the morphology file.
+    """
+
+    sections = numpy.ascontiguousarray(sections, dtype='<i4').reshape(-1, 4)
+    parents = numpy.ascontiguousarray(parents, dtype='<i4').reshape(-1)
+    points = numpy.ascontiguousarray(points, dtype='<f4').reshape(-1, 3)
+    radii = numpy.ascontiguousarray(radii, dtype='<f4').reshape(-1)
+    soma_points = numpy.ascontiguousarray(soma_points, dtype='<f4').reshape(-1, 3)
+
+    layout = compute_binary_morphology_layout(
+        len(sections), len(points), len(soma_points))
+
+    header = numpy.zeros(1, dtype=BINARY_MORPHOLOGY_HEADER)
+    header['magic'] = BINARY_MORPHOLOGY_MAGIC
+    header['version'] = BINARY_MORPHOLOGY_VERSION
+    header['number_sections'] = len(sections)
+    header['number_samples'] = len(points)
+    header['number_soma_profile_points'] = len(soma_points) - number_arbors_profile_points
+    header['number_arbors_profile_points'] = number_arbors_profile_points
+    header['number_stems'] = number_stems
+    header['original_center'] = numpy.nan if original_center is None else original_center
+    header['soma_centroid'] = 0.0 if soma_centroid is None else soma_centroid
+    header['soma_mean_radius'] = soma_mean_radius
+    for name, offset in layout.items():
+        header[name] = offset
+
+    temporary_file_path = '%s.%d.tmp' % (file_path, os.getpid())
+    with open(temporary_file_path, 'wb') as binary_file:
+        binary_file.write(header.tobytes())
+        for name, array in (('sections_offset', sections),
+                            ('parents_offset', parents),
+                            ('points_offset', points),
+                            ('radii_offset', radii),
+                            ('soma_offset', soma_points)):
+            binary_file.seek(layout[name])
+            binary_file.write(array.tobytes())
+        binary_file.truncate(layout['file_size'])
+    os.replace(temporary_file_path, file_path)
+
+
+####################################################################################################
+# @map_binary_morphology
+####################################################################################################
+def map_binary_morphology(file_path,
+                          mode='r'):
+    """Maps a binary morphology file into memory.
+
+    The returned tables are views of the mapped file, so nothing is read until the tables are
+    accessed, and only the accessed pages are read.
+
+    :param file_path:
+        The path of the binary morphology file.
+    :param mode:
+        The mode of numpy.memmap, 'r' for read-only tables or 'c' for copy-on-write tables.
+    :return:
+        A dictionary of the header values and the 'sections', 'parents', 'points', 'radii',
+        'soma_profile_points' and 'arbors_profile_points' tables.
+    :raises ValueError:
+        If the file is not a valid binary morphology file.
+    """
+
+    data = numpy.memmap(file_path, dtype=numpy.uint8, mode=mode)
+    if len(data) < BINARY_MORPHOLOGY_HEADER.itemsize:
+        raise ValueError('[%s] is too small to be a binary morphology file' % file_path)
+
+    header = data[:BINARY_MORPHOLOGY_HEADER.itemsize].view(BINARY_MORPHOLOGY_HEADER)[0]
+    if header['magic'] != BINARY_MORPHOLOGY_MAGIC:
+        raise ValueError('[%s] is not a binary morphology file' % file_path)
+    if header['version'] != BINARY_MORPHOLOGY_VERSION:
+        raise ValueError('[%s] has an unsupported version [%d]' %
+                         (file_path, int(header['version'])))
+    if int(header['file_size']) != len(data):
+        raise ValueError('[%s] is truncated' % file_path)
+
+    morphology = {name: header[name].tolist() for name in BINARY_MORPHOLOGY_HEADER.names}
+
+    # Create the tables as views of the mapped file
+    number_sections = morphology['number_sections']
+    number_samples = morphology['number_samples']
+    number_soma_points = morphology['number_soma_profile_points']
+    number_arbors_points = morphology['number_arbors_profile_points']
+    for name, offset, dtype, shape in (
+            ('sections', 'sections_offset', '<i4', (number_sections, 4)),
+            ('parents', 'parents_offset', '<i4', (number_sections,)),
+            ('points', 'points_offset', '<f4', (number_samples, 3)),
+            ('radii', 'radii_offset', '<f4', (number_samples,)),
+            ('soma_points', 'soma_offset', '<f4', (number_soma_points + number_arbors_points, 3))):
+        morphology[name] = numpy.ndarray(
+            shape=shape, dtype=dtype, buffer=data, offset=morphology[offset])
+
+    morphology['soma_profile_points'] = morphology['soma_points'][:number_soma_points]
+    morphology['arbors_profile_points'] = morphology['soma_points'][number_soma_points:]
+    return morphology
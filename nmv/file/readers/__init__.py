@@ -15,9 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh import *
-from .morphology import *
-from .nuclei import *
-from .spines import *
-from .configs import *
-from .tetrahedal import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'mesh',
+    'morphology',
+    'nuclei',
+    'spines',
+    'configs',
+    'tetrahedal',
+))
@@ -0,0 +1,408 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+
+# External imports
+import numpy
+
+
+# PLY scalar types and their numpy equivalents
+PLY_TYPES = {'char': 'i1', 'int8': 'i1',
+             'uchar': 'u1', 'uint8': 'u1',
+             'short': 'i2', 'int16': 'i2',
+             'ushort': 'u2', 'uint16': 'u2',
+             'int': 'i4', 'int32': 'i4',
+             'uint': 'u4', 'uint32': 'u4',
+             'float': 'f4', 'float32': 'f4',
+             'double': 'f8', 'float64': 'f8'}
+
+
+####################################################################################################
+# @MeshArrays
+####################################################################################################
+class MeshArrays:
+    """The geometry of a mesh stored in flat arrays that can be passed between processes and
+    loaded into Blender in bulk.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 vertices,
+                 face_indices,
+                 face_sizes):
+        """Constructor
+
+        :param vertices:
+            An Nx3 float32 array of the vertices of the mesh.
+        :param face_indices:
+            A flat int32 array of the vertex indices of all the faces of the mesh.
+        :param face_sizes:
+            An int32 array with the number of vertices of every face.
+        """
+
+        # Vertices
+        self.vertices = vertices
+
+        # Faces
+        self.face_indices = face_indices
+        self.face_sizes = face_sizes
+
+    ################################################################################################
+    # @get_triangles
+    ################################################################################################
+    def get_triangles(self):
+        """Triangulates the faces of the mesh as fans around their first vertices.
+
+        :return:
+            A Tx3 int64 array of triangles.
+        """
+
+        face_sizes = self.face_sizes.astype(numpy.int64)
+        face_starts = numpy.cumsum(face_sizes) - face_sizes
+
+        # A face with K vertices is split into K - 2 triangles (first, i, i + 1)
+        number_fans = numpy.maximum(face_sizes - 2, 0)
+        fan_starts = numpy.repeat(face_starts, number_fans)
+        fan_offsets = numpy.arange(int(number_fans.sum())) - \
+            numpy.repeat(numpy.cumsum(number_fans) - number_fans, number_fans)
+        indices = self.face_indices.astype(numpy.int64)
+        return numpy.stack((indices[fan_starts],
+                            indices[fan_starts + fan_offsets + 1],
+                            indices[fan_starts + fan_offsets + 2]), axis=1)
+
+
+####################################################################################################
+# @read_ply_header
+####################################################################################################
+def read_ply_header(file_handle):
+    """Reads the header of a .PLY file.
+
+    :param file_handle:
+        A handle to the file opened in binary mode.
+    :return:
+        The format of the file and a list of its elements, where each element is a list of
+        [name, count, properties] and each property is [name, type, list count type or None].
+    """
+
+    if file_handle.readline().strip() != b'ply':
+        raise ValueError('Not a PLY file')
+
+    file_format = None
+    elements = list()
+    while True:
+        line = file_handle.readline()
+        if not line:
+            raise ValueError('Incomplete PLY header')
+        tokens = line.decode('ascii').split()
+        if not tokens or tokens[0] in ('comment', 'obj_info'):
+            continue
+        elif tokens[0] == 'format':
+            file_format = tokens[1]
+        elif tokens[0] == 'element':
+            elements.append([tokens[1], int(tokens[2]), list()])
+        elif tokens[0] == 'property':
+            if tokens[1] == 'list':
+                elements[-1][2].append([tokens[4], PLY_TYPES[tokens[3]], PLY_TYPES[tokens[2]]])
+            else:
+                elements[-1][2].append([tokens[2], PLY_TYPES[tokens[1]], None])
+        elif tokens[0] == 'end_header':
+            break
+
+    return file_format, elements
+
+
+####################################################################################################
+# @read_binary_ply_faces
+####################################################################################################
+def read_binary_ply_faces(data,
+                          offset,
+                          count,
+                          size_type,
+                          index_type):
+    """Reads the faces block of a binary .PLY file.
+
+    If all the faces have the same number of vertices, which is the case for the meshes generated
+    by NeuroMorphoVis, the whole block is read with a single structured view, otherwise the faces
+    are read one by one.
+
+    :param data:
+        The binary contents of the file.
+    :param offset:
+        The offset of the faces block.
+    :param count:
+        The number of faces.
+    :param size_type:
+        The numpy type of the face size.
+    :param index_type:
+        The numpy type of the vertex indices.
+    :return:
+        The flat array of the face indices, the array of the face sizes and the offset of the
+        end of the block.
+    """
+
+    if count == 0:
+        return numpy.zeros(0, dtype=numpy.int32), numpy.zeros(0, dtype=numpy.int32), offset
+
+    # Assume that all the faces have the size of the first one
+    face_size = int(numpy.frombuffer(data, dtype=size_type, count=1, offset=offset)[0])
+    dtype = numpy.dtype([('size', size_type), ('indices', index_type, (face_size,))])
+    if offset + count * dtype.itemsize <= len(data):
+        faces = numpy.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        if numpy.all(faces['size'] == face_size):
+            return (faces['indices'].astype(numpy.int32).ravel(),
+                    numpy.full(count, face_size, dtype=numpy.int32),
+                    offset + count * dtype.itemsize)
+
+    # Mixed face sizes
+    size_dtype = numpy.dtype(size_type)
+    index_dtype = numpy.dtype(index_type)
+    face_indices = list()
+    face_sizes = numpy.empty(count, dtype=numpy.int32)
+    for i in range(count):
+        face_size = int(numpy.frombuffer(data, dtype=size_dtype, count=1, offset=offset)[0])
+        offset += size_dtype.itemsize
+        face_indices.append(numpy.frombuffer(data, dtype=index_dtype, count=face_size,
+                                             offset=offset))
+        offset += face_size * index_dtype.itemsize
+        face_sizes[i] = face_size
+
+    return numpy.concatenate(face_indices).astype(numpy.int32), face_sizes, offset
+
+
+####################################################################################################
+# @read_ply_mesh_arrays
+####################################################################################################
+def read_ply_mesh_arrays(file_path):
+    """Reads a .PLY file, either ascii or binary, into flat arrays.
+
+    :param file_path:
+        The path to the .PLY file.
+    :return:
+        A MeshArrays object.
+    """
+
+    with open(file_path, 'rb') as file_handle:
+        file_format, elements = read_ply_header(file_handle)
+        data = file_handle.read()
+
+    vertices = numpy.zeros((0, 3), dtype=numpy.float32)
+    face_indices = numpy.zeros(0, dtype=numpy.int32)
+    face_sizes = numpy.zeros(0, dtype=numpy.int32)
+
+    # ASCII files
+    if file_format == 'ascii':
+        lines = data.decode('ascii').splitlines()
+        lines = [line for line in lines if line.strip()]
+        line_index = 0
+        for name, count, properties in elements:
+            block = lines[line_index:line_index + count]
+            line_index += count
+            if name == 'vertex':
+                names = [p[0] for p in properties]
+                values = numpy.array(' '.join(block).split(), dtype=numpy.float64)
+                values = values.reshape(count, len(properties))
+                vertices = values[:, [names.index('x'), names.index('y'), names.index('z')]]
+            elif name == 'face' and count > 0:
+                rows = [row.split() for row in block]
+                face_sizes = numpy.array([int(row[0]) for row in rows], dtype=numpy.int32)
+                face_indices = numpy.array(
+                    [index for row, size in zip(rows, face_sizes) for index in row[1:size + 1]],
+                    dtype=numpy.int32)
+
+    # Binary files
+    else:
+        byte_order = '<' if file_format == 'binary_little_endian' else '>'
+        offset = 0
+        for name, count, properties in elements:
+
+            # Scalar elements are read with a single structured view
+            if all(p[2] is None for p in properties):
+                dtype = numpy.dtype([(p[0], byte_order + p[1]) for p in properties])
+                values = numpy.frombuffer(data, dtype=dtype, count=count, offset=offset)
+                offset += count * dtype.itemsize
+                if name == 'vertex':
+                    vertices = numpy.column_stack((values['x'], values['y'], values['z']))
+
+            # The faces element, with a single list property
+            elif name == 'face' and len(properties) == 1:
+                face_indices, face_sizes, offset = read_binary_ply_faces(
+                    data, offset, count,
+                    byte_order + properties[0][2], byte_order + properties[0][1])
+
+            else:
+                raise ValueError('Unsupported PLY element [%s] in [%s]' % (name, file_path))
+
+    return MeshArrays(numpy.ascontiguousarray(vertices, dtype=numpy.float32),
+                      face_indices, face_sizes)
+
+
+####################################################################################################
+# @read_obj_mesh_arrays
+####################################################################################################
+def read_obj_mesh_arrays(file_path):
+    """Reads the vertices and the faces of an .OBJ file into flat arrays.
+
+    :param file_path:
+        The path to the .OBJ file.
+    :return:
+        A MeshArrays object.
+    """
+
+    vertex_lines = list()
+    face_rows = list()
+    with open(file_path, 'r') as file_handle:
+        for line in file_handle:
+            if line.startswith('v '):
+                vertex_lines.append(line[2:])
+            elif line.startswith('f '):
+                face_rows.append([token.split('/')[0] for token in line[2:].split()])
+
+    # Only the first three components of every vertex are used
+    vertices = numpy.array(' '.join(
+        ' '.join(line.split()[:3]) for line in vertex_lines).split(), dtype=numpy.float32)
+    vertices = vertices.reshape(-1, 3)
+
+    # OBJ indices are one-based, and negative indices are relative to the end of the list
+    face_sizes = numpy.array([len(row) for row in face_rows], dtype=numpy.int32)
+    face_indices = numpy.array([index for row in face_rows for index in row], dtype=numpy.int64)
+    face_indices = numpy.where(face_indices < 0, face_indices + len(vertices), face_indices - 1)
+
+    return MeshArrays(vertices, face_indices.astype(numpy.int32), face_sizes)
+
+
+####################################################################################################
+# @read_mesh_arrays
+####################################################################################################
+def read_mesh_arrays(file_path):
+    """Reads a .PLY or an .OBJ file into flat arrays, without Blender.
+
+    :param file_path:
+        The path to the mesh file.
+    :return:
+        A MeshArrays object.
+    """
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.ply':
+        return read_ply_mesh_arrays(file_path)
+    elif extension == '.obj':
+        return read_obj_mesh_arrays(file_path)
+    raise ValueError('Unsupported file format [%s]' % extension)
+
+
+####################################################################################################
+# @read_ply_vertices
+####################################################################################################
+def read_ply_vertices(file_path):
+    """Reads only the vertices of a .PLY file, without reading its faces.
+
+    The vertices are read directly after the header. If the vertices are preceded by an element
+    with a list property, whose size is not known from the header, the whole file is read.
+
+    :param file_path:
+        The path to the .PLY file.
+    :return:
+        An Nx3 float32 array of the vertices.
+    """
+
+    with open(file_path, 'rb') as file_handle:
+        file_format, elements = read_ply_header(file_handle)
+
+        # ASCII files, every entry of an element is on a single line
+        if file_format == 'ascii':
+            skipped_lines = 0
+            for name, count, properties in elements:
+                if name != 'vertex':
+                    skipped_lines += count
+                    continue
+                names = [p[0] for p in properties]
+                block = list()
+                for line in file_handle:
+                    if not line.strip():
+                        continue
+                    if skipped_lines > 0:
+                        skipped_lines -= 1
+                        continue
+                    block.append(line.decode('ascii'))
+                    if len(block) == count:
+                        break
+                values = numpy.array(' '.join(block).split(), dtype=numpy.float64)
+                values = values.reshape(count, len(properties))
+                vertices = values[:, [names.index('x'), names.index('y'), names.index('z')]]
+                return numpy.ascontiguousarray(vertices, dtype=numpy.float32)
+            return numpy.zeros((0, 3), dtype=numpy.float32)
+
+        # Binary files, skip the scalar elements that precede the vertices
+        byte_order = '<' if file_format == 'binary_little_endian' else '>'
+        for name, count, properties in elements:
+            if any(p[2] is not None for p in properties):
+                break
+            dtype = numpy.dtype([(p[0], byte_order + p[1]) for p in properties])
+            if name != 'vertex':
+                file_handle.seek(count * dtype.itemsize, os.SEEK_CUR)
+                continue
+            values = numpy.frombuffer(file_handle.read(count * dtype.itemsize),
+                                      dtype=dtype, count=count)
+            return numpy.ascontiguousarray(
+                numpy.column_stack((values['x'], values['y'], values['z'])), dtype=numpy.float32)
+
+    return read_ply_mesh_arrays(file_path).vertices
+
+
+####################################################################################################
+# @read_obj_vertices
+####################################################################################################
+def read_obj_vertices(file_path):
+    """Reads only the vertices of an .OBJ file, without parsing its faces.
+
+    :param file_path:
+        The path to the .OBJ file.
+    :return:
+        An Nx3 float32 array of the vertices.
+    """
+
+    with open(file_path, 'r') as file_handle:
+        vertex_lines = [' '.join(line.split()[1:4])
+                        for line in file_handle if line.startswith('v ')]
+
+    vertices = numpy.array(' '.join(vertex_lines).split(), dtype=numpy.float32)
+    return vertices.reshape(-1, 3)
+
+
+####################################################################################################
+# @read_mesh_vertices
+####################################################################################################
+def read_mesh_vertices(file_path):
+    """Reads only the vertices of a .PLY or an .OBJ file, for example to compute its bounds
+    before deciding whether the whole mesh is needed.
+
+    :param file_path:
+        The path to the mesh file.
+    :return:
+        An Nx3 float32 array of the vertices.
+    """
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.ply':
+        return read_ply_vertices(file_path)
+    elif extension == '.obj':
+        return read_obj_vertices(file_path)
+    raise ValueError('Unsupported file format [%s]' % extension)
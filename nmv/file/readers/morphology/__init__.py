@@ -15,7 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .h5_reader import *
-from .swc_reader import *
-from .bbp_reader import *
-from .morphology_reader import *
\ No newline at end of file
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'h5_reader',
+    'swc_reader',
+    'circuit_session',
+    'bbp_reader',
+    'nmvb_reader',
+    'morphology_reader',
+))
@@ -23,6 +23,7 @@ from mathutils import Vector, Matrix
 
 # Internal imports
 import nmv.consts
+import nmv.file
 import nmv.skeleton
 
 
@@ -56,19 +57,13 @@ class BBPReader:
             A list of GIDs composing the target.
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the session of the circuit, the circuit is opened only once
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
         # Loading the GIDs of the sample target within the circuit
-        gids = circuit.cells.ids(target)
+        gids = session.get_gids_from_target(target)
 
         # Return a list of all the GIDs
         return gids
@@ -89,16 +84,16 @@ class BBPReader:
             A reference to a BBP morphology structure
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the session of the circuit, the circuit is opened only once
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
+        # Only BluePy circuits can build BBP morphology structures
+        circuit = session.get_circuit()
+        if circuit is None:
+            print('ERROR: The circuit [%s] is not a BluePy circuit' % blue_config)
+            return None
 
         # Get the morphology from its GID
         bbp_morphology = circuit.morph.get(int(gid), True)
@@ -122,20 +117,14 @@ class BBPReader:
             A reference to a BBP morphology structure
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the session of the circuit, the circuit is opened only once
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
         # Get the morphology file path from its GID
         # We must ensure that the GID is integer, that's why the cast is there
-        h5_morphology_path = circuit.morph.get_filepath(int(gid))
+        h5_morphology_path = session.get_morphology_paths([int(gid)])[0]
 
         # Use the H5 morphology loader to load this file
         # Don't center the morphology, as it is assumed to be cleared and reviewed by the team
@@ -164,19 +153,13 @@ class BBPReader:
             A reference to the BBP neuron
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the session of the circuit, the circuit is opened only once
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
         # Get a reference to the neuron where you can access its data later
-        bbp_neuron = circuit.cells.get(gid)
+        bbp_neuron = session.get_cell(int(gid))
 
         # Return a reference to the BBP neuron
         return bbp_neuron
@@ -197,11 +180,13 @@ class BBPReader:
             Cartesian coordinates of the position of the neuron (soma position)
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
+        # Get the session of the circuit
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
+            return None
 
         # Return the position of the neuron
-        return Vector((neuron['x'], neuron['y'], neuron['z']))
+        return Vector(session.get_positions([int(gid)])[0].tolist())
 
     ################################################################################################
     # @get_neuron_orientation_from_gid
@@ -219,15 +204,17 @@ class BBPReader:
             The orientation of the neuron.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
+        # Get the session of the circuit
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
+            return None
 
         # Return the orientation of he neuron
-        o = neuron['orientation']
+        o = session.get_orientations([int(gid)])[0]
         o0 = Vector((o[0][0], o[0][1], o[0][2]))
         o1 = Vector((o[1][0], o[1][1], o[1][2]))
         o2 = Vector((o[2][0], o[2][1], o[2][2]))
-        return Matrix(o0, o1, o2)
+        return Matrix((o0, o1, o2))
 
     ################################################################################################
     # @get_neuron_mtype_name_from_gid
@@ -245,11 +232,13 @@ class BBPReader:
             Neuron morphological type name.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
+        # Get the session of the circuit
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
+            return None
 
         # Return the mtype name
-        return neuron['mtype']
+        return str(session.get_mtypes([int(gid)])[0])
 
     ################################################################################################
     # @get_neuron_morphology_label_from_gid
@@ -267,11 +256,13 @@ class BBPReader:
             Neuron morphology label.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
+        # Get the session of the circuit
+        session = nmv.file.get_circuit_session(blue_config)
+        if session is None:
+            return None
 
         # Return morphology label
-        return neuron['morphology']
+        return str(session.get_morphology_labels([int(gid)])[0])
 
     ################################################################################################
     # @get_section_from_id
@@ -0,0 +1,648 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+
+import numpy
+
+
+####################################################################################################
+# @CircuitBackend
+####################################################################################################
+class CircuitBackend:
+    """The interface of the backends that provide the cell properties of a circuit to a
+    CircuitSession.
+
+    A backend returns all the cell properties of the circuit in a single call as columnar arrays,
+    and the session takes care of the caching and the batched queries.
+    """
+
+    ################################################################################################
+    # @get_cell_properties
+    ################################################################################################
+    def get_cell_properties(self):
+        """Gets the properties of all the cells in the circuit.
+
+        :return:
+            A dictionary of columns, where 'gid' is an array of N integers, 'position' is an Nx3
+            array, 'orientation' is an Nx3x3 array and 'mtype' and 'morphology' are arrays of N
+            strings.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_target_gids
+    ################################################################################################
+    def get_target_gids(self,
+                        target):
+        """Gets the GIDs of a given target in the circuit.
+
+        :param target:
+            The name of the target.
+        :return:
+            An array of the GIDs composing the target.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_morphology_paths
+    ################################################################################################
+    def get_morphology_paths(self,
+                             gids):
+        """Gets the paths to the morphology files of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            A list of the paths to the morphology files, in the same order of the GIDs.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_circuit
+    ################################################################################################
+    def get_circuit(self):
+        """Gets the native circuit object of the backend, if any.
+
+        :return:
+            A reference to the native circuit object, or None if the backend has no one.
+        """
+
+        return None
+
+
+####################################################################################################
+# @BluePyCircuitBackend
+####################################################################################################
+class BluePyCircuitBackend(CircuitBackend):
+    """A backend that reads the circuit with BluePy, the circuit is opened only once.
+    """
+
+    # The properties that are loaded from the circuit in bulk
+    CELL_PROPERTIES = ['x', 'y', 'z', 'orientation', 'mtype', 'morphology']
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 blue_config):
+        """Constructor
+
+        :param blue_config:
+            A given BBP circuit configuration file.
+        """
+
+        # Raises an ImportError if BluePy is not installed
+        from bluepy.v2 import Circuit
+
+        # Open the circuit once
+        self.circuit = Circuit(blue_config)
+
+    ################################################################################################
+    # @get_cell_properties
+    ################################################################################################
+    def get_cell_properties(self):
+        """Gets the properties of all the cells in the circuit in a single query.
+
+        :return:
+            A dictionary of columns, see CircuitBackend.get_cell_properties.
+        """
+
+        # A data frame indexed by the GIDs
+        cells = self.circuit.cells.get(properties=self.CELL_PROPERTIES)
+
+        return {'gid': cells.index.values.astype(numpy.int64),
+                'position': cells[['x', 'y', 'z']].values.astype(numpy.float64),
+                'orientation': numpy.array(
+                    [numpy.asarray(o, dtype=numpy.float64) for o in cells['orientation'].values],
+                    dtype=numpy.float64).reshape(-1, 3, 3),
+                'mtype': cells['mtype'].values.astype(str),
+                'morphology': cells['morphology'].values.astype(str)}
+
+    ################################################################################################
+    # @get_target_gids
+    ################################################################################################
+    def get_target_gids(self,
+                        target):
+        """Gets the GIDs of a given target in the circuit.
+
+        :param target:
+            The name of the target.
+        :return:
+            An array of the GIDs composing the target.
+        """
+
+        return numpy.asarray(self.circuit.cells.ids(target), dtype=numpy.int64)
+
+    ################################################################################################
+    # @get_morphology_paths
+    ################################################################################################
+    def get_morphology_paths(self,
+                             gids):
+        """Gets the paths to the morphology files of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            A list of the paths to the morphology files, in the same order of the GIDs.
+        """
+
+        return [self.circuit.morph.get_filepath(int(gid)) for gid in gids]
+
+    ################################################################################################
+    # @get_circuit
+    ################################################################################################
+    def get_circuit(self):
+        """Gets the BluePy circuit.
+
+        :return:
+            A reference to the BluePy circuit.
+        """
+
+        return self.circuit
+
+
+####################################################################################################
+# @OfflineCircuitBackend
+####################################################################################################
+class OfflineCircuitBackend(CircuitBackend):
+    """A backend that reads the circuit from an offline .npz snapshot, see
+    write_offline_circuit. It does not need BluePy, and it is used for testing and for running on
+    machines that have no access to the circuit.
+    """
+
+    # The prefix of the names of the target arrays in the snapshot
+    TARGET_PREFIX = 'target_'
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 snapshot_file):
+        """Constructor
+
+        :param snapshot_file:
+            A given .npz snapshot of the circuit.
+        """
+
+        # The directory of the snapshot, to resolve the relative morphology paths
+        self.directory = os.path.dirname(os.path.abspath(snapshot_file))
+
+        # Load the whole snapshot once
+        with numpy.load(snapshot_file, allow_pickle=False) as snapshot:
+            self.arrays = {key: snapshot[key] for key in snapshot.files}
+
+        # Verify that the snapshot has all the cell properties
+        for key in ('gid', 'position', 'orientation', 'mtype', 'morphology'):
+            if key not in self.arrays:
+                raise ValueError('The circuit snapshot [%s] has no [%s] array' %
+                                 (snapshot_file, key))
+
+    ################################################################################################
+    # @get_cell_properties
+    ################################################################################################
+    def get_cell_properties(self):
+        """Gets the properties of all the cells in the snapshot.
+
+        :return:
+            A dictionary of columns, see CircuitBackend.get_cell_properties.
+        """
+
+        return {'gid': self.arrays['gid'].astype(numpy.int64),
+                'position': self.arrays['position'].astype(numpy.float64).reshape(-1, 3),
+                'orientation': self.arrays['orientation'].astype(numpy.float64).reshape(-1, 3, 3),
+                'mtype': self.arrays['mtype'].astype(str),
+                'morphology': self.arrays['morphology'].astype(str)}
+
+    ################################################################################################
+    # @get_target_gids
+    ################################################################################################
+    def get_target_gids(self,
+                        target):
+        """Gets the GIDs of a given target in the snapshot.
+
+        :param target:
+            The name of the target.
+        :return:
+            An array of the GIDs composing the target.
+        """
+
+        key = self.TARGET_PREFIX + target
+        if key not in self.arrays:
+            raise KeyError('The target [%s] is not in the circuit snapshot' % target)
+        return self.arrays[key].astype(numpy.int64)
+
+    ################################################################################################
+    # @get_morphology_paths
+    ################################################################################################
+    def get_morphology_paths(self,
+                             gids):
+        """Gets the paths to the morphology files of a given list of GIDs.
+
+        The paths are stored in the snapshot either explicitly in a 'morphology_path' array, or
+        implicitly as a 'morphology_directory' where the morphologies are named after their
+        labels with an .h5 extension. Relative paths are resolved with respect to the snapshot.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            A list of the paths to the morphology files, in the same order of the GIDs.
+        """
+
+        all_gids = self.arrays['gid'].astype(numpy.int64)
+        order = numpy.argsort(all_gids, kind='stable')
+        rows = order[numpy.searchsorted(all_gids, gids, sorter=order)]
+
+        if 'morphology_path' in self.arrays:
+            paths = self.arrays['morphology_path'].astype(str)[rows]
+        else:
+            directory = str(self.arrays['morphology_directory']) \
+                if 'morphology_directory' in self.arrays else '.'
+            paths = ['%s/%s.h5' % (directory, label)
+                     for label in self.arrays['morphology'].astype(str)[rows]]
+
+        return [str(path) if os.path.isabs(path) else os.path.join(self.directory, str(path))
+                for path in paths]
+
+
+####################################################################################################
+# @CircuitSession
+####################################################################################################
+class CircuitSession:
+    """A session on a circuit that opens the circuit once and caches the properties of its cells
+    as columnar arrays to answer batched queries for many GIDs at once.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 backend):
+        """Constructor
+
+        :param backend:
+            The backend that provides the cell properties, a CircuitBackend.
+        """
+
+        # The backend
+        self.backend = backend
+
+        # The columns of the cell properties, loaded on the first query
+        self.columns = None
+
+        # The sorting order of the GIDs, used to map the GIDs to the rows of the columns
+        self.gids_order = None
+        self.sorted_gids = None
+
+        # Cached target GIDs and morphology paths
+        self.targets = dict()
+        self.morphology_paths = dict()
+
+    ################################################################################################
+    # @load_columns
+    ################################################################################################
+    def load_columns(self):
+        """Loads the cell properties from the backend, only once.
+        """
+
+        if self.columns is not None:
+            return
+
+        self.columns = self.backend.get_cell_properties()
+        self.gids_order = numpy.argsort(self.columns['gid'], kind='stable')
+        self.sorted_gids = self.columns['gid'][self.gids_order]
+
+    ################################################################################################
+    # @get_rows
+    ################################################################################################
+    def get_rows(self,
+                 gids):
+        """Gets the rows of a given list of GIDs in the columns of the cell properties.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An array of the rows of the GIDs.
+        """
+
+        self.load_columns()
+
+        gids = numpy.atleast_1d(numpy.asarray(gids, dtype=numpy.int64))
+        indices = numpy.searchsorted(self.sorted_gids, gids)
+        indices = numpy.minimum(indices, len(self.sorted_gids) - 1)
+
+        # Verify that all the GIDs are in the circuit
+        missing = self.sorted_gids[indices] != gids if len(self.sorted_gids) > 0 else \
+            numpy.ones(len(gids), dtype=bool)
+        if numpy.any(missing):
+            raise KeyError('The GIDs %s are not in the circuit' % gids[missing].tolist())
+
+        return self.gids_order[indices]
+
+    ################################################################################################
+    # @get_gids
+    ################################################################################################
+    def get_gids(self):
+        """Gets all the GIDs of the circuit.
+
+        :return:
+            An array of all the GIDs in the circuit.
+        """
+
+        self.load_columns()
+        return self.columns['gid']
+
+    ################################################################################################
+    # @get_gids_from_target
+    ################################################################################################
+    def get_gids_from_target(self,
+                             target):
+        """Gets the GIDs of a given target in the circuit.
+
+        :param target:
+            The name of the target.
+        :return:
+            An array of the GIDs composing the target.
+        """
+
+        if target not in self.targets:
+            self.targets[target] = self.backend.get_target_gids(target)
+        return self.targets[target]
+
+    ################################################################################################
+    # @get_positions
+    ################################################################################################
+    def get_positions(self,
+                      gids):
+        """Gets the positions of the somata of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An Nx3 array of the positions.
+        """
+
+        rows = self.get_rows(gids)
+        return self.columns['position'][rows]
+
+    ################################################################################################
+    # @get_orientations
+    ################################################################################################
+    def get_orientations(self,
+                         gids):
+        """Gets the orientations of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An Nx3x3 array of the rotation matrices.
+        """
+
+        rows = self.get_rows(gids)
+        return self.columns['orientation'][rows]
+
+    ################################################################################################
+    # @get_mtypes
+    ################################################################################################
+    def get_mtypes(self,
+                   gids):
+        """Gets the morphological types of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An array of the mtype names.
+        """
+
+        rows = self.get_rows(gids)
+        return self.columns['mtype'][rows]
+
+    ################################################################################################
+    # @get_morphology_labels
+    ################################################################################################
+    def get_morphology_labels(self,
+                              gids):
+        """Gets the morphology labels of a given list of GIDs.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An array of the morphology labels.
+        """
+
+        rows = self.get_rows(gids)
+        return self.columns['morphology'][rows]
+
+    ################################################################################################
+    # @get_morphology_paths
+    ################################################################################################
+    def get_morphology_paths(self,
+                             gids):
+        """Gets the paths to the morphology files of a given list of GIDs.
+
+        Only the paths that are not cached are requested from the backend, in a single batch.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            A list of the paths to the morphology files, in the same order of the GIDs.
+        """
+
+        gids = [int(gid) for gid in numpy.atleast_1d(gids)]
+
+        missing = [gid for gid in dict.fromkeys(gids) if gid not in self.morphology_paths]
+        if len(missing) > 0:
+            self.get_rows(missing)
+            self.morphology_paths.update(zip(missing, self.backend.get_morphology_paths(missing)))
+
+        return [self.morphology_paths[gid] for gid in gids]
+
+    ################################################################################################
+    # @get_transformation_matrices
+    ################################################################################################
+    def get_transformation_matrices(self,
+                                    gids):
+        """Gets the matrices that transform the local coordinates of a given list of neurons to
+        the global coordinates of the circuit.
+
+        :param gids:
+            A list of neuron GIDs.
+        :return:
+            An Nx4x4 array of the transformation matrices.
+        """
+
+        rows = self.get_rows(gids)
+
+        matrices = numpy.zeros((len(rows), 4, 4), dtype=numpy.float64)
+        matrices[:, :3, :3] = self.columns['orientation'][rows]
+        matrices[:, :3, 3] = self.columns['position'][rows]
+        matrices[:, 3, 3] = 1.0
+        return matrices
+
+    ################################################################################################
+    # @get_cell
+    ################################################################################################
+    def get_cell(self,
+                 gid):
+        """Gets the properties of a single cell, with the same keys of a BluePy cell.
+
+        :param gid:
+            A given neuron GID.
+        :return:
+            A dictionary of the cell properties.
+        """
+
+        row = self.get_rows([gid])[0]
+        position = self.columns['position'][row]
+
+        return {'x': position[0], 'y': position[1], 'z': position[2],
+                'orientation': self.columns['orientation'][row],
+                'mtype': str(self.columns['mtype'][row]),
+                'morphology': str(self.columns['morphology'][row])}
+
+    ################################################################################################
+    # @get_circuit
+    ################################################################################################
+    def get_circuit(self):
+        """Gets the native circuit object of the backend, if any.
+
+        :return:
+            A reference to the native circuit object, or None if the backend has no one.
+        """
+
+        return self.backend.get_circuit()
+
+
+# The open sessions, indexed by the circuit configurations
+circuit_sessions = dict()
+
+
+####################################################################################################
+# @create_circuit_backend
+####################################################################################################
+def create_circuit_backend(blue_config):
+    """Creates the backend of a given circuit configuration.
+
+    Offline .npz snapshots are read with OfflineCircuitBackend, and the other configurations are
+    read with BluePy.
+
+    :param blue_config:
+        A given BBP circuit configuration file, or an offline .npz snapshot.
+    :return:
+        A reference to the backend.
+    """
+
+    if str(blue_config).endswith('.npz'):
+        return OfflineCircuitBackend(blue_config)
+    return BluePyCircuitBackend(blue_config)
+
+
+####################################################################################################
+# @get_circuit_session
+####################################################################################################
+def get_circuit_session(blue_config):
+    """Gets the session of a given circuit, the session is created only on the first call.
+
+    :param blue_config:
+        A given BBP circuit configuration file, or an offline .npz snapshot.
+    :return:
+        A reference to the CircuitSession, or None if the circuit cannot be opened.
+    """
+
+    key = os.path.abspath(blue_config)
+    if key not in circuit_sessions:
+
+        try:
+            backend = create_circuit_backend(blue_config)
+        except ImportError:
+            print('ERROR: Cannot import [BluePy], please install it')
+            return None
+
+        circuit_sessions[key] = CircuitSession(backend)
+
+    return circuit_sessions[key]
+
+
+####################################################################################################
+# @register_circuit_session
+####################################################################################################
+def register_circuit_session(blue_config,
+                             backend):
+    """Registers a session with a custom backend for a given circuit configuration.
+
+    :param blue_config:
+        A given circuit configuration, used as a key to retrieve the session.
+    :param backend:
+        The backend of the session, a CircuitBackend.
+    :return:
+        A reference to the registered CircuitSession.
+    """
+
+    circuit_sessions[os.path.abspath(blue_config)] = CircuitSession(backend)
+    return circuit_sessions[os.path.abspath(blue_config)]
+
+
+####################################################################################################
+# @close_circuit_sessions
+####################################################################################################
+def close_circuit_sessions():
+    """Closes all the open sessions to release the cached cell properties.
+    """
+
+    circuit_sessions.clear()
+
+
+####################################################################################################
+# @write_offline_circuit
+####################################################################################################
+def write_offline_circuit(session,
+                          snapshot_file,
+                          targets=None,
+                          gids=None):
+    """Writes an offline .npz snapshot of a circuit that can be read by OfflineCircuitBackend.
+
+    :param session:
+        An open session of the circuit, a CircuitSession.
+    :param snapshot_file:
+        The path to the output .npz file.
+    :param targets:
+        A list of target names to be included in the snapshot.
+    :param gids:
+        A list of GIDs to be included in the snapshot, by default all the cells of the circuit.
+    """
+
+    if gids is None:
+        gids = session.get_gids()
+    gids = numpy.asarray(gids, dtype=numpy.int64)
+    rows = session.get_rows(gids)
+
+    arrays = {'gid': gids,
+              'position': session.columns['position'][rows],
+              'orientation': session.columns['orientation'][rows],
+              'mtype': session.columns['mtype'][rows],
+              'morphology': session.columns['morphology'][rows],
+              'morphology_path': numpy.array(session.get_morphology_paths(gids), dtype=str)}
+
+    for target in targets if targets is not None else list():
+        arrays[OfflineCircuitBackend.TARGET_PREFIX + target] = \
+            session.get_gids_from_target(target)
+
+    numpy.savez(snapshot_file, **arrays)
@@ -19,6 +19,7 @@
 import os
 
 # Internal imports
+import nmv.consts
 import nmv.file
 
 
@@ -83,11 +84,41 @@ def read_swc_morphology(swc_file):
     return None
 
 
+####################################################################################################
+# @read_nmvb_morphology
+####################################################################################################
+def read_nmvb_morphology(nmvb_file):
+    """Verifies if the given path is valid or not and then loads a compact binary .nmvb
+    morphology file.
+
+    If the path is not valid, this function returns None.
+
+    :param nmvb_file:
+        Path to the binary morphology file.
+    :return:
+        A morphology object or None if the path is not valid.
+    """
+
+    # If the path is valid
+    if os.path.isfile(nmvb_file):
+
+        # Map and load the .nmvb morphology
+        reader = nmv.file.readers.NMVBReader(nmvb_file=nmvb_file)
+        return reader.read_file()
+
+    # Issue an error
+    nmv.logger.log('ERROR: The morphology path [%s] is invalid' % nmvb_file)
+
+    # Otherwise, return None
+    return None
+
+
 ####################################################################################################
 # @read_morphology_from_file
 ####################################################################################################
 def read_morphology_from_file(options):
-    """Loads a morphology object from file. This loader mainly supports .h5 or .swc file formats.
+    """Loads a morphology object from file. This loader mainly supports .h5, .swc or .nmvb
+    file formats.
 
     :param options:
         A reference to the system options.
@@ -113,6 +144,11 @@ def read_morphology_from_file(options):
         # Load the .swc file
         morphology_object = read_swc_morphology(morphology_file_path)
 
+    elif nmv.consts.Skeleton.NMVB_EXTENSION == morphology_extension:
+
+        # Load the .nmvb file
+        morphology_object = read_nmvb_morphology(morphology_file_path)
+
     else:
 
         # Issue an error
@@ -132,7 +168,8 @@ def read_morphology_from_file(options):
 # @read_morphology_from_file_naively
 ####################################################################################################
 def read_morphology_from_file_naively(morphology_file_path):
-    """Loads a morphology object from file. This loader mainly supports .h5 or .swc file formats.
+    """Loads a morphology object from file. This loader mainly supports .h5, .swc or .nmvb
+    file formats.
 
     :param morphology_file_path:
         The path where the morphology is.
@@ -155,6 +192,11 @@ def read_morphology_from_file_naively(morphology_file_path):
         # Load the .swc file
         morphology_object = read_swc_morphology(morphology_file_path)
 
+    elif nmv.consts.Skeleton.NMVB_EXTENSION == morphology_extension:
+
+        # Load the .nmvb file
+        morphology_object = read_nmvb_morphology(morphology_file_path)
+
     else:
 
         # Issue an error
@@ -0,0 +1,181 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import math
+
+# Blender imports
+from mathutils import Vector
+
+# Internal imports
+import nmv.consts
+import nmv.file
+import nmv.skeleton
+
+
+####################################################################################################
+# @NMVBReader
+####################################################################################################
+class NMVBReader:
+    """Compact binary morphology (.nmvb) reader.
+
+    The file is mapped into memory and its tables are used directly without any parsing, see
+    nmv.file.map_binary_morphology.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 nmvb_file,
+                 center_morphology=True):
+        """Constructor
+
+        :param nmvb_file:
+            A given .nmvb morphology file.
+        :param center_morphology:
+            Center the morphology at the origin, by default True. Otherwise, the morphology is
+            moved back to its original center, if it is known.
+        """
+
+        # Set the path to the given file
+        self.morphology_file = nmvb_file
+
+        # Centering the morphology at the origin
+        self.center_morphology = center_morphology
+
+    ################################################################################################
+    # @label_arbors
+    ################################################################################################
+    @staticmethod
+    def label_arbors(arbors,
+                     label,
+                     tag):
+        """Labels and tags a list of arbors of the same type.
+
+        :param arbors:
+            A list of arbors, or None.
+        :param label:
+            The label of the arbors, e.g. 'Axon'.
+        :param tag:
+            The tag of the arbors, e.g. 'Axon'.
+        """
+
+        if arbors is None:
+            return
+
+        if len(arbors) == 1:
+            arbors[0].label = label
+            arbors[0].tag = tag
+        else:
+            for i in range(len(arbors)):
+                arbors[i].label = '%s %d' % (label, i + 1)
+                arbors[i].tag = '%s%d' % (tag, i + 1)
+
+    ################################################################################################
+    # @read_file
+    ################################################################################################
+    def read_file(self):
+        """Reads a morphology skeleton given in a .nmvb file into a NeuroMorphoVis morphology
+        structure.
+
+        :return:
+            Returns a reference to a NeuroMorphoVis morphology as read from the file, or None if
+            the file is invalid.
+        """
+
+        # Map the file
+        try:
+            data = nmv.file.map_binary_morphology(self.morphology_file)
+        except ValueError as error:
+            nmv.logger.log('ERROR: %s' % str(error))
+            return None
+
+        # The original center of the morphology, if known
+        original_center = None
+        if not any(math.isnan(value) for value in data['original_center']):
+            original_center = Vector(data['original_center'])
+
+        # The offset that is added to all the points
+        offset = Vector((0.0, 0.0, 0.0))
+        if not self.center_morphology and original_center is not None:
+            offset = original_center
+
+        # Convert the tables to lists at once, rather than accessing the mapped arrays per sample
+        points = [Vector(point) + offset for point in data['points'].tolist()]
+        radii = data['radii'].tolist()
+
+        # Build the sections
+        sections = list()
+        for first_sample, number_samples, section_type, section_index in \
+                data['sections'].tolist():
+            samples = [nmv.skeleton.Sample(
+                point=points[i], radius=radii[i], index=i - first_sample,
+                morphology_id=i - first_sample, type=section_type)
+                for i in range(first_sample, first_sample + number_samples)]
+            sections.append(nmv.skeleton.Section(
+                index=section_index, samples=samples, type=section_type))
+
+        # Link the sections
+        for section, parent_row in zip(sections, data['parents'].tolist()):
+            if parent_row >= 0:
+                parent = sections[parent_row]
+                section.parent = parent
+                section.parent_index = parent.index
+                parent.children.append(section)
+                parent.children_ids.append(section.index)
+
+        # Group the roots based on their types
+        arbors = {nmv.consts.Skeleton.H5_APICAL_DENDRITE_SECTION_TYPE: list(),
+                  nmv.consts.Skeleton.H5_BASAL_DENDRITE_SECTION_TYPE: list(),
+                  nmv.consts.Skeleton.H5_AXON_SECTION_TYPE: list()}
+        for section in sections:
+            if section.parent is None:
+                if section.type in arbors:
+                    arbors[section.type].append(section)
+                else:
+                    nmv.logger.log('ERROR: Unknown section type [%s] !' % str(section.type))
+
+        apical_dendrites = arbors[nmv.consts.Skeleton.H5_APICAL_DENDRITE_SECTION_TYPE] or None
+        basal_dendrites = arbors[nmv.consts.Skeleton.H5_BASAL_DENDRITE_SECTION_TYPE] or None
+        axons = arbors[nmv.consts.Skeleton.H5_AXON_SECTION_TYPE] or None
+
+        self.label_arbors(apical_dendrites, 'Apical Dendrite', 'ApicalDendrite')
+        self.label_arbors(basal_dendrites, 'Basal Dendrite', 'BasalDendrite')
+        self.label_arbors(axons, 'Axon', 'Axon')
+
+        # Build the soma
+        soma = None
+        if data['soma_mean_radius'] >= 0.0:
+            soma = nmv.skeleton.Soma(
+                centroid=Vector(data['soma_centroid']) + offset,
+                mean_radius=data['soma_mean_radius'],
+                profile_points=[Vector(point) + offset
+                                for point in data['soma_profile_points'].tolist()],
+                arbors_profile_points=[Vector(point) + offset
+                                       for point in data['arbors_profile_points'].tolist()])
+
+        # Construct the morphology skeleton
+        nmv_morphology = nmv.skeleton.Morphology(
+            soma=soma, axons=axons, basal_dendrites=basal_dendrites,
+            apical_dendrites=apical_dendrites,
+            label=nmv.file.ops.get_file_name_from_path(self.morphology_file))
+        nmv_morphology.original_center = original_center
+        nmv_morphology.number_stems = data['number_stems']
+
+        # Return a reference to the reconstructed morphology skeleton
+        return nmv_morphology
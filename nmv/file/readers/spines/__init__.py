@@ -16,4 +16,10 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .spines_reader import *
\ No newline at end of file
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'spines_reader',
+))
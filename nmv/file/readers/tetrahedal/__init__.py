@@ -15,5 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .quartet_reader import *
-from .tetgen_reader import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'tetrahedral_mesh',
+    'quartet_reader',
+    'tetgen_reader',
+))
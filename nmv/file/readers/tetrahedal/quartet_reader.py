@@ -15,16 +15,8 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import os
-
-# Blender imports
-import bpy
-import bmesh
-from mathutils import Vector
-
 # Internal imports
-import nmv.mesh
+import nmv.file
 
 
 ####################################################################################################
@@ -38,21 +30,25 @@ class QuarTetTetrahedralReader:
     # @__init__
     ################################################################################################
     def __init__(self,
-                 tet_file):
+                 tet_file,
+                 memory_bounded=False):
         """Constructor
 
         :param tet_file:
             Quartet .tet file.
+        :param memory_bounded:
+            If set, the elements are streamed from the file block by block instead of being
+            loaded at once. This is recommended for very large meshes.
         """
 
         # Node file
         self.tet_file = tet_file
 
-        # Nodes
-        self.nodes = list()
+        # Stream the elements
+        self.memory_bounded = memory_bounded
 
-        # Elements
-        self.elements = list()
+        # The tetrahedral mesh, with the nodes and elements in shared arrays
+        self.tetrahedral_mesh = None
 
         # Number of nodes
         self.number_nodes = 0
@@ -60,167 +56,37 @@ class QuarTetTetrahedralReader:
         # Number of elements
         self.number_elements = 0
 
-    ################################################################################################
-    # @Tetrahedron
-    ################################################################################################
-    class Tetrahedron:
-        """Tetrahedron
-        """
-
-        ############################################################################################
-        # @__init__
-        ############################################################################################
-        def __init__(self):
-            """Constructor
-            """
-
-            # Tetrahedron index
-            self.index = None
-
-            # Tetrahedron face
-            self.face = None
-
-    ################################################################################################
-    # @__init__
-    ################################################################################################
-    class TetrahedralMeshData:
-        """TetrahedralMeshData
-        """
-
-        ############################################################################################
-        # @__init__
-        ############################################################################################
-        def __init__(self):
-            """Constructor
-            """
-
-            # Vertex list
-            self.vertices = None
-
-            # Tetrahedra list
-            self.tetrahedrons = None
-
     ################################################################################################
     # @read_tet_file
     ################################################################################################
     def read_tet_file(self):
-        """Read the .tet file.
-        """
-
-        data = list()
-
-        # Open the file
-        file = open(self.tet_file, 'r')
-
-        # Read every line
-        for line in file:
-
-            # If line is a comment, ignore
-            if '#' in line:
-                continue
-
-                # Get the number of vertices and tets
-            if 'tet' in line:
-                data_count = line
-                continue
-
-            data.append(line.strip('\n'))
+        """Read the .tet file into a tetrahedral mesh, only once.
 
-        # Close the file
-        file.close()
-
-        # Get the number of vertices and faces from the data_count
-        data_count = data_count.split(' ')
-
-        number_vertices = int(data_count[1])
-        faces = int(data_count[2])
-
-        nmv.logger.log('The volumetric mesh has [%d] vertices and [%d] faces' % (number_vertices,
-                                                                                 faces))
-
-        # Get the vertices
-        vertices = list()
-        for i in range(number_vertices):
-            vertex_data = data[i].split()
-            vertex = Vector((float(vertex_data[0]), float(vertex_data[1]), float(vertex_data[2])))
-            vertices.append(vertex)
-
-        # Get the faces
-        faces = list()
-        for i in range(number_vertices, len(data)):
-            face_data = data[i].split()
-            face = [int(face_data[0]), int(face_data[1]), int(face_data[2]), int(face_data[3])]
-            faces.append(face)
+        :return:
+            A reference to the TetrahedralMesh.
+        """
 
-        # Create the tetrahedrons
-        tetrahedrons = list()
-        for i, face in enumerate(faces):
-            tetrahedron = self.Tetrahedron()
-            tetrahedron.index = i
-            tetrahedron.face = face
-            tetrahedrons.append(tetrahedron)
+        if self.tetrahedral_mesh is None:
+            self.tetrahedral_mesh = nmv.file.load_quartet_mesh(
+                self.tet_file, memory_bounded=self.memory_bounded)
+            self.number_nodes = len(self.tetrahedral_mesh.nodes)
+            if self.tetrahedral_mesh.elements is not None:
+                self.number_elements = len(self.tetrahedral_mesh.elements)
 
-        # Create the tetrahedral mesh data structure
-        tetrahedral_mesh_data = self.TetrahedralMeshData()
-        tetrahedral_mesh_data.vertices = vertices
-        tetrahedral_mesh_data.tetrahedrons = tetrahedrons
+            nmv.logger.log('The volumetric mesh has [%d] vertices and [%d] tetrahedra' %
+                           (self.number_nodes, self.number_elements))
 
-        # Return the mesh data
-        return tetrahedral_mesh_data
+        return self.tetrahedral_mesh
 
     ################################################################################################
     # @create_tetrahedral_mesh
     ################################################################################################
     def create_tetrahedral_mesh(self):
-        """Create a tetrahedral mesh and link it to the scene.
+        """Create a tetrahedral mesh, where every tetrahedron has its own vertices, and link it
+        to the scene.
         """
 
-        # Read the file
-        tetrahedral_mesh_data = self.read_tet_file()
-
-        # Create a bmesh
-        tetrahedral_bmesh = bmesh.new()
-
-        vertices = list()
-
-        # Add the vertices and faces
-        for i, tetrahedron in enumerate(tetrahedral_mesh_data.tetrahedrons):
-            vertex_list = tetrahedral_mesh_data.vertices
-
-            # Get the vertices from the list
-            vertices.append(tetrahedral_bmesh.verts.new(vertex_list[tetrahedron.face[0]]))
-            vertices.append(tetrahedral_bmesh.verts.new(vertex_list[tetrahedron.face[1]]))
-            vertices.append(tetrahedral_bmesh.verts.new(vertex_list[tetrahedron.face[2]]))
-            vertices.append(tetrahedral_bmesh.verts.new(vertex_list[tetrahedron.face[3]]))
-
-        # tetrahedral_mesh.verts.ensure_lookup_table()
-        for i, vertex in enumerate(vertices):
-            vertex.index = i
-
-        # Add the vertices and faces
-        for i, tetrahedron in enumerate(tetrahedral_mesh_data.tetrahedrons):
-            # Get the vertices to construct the faces
-            v1 = vertices[4 * i + 0]
-            v2 = vertices[4 * i + 1]
-            v3 = vertices[4 * i + 2]
-            v4 = vertices[4 * i + 3]
-
-            # Add the faces to the mesh
-            f1 = tetrahedral_bmesh.faces.new((v1, v2, v3))
-            f2 = tetrahedral_bmesh.faces.new([v2, v3, v4])
-            f3 = tetrahedral_bmesh.faces.new([v3, v4, v1])
-            f4 = tetrahedral_bmesh.faces.new([v1, v4, v2])
-
-        # Get mesh base name
-        mesh_name = os.path.basename(self.tet_file).split('.')[0]
-
-        tetrahedral_mesh = bpy.data.meshes.new(mesh_name)
-        tetrahedral_bmesh.to_mesh(tetrahedral_mesh)
-
-        tetrahedral_mesh_object = bpy.data.objects.new(mesh_name, tetrahedral_mesh)
-        bpy.context.scene.collection.objects.link(tetrahedral_mesh_object)
-
-        return tetrahedral_mesh_object
+        return self.read_tet_file().create_tetrahedral_mesh()
 
     ################################################################################################
     # @create_simplified_tetrahedral_mesh
@@ -233,14 +99,19 @@ class QuarTetTetrahedralReader:
             A reference to the created mesh.
         """
 
-        # Construct the tetrahedral mesh and return a reference to it
-        tetrahedral_mesh = self.create_tetrahedral_mesh()
+        return self.read_tet_file().create_simplified_tetrahedral_mesh()
 
-        # Remove the duplicates
-        nmv.mesh.remove_doubles(tetrahedral_mesh)
+    ################################################################################################
+    # @create_surface_tetrahedral_mesh
+    ################################################################################################
+    def create_surface_tetrahedral_mesh(self):
+        """Creates a mesh of the boundary surface of the tetrahedral mesh.
+
+        :return:
+            A reference to the created mesh.
+        """
 
-        # Return a reference to the mesh
-        return tetrahedral_mesh
+        return self.read_tet_file().create_surface_mesh()
 
     ################################################################################################
     # @create_wireframe_tetrahedral_mesh
@@ -255,12 +126,8 @@ class QuarTetTetrahedralReader:
             A reference to the wireframe mesh.
         """
 
-        # Create the simplified tetrahedral mesh
-        simplified_tetrahedral_mesh = self.create_simplified_tetrahedral_mesh()
-
-        # Apply the wireframe operator
-        return nmv.mesh.create_wire_frame(
-            mesh_object=simplified_tetrahedral_mesh, wireframe_thickness=wireframe_thickness)
+        return self.read_tet_file().create_wireframe_tetrahedral_mesh(
+            wireframe_thickness=wireframe_thickness)
 
 
 ####################################################################################################
@@ -297,7 +164,26 @@ def import_quartet_mesh_simplified(tet_file):
 
 
 ####################################################################################################
-# @import_quartet_mesh
+# @import_quartet_mesh_surface
+####################################################################################################
+def import_quartet_mesh_surface(tet_file,
+                                memory_bounded=False):
+    """Imports the boundary surface of a quartet mesh.
+
+    :param tet_file:
+        Quartet .tet file.
+    :param memory_bounded:
+        Stream the elements from the file block by block, for very large meshes.
+    :return:
+        A reference to the imported mesh.
+    """
+
+    reader = nmv.file.QuarTetTetrahedralReader(tet_file=tet_file, memory_bounded=memory_bounded)
+    return reader.create_surface_tetrahedral_mesh()
+
+
+####################################################################################################
+# @import_quartet_mesh_wireframe
 ####################################################################################################
 def import_quartet_mesh_wireframe(tet_file,
                                   wireframe_thickness):
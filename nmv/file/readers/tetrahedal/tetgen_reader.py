@@ -15,16 +15,8 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import os
-
-# Blender imports
-import bpy
-import bmesh
-from mathutils import Vector
-
 # Internal imports
-import nmv.mesh
+import nmv.file
 
 
 ####################################################################################################
@@ -39,13 +31,17 @@ class TetGenTetrahedralReader:
     ################################################################################################
     def __init__(self,
                  node_file,
-                 ele_file):
+                 ele_file,
+                 memory_bounded=False):
         """Constructor
 
         :param node_file:
             Path to the node file.
         :param ele_file:
             Path to the element file.
+        :param memory_bounded:
+            If set, the elements are streamed from the file block by block instead of being
+            loaded at once. This is recommended for very large meshes.
         """
 
         # Node file
@@ -54,11 +50,11 @@ class TetGenTetrahedralReader:
         # Element file
         self.ele_file = ele_file
 
-        # Nodes
-        self.nodes = list()
+        # Stream the elements
+        self.memory_bounded = memory_bounded
 
-        # Elements
-        self.elements = list()
+        # The tetrahedral mesh, with the nodes and elements in shared arrays
+        self.tetrahedral_mesh = None
 
         # Number of nodes
         self.number_nodes = 0
@@ -67,174 +63,35 @@ class TetGenTetrahedralReader:
         self.number_elements = 0
 
     ################################################################################################
-    # @read_node_file
-    ################################################################################################
-    def read_node_file(self):
-        """Reads a node file.
-        """
-
-        # Open the file
-        file = open(self.node_file, 'r')
-
-        # Read the file line by line into a structure
-        for i, line in enumerate(file):
-
-            # Read the number of nodes
-            if i == 0:
-                data = ' '.join(line.split())
-                data = data.split(' ')
-                self.number_nodes = data[0]
-
-            # Actual nodes
-            else:
-                # Avoid comments
-                if '#' in line:
-                    continue
-
-                data = ' '.join(line.split())
-                data = data.split(' ')
-
-                # Index
-                index = int(data[0])
-
-                # Coordinates
-                x = float(data[1])
-                y = float(data[2])
-                z = float(data[3])
-
-                # Add to the list
-                vertex = Vector((x, y, z))
-                self.nodes.append(vertex)
-
-        # Close the file
-        file.close()
-
-    ################################################################################################
-    # @read_ele_file
+    # @read_tetrahedral_mesh
     ################################################################################################
-    def read_ele_file(self):
-        """Reads an element file.
-        """
-
-        # Open the file
-        file = open(self.ele_file, 'r')
-
-        # Read the file line by line into a structure
-        for i, line in enumerate(file):
-
-            # Read the number of elements
-            if i == 0:
-                data = line.split(' ')
-                self.number_elements = data[0]
-
-            # Actual elements
-            else:
-                # Avoid comments
-                if '#' in line:
-                    continue
-
-                data = ' '.join(line.split())
-                data = data.split(' ')
-
-                # Index
-                index = int(data[0])
-
-                # Elements
-                n0 = int(data[1])
-                n1 = int(data[2])
-                n2 = int(data[3])
-                n3 = int(data[4])
-
-                # Add to the list
-                self.elements.append([n0, n1, n2, n3])
-
-        # Close the file
-        file.close()
-
-    ################################################################################################
-    # @construct_tetrahedral_mesh
-    ################################################################################################
-    def construct_tetrahedral_mesh(self):
-        """Construct the tetrahedral mesh
+    def read_tetrahedral_mesh(self):
+        """Reads the node and element files into a tetrahedral mesh, only once.
 
         :return:
-            A default mesh file containing the tetrahedral elements.
+            A reference to the TetrahedralMesh.
         """
 
-        # Create a bmesh
-        tetrahedral_bmesh = bmesh.new()
-
-        # Vertices
-        vertices = list()
-
-        # Add the vertices and faces
-        for i, element in enumerate(self.elements):
-
-            # Get the vertices
-            v1 = self.nodes[element[0] - 1]
-            v2 = self.nodes[element[1] - 1]
-            v3 = self.nodes[element[2] - 1]
-            v4 = self.nodes[element[3] - 1]
+        if self.tetrahedral_mesh is None:
+            self.tetrahedral_mesh = nmv.file.load_tetgen_mesh(
+                self.node_file, self.ele_file, memory_bounded=self.memory_bounded)
+            self.number_nodes = len(self.tetrahedral_mesh.nodes)
+            if self.tetrahedral_mesh.elements is not None:
+                self.number_elements = len(self.tetrahedral_mesh.elements)
 
-            # Get the vertices from the list
-            vertices.append(tetrahedral_bmesh.verts.new(v1))
-            vertices.append(tetrahedral_bmesh.verts.new(v2))
-            vertices.append(tetrahedral_bmesh.verts.new(v3))
-            vertices.append(tetrahedral_bmesh.verts.new(v4))
-
-        for i, vertex in enumerate(vertices):
-            vertex.index = i
-
-        # Process the elements
-        for i, element in enumerate(self.elements):
-            # Get the vertices to construct the faces
-            v1 = vertices[4 * i + 0]
-            v2 = vertices[4 * i + 1]
-            v3 = vertices[4 * i + 2]
-            v4 = vertices[4 * i + 3]
-
-            # Add the faces to the mesh
-            f1 = tetrahedral_bmesh.faces.new((v1, v2, v3))
-            f2 = tetrahedral_bmesh.faces.new([v2, v3, v4])
-            f3 = tetrahedral_bmesh.faces.new([v3, v4, v1])
-            f4 = tetrahedral_bmesh.faces.new([v1, v4, v2])
-
-        # Get mesh base name
-        mesh_name = os.path.basename(self.node_file).split('.')[0]
-
-        # Bmesh reconstructed
-        tetrahedral_mesh = bpy.data.meshes.new(mesh_name)
-
-        # Convert to a mesh
-        tetrahedral_bmesh.to_mesh(tetrahedral_mesh)
-
-        # New object
-        tetrahedral_mesh_object = bpy.data.objects.new(mesh_name, tetrahedral_mesh)
-
-        # Link it to the scene
-        bpy.context.scene.collection.objects.link(tetrahedral_mesh_object)
-
-        # Return the mesh object
-        return tetrahedral_mesh_object
+        return self.tetrahedral_mesh
 
     ################################################################################################
     # @create_tetrahedral_mesh
     ################################################################################################
     def create_tetrahedral_mesh(self):
-        """Creates a default tetrahedral mesh.
+        """Creates a default tetrahedral mesh, where every tetrahedron has its own vertices.
 
         :return:
             A reference to the created mesh.
         """
 
-        # Read the node file
-        self.read_node_file()
-
-        # Read the elements file
-        self.read_ele_file()
-
-        # Construct the tetrahedral mesh and return a reference to it
-        return self.construct_tetrahedral_mesh()
+        return self.read_tetrahedral_mesh().create_tetrahedral_mesh()
 
     ################################################################################################
     # @create_simplified_tetrahedral_mesh
@@ -246,20 +103,20 @@ class TetGenTetrahedralReader:
         :return:
             A reference to the created mesh.
         """
-        # Read the node file
-        self.read_node_file()
 
-        # Read the elements file
-        self.read_ele_file()
+        return self.read_tetrahedral_mesh().create_simplified_tetrahedral_mesh()
 
-        # Construct the tetrahedral mesh and return a reference to it
-        tetrahedral_mesh = self.construct_tetrahedral_mesh()
+    ################################################################################################
+    # @create_surface_tetrahedral_mesh
+    ################################################################################################
+    def create_surface_tetrahedral_mesh(self):
+        """Creates a mesh of the boundary surface of the tetrahedral mesh.
 
-        # Remove the duplicates
-        nmv.mesh.remove_doubles(tetrahedral_mesh)
+        :return:
+            A reference to the created mesh.
+        """
 
-        # Return a reference to the mesh
-        return tetrahedral_mesh
+        return self.read_tetrahedral_mesh().create_surface_mesh()
 
     ################################################################################################
     # @create_wireframe_tetrahedral_mesh
@@ -274,12 +131,8 @@ class TetGenTetrahedralReader:
             A reference to the wireframe mesh.
         """
 
-        # Create the simplified tetrahedral mesh
-        simplified_tetrahedral_mesh = self.create_simplified_tetrahedral_mesh()
-
-        # Apply the wireframe operator
-        return nmv.mesh.create_wire_frame(
-            mesh_object=simplified_tetrahedral_mesh, wireframe_thickness=wireframe_thickness)
+        return self.read_tetrahedral_mesh().create_wireframe_tetrahedral_mesh(
+            wireframe_thickness=wireframe_thickness)
 
 
 ####################################################################################################
@@ -322,7 +175,29 @@ def import_tetgen_mesh_simplified(node_file,
 
 
 ####################################################################################################
-# @import_tetgen_mesh_simplified
+# @import_tetgen_mesh_surface
+####################################################################################################
+def import_tetgen_mesh_surface(node_file,
+                               ele_file,
+                               memory_bounded=False):
+    """Imports the boundary surface of a tetgen mesh.
+
+    :param node_file:
+        Path to the node file.
+    :param ele_file:
+        Path to the element file.
+    :param memory_bounded:
+        Stream the elements from the file block by block, for very large meshes.
+    :return:
+        A reference to the imported mesh.
+    """
+
+    reader = nmv.file.TetGenTetrahedralReader(node_file, ele_file, memory_bounded)
+    return reader.create_surface_tetrahedral_mesh()
+
+
+####################################################################################################
+# @import_tetgen_mesh_wireframe
 ####################################################################################################
 def import_tetgen_mesh_wireframe(node_file,
                                  ele_file):
@@ -0,0 +1,631 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import itertools
+import os
+
+# External imports
+import numpy
+
+# Internal imports
+import nmv.mesh
+
+
+# The faces of a tetrahedron (as local vertex indices) and the vertex opposite to every face
+TETRAHEDRON_FACES = numpy.array([[0, 1, 2], [1, 2, 3], [2, 3, 0], [3, 0, 1]])
+TETRAHEDRON_OPPOSITE_VERTICES = numpy.array([3, 0, 1, 2])
+
+# The edges of a tetrahedron
+TETRAHEDRON_EDGES = numpy.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+
+# The number of elements that are processed at once in the memory-bounded path
+DEFAULT_ELEMENTS_BLOCK_SIZE = 1000000
+
+
+####################################################################################################
+# @read_rows
+####################################################################################################
+def read_rows(file_handle,
+              number_rows,
+              columns,
+              dtype):
+    """Reads a number of rows from a text file into an array with a single bulk parse.
+
+    Comments and empty lines are skipped and do not count as rows.
+
+    :param file_handle:
+        A handle to the text file.
+    :param number_rows:
+        The number of rows to read.
+    :param columns:
+        The indices of the columns to read.
+    :param dtype:
+        The numpy type of the data.
+    :return:
+        An array of shape (rows, len(columns)), with less rows if the file ends.
+    """
+
+    rows = list()
+    while len(rows) < number_rows:
+        lines = list(itertools.islice(file_handle, number_rows - len(rows)))
+        if not lines:
+            break
+        rows.extend(line for line in lines if line.strip() and not line.lstrip().startswith('#'))
+
+    if not rows:
+        return numpy.zeros((0, len(columns)), dtype=dtype)
+
+    return numpy.loadtxt(rows, comments='#', usecols=columns, dtype=dtype, ndmin=2)
+
+
+####################################################################################################
+# @read_header
+####################################################################################################
+def read_header(file_handle):
+    """Reads the first line of a file that is not a comment.
+
+    :param file_handle:
+        A handle to the text file.
+    :return:
+        A list of the tokens of the header.
+    """
+
+    for line in file_handle:
+        if line.strip() and not line.lstrip().startswith('#'):
+            return line.split('#')[0].split()
+    raise ValueError('The file has no header')
+
+
+####################################################################################################
+# @read_tetgen_node_file
+####################################################################################################
+def read_tetgen_node_file(node_file):
+    """Reads the nodes of a TetGen .node file.
+
+    :param node_file:
+        Path to the node file.
+    :return:
+        An Nx3 array of the nodes and the index of the first node (TetGen files can be zero or
+        one based).
+    """
+
+    with open(node_file, 'r') as file_handle:
+        number_nodes = int(read_header(file_handle)[0])
+        data = read_rows(file_handle, number_nodes, (0, 1, 2, 3), numpy.float64)
+
+    first_index = int(data[0, 0]) if len(data) > 0 else 0
+    return numpy.ascontiguousarray(data[:, 1:4]), first_index
+
+
+####################################################################################################
+# @iterate_tetgen_ele_file
+####################################################################################################
+def iterate_tetgen_ele_file(ele_file,
+                            first_index=1,
+                            block_size=DEFAULT_ELEMENTS_BLOCK_SIZE):
+    """Reads the elements of a TetGen .ele file block by block.
+
+    :param ele_file:
+        Path to the element file.
+    :param first_index:
+        The index of the first node in the node file.
+    :param block_size:
+        The number of elements per block.
+    :return:
+        A generator of Kx4 arrays of zero-based node indices.
+    """
+
+    with open(ele_file, 'r') as file_handle:
+        number_elements = int(read_header(file_handle)[0])
+        remaining = number_elements
+        while remaining > 0:
+            block = read_rows(file_handle, min(block_size, remaining), (1, 2, 3, 4), numpy.int64)
+            if len(block) == 0:
+                break
+            remaining -= len(block)
+            yield block - first_index
+
+
+####################################################################################################
+# @read_quartet_tet_file_nodes
+####################################################################################################
+def read_quartet_tet_file_nodes(tet_file):
+    """Reads the nodes of a QuarTet .tet file.
+
+    :param tet_file:
+        Path to the .tet file.
+    :return:
+        An Nx3 array of the nodes.
+    """
+
+    with open(tet_file, 'r') as file_handle:
+        number_nodes = int(read_header(file_handle)[1])
+        return read_rows(file_handle, number_nodes, (0, 1, 2), numpy.float64)
+
+
+####################################################################################################
+# @iterate_quartet_tet_file
+####################################################################################################
+def iterate_quartet_tet_file(tet_file,
+                             block_size=DEFAULT_ELEMENTS_BLOCK_SIZE):
+    """Reads the elements of a QuarTet .tet file block by block.
+
+    :param tet_file:
+        Path to the .tet file.
+    :param block_size:
+        The number of elements per block.
+    :return:
+        A generator of Kx4 arrays of zero-based node indices.
+    """
+
+    with open(tet_file, 'r') as file_handle:
+        header = read_header(file_handle)
+        number_nodes = int(header[1])
+        number_elements = int(header[2])
+
+        # Skip the nodes without parsing them
+        skipped = 0
+        while skipped < number_nodes:
+            line = file_handle.readline()
+            if not line:
+                break
+            if line.strip() and not line.lstrip().startswith('#'):
+                skipped += 1
+
+        remaining = number_elements
+        while remaining > 0:
+            block = read_rows(file_handle, min(block_size, remaining), (0, 1, 2, 3), numpy.int64)
+            if len(block) == 0:
+                break
+            remaining -= len(block)
+            yield block
+
+
+####################################################################################################
+# @hash_faces
+####################################################################################################
+def hash_faces(faces,
+               number_nodes):
+    """Computes a key for every triangle that does not depend on the order of its vertices.
+
+    :param faces:
+        An Mx3 array of the node indices of the faces.
+    :param number_nodes:
+        The number of nodes in the mesh.
+    :return:
+        An array of M keys.
+    """
+
+    sorted_faces = numpy.sort(faces, axis=1).astype(numpy.int64)
+
+    # Pack the three indices into a single integer if they fit
+    if number_nodes < 2 ** 20:
+        return (sorted_faces[:, 0] * number_nodes + sorted_faces[:, 1]) * number_nodes + \
+               sorted_faces[:, 2]
+
+    # Otherwise, use the raw bytes of the sorted faces
+    sorted_faces = numpy.ascontiguousarray(sorted_faces)
+    return sorted_faces.view(numpy.dtype((numpy.void, sorted_faces.itemsize * 3))).ravel()
+
+
+####################################################################################################
+# @find_unpaired_keys
+####################################################################################################
+def find_unpaired_keys(keys):
+    """Finds the keys that appear only once in a list of keys.
+
+    :param keys:
+        An array of keys.
+    :return:
+        The indices of the keys that appear only once.
+    """
+
+    if len(keys) == 0:
+        return numpy.zeros(0, dtype=numpy.int64)
+
+    order = numpy.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    # A key is unpaired if it differs from both its neighbours in the sorted list
+    different = sorted_keys[1:] != sorted_keys[:-1]
+    unpaired = numpy.ones(len(keys), dtype=bool)
+    unpaired[1:] &= different
+    unpaired[:-1] &= different
+    return order[unpaired]
+
+
+####################################################################################################
+# @get_element_faces
+####################################################################################################
+def get_element_faces(nodes,
+                      elements):
+    """Gets the faces of a block of tetrahedra, oriented outwards.
+
+    :param nodes:
+        An Nx3 array of the nodes.
+    :param elements:
+        A Kx4 array of the elements.
+    :return:
+        A (4K)x3 array of the faces.
+    """
+
+    faces = elements[:, TETRAHEDRON_FACES].reshape(-1, 3)
+    opposite = elements[:, TETRAHEDRON_OPPOSITE_VERTICES].reshape(-1)
+
+    # Flip the faces whose normals point towards the opposite vertex
+    p0 = nodes[faces[:, 0]]
+    normals = numpy.cross(nodes[faces[:, 1]] - p0, nodes[faces[:, 2]] - p0)
+    inwards = numpy.einsum('ij,ij->i', normals, nodes[opposite] - p0) > 0
+    faces[inwards] = faces[inwards][:, [0, 2, 1]]
+
+    return faces
+
+
+####################################################################################################
+# @extract_boundary_faces
+####################################################################################################
+def extract_boundary_faces(nodes,
+                           element_blocks):
+    """Extracts the boundary surface of a tetrahedral mesh, i.e. the faces that belong to a
+    single tetrahedron.
+
+    The elements are processed block by block, and only the faces that are not yet paired are kept
+    between the blocks, therefore the memory is bounded by the size of a block and the surface of
+    the processed region rather than by the total number of elements.
+
+    :param nodes:
+        An Nx3 array of the nodes.
+    :param element_blocks:
+        An iterable of Kx4 arrays of the elements.
+    :return:
+        An Mx3 array of the boundary faces, oriented outwards.
+    """
+
+    boundary_faces = numpy.zeros((0, 3), dtype=numpy.int64)
+    boundary_keys = hash_faces(boundary_faces, len(nodes))
+
+    for elements in element_blocks:
+        faces = get_element_faces(nodes, elements)
+        faces = numpy.concatenate((boundary_faces, faces))
+        keys = numpy.concatenate((boundary_keys, hash_faces(faces[len(boundary_faces):],
+                                                            len(nodes))))
+
+        # The paired faces are interior faces shared by two tetrahedra
+        unpaired = find_unpaired_keys(keys)
+        boundary_faces = faces[unpaired]
+        boundary_keys = keys[unpaired]
+
+    return boundary_faces
+
+
+####################################################################################################
+# @extract_unique_faces
+####################################################################################################
+def extract_unique_faces(nodes,
+                         element_blocks):
+    """Extracts all the faces of a tetrahedral mesh without duplicating the faces that are shared
+    between two tetrahedra.
+
+    :param nodes:
+        An Nx3 array of the nodes.
+    :param element_blocks:
+        An iterable of Kx4 arrays of the elements.
+    :return:
+        An Mx3 array of the faces.
+    """
+
+    unique_faces = numpy.zeros((0, 3), dtype=numpy.int64)
+    unique_keys = hash_faces(unique_faces, len(nodes))
+
+    for elements in element_blocks:
+        faces = numpy.concatenate((unique_faces, get_element_faces(nodes, elements)))
+        keys = numpy.concatenate((unique_keys, hash_faces(faces[len(unique_faces):], len(nodes))))
+        unique_keys, indices = numpy.unique(keys, return_index=True)
+        unique_faces = faces[indices]
+
+    return unique_faces
+
+
+####################################################################################################
+# @extract_unique_edges
+####################################################################################################
+def extract_unique_edges(element_blocks):
+    """Extracts the edges of a tetrahedral mesh without duplicates.
+
+    :param element_blocks:
+        An iterable of Kx4 arrays of the elements.
+    :return:
+        An Ex2 array of the edges.
+    """
+
+    unique_edges = numpy.zeros((0, 2), dtype=numpy.int64)
+    for elements in element_blocks:
+        edges = numpy.sort(elements[:, TETRAHEDRON_EDGES].reshape(-1, 2), axis=1)
+        unique_edges = numpy.unique(numpy.concatenate((unique_edges, edges)), axis=0)
+
+    return unique_edges
+
+
+####################################################################################################
+# @compact_vertices
+####################################################################################################
+def compact_vertices(nodes,
+                     faces):
+    """Removes the nodes that are not referenced by a list of faces and re-indexes the faces.
+
+    :param nodes:
+        An Nx3 array of the nodes.
+    :param faces:
+        An Mx3 array of the faces.
+    :return:
+        The used nodes and the re-indexed faces.
+    """
+
+    used_nodes = numpy.unique(faces)
+    return nodes[used_nodes], numpy.searchsorted(used_nodes, faces)
+
+
+####################################################################################################
+# @TetrahedralMesh
+####################################################################################################
+class TetrahedralMesh:
+    """A tetrahedral mesh stored in shared numpy arrays, from which the different surface
+    variants are created.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 name,
+                 nodes,
+                 elements=None,
+                 element_blocks_reader=None,
+                 block_size=DEFAULT_ELEMENTS_BLOCK_SIZE):
+        """Constructor
+
+        :param name:
+            The name of the mesh.
+        :param nodes:
+            An Nx3 array of the nodes.
+        :param elements:
+            A Kx4 array of zero-based elements, if they are loaded in memory.
+        :param element_blocks_reader:
+            A function that returns a new generator over the blocks of the elements in the file,
+            used for the memory-bounded path if the elements are not loaded in memory.
+        :param block_size:
+            The number of elements processed at once.
+        """
+
+        # Mesh name
+        self.name = name
+
+        # Nodes
+        self.nodes = nodes
+
+        # Elements
+        self.elements = elements
+        self.element_blocks_reader = element_blocks_reader
+        self.block_size = block_size
+
+        # Cached faces and edges
+        self.boundary_faces = None
+        self.unique_faces = None
+        self.unique_edges = None
+
+    ################################################################################################
+    # @iterate_element_blocks
+    ################################################################################################
+    def iterate_element_blocks(self):
+        """Iterates over the elements of the mesh block by block.
+
+        :return:
+            A generator of Kx4 arrays of the elements.
+        """
+
+        if self.elements is not None:
+            for i in range(0, len(self.elements), self.block_size):
+                yield self.elements[i:i + self.block_size]
+        else:
+            for block in self.element_blocks_reader():
+                yield block
+
+    ################################################################################################
+    # @get_boundary_faces
+    ################################################################################################
+    def get_boundary_faces(self):
+        """Gets the faces of the boundary surface of the mesh.
+
+        :return:
+            An Mx3 array of the faces.
+        """
+
+        if self.boundary_faces is None:
+            self.boundary_faces = extract_boundary_faces(self.nodes, self.iterate_element_blocks())
+        return self.boundary_faces
+
+    ################################################################################################
+    # @get_unique_faces
+    ################################################################################################
+    def get_unique_faces(self):
+        """Gets all the faces of the mesh without duplicates.
+
+        :return:
+            An Mx3 array of the faces.
+        """
+
+        if self.unique_faces is None:
+            self.unique_faces = extract_unique_faces(self.nodes, self.iterate_element_blocks())
+        return self.unique_faces
+
+    ################################################################################################
+    # @get_unique_edges
+    ################################################################################################
+    def get_unique_edges(self):
+        """Gets all the edges of the mesh without duplicates.
+
+        :return:
+            An Ex2 array of the edges.
+        """
+
+        if self.unique_edges is None:
+            self.unique_edges = extract_unique_edges(self.iterate_element_blocks())
+        return self.unique_edges
+
+    ################################################################################################
+    # @create_surface_mesh
+    ################################################################################################
+    def create_surface_mesh(self):
+        """Creates a mesh of the boundary surface of the tetrahedral mesh.
+
+        :return:
+            A reference to the created mesh.
+        """
+
+        vertices, faces = compact_vertices(self.nodes, self.get_boundary_faces())
+        return nmv.mesh.create_mesh_from_arrays(
+            vertices=vertices, triangles=faces, name='%s_surface' % self.name)
+
+    ################################################################################################
+    # @create_tetrahedral_mesh
+    ################################################################################################
+    def create_tetrahedral_mesh(self):
+        """Creates a mesh where every tetrahedron is a separate shell with its own vertices.
+
+        :return:
+            A reference to the created mesh.
+        """
+
+        vertices = list()
+        faces = list()
+        number_vertices = 0
+        for elements in self.iterate_element_blocks():
+            vertices.append(self.nodes[elements].reshape(-1, 3))
+            local_elements = numpy.arange(number_vertices, number_vertices + elements.size)
+            faces.append(local_elements.reshape(-1, 4)[:, TETRAHEDRON_FACES].reshape(-1, 3))
+            number_vertices += elements.size
+
+        if not vertices:
+            return nmv.mesh.create_mesh_from_arrays(
+                vertices=numpy.zeros((0, 3)), name=self.name)
+
+        return nmv.mesh.create_mesh_from_arrays(
+            vertices=numpy.concatenate(vertices), triangles=numpy.concatenate(faces),
+            name=self.name)
+
+    ################################################################################################
+    # @create_simplified_tetrahedral_mesh
+    ################################################################################################
+    def create_simplified_tetrahedral_mesh(self):
+        """Creates a tetrahedral mesh with no duplicate vertices or faces.
+
+        :return:
+            A reference to the created mesh.
+        """
+
+        return nmv.mesh.create_mesh_from_arrays(
+            vertices=self.nodes, triangles=self.get_unique_faces(), name=self.name)
+
+    ################################################################################################
+    # @create_wireframe_tetrahedral_mesh
+    ################################################################################################
+    def create_wireframe_tetrahedral_mesh(self,
+                                          wireframe_thickness=0.01):
+        """Creates a wireframe mesh.
+
+        :param wireframe_thickness:
+            The thickness of the wireframe.
+        :return:
+            A reference to the wireframe mesh.
+        """
+
+        # Apply the wireframe operator to the simplified mesh
+        return nmv.mesh.create_wire_frame(
+            mesh_object=self.create_simplified_tetrahedral_mesh(),
+            wireframe_thickness=wireframe_thickness)
+
+
+####################################################################################################
+# @load_tetgen_mesh
+####################################################################################################
+def load_tetgen_mesh(node_file,
+                     ele_file,
+                     memory_bounded=False,
+                     block_size=DEFAULT_ELEMENTS_BLOCK_SIZE):
+    """Loads a TetGen mesh into a TetrahedralMesh.
+
+    :param node_file:
+        Path to the node file.
+    :param ele_file:
+        Path to the element file.
+    :param memory_bounded:
+        If set, the elements are never loaded into memory at once, but streamed from the file
+        block by block whenever they are needed.
+    :param block_size:
+        The number of elements processed at once.
+    :return:
+        A TetrahedralMesh.
+    """
+
+    nodes, first_index = read_tetgen_node_file(node_file)
+    mesh_name = os.path.basename(node_file).split('.')[0]
+
+    def read_element_blocks():
+        return iterate_tetgen_ele_file(ele_file, first_index, block_size)
+
+    if memory_bounded:
+        return TetrahedralMesh(mesh_name, nodes, element_blocks_reader=read_element_blocks,
+                               block_size=block_size)
+
+    blocks = list(read_element_blocks())
+    elements = numpy.concatenate(blocks) if blocks else numpy.zeros((0, 4), dtype=numpy.int64)
+    return TetrahedralMesh(mesh_name, nodes, elements=elements, block_size=block_size)
+
+
+####################################################################################################
+# @load_quartet_mesh
+####################################################################################################
+def load_quartet_mesh(tet_file,
+                      memory_bounded=False,
+                      block_size=DEFAULT_ELEMENTS_BLOCK_SIZE):
+    """Loads a QuarTet mesh into a TetrahedralMesh.
+
+    :param tet_file:
+        Quartet .tet file.
+    :param memory_bounded:
+        If set, the elements are never loaded into memory at once, but streamed from the file
+        block by block whenever they are needed.
+    :param block_size:
+        The number of elements processed at once.
+    :return:
+        A TetrahedralMesh.
+    """
+
+    nodes = read_quartet_tet_file_nodes(tet_file)
+    mesh_name = os.path.basename(tet_file).split('.')[0]
+
+    def read_element_blocks():
+        return iterate_quartet_tet_file(tet_file, block_size)
+
+    if memory_bounded:
+        return TetrahedralMesh(mesh_name, nodes, element_blocks_reader=read_element_blocks,
+                               block_size=block_size)
+
+    blocks = list(read_element_blocks())
+    elements = numpy.concatenate(blocks) if blocks else numpy.zeros((0, 4), dtype=numpy.int64)
+    return TetrahedralMesh(mesh_name, nodes, elements=elements, block_size=block_size)
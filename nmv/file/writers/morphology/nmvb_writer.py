@@ -0,0 +1,105 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Internal imports
+import nmv.consts
+import nmv.file
+import nmv.skeleton
+
+
+####################################################################################################
+# @get_morphology_binary_tables
+####################################################################################################
+def get_morphology_binary_tables(morphology_object):
+    """Gets the tables of a morphology skeleton that are stored in a binary morphology file.
+
+    :param morphology_object:
+        A given morphology object.
+    :return:
+        A dictionary of the sections, parents, points, radii and soma_points tables, as lists,
+        and the number of the profile points of the soma on the arbors.
+    """
+
+    # The sections of every arbor in depth-first order, the apical dendrites come first
+    sections = nmv.skeleton.ops.get_morphology_sections(morphology_object)
+    rows = {id(section): i for i, section in enumerate(sections)}
+
+    sections_table = list()
+    parents_table = list()
+    points = list()
+    radii = list()
+    for section in sections:
+        sections_table.append([len(radii), len(section.samples), section.type, section.index])
+        parents_table.append(rows.get(id(section.parent), -1))
+        points.extend([sample.point[:] for sample in section.samples])
+        radii.extend([sample.radius for sample in section.samples])
+
+    # The profile points of the soma followed by its profile points on the arbors
+    soma_points = list()
+    number_arbors_profile_points = 0
+    if morphology_object.soma is not None:
+        soma_points.extend([point[:] for point in morphology_object.soma.profile_points])
+        if morphology_object.soma.arbors_profile_points is not None:
+            soma_points.extend(
+                [point[:] for point in morphology_object.soma.arbors_profile_points])
+            number_arbors_profile_points = len(morphology_object.soma.arbors_profile_points)
+
+    return {'sections': sections_table,
+            'parents': parents_table,
+            'points': points,
+            'radii': radii,
+            'soma_points': soma_points,
+            'number_arbors_profile_points': number_arbors_profile_points}
+
+
+####################################################################################################
+# @write_morphology_to_nmvb_file
+####################################################################################################
+def write_morphology_to_nmvb_file(morphology_object,
+                                  output_directory):
+    """Writes the morphology skeleton to a compact binary morphology file (.nmvb) that can be
+    mapped into memory directly when it is loaded.
+
+    :param morphology_object:
+        A given morphology object to be written to the file.
+    :param output_directory:
+        The directory where the file will be written, labeled with the morphology label.
+    :return:
+        The path of the written file.
+    """
+
+    tables = get_morphology_binary_tables(morphology_object)
+
+    soma = morphology_object.soma
+    original_center = morphology_object.original_center
+    file_path = '%s/%s%s' % (output_directory, morphology_object.label,
+                             nmv.consts.Skeleton.NMVB_EXTENSION)
+
+    nmv.file.write_binary_morphology(
+        file_path=file_path,
+        sections=tables['sections'],
+        parents=tables['parents'],
+        points=tables['points'],
+        radii=tables['radii'],
+        soma_points=tables['soma_points'],
+        number_arbors_profile_points=tables['number_arbors_profile_points'],
+        original_center=None if original_center is None else original_center[:],
+        soma_centroid=None if soma is None else soma.centroid[:],
+        soma_mean_radius=-1.0 if soma is None else soma.mean_radius,
+        number_stems=morphology_object.number_stems)
+
+    return file_path
@@ -15,8 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .curve import *
-from .line import *
-from .sphere import *
-from .vertex import *
-from .poly_line import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'curve',
+    'line',
+    'sphere',
+    'vertex',
+    'poly_line',
+))
@@ -16,7 +16,16 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .intersection import *
-from .line_ops import *
-from .sphere_ops import *
-from .poly_line_ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'intersection',
+    'line_ops',
+    'sphere_ops',
+    'poly_line_ops',
+    'resampling_ops',
+    'simplification_ops',
+    'glyph_ops',
+))
@@ -0,0 +1,175 @@
+####################################################################################################
+#  Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import numpy
+
+# Internal imports
+import nmv.mesh
+
+
+# Subdivisions -> (vertices, triangles) of a unit ico-sphere, computed once and shared
+unit_ico_spheres = dict()
+
+
+####################################################################################################
+# @create_ico_sphere_arrays
+####################################################################################################
+def create_ico_sphere_arrays(subdivisions=1):
+    """Creates a unit ico-sphere as arrays of vertices and triangles.
+
+    The subdivisions follow the convention of Blender's ico-sphere primitive, where 1 is the
+    icosahedron and every further level splits each triangle into four, for example 3 gives 162
+    vertices and 320 triangles.
+
+    :param subdivisions:
+        The subdivision level of the ico-sphere, 1 by default.
+    :return:
+        An Nx3 array of vertices and an Mx3 array of triangles.
+    """
+
+    # The icosahedron
+    t = (1.0 + 5.0 ** 0.5) / 2.0
+    vertices = [[-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+                [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+                [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1]]
+    triangles = [[0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+                 [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+                 [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+                 [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]]
+
+    # Split every triangle into four, sharing the mid-points between the adjacent triangles
+    for _ in range(subdivisions - 1):
+        mid_points = dict()
+
+        def get_mid_point(i, j):
+            key = (min(i, j), max(i, j))
+            if key not in mid_points:
+                mid_points[key] = len(vertices)
+                vertices.append([0.5 * (vertices[i][k] + vertices[j][k]) for k in range(3)])
+            return mid_points[key]
+
+        subdivided_triangles = list()
+        for a, b, c in triangles:
+            ab, bc, ca = get_mid_point(a, b), get_mid_point(b, c), get_mid_point(c, a)
+            subdivided_triangles.extend([[a, ab, ca], [b, bc, ab], [c, ca, bc], [ab, bc, ca]])
+        triangles = subdivided_triangles
+
+    vertices = numpy.array(vertices, dtype=numpy.float64)
+    vertices /= numpy.linalg.norm(vertices, axis=1)[:, None]
+    return vertices, numpy.array(triangles, dtype=numpy.int32)
+
+
+####################################################################################################
+# @get_unit_ico_sphere
+####################################################################################################
+def get_unit_ico_sphere(subdivisions=3):
+    """Gets the arrays of a unit ico-sphere glyph, which are only computed on the first request.
+
+    :param subdivisions:
+        The subdivision level of the ico-sphere as in Blender, 3 by default.
+    :return:
+        A read-only Nx3 array of vertices and a read-only Mx3 array of triangles.
+    """
+
+    if subdivisions not in unit_ico_spheres:
+        vertices, triangles = create_ico_sphere_arrays(subdivisions)
+        vertices.flags.writeable = False
+        triangles.flags.writeable = False
+        unit_ico_spheres[subdivisions] = (vertices, triangles)
+    return unit_ico_spheres[subdivisions]
+
+
+####################################################################################################
+# @stamp_glyphs
+####################################################################################################
+def stamp_glyphs(glyph_vertices,
+                 glyph_triangles,
+                 centers,
+                 scales):
+    """Stamps a unit glyph at a list of centers with a list of scales in a single step.
+
+    :param glyph_vertices:
+        An Nx3 array of the vertices of the unit glyph.
+    :param glyph_triangles:
+        An Mx3 array of the triangles of the unit glyph.
+    :param centers:
+        A Kx3 array of the centers of the stamped glyphs.
+    :param scales:
+        An array of K scales, e.g. the radii of spheres.
+    :return:
+        A (K*N)x3 array of vertices and a (K*M)x3 array of triangles of all the glyphs.
+    """
+
+    centers = numpy.asarray(centers, dtype=numpy.float64).reshape(-1, 3)
+    scales = numpy.asarray(scales, dtype=numpy.float64).reshape(-1)
+
+    # Scale and translate the glyph once per center with broadcasting
+    vertices = glyph_vertices[None, :, :] * scales[:, None, None] + centers[:, None, :]
+
+    # Offset the indices of the triangles of every glyph by the vertices of the previous ones
+    offsets = numpy.arange(len(centers), dtype=numpy.int32) * len(glyph_vertices)
+    triangles = glyph_triangles[None, :, :] + offsets[:, None, None]
+    return vertices.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+####################################################################################################
+# @create_ico_spheres_arrays
+####################################################################################################
+def create_ico_spheres_arrays(centers,
+                              radii,
+                              subdivisions=3):
+    """Creates the geometry of a group of ico-spheres as a single set of arrays.
+
+    :param centers:
+        An Nx3 array of the centers of the spheres.
+    :param radii:
+        An array of N radii.
+    :param subdivisions:
+        The subdivision level of the ico-spheres as in Blender, 3 by default.
+    :return:
+        An array of vertices and an array of triangles of all the spheres.
+    """
+
+    glyph_vertices, glyph_triangles = get_unit_ico_sphere(subdivisions)
+    return stamp_glyphs(glyph_vertices, glyph_triangles, centers, radii)
+
+
+####################################################################################################
+# @create_ico_spheres_mesh
+####################################################################################################
+def create_ico_spheres_mesh(centers,
+                            radii,
+                            name,
+                            subdivisions=3):
+    """Creates a single mesh object that contains a group of ico-spheres, for example the samples
+    of an arbor, in one bulk call instead of creating and joining a mesh per sphere.
+
+    :param centers:
+        An Nx3 array, or a list of points, of the centers of the spheres.
+    :param radii:
+        An array, or a list, of N radii.
+    :param name:
+        The name of the mesh object.
+    :param subdivisions:
+        The subdivision level of the ico-spheres as in Blender, 3 by default.
+    :return:
+        A reference to the created mesh object, linked to the scene.
+    """
+
+    vertices, triangles = create_ico_spheres_arrays(centers, radii, subdivisions)
+    return nmv.mesh.create_mesh_from_arrays(vertices=vertices, triangles=triangles, name=name)
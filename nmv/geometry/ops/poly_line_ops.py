@@ -372,6 +372,32 @@ def draw_poly_lines_in_multiple_objects(poly_lines,
     #    poly_lines_list.append(draw_poly_line(poly_line), )
 
 
+####################################################################################################
+# @resample_poly_line
+####################################################################################################
+def resample_poly_line(poly_line,
+                       mode,
+                       sampling_step=1.0):
+    """Resamples a poly-line in a single pass using its arc length and radius profile, and rebuilds
+    its samples list at once.
+
+    :param poly_line:
+        A given poly-line to be resampled, with at least two samples.
+    :param mode:
+        The resampling mode, one of the nmv.geometry.RESAMPLING_* modes.
+    :param sampling_step:
+        The sampling step of the fixed-step mode.
+    """
+
+    points = [sample[0][:3] for sample in poly_line.samples]
+    radii = [get_sample_radius(sample) for sample in poly_line.samples]
+    points, radii = nmv.geometry.resample_poly_line_profile(
+        points=points, radii=radii, mode=mode, sampling_step=sampling_step)
+
+    poly_line.samples = [point_to_sample(point, radius)
+                         for point, radius in zip(points.tolist(), radii.tolist())]
+
+
 ####################################################################################################
 # @resample_poly_line_at_fixed_step
 ####################################################################################################
@@ -397,67 +423,10 @@ def resample_poly_line_at_fixed_step(poly_line,
         nmv.logger.error('Poly-line [%s] has ONE sample, cannot be re-sampled' % poly_line.name)
         return
 
-    # If the poly-line length is less than the sampling step, then adaptively resample it
-    poly_line_length = compute_poly_line_length(poly_line=poly_line)
-    if poly_line_length < sampling_step:
-        # Get a good sampling step that would match this small poly-line
-        number_samples = len(poly_line.samples)
-        convenient_step = poly_line_length / number_samples
-
-        # Resample the poly-line at this sampling step
-        resample_poly_line_at_fixed_step(poly_line=poly_line, sampling_step=convenient_step)
-        return
-
-    # Sample index
-    i = 0
-
-    # Just keep moving along the poly-line till you hit the last sample
-    while True:
-
-        # Break if we reach the last sample
-        if i >= len(poly_line.samples) - 1:
-            break
-
-        # Compute the distance between the current sample and the next one
-        distance = (sample_to_point(poly_line.samples[i + 1]) -
-                    sample_to_point(poly_line.samples[i])).length
-
-        # If the distance is less than the resampling step, then remove this sample at [i + 1]
-        if distance < sampling_step:
-
-            # If this is the last sample, then terminate as we cannot remove the last sample
-            if i >= len(poly_line.samples) - 2:
-                break
-
-            # Remove the sample
-            poly_line.samples.remove(poly_line.samples[i + 1])
-
-            # Proceed to the next sample
-            continue
-
-        # If the sample is at a greater step, then add a new sample exactly at the current step
-        else:
-
-            # Compute the auxiliary sample radius based on the previous and next samples
-            radius = (get_sample_radius(poly_line.samples[i + 1]) +
-                      get_sample_radius(poly_line.samples[i])) / 2.0
-
-            # Compute the direction
-            direction = (sample_to_point(poly_line.samples[i + 1]) -
-                         sample_to_point(poly_line.samples[i])).normalized()
-
-            # Compute the auxiliary sample point, use epsilon for floating point comparison
-            point = sample_to_point(poly_line.samples[i]) + (direction * sampling_step)
-
-            # Update the samples list
-            poly_line.samples.insert(i + 1, point_to_sample(point, radius))
-
-            # Move to the nex sample
-            i += 1
-
-            # Break if we reach the last sample
-            if i >= len(poly_line.samples) - 1:
-                break
+    # Place the samples along the poly-line at the given step, short poly-lines use a
+    # convenient step that is derived from their length
+    resample_poly_line(poly_line=poly_line, mode=nmv.geometry.RESAMPLING_FIXED_STEP,
+                       sampling_step=sampling_step)
 
 
 ####################################################################################################
@@ -482,59 +451,8 @@ def resample_poly_line_adaptively(poly_line):
         nmv.logger.error('Poly-line [%s] has ONE sample, cannot be re-sampled' % poly_line.name)
         return
 
-    # Sample index
-    i = 0
-
-    # Just keep moving along the poly-line till you hit the last sample
-    while True:
-
-        # Break if we reach the last sample
-        if i >= len(poly_line.samples) - 1:
-            break
-
-        # Compute the distance between the current sample and the next one
-        distance = (sample_to_point(poly_line.samples[i + 1]) -
-                    sample_to_point(poly_line.samples[i])).length
-
-        # Get the extent of the sample, where no other samples should be located
-        extent = get_sample_radius(poly_line.samples[i])
-
-        # If the next sample is located within the extent of this sample, then remove it
-        if distance < extent:
-
-            # If this is the last sample, then terminate as we cannot remove the last sample
-            if i >= len(poly_line.samples) - 2:
-                break
-
-            # Remove the sample
-            poly_line.samples.remove(poly_line.samples[i + 1])
-
-            # Proceed to the next sample
-            continue
-
-        # Otherwise, add a new sample at the radius
-        else:
-
-            # Compute the auxiliary sample radius based on the previous and next samples
-            radius = (get_sample_radius(poly_line.samples[i + 1]) +
-                      get_sample_radius(poly_line.samples[i])) / 2.0
-
-            # Compute the direction
-            direction = (sample_to_point(poly_line.samples[i + 1]) -
-                         sample_to_point(poly_line.samples[i])).normalized()
-
-            # Compute the auxiliary sample point, use epsilon for floating point comparison
-            point = sample_to_point(poly_line.samples[i]) + (direction * extent)
-
-            # Update the samples list
-            poly_line.samples.insert(i + 1, point_to_sample(point, radius))
-
-            # Move to the nex sample
-            i += 1
-
-            # Break if we reach the last sample
-            if i >= len(poly_line.samples) - 1:
-                break
+    # Place every sample at the radius of the previous one
+    resample_poly_line(poly_line=poly_line, mode=nmv.geometry.RESAMPLING_ADAPTIVE_PACKED)
 
 
 ####################################################################################################
@@ -559,57 +477,5 @@ def resample_poly_line_adaptively_relaxed(poly_line):
         nmv.logger.error('Poly-line [%s] has ONE sample, cannot be re-sampled' % poly_line.name)
         return
 
-    # Sample index
-    i = 0
-
-    # Just keep moving along the poly-line till you hit the last sample
-    while True:
-
-        # Break if we reach the last sample
-        if i >= len(poly_line.samples) - 1:
-            break
-
-        # Compute the distance between the current sample and the next one
-        distance = (sample_to_point(poly_line.samples[i + 1]) -
-                    sample_to_point(poly_line.samples[i])).length
-
-        # Get the extent of the sample, where no other samples should be located
-        extent = get_sample_radius(poly_line.samples[i]) + \
-                 get_sample_radius(poly_line.samples[i + 1])
-
-        # If the next sample is located within the extent of this sample, then remove it
-        if distance < extent:
-
-            # If this is the last sample, then terminate as we cannot remove the last sample
-            if i >= len(poly_line.samples) - 2:
-                break
-
-            # Remove the sample
-            poly_line.samples.remove(poly_line.samples[i + 1])
-
-            # Proceed to the next sample
-            continue
-
-        # Otherwise, add a new sample at the radius
-        else:
-
-            # Compute the auxiliary sample radius based on the previous and next samples
-            radius = (get_sample_radius(poly_line.samples[i + 1]) +
-                      get_sample_radius(poly_line.samples[i])) / 2.0
-
-            # Compute the direction
-            direction = (sample_to_point(poly_line.samples[i + 1]) -
-                         sample_to_point(poly_line.samples[i])).normalized()
-
-            # Compute the auxiliary sample point, use epsilon for floating point comparison
-            point = sample_to_point(poly_line.samples[i]) + (direction * extent)
-
-            # Update the samples list
-            poly_line.samples.insert(i + 1, point_to_sample(point, radius))
-
-            # Move to the nex sample
-            i += 1
-
-            # Break if we reach the last sample
-            if i >= len(poly_line.samples) - 1:
-                break
+    # Place every sample at the sum of its radius and the radius of the previous one
+    resample_poly_line(poly_line=poly_line, mode=nmv.geometry.RESAMPLING_ADAPTIVE_RELAXED)
@@ -0,0 +1,302 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import numpy
+
+
+# The resampling modes of a profile
+RESAMPLING_FIXED_STEP = 'FIXED_STEP'
+RESAMPLING_ADAPTIVE_PACKED = 'ADAPTIVE_PACKED'
+RESAMPLING_ADAPTIVE_RELAXED = 'ADAPTIVE_RELAXED'
+
+# The smallest step of the adaptive resampling, avoids stalling at samples with zero radii
+MINIMUM_ADAPTIVE_STEP = 0.01
+
+# The largest number of samples that the smallest step may place along a poly-line, such that the
+# segments with almost zero radii do not make long poly-lines very dense
+MAXIMUM_ADAPTIVE_SAMPLES = 1000
+
+
+####################################################################################################
+# @compute_arc_lengths
+####################################################################################################
+def compute_arc_lengths(points):
+    """Computes the cumulative arc length at every point of a poly-line.
+
+    :param points:
+        An Nx3 array of the points of the poly-line.
+    :return:
+        An array of N arc lengths, starting at 0.0.
+    """
+
+    arc_lengths = numpy.zeros(len(points), dtype=numpy.float64)
+    if len(points) > 1:
+        numpy.cumsum(numpy.linalg.norm(numpy.diff(points, axis=0), axis=1), out=arc_lengths[1:])
+    return arc_lengths
+
+
+####################################################################################################
+# @compute_fixed_step_arc_positions
+####################################################################################################
+def compute_fixed_step_arc_positions(length,
+                                     number_samples,
+                                     sampling_step):
+    """Computes the arc positions of the samples of a poly-line that is resampled at a fixed step.
+
+    The first and last positions are always at the ends of the poly-line. If the poly-line is
+    shorter than the step, a convenient step is derived from its length and number of samples.
+
+    :param length:
+        The length of the poly-line.
+    :param number_samples:
+        The current number of samples of the poly-line.
+    :param sampling_step:
+        The sampling step.
+    :return:
+        An array of the arc positions of the new samples.
+    """
+
+    if length < sampling_step:
+        sampling_step = length / number_samples
+    if sampling_step <= 0.0:
+        return numpy.array([0.0, length])
+
+    # All the positions at a multiple of the step strictly before the end, then the end
+    count = int(numpy.ceil(length / sampling_step - 1e-9))
+    positions = numpy.arange(max(count, 1), dtype=numpy.float64) * sampling_step
+    return numpy.append(positions, length)
+
+
+####################################################################################################
+# @compute_adaptive_arc_positions
+####################################################################################################
+def compute_adaptive_arc_positions(arc_lengths,
+                                   radii,
+                                   relaxed=False,
+                                   minimum_step=None):
+    """Computes the arc positions of the samples of a poly-line that is resampled adaptively.
+
+    In the packed mode, every sample is placed at a distance of the radius of its predecessor, so
+    consecutive samples overlap. In the relaxed mode, the distance is the sum of the radii of the
+    two samples, so they only touch. The positions are generated in a single pass that walks the
+    segments of the poly-line and the new samples together.
+
+    :param arc_lengths:
+        The cumulative arc lengths of the points of the poly-line.
+    :param radii:
+        The radii of the points of the poly-line.
+    :param relaxed:
+        Use the relaxed mode, otherwise the packed mode.
+    :param minimum_step:
+        The smallest step between two samples. If None, the larger of MINIMUM_ADAPTIVE_STEP and
+        the length of the poly-line divided by MAXIMUM_ADAPTIVE_SAMPLES is used.
+    :return:
+        An array of the arc positions of the new samples.
+    """
+
+    length = float(arc_lengths[-1])
+    if minimum_step is None:
+        minimum_step = max(MINIMUM_ADAPTIVE_STEP, length / MAXIMUM_ADAPTIVE_SAMPLES)
+    arc_lengths = arc_lengths.tolist()
+    radii = radii.tolist()
+    last_segment = len(arc_lengths) - 2
+
+    def get_radius(position, segment):
+
+        # Move forward to the segment that contains the position
+        while segment < last_segment and arc_lengths[segment + 1] < position:
+            segment += 1
+
+        # Interpolate the radius along the segment
+        segment_length = arc_lengths[segment + 1] - arc_lengths[segment]
+        t = 0.0 if segment_length <= 0.0 else \
+            min(max((position - arc_lengths[segment]) / segment_length, 0.0), 1.0)
+        return radii[segment] + t * (radii[segment + 1] - radii[segment]), segment
+
+    positions = [0.0]
+    position = 0.0
+    segment = 0
+    while True:
+        radius, segment = get_radius(position, segment)
+        step = radius
+
+        # Add the radius of the next sample, estimated at the distance of two radii
+        if relaxed:
+            step += get_radius(position + 2.0 * radius, segment)[0]
+
+        position += max(step, minimum_step)
+        if position >= length - 1e-9:
+            break
+        positions.append(position)
+
+    positions.append(length)
+    return numpy.array(positions)
+
+
+####################################################################################################
+# @interpolate_poly_line_profile
+####################################################################################################
+def interpolate_poly_line_profile(points,
+                                  radii,
+                                  arc_lengths,
+                                  positions):
+    """Interpolates the points and radii of a poly-line at given arc positions.
+
+    :param points:
+        An Nx3 array of the points of the poly-line.
+    :param radii:
+        An array of the N radii of the poly-line.
+    :param arc_lengths:
+        The cumulative arc lengths of the points of the poly-line.
+    :param positions:
+        An array of M arc positions, sorted.
+    :return:
+        An Mx3 array of points and an array of M radii.
+    """
+
+    # The segment of every position and the interpolation factor along it
+    segments = numpy.clip(numpy.searchsorted(arc_lengths, positions, side='right') - 1,
+                          0, len(arc_lengths) - 2)
+    segment_lengths = arc_lengths[segments + 1] - arc_lengths[segments]
+    t = numpy.divide(positions - arc_lengths[segments], segment_lengths,
+                     out=numpy.zeros(len(positions)), where=segment_lengths > 0.0)
+    t = numpy.clip(t, 0.0, 1.0)
+
+    new_points = points[segments] + t[:, None] * (points[segments + 1] - points[segments])
+    new_radii = radii[segments] + t * (radii[segments + 1] - radii[segments])
+    return new_points, new_radii
+
+
+####################################################################################################
+# @resample_poly_line_profile
+####################################################################################################
+def resample_poly_line_profile(points,
+                               radii,
+                               mode,
+                               sampling_step=1.0,
+                               minimum_step=None):
+    """Resamples the profile of a poly-line, i.e. its points and radii, in a single pass.
+
+    The new samples are distributed along the arc length of the poly-line and their radii are
+    linearly interpolated, while the first and last samples are always kept.
+
+    :param points:
+        An Nx3 array of the points of the poly-line, N >= 2.
+    :param radii:
+        An array of the N radii of the poly-line.
+    :param mode:
+        RESAMPLING_FIXED_STEP, RESAMPLING_ADAPTIVE_PACKED or RESAMPLING_ADAPTIVE_RELAXED.
+    :param sampling_step:
+        The sampling step of the fixed-step mode.
+    :param minimum_step:
+        The smallest step of the adaptive modes, by default relative to the length of the
+        poly-line, see compute_adaptive_arc_positions.
+    :return:
+        An Mx3 array of points and an array of M radii.
+    """
+
+    points = numpy.asarray(points, dtype=numpy.float64)
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+    arc_lengths = compute_arc_lengths(points)
+
+    if mode == RESAMPLING_FIXED_STEP:
+        positions = compute_fixed_step_arc_positions(
+            float(arc_lengths[-1]), len(points), sampling_step)
+    else:
+        positions = compute_adaptive_arc_positions(
+            arc_lengths, radii, relaxed=mode == RESAMPLING_ADAPTIVE_RELAXED,
+            minimum_step=minimum_step)
+
+    new_points, new_radii = interpolate_poly_line_profile(points, radii, arc_lengths, positions)
+
+    # Keep the ends exactly
+    new_points[0], new_points[-1] = points[0], points[-1]
+    new_radii[0], new_radii[-1] = radii[0], radii[-1]
+    return new_points, new_radii
+
+
+####################################################################################################
+# @resample_poly_line_profiles_at_fixed_step
+####################################################################################################
+def resample_poly_line_profiles_at_fixed_step(points,
+                                              radii,
+                                              offsets,
+                                              sampling_step=1.0):
+    """Resamples a batch of poly-lines, that are stored in concatenated arrays, at a fixed step.
+
+    All the poly-lines are processed together with array operations.
+
+    :param points:
+        An Nx3 array of the points of all the poly-lines.
+    :param radii:
+        An array of the N radii of all the poly-lines.
+    :param offsets:
+        An array of K + 1 offsets of the first point of each of the K poly-lines, where the last
+        one is N. Every poly-line must have at least two points.
+    :param sampling_step:
+        The sampling step.
+    :return:
+        The new points, radii and offsets of the poly-lines, in the same layout.
+    """
+
+    points = numpy.asarray(points, dtype=numpy.float64)
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    starts = offsets[:-1]
+    ends = offsets[1:] - 1
+
+    # The cumulative arc length of all the points, restarted at every poly-line
+    segment_lengths = numpy.linalg.norm(numpy.diff(points, axis=0), axis=1)
+    segment_lengths[ends[:-1]] = 0.0
+    arc_lengths = numpy.concatenate(([0.0], numpy.cumsum(segment_lengths)))
+    arc_lengths -= numpy.repeat(arc_lengths[starts], offsets[1:] - starts)
+    lengths = arc_lengths[ends]
+
+    # The step of every poly-line, shorter poly-lines use a convenient one
+    steps = numpy.where(lengths < sampling_step, lengths / (offsets[1:] - starts), sampling_step)
+    steps = numpy.maximum(steps, 1e-12)
+    counts = numpy.maximum(numpy.ceil(lengths / steps - 1e-9).astype(numpy.int64), 1) + 1
+    new_offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+
+    # The arc position of every new sample, and the last sample at the end of every poly-line
+    poly_lines = numpy.repeat(numpy.arange(len(counts)), counts)
+    ranks = numpy.arange(new_offsets[-1]) - new_offsets[poly_lines]
+    positions = ranks * steps[poly_lines]
+    last = new_offsets[1:] - 1
+    positions[last] = lengths
+
+    # Locate every position in the segments of its own poly-line
+    global_positions = positions + poly_lines * (lengths.max() + 1.0)
+    global_arc_lengths = arc_lengths + numpy.repeat(numpy.arange(len(counts)),
+                                                    offsets[1:] - starts) * (lengths.max() + 1.0)
+    segments = numpy.searchsorted(global_arc_lengths, global_positions, side='right') - 1
+    segments = numpy.clip(segments, starts[poly_lines], ends[poly_lines] - 1)
+
+    segment_spans = arc_lengths[segments + 1] - arc_lengths[segments]
+    t = numpy.divide(positions - arc_lengths[segments], segment_spans,
+                     out=numpy.zeros(len(positions)), where=segment_spans > 0.0)
+    t = numpy.clip(t, 0.0, 1.0)
+
+    new_points = points[segments] + t[:, None] * (points[segments + 1] - points[segments])
+    new_radii = radii[segments] + t * (radii[segments + 1] - radii[segments])
+
+    # Keep the ends exactly
+    first = new_offsets[:-1]
+    new_points[first], new_radii[first] = points[starts], radii[starts]
+    new_points[last], new_radii[last] = points[ends], radii[ends]
+    return new_points, new_radii, new_offsets
@@ -0,0 +1,310 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import numpy
+
+
+# The simplification methods of a profile
+SIMPLIFICATION_DOUGLAS_PEUCKER = 'DOUGLAS_PEUCKER'
+SIMPLIFICATION_VISVALINGAM = 'VISVALINGAM'
+
+
+####################################################################################################
+# @compute_chords_deviations
+####################################################################################################
+def compute_chords_deviations(points,
+                              radii,
+                              firsts,
+                              lasts,
+                              tolerance,
+                              radius_tolerance):
+    """Computes the deviations of the inner points of a batch of chords at once.
+
+    Each inner point is projected on its chord, and its radius is compared against the radius
+    interpolated linearly at its projection. The positional and radial deviations are normalized
+    by their tolerances, so a point within both tolerances has a deviation that is at most 1.
+
+    :param points:
+        An Nx3 array of the points of all the poly-lines.
+    :param radii:
+        An array of N radii.
+    :param firsts:
+        An array of the indices of the first points of the chords.
+    :param lasts:
+        An array of the indices of the last points of the chords.
+    :param tolerance:
+        The positional tolerance.
+    :param radius_tolerance:
+        The radial tolerance.
+    :return:
+        The chord of every inner point, the indices of the inner points and their normalized
+        deviations, where the inner points of every chord are consecutive.
+    """
+
+    counts = numpy.maximum(lasts - firsts - 1, 0)
+    chord_ids = numpy.repeat(numpy.arange(len(firsts)), counts)
+    group_starts = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    inner = numpy.repeat(firsts + 1, counts) + numpy.arange(int(counts.sum())) - group_starts
+
+    first_points = points[firsts[chord_ids]]
+    chords = points[lasts[chord_ids]] - first_points
+    offsets = points[inner] - first_points
+
+    # The parameters of the projections of the points on the chords, clamped to the chords
+    lengths_squared = numpy.einsum('ij,ij->i', chords, chords)
+    t = numpy.einsum('ij,ij->i', offsets, chords) / numpy.maximum(lengths_squared, 1e-24)
+    t = numpy.clip(numpy.where(lengths_squared > 0.0, t, 0.0), 0.0, 1.0)
+
+    positional_deviations = numpy.linalg.norm(offsets - t[:, None] * chords, axis=1)
+    first_radii = radii[firsts[chord_ids]]
+    radial_deviations = numpy.abs(
+        radii[inner] - (first_radii + t * (radii[lasts[chord_ids]] - first_radii)))
+
+    deviations = numpy.maximum(positional_deviations / max(tolerance, 1e-12),
+                               radial_deviations / max(radius_tolerance, 1e-12))
+    return chord_ids, inner, deviations
+
+
+####################################################################################################
+# @find_chords_maxima
+####################################################################################################
+def find_chords_maxima(chord_ids,
+                       deviations,
+                       number_chords):
+    """Finds the largest deviation of every chord and the position of the point that has it.
+
+    :param chord_ids:
+        The chord of every inner point, sorted.
+    :param deviations:
+        The deviations of the inner points.
+    :param number_chords:
+        The number of chords.
+    :return:
+        An array of the largest deviation of every chord (-1 for chords without inner points) and
+        an array of the positions of the corresponding points in the deviations array.
+    """
+
+    maxima = numpy.full(number_chords, -1.0)
+    positions = numpy.full(number_chords, -1, dtype=numpy.int64)
+    if len(deviations) == 0:
+        return maxima, positions
+
+    # The inner points of every chord are consecutive
+    counts = numpy.bincount(chord_ids, minlength=number_chords)
+    non_empty = counts > 0
+    starts = (numpy.cumsum(counts) - counts)[non_empty]
+    maxima[non_empty] = numpy.maximum.reduceat(deviations, starts)
+
+    # The first point of every chord that reaches the maximum
+    candidates = numpy.flatnonzero(deviations == maxima[chord_ids])
+    _, first_candidates = numpy.unique(chord_ids[candidates], return_index=True)
+    positions[chord_ids[candidates[first_candidates]]] = candidates[first_candidates]
+    return maxima, positions
+
+
+####################################################################################################
+# @get_profiles_ends
+####################################################################################################
+def get_profiles_ends(offsets):
+    """Gets the first and last points of the non-empty poly-lines of concatenated profiles.
+
+    :param offsets:
+        An array of P + 1 offsets of the P poly-lines in the concatenated arrays.
+    :return:
+        Two arrays of the indices of the first and last points of the poly-lines.
+    """
+
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    non_empty = offsets[1:] > offsets[:-1]
+    return offsets[:-1][non_empty], offsets[1:][non_empty] - 1
+
+
+####################################################################################################
+# @simplify_profiles_douglas_peucker
+####################################################################################################
+def simplify_profiles_douglas_peucker(points,
+                                      radii,
+                                      offsets,
+                                      tolerance,
+                                      radius_tolerance):
+    """Simplifies concatenated poly-lines with radii using a radius-aware Douglas-Peucker algorithm.
+
+    The chords of all the poly-lines are refined together, level by level, where every level is
+    computed with array operations at once.
+
+    :param points:
+        An Nx3 array of the points of all the poly-lines.
+    :param radii:
+        An array of N radii.
+    :param offsets:
+        An array of P + 1 offsets of the P poly-lines in the concatenated arrays.
+    :param tolerance:
+        The maximum positional deviation of a removed point.
+    :param radius_tolerance:
+        The maximum radial deviation of a removed point.
+    :return:
+        A boolean array, True for the kept points.
+    """
+
+    firsts, lasts = get_profiles_ends(offsets)
+    keep = numpy.zeros(len(points), dtype=bool)
+    keep[firsts] = True
+    keep[lasts] = True
+
+    while True:
+
+        # Only the chords with inner points can be split
+        splittable = lasts - firsts > 1
+        firsts, lasts = firsts[splittable], lasts[splittable]
+        if len(firsts) == 0:
+            break
+
+        chord_ids, inner, deviations = compute_chords_deviations(
+            points, radii, firsts, lasts, tolerance, radius_tolerance)
+        maxima, positions = find_chords_maxima(chord_ids, deviations, len(firsts))
+
+        # Accept the chords within the tolerances, and split the others at their worst points
+        split = maxima > 1.0
+        split_points = inner[positions[split]]
+        keep[split_points] = True
+        firsts, lasts = (numpy.concatenate((firsts[split], split_points)),
+                         numpy.concatenate((split_points, lasts[split])))
+
+    return keep
+
+
+####################################################################################################
+# @simplify_profiles_visvalingam
+####################################################################################################
+def simplify_profiles_visvalingam(points,
+                                  radii,
+                                  offsets,
+                                  tolerance,
+                                  radius_tolerance):
+    """Simplifies concatenated poly-lines with radii by removing the points in the order of their
+    effective errors, similar to the Visvalingam-Whyatt algorithm.
+
+    The effective error of a point is the largest deviation of all the original points between its
+    kept neighbours from the chord that connects them, so the error of the points that were
+    already removed remains bounded. At every round, all the points that have smaller errors than
+    their kept neighbours are removed at once, as long as they are within the tolerances.
+
+    :param points:
+        An Nx3 array of the points of all the poly-lines.
+    :param radii:
+        An array of N radii.
+    :param offsets:
+        An array of P + 1 offsets of the P poly-lines in the concatenated arrays.
+    :param tolerance:
+        The maximum positional deviation of a removed point.
+    :param radius_tolerance:
+        The maximum radial deviation of a removed point.
+    :return:
+        A boolean array, True for the kept points.
+    """
+
+    number_points = len(points)
+    firsts, lasts = get_profiles_ends(offsets)
+    keep = numpy.ones(number_points, dtype=bool)
+
+    # The kept neighbours of every point, as linked lists
+    previous_points = numpy.arange(number_points) - 1
+    next_points = numpy.arange(number_points) + 1
+    removable = numpy.ones(number_points, dtype=bool)
+    removable[firsts] = False
+    removable[lasts] = False
+
+    # A fixed pseudo-random rank breaks the ties between neighbours with equal errors, e.g. along
+    # straight segments, so that many points can be removed in every round
+    ranks = (numpy.arange(number_points, dtype=numpy.uint64) *
+             numpy.uint64(2654435761)) % numpy.uint64(4294967291)
+
+    errors = numpy.full(number_points, numpy.inf)
+    while True:
+        candidates = numpy.flatnonzero(removable)
+        if len(candidates) == 0:
+            break
+
+        # The effective errors of the candidates
+        chord_ids, _, deviations = compute_chords_deviations(
+            points, radii, previous_points[candidates], next_points[candidates],
+            tolerance, radius_tolerance)
+        errors[candidates], _ = find_chords_maxima(chord_ids, deviations, len(candidates))
+        errors[candidates] = numpy.maximum(errors[candidates], 0.0)
+
+        # The points beyond the tolerances are kept for good
+        exceeding = errors[candidates] > 1.0
+        removable[candidates[exceeding]] = False
+        errors[candidates[exceeding]] = numpy.inf
+        candidates = candidates[~exceeding]
+        if len(candidates) == 0:
+            break
+
+        # Remove the points whose errors are smaller than those of their kept neighbours
+        selected = numpy.ones(len(candidates), dtype=bool)
+        for neighbours in (previous_points[candidates], next_points[candidates]):
+            selected &= (errors[candidates] < errors[neighbours]) | \
+                        ((errors[candidates] == errors[neighbours]) &
+                         (ranks[candidates] < ranks[neighbours]))
+        removed = candidates[selected]
+
+        # Unlink the removed points, which are never adjacent
+        keep[removed] = False
+        removable[removed] = False
+        errors[removed] = numpy.inf
+        next_points[previous_points[removed]] = next_points[removed]
+        previous_points[next_points[removed]] = previous_points[removed]
+
+    return keep
+
+
+####################################################################################################
+# @simplify_poly_line_profiles
+####################################################################################################
+def simplify_poly_line_profiles(points,
+                                radii,
+                                offsets,
+                                tolerance,
+                                radius_tolerance,
+                                method=SIMPLIFICATION_DOUGLAS_PEUCKER):
+    """Simplifies a batch of concatenated poly-lines with radii, while bounding both the
+    positional and the radial deviations of the removed points. The ends of every poly-line are
+    always kept.
+
+    :param points:
+        An Nx3 array of the points of all the poly-lines.
+    :param radii:
+        An array of N radii.
+    :param offsets:
+        An array of P + 1 offsets of the P poly-lines in the concatenated arrays.
+    :param tolerance:
+        The maximum positional deviation of a removed point.
+    :param radius_tolerance:
+        The maximum radial deviation of a removed point.
+    :param method:
+        SIMPLIFICATION_DOUGLAS_PEUCKER or SIMPLIFICATION_VISVALINGAM.
+    :return:
+        A boolean array, True for the kept points.
+    """
+
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+
+    if method == SIMPLIFICATION_VISVALINGAM:
+        return simplify_profiles_visvalingam(points, radii, offsets, tolerance, radius_tolerance)
+    return simplify_profiles_douglas_peucker(points, radii, offsets, tolerance, radius_tolerance)
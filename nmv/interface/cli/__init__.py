@@ -15,11 +15,20 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .args_strings import *
-from .arguments_parser import *
-from .common import *
-from .morphology_analysis import *
-from .neuron_mesh_reconstruction import *
-from .neuron_morphology_reconstruction import *
-from .soma_reconstruction import *
-from .options_parser import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'args_strings',
+    'arguments_parser',
+    'common',
+    'morphology_batch',
+    'morphology_analysis',
+    'neuron_mesh_reconstruction',
+    'neuron_morphology_reconstruction',
+    'soma_reconstruction',
+    'sequence_rendering',
+    'mesh_union',
+    'options_parser',
+))
@@ -129,6 +129,11 @@ class Args:
     # Morphology bevel object sides
     MORPHOLOGY_BEVEL_SIDES = '--bevel-sides'
 
+    # Skeleton simplification
+    SIMPLIFICATION_METHOD = '--simplification'
+    SIMPLIFICATION_TOLERANCE = '--simplification-tolerance'
+    SIMPLIFICATION_RADIUS_TOLERANCE = '--simplification-radius-tolerance'
+
     # Branching method
     BRANCHING_METHOD = '--branching'
 
@@ -198,6 +203,15 @@ class Args:
     # Connect the soma to the arbors
     CONNECT_SOMA_ARBORS = '--connect-soma-arbors'
 
+    # Number of processes used to union the sections of the arbors
+    UNION_PROCESSES = '--union-processes'
+
+    # The voxel size of the voxelization meshing algorithm
+    VOXEL_SIZE = '--voxel-size'
+
+    # Number of processes used to evaluate the blocks of the voxelization meshing algorithm
+    VOXELIZATION_PROCESSES = '--voxelization-processes'
+
     ################################################################################################
     # Geometry export arguments
     ################################################################################################
@@ -291,3 +305,24 @@ class Args:
     ################################################################################################
     # Execution node
     EXECUTION_NODE = '--execution-node'
+
+    # Frame scheduler of the rendered sequences
+    SEQUENCE_SCHEDULER = '--sequence-scheduler'
+
+    # Number of workers used to render the sequences
+    SEQUENCE_WORKERS = '--sequence-workers'
+
+    # Number of morphologies loaded ahead in directory and target runs
+    PREFETCH_DEPTH = '--prefetch-depth'
+
+    # Number of threads loading the morphologies in directory and target runs
+    PREFETCH_THREADS = '--prefetch-threads'
+
+    # Minimum time between two progress updates of the same task
+    PROGRESS_INTERVAL = '--progress-interval'
+
+    # JSON events file of the progress of the workers
+    PROGRESS_EVENTS = '--progress-events'
+
+    # Do not print the progress to the standard output
+    QUIET_PROGRESS = '--quiet-progress'
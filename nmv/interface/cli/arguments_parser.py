@@ -311,6 +311,37 @@ def parse_command_line_arguments():
         action='store', type=int, default=16,
         help=arg_help)
 
+    # Skeleton simplification
+    arg_options = ['none', 'douglas-peucker', 'visvalingam']
+    arg_help = 'Simplifies the sections of the skeleton before it is reconstructed, while the \n' \
+               'removed samples are kept within the given tolerances. \n' \
+               'Options: %s \n' \
+               'Default none' % arg_options
+    skeletonization_args.add_argument(
+        Args.SIMPLIFICATION_METHOD,
+        action='store', default='none',
+        help=arg_help)
+
+    # Skeleton simplification positional tolerance
+    arg_help = 'The maximum distance between a removed sample and the simplified section, \n' \
+               'in um.\n' \
+               'Valid only if --simplification is not none.\n' \
+               'Default 0.1'
+    skeletonization_args.add_argument(
+        Args.SIMPLIFICATION_TOLERANCE,
+        action='store', type=float, default=0.1,
+        help=arg_help)
+
+    # Skeleton simplification radial tolerance
+    arg_help = 'The maximum difference between the radius of a removed sample and the radius \n' \
+               'interpolated along the simplified section, in um.\n' \
+               'Valid only if --simplification is not none.\n' \
+               'Default 0.05'
+    skeletonization_args.add_argument(
+        Args.SIMPLIFICATION_RADIUS_TOLERANCE,
+        action='store', type=float, default=0.05,
+        help=arg_help)
+
     ################################################################################################
     # Structures (like spines and nucleus) arguments
     ################################################################################################
@@ -434,7 +465,7 @@ def parse_command_line_arguments():
         help=arg_help)
 
     # Meshing algorithm
-    arg_options = ['(piecewise-watertight)', 'union', 'skinning', 'meta-balls']
+    arg_options = ['(piecewise-watertight)', 'union', 'skinning', 'meta-balls', 'voxelization']
     arg_help = 'Meshing algorithm. \n' \
                'Options: %s' % arg_options
     meshing_args.add_argument(
@@ -494,6 +525,33 @@ def parse_command_line_arguments():
         action='store_true', default=False,
         help=arg_help)
 
+    # Number of processes used by the union meshing algorithm
+    arg_help = 'The number of background processes used to union the sections of every arbor \n' \
+               'in the union meshing algorithm. \n' \
+               'Default 1.'
+    meshing_args.add_argument(
+        Args.UNION_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
+    # Voxel size
+    arg_help = 'The size of the voxels (in microns) used by the voxelization meshing algorithm, ' \
+               'smaller voxels create finer meshes. \n' \
+               'Default 0.0, where the size is derived from the radii of the morphology.'
+    meshing_args.add_argument(
+        Args.VOXEL_SIZE,
+        action='store', type=float, default=0.0,
+        help=arg_help)
+
+    # Number of processes for the voxelization
+    arg_help = 'The number of processes used to evaluate the blocks of the voxel grid ' \
+               'in the voxelization meshing algorithm. \n' \
+               'Default 1.'
+    meshing_args.add_argument(
+        Args.VOXELIZATION_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
     ################################################################################################
     # Geometry export arguments
     ################################################################################################
@@ -721,6 +779,68 @@ def parse_command_line_arguments():
         action='store', default='local',
         help=arg_help)
 
+    # Sequence scheduler
+    arg_options = ['(serial)', 'local', 'slurm']
+    arg_help = 'How the frames of the sequences are rendered: serial renders them in the \n' \
+               'same process, local splits them among worker processes on this machine and \n' \
+               'slurm splits them among the tasks of a SLURM array job, followed by a job \n' \
+               'that assembles the movie. \n' \
+               'Options: %s' % arg_options
+    execution_args.add_argument(
+        Args.SEQUENCE_SCHEDULER,
+        action='store', default='serial',
+        help=arg_help)
+
+    # Sequence workers
+    arg_help = 'The number of worker processes or SLURM array tasks used to render the \n' \
+               'frames of the sequences. \n' \
+               'Default 1.'
+    execution_args.add_argument(
+        Args.SEQUENCE_WORKERS,
+        action='store', type=int, default=1,
+        help=arg_help)
+
+    # Prefetch depth
+    arg_help = 'Process all the morphologies of a directory or a target in a single process, \n' \
+               'while this number of upcoming morphologies is loaded in the background. \n' \
+               'Default 0, every morphology is processed in a separate process.'
+    execution_args.add_argument(
+        Args.PREFETCH_DEPTH,
+        action='store', type=int, default=0,
+        help=arg_help)
+
+    # Prefetch threads
+    arg_help = 'The number of threads loading the morphologies when the prefetch depth is set. \n' \
+               'Default 1.'
+    execution_args.add_argument(
+        Args.PREFETCH_THREADS,
+        action='store', type=int, default=1,
+        help=arg_help)
+
+    # Progress interval
+    arg_help = 'The minimum time, in seconds, between two progress updates of the same loop. \n' \
+               'Default 0.5.'
+    execution_args.add_argument(
+        Args.PROGRESS_INTERVAL,
+        action='store', type=float, default=0.5,
+        help=arg_help)
+
+    # Progress events
+    arg_help = 'A file where all the workers append their progress and the status of the \n' \
+               'processed morphologies as JSON lines, or - for the standard output, where \n' \
+               'the progress of the loops is then printed to the standard error.'
+    execution_args.add_argument(
+        Args.PROGRESS_EVENTS,
+        action='store', default=None,
+        help=arg_help)
+
+    # Quiet progress
+    arg_help = 'Do not print the progress of the loops to the standard output.'
+    execution_args.add_argument(
+        Args.QUIET_PROGRESS,
+        action='store_true', default=False,
+        help=arg_help)
+
     # Parse the arguments, and return a list of them
     return parser.parse_args()
 
@@ -750,8 +870,8 @@ def get_arguments_string_as_list(arguments):
         # Get the argument value
         arg_value = getattr(arguments, arg)
 
-        # Ignore the unset flags
-        if arg_value is False:
+        # Ignore the unset flags and the unset options
+        if arg_value is False or arg_value is None:
             continue
 
         elif arg_value is True:
@@ -0,0 +1,103 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys
+import os
+import argparse
+
+# Blender imports
+import bpy
+
+# Append the internal modules into the system paths to avoid Blender importing conflicts
+import_paths = ['neuromorphovis']
+for import_path in import_paths:
+    sys.path.append(('%s/../../..' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# Internal imports
+import nmv.mesh
+import nmv.scene
+
+
+####################################################################################################
+# @parse_union_worker_arguments
+####################################################################################################
+def parse_union_worker_arguments():
+    """Parses the arguments of a union worker.
+
+    :return:
+        Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(description='NeuroMorphoVis mesh union worker')
+
+    # The input meshes
+    arg_help = 'The .blend file that contains the meshes to be merged.'
+    parser.add_argument('--input-file',
+                        action='store', required=True,
+                        help=arg_help)
+
+    # The output mesh
+    arg_help = 'The .blend file where the merged mesh will be written.'
+    parser.add_argument('--output-file',
+                        action='store', required=True,
+                        help=arg_help)
+
+    # Parse the arguments, and return a list of them
+    return parser.parse_args()
+
+
+####################################################################################################
+# @union_meshes_in_blend_file
+####################################################################################################
+def union_meshes_in_blend_file(input_file,
+                               output_file):
+    """Merges all the meshes in a .blend file into a single mesh and writes it to another file.
+
+    :param input_file:
+        The .blend file that contains the meshes to be merged.
+    :param output_file:
+        The .blend file where the merged mesh will be written.
+    """
+
+    # Start from an empty scene
+    nmv.scene.clear_scene()
+
+    # Load the meshes
+    mesh_objects = nmv.mesh.ops.load_mesh_objects_from_blend_file(input_file)
+
+    # Merge them
+    mesh_object = nmv.mesh.ops.union_mesh_objects_in_balanced_tree(mesh_objects)
+
+    # Write the merged mesh
+    bpy.data.libraries.write(output_file, {mesh_object})
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = [args[0]] + args[args.index("--") + 1:]
+
+    # Parse the command line arguments
+    arguments = parse_union_worker_arguments()
+
+    # Merge the meshes
+    union_meshes_in_blend_file(input_file=arguments.input_file, output_file=arguments.output_file)
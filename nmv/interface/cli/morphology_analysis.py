@@ -92,6 +92,15 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # Directories and targets are processed in this process while the upcoming morphologies are
+    # loaded in the background
+    if arguments.input == 'directory' or arguments.input == 'target':
+        nmv.interface.cli.run_morphology_batch(
+            arguments=arguments, options=input_options,
+            process_function=analyze_morphology_skeleton)
+        nmv.logger.log('Analysis done')
+        exit(0)
+
     # Read the morphology
     input_morphology = None
 
@@ -0,0 +1,171 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Internal imports
+import nmv.consts
+import nmv.file
+import nmv.utilities
+
+
+####################################################################################################
+# @get_batch_inputs
+####################################################################################################
+def get_batch_inputs(arguments):
+    """Gets the inputs of a directory or a target run, either morphology files or GIDs.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        A list of the paths of the morphology files in the directory, or the GIDs of the target.
+    """
+
+    # All the morphology files in the directory
+    if arguments.input == 'directory':
+        morphology_files = list()
+        for extension in ['.h5', '.swc', nmv.consts.Skeleton.NMVB_EXTENSION]:
+            morphology_files.extend(nmv.file.ops.get_files_in_directory(
+                arguments.morphology_directory, extension))
+        return ['%s/%s' % (arguments.morphology_directory, morphology_file)
+                for morphology_file in sorted(morphology_files)]
+
+    # All the GIDs of the target
+    if arguments.input == 'target':
+        session = nmv.file.get_circuit_session(arguments.blue_config)
+        if session is None:
+            return list()
+
+        # Load the cell properties once before the loading threads share the session
+        session.load_columns()
+        return [int(gid) for gid in session.get_gids_from_target(arguments.target)]
+
+    return list()
+
+
+####################################################################################################
+# @load_batch_input
+####################################################################################################
+def load_batch_input(arguments,
+                     batch_input):
+    """Loads the morphology of a single input of a directory or a target run.
+
+    This function runs in the loading threads of the pipeline and does not access the Blender API.
+
+    :param arguments:
+        Command line arguments.
+    :param batch_input:
+        A morphology file or a GID.
+    :return:
+        The loaded morphology.
+    """
+
+    if arguments.input == 'target':
+        loading_flag, morphology = nmv.file.BBPReader.load_morphology_from_circuit(
+            blue_config=arguments.blue_config, gid=batch_input)
+    else:
+        loading_flag, morphology = nmv.file.read_morphology_from_file_naively(batch_input)
+
+    if not loading_flag:
+        raise IOError('Cannot load the morphology [%s]' % str(batch_input))
+    return morphology
+
+
+####################################################################################################
+# @set_batch_input_options
+####################################################################################################
+def set_batch_input_options(arguments,
+                            options,
+                            batch_input):
+    """Updates the morphology options to the current input of a directory or a target run, the
+    same way NeuroMorphoVisOptions.consume_arguments does for a single file or a single GID.
+
+    :param arguments:
+        Command line arguments.
+    :param options:
+        System options.
+    :param batch_input:
+        A morphology file or a GID.
+    """
+
+    if arguments.input == 'target':
+        options.morphology.gid = batch_input
+        options.morphology.blue_config = arguments.blue_config
+        options.morphology.label = 'neuron_' + str(batch_input)
+    else:
+        options.morphology.gid = None
+        options.morphology.morphology_file_path = batch_input
+        options.morphology.label = nmv.file.ops.get_file_name_from_path(batch_input)
+
+
+####################################################################################################
+# @run_morphology_batch
+####################################################################################################
+def run_morphology_batch(arguments,
+                         options,
+                         process_function,
+                         outputs_function=None):
+    """Runs a CLI task on all the morphologies of a directory or a target in a single process.
+
+    The upcoming morphologies are loaded in background threads while the current one is
+    processed, and the outputs that do not need Blender are written in a writer thread.
+
+    :param arguments:
+        Command line arguments.
+    :param options:
+        System options.
+    :param process_function:
+        The task, a function that takes a morphology and the options and runs on the main thread.
+    :param outputs_function:
+        A function that takes a morphology and the options and returns a list of outputs, each is
+        a tuple of a function that does not access the Blender API and its arguments.
+    :return:
+        A list of the inputs that could not be loaded or processed.
+    """
+
+    # Process a single input on the main thread
+    def process_batch_input(pipeline,
+                            batch_input,
+                            morphology):
+        set_batch_input_options(arguments, options, batch_input)
+        process_function(morphology, options)
+
+        if outputs_function is not None:
+            for output in outputs_function(morphology, options):
+                pipeline.submit_output(output[0], *output[1:])
+
+    batch_inputs = get_batch_inputs(arguments)
+    if len(batch_inputs) == 0:
+        nmv.logger.log('ERROR: No morphologies were found in [%s]' % (
+            arguments.morphology_directory if arguments.input == 'directory' else
+            arguments.target))
+        return list()
+
+    pipeline = nmv.utilities.Pipeline(
+        load_function=lambda batch_input: load_batch_input(arguments, batch_input),
+        process_function=process_batch_input,
+        queue_depth=arguments.prefetch_depth,
+        number_loaders=arguments.prefetch_threads)
+
+    nmv.logger.header('Processing [%d] morphologies' % len(batch_inputs))
+    failures = pipeline.run(batch_inputs)
+
+    # Report the timing of the stages
+    for line in pipeline.get_report():
+        nmv.logger.info(line)
+    if len(failures) > 0:
+        nmv.logger.log('ERROR: [%d] morphologies failed: %s' % (len(failures), str(failures)))
+
+    return failures
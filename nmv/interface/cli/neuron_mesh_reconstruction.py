@@ -73,6 +73,11 @@ def reconstruct_neuron_mesh(cli_morphology,
         nmv.logger.log('Builder: Skinning')
         neuron_mesh_builder = nmv.builders.SkinningBuilder(cli_morphology, cli_options)
 
+    # VoxelBuilder
+    elif cli_options.mesh.meshing_technique == nmv.enums.Meshing.Technique.VOXELIZATION:
+        nmv.logger.log('Builder: Voxelization')
+        neuron_mesh_builder = nmv.builders.VoxelBuilder(cli_morphology, cli_options)
+
     # PiecewiseBuilder
     elif cli_options.mesh.meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
         nmv.logger.log('Builder: Piecewise Watertight')
@@ -253,11 +258,16 @@ def render_neuron_mesh_360(cli_options,
             bounding_box = nmv.bbox.compute_unified_extent_bounding_box(
                 extent=cli_options.rendering.close_up_dimensions)
 
+            # Compute a 360 bounding box to fit the arbors
+            bounding_box_360 = nmv.bbox.compute_360_bounding_box(bounding_box,
+                                                                 cli_morphology.soma.centroid)
+
         # Compute the bounding box for a mid shot view
         elif cli_options.rendering.rendering_view == nmv.enums.Rendering.View.MID_SHOT:
 
-            # Compute the bounding box for the available meshes only
-            bounding_box = nmv.bbox.compute_scene_bounding_box_for_meshes()
+            # Compute the 360 bounding box directly from the cached extents of the meshes
+            bounding_box_360 = nmv.bbox.compute_objects_360_bounding_box(
+                nmv.scene.get_list_of_meshes_in_scene(), cli_morphology.soma.centroid)
 
         # Compute the bounding box for the wide shot view that correspond to whole morphology
         else:
@@ -266,51 +276,61 @@ def render_neuron_mesh_360(cli_options,
             bounding_box = nmv.skeleton.compute_full_morphology_bounding_box(
                 morphology=cli_morphology)
 
-        # Compute a 360 bounding box to fit the arbors
-        bounding_box_360 = nmv.bbox.compute_360_bounding_box(bounding_box,
-                                                             cli_morphology.soma.centroid)
+            # Compute a 360 bounding box to fit the arbors
+            bounding_box_360 = nmv.bbox.compute_360_bounding_box(bounding_box,
+                                                                 cli_morphology.soma.centroid)
 
         # Stretch the bounding box by few microns
         bounding_box_360.extend_bbox_uniformly(delta=nmv.consts.Image.GAP_DELTA)
 
-        # Create a specific directory for this mesh
+        # The directory of the frames of this mesh, the existing frames are kept to resume
         output_directory = '%s/%s_mesh_360' % (
             cli_options.io.sequences_directory, cli_options.morphology.label)
-        nmv.file.ops.clean_and_create_directory(output_directory)
 
-        # Get a list of all the meshes in the scene
-        scene_meshes = nmv.scene.get_list_of_meshes_in_scene()
+        # Render the 360 sequence, the frames can be distributed among multiple workers
+        nmv.rendering.render_sequence(
+            scene_objects=nmv.scene.get_list_of_meshes_in_scene(),
+            bounding_box=bounding_box_360,
+            frames_directory=output_directory,
+            sequence_type=nmv.rendering.SEQUENCE_360,
+            camera_view=nmv.enums.Camera.View.FRONT_360,
+            resolution_basis=cli_options.rendering.resolution_basis,
+            image_resolution=cli_options.rendering.full_view_resolution,
+            image_scale_factor=cli_options.rendering.resolution_scale_factor,
+            scheduler=cli_options.rendering.sequence_scheduler,
+            number_workers=cli_options.rendering.sequence_workers)
 
-        # Render 360
-        for i in range(360):
 
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
+####################################################################################################
+# @process_neuron_mesh
+####################################################################################################
+def process_neuron_mesh(cli_morphology,
+                        cli_options):
+    """Reconstructs the mesh of a neuron, exports it and renders it according to the options.
 
-            # Render at a specific resolution
-            if cli_options.rendering.resolution_basis == \
-                    nmv.enums.Rendering.Resolution.FIXED:
+    :param cli_morphology:
+        The morphology loaded from the command line interface (CLI).
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    """
 
-                # Render the image
-                nmv.rendering.renderer.render_at_angle(
-                    scene_objects=scene_meshes,
-                    angle=i,
-                    bounding_box=bounding_box_360,
-                    camera_view=nmv.enums.Camera.View.FRONT_360,
-                    image_resolution=cli_options.rendering.full_view_resolution,
-                    image_name=image_name)
+    # Neuron mesh reconstruction
+    reconstruct_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
 
-            # Render at a specific scale factor
-            else:
+    # Saving the mesh
+    if cli_options.mesh.export_ply or cli_options.mesh.export_obj or \
+       cli_options.mesh.export_stl or cli_options.mesh.export_blend:
 
-                # Render the image
-                nmv.rendering.renderer.render_at_angle_to_scale(
-                    scene_objects=scene_meshes,
-                    angle=i,
-                    bounding_box=bounding_box_360,
-                    camera_view=nmv.enums.Camera.View.FRONT_360,
-                    image_scale_factor=cli_options.rendering.resolution_scale_facto,
-                    image_name=image_name)
+        # Export the neuron mesh
+        export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+
+    # Render the mesh
+    if cli_options.rendering.render_mesh_static_frame:
+        render_neuron_mesh_to_static_frame(cli_options=cli_options, cli_morphology=cli_morphology)
+
+    # Render 360 of the mesh
+    if cli_options.rendering.render_mesh_360:
+        render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
 
 
 ####################################################################################################
@@ -338,6 +358,15 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     cli_options.consume_arguments(arguments=arguments)
 
+    # Directories and targets are processed in this process while the upcoming morphologies are
+    # loaded in the background
+    if arguments.input == 'directory' or arguments.input == 'target':
+        nmv.interface.cli.run_morphology_batch(
+            arguments=arguments, options=cli_options,
+            process_function=process_neuron_mesh)
+        nmv.logger.log('NMV Done')
+        exit(0)
+
     # Read the morphology
     cli_morphology = None
 
@@ -369,25 +398,8 @@ if __name__ == "__main__":
         nmv.logger.log('ERROR: Invalid input option')
         exit(0)
 
-    # Soma mesh reconstruction and visualization
-    neuron_mesh = reconstruct_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
-
-    # Saving the mesh
-    if cli_options.mesh.export_ply or cli_options.mesh.export_obj or \
-       cli_options.mesh.export_stl or cli_options.mesh.export_blend:
-
-        # Export the neuron mesh
-        export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
-
-    # Render the mesh
-    if cli_options.rendering.render_mesh_static_frame:
-        render_neuron_mesh_to_static_frame(cli_options=cli_options, cli_morphology=cli_morphology)
-
-    # Render 360 of the mesh
-    if cli_options.rendering.render_mesh_360:
-        render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
-
-    # Rendering the mesh
+    # Neuron mesh reconstruction, export and visualization
+    process_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
     nmv.logger.log('NMV Done')
 
 
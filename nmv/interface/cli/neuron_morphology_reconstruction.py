@@ -192,20 +192,16 @@ def reconstruct_neuron_morphology(cli_morphology,
         # Stretch the bounding box by few microns
         bounding_box_360.extend_bbox_uniformly(delta=nmv.consts.Image.GAP_DELTA)
 
-        for i in range(0, 360):
-
-            # Set the frame name
-            image_name = '%s/%s/frame_%s' % (
-                cli_options.io.sequences_directory, cli_morphology.label, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.renderer.render_at_angle(
-                scene_objects=nmv.scene.get_list_of_objects_in_scene(),
-                angle=i,
-                bounding_box=bounding_box_360,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.rendering.full_view_resolution,
-                image_name=image_name)
+        # Render the 360 sequence, the frames can be distributed among multiple workers
+        nmv.rendering.render_sequence(
+            scene_objects=nmv.scene.get_list_of_objects_in_scene(),
+            bounding_box=bounding_box_360,
+            frames_directory='%s/%s' % (cli_options.io.sequences_directory, cli_morphology.label),
+            sequence_type=nmv.rendering.SEQUENCE_360,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.rendering.full_view_resolution,
+            scheduler=cli_options.rendering.sequence_scheduler,
+            number_workers=cli_options.rendering.sequence_workers)
 
     # Render a sequence of the progressive reconstruction of the morphology skeleton
     if cli_options.rendering.render_morphology_progressive:
@@ -238,24 +234,54 @@ def reconstruct_neuron_morphology(cli_morphology,
             rendering_bbox = nmv.skeleton.compute_full_morphology_bounding_box(
                 morphology=cli_morphology)
 
-        # Move to the last frame to get the bounding box of all the drawn objects
-        import bpy
-        bpy.context.scene.frame_set(0)
+        # Render the progressive sequence, the workers replay the time-line up to their frames
+        nmv.rendering.render_sequence(
+            scene_objects=nmv.scene.get_list_of_objects_in_scene(),
+            bounding_box=rendering_bbox,
+            frames_directory='%s/%s_progressive' % (
+                cli_options.io.sequences_directory, cli_morphology.label),
+            sequence_type=nmv.rendering.SEQUENCE_PROGRESSIVE,
+            number_frames=nmv.consts.Image.SEQUENCE_PROGRESSIVE_FRAMES,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.rendering.full_view_resolution,
+            scheduler=cli_options.rendering.sequence_scheduler,
+            number_workers=cli_options.rendering.sequence_workers)
 
-        for i in range(0, 100):
-            bpy.context.scene.frame_set(i)
 
-            # Set the frame name
-            image_name = '%s/%s/%s' % (
-                cli_options.io.sequences_directory, cli_morphology.label, '{0:05d}'.format(i))
+####################################################################################################
+# @get_morphology_outputs
+####################################################################################################
+def get_morphology_outputs(cli_morphology,
+                           cli_options):
+    """Gets the morphology files that must be written for a reconstructed morphology. These
+    outputs do not need Blender, and therefore they can be written in a background thread.
 
-            # Render a frame
-            nmv.rendering.renderer.render(
-                bounding_box=rendering_bbox,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.rendering.full_view_resolution,
-                image_name=image_name,
-                image_directory=None)
+    :param cli_morphology:
+        The morphology loaded from the command line interface (CLI).
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    :return:
+        A list of outputs, each is a tuple of a writing function and its arguments.
+    """
+
+    outputs = list()
+
+    # Create the morphologies directory if it does not exist
+    if cli_options.morphology.export_swc or cli_options.morphology.export_segments:
+        if not nmv.file.ops.path_exists(cli_options.io.morphologies_directory):
+            nmv.file.ops.clean_and_create_directory(cli_options.io.morphologies_directory)
+
+    # Export to .SWC file
+    if cli_options.morphology.export_swc:
+        outputs.append((nmv.file.write_morphology_to_swc_file,
+                        cli_morphology, cli_options.io.morphologies_directory))
+
+    # Export to .SEGMENTS file
+    if cli_options.morphology.export_segments:
+        outputs.append((nmv.file.write_morphology_to_segments_file,
+                        cli_morphology, cli_options.io.morphologies_directory))
+
+    return outputs
 
 
 ####################################################################################################
@@ -283,6 +309,16 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # Directories and targets are processed in this process while the upcoming morphologies are
+    # loaded in the background
+    if arguments.input == 'directory' or arguments.input == 'target':
+        nmv.interface.cli.run_morphology_batch(
+            arguments=arguments, options=input_options,
+            process_function=reconstruct_neuron_morphology,
+            outputs_function=get_morphology_outputs)
+        nmv.logger.log('NMV Done')
+        exit(0)
+
     # Read the morphology
     input_morphology = None
 
@@ -316,6 +352,10 @@ if __name__ == "__main__":
 
     # Neuron morphology reconstruction and visualization
     reconstruct_neuron_morphology(cli_morphology=input_morphology, cli_options=input_options)
+
+    # Write the morphology files
+    for output in get_morphology_outputs(input_morphology, input_options):
+        output[0](*output[1:])
     nmv.logger.log('NMV Done')
 
 
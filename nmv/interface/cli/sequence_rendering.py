@@ -0,0 +1,135 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys
+import os
+import argparse
+
+# Append the internal modules into the system paths to avoid Blender importing conflicts
+import_paths = ['neuromorphovis']
+for import_path in import_paths:
+    sys.path.append(('%s/../../..' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# Internal imports
+import nmv.rendering
+
+
+####################################################################################################
+# @parse_sequence_worker_arguments
+####################################################################################################
+def parse_sequence_worker_arguments():
+    """Parses the arguments of a sequence rendering worker.
+
+    :return:
+        Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(description='NeuroMorphoVis sequence rendering worker')
+
+    # The description of the sequence
+    arg_help = 'The .json description of the sequence.'
+    parser.add_argument('--sequence-description',
+                        action='store', required=True,
+                        help=arg_help)
+
+    # Number of workers
+    arg_help = 'The total number of workers rendering the sequence.'
+    parser.add_argument('--number-workers',
+                        action='store', type=int, default=1,
+                        help=arg_help)
+
+    # Worker index
+    arg_help = 'The index of this worker. If not given, the SLURM_ARRAY_TASK_ID is used.'
+    parser.add_argument('--worker-index',
+                        action='store', type=int, default=None,
+                        help=arg_help)
+
+    # Finalize
+    arg_help = 'Finalize the sequence after all the workers are done, instead of rendering.'
+    parser.add_argument('--finalize',
+                        action='store_true', default=False,
+                        help=arg_help)
+
+    # No movie
+    arg_help = 'Do not assemble the frames into a movie when the sequence is finalized.'
+    parser.add_argument('--no-movie',
+                        action='store_true', default=False,
+                        help=arg_help)
+
+    # Parse the arguments, and return a list of them
+    return parser.parse_args()
+
+
+####################################################################################################
+# @render_sequence_worker_frames
+####################################################################################################
+def render_sequence_worker_frames(description_file,
+                                  worker_index,
+                                  number_workers):
+    """Renders the frames that belong to a specific worker of a sequence.
+
+    :param description_file:
+        The .json description of the sequence.
+    :param worker_index:
+        The index of the worker.
+    :param number_workers:
+        The total number of workers.
+    """
+
+    # Load the description of the sequence
+    description = nmv.rendering.read_sequence_description(description_file)
+
+    # Get the frames of this worker, progressive sequences must be split into contiguous blocks
+    frames = nmv.rendering.partition_frames(
+        frames=nmv.rendering.get_sequence_frames(description),
+        worker_index=worker_index,
+        number_workers=number_workers,
+        contiguous=description['sequence_type'] == nmv.rendering.SEQUENCE_PROGRESSIVE)
+
+    # Render them
+    nmv.rendering.render_sequence_frames(description, frames)
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = [args[0]] + args[args.index("--") + 1:]
+
+    # Parse the command line arguments
+    arguments = parse_sequence_worker_arguments()
+
+    # Verify the frames, assemble the movie and clean up, and report an incomplete sequence
+    if arguments.finalize:
+        if not nmv.rendering.finalize_sequence(description_file=arguments.sequence_description,
+                                               create_movie=not arguments.no_movie):
+            sys.exit(1)
+        sys.exit(0)
+
+    # Use the index of the SLURM array task if the worker index is not given
+    worker_index = arguments.worker_index
+    if worker_index is None:
+        worker_index = int(os.environ.get('SLURM_ARRAY_TASK_ID', 0))
+
+    # Render the frames of this worker
+    render_sequence_worker_frames(description_file=arguments.sequence_description,
+                                  worker_index=worker_index,
+                                  number_workers=arguments.number_workers)
@@ -28,6 +28,7 @@ for import_path in import_paths:
     sys.path.append(('%s/../../..' % (os.path.dirname(os.path.realpath(__file__)))))
 
 # Internal imports
+import nmv.bbox
 import nmv.builders
 import nmv.consts
 import nmv.enums
@@ -116,25 +117,18 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
         if not nmv.file.ops.path_exists(cli_options.io.sequences_directory):
             nmv.file.ops.clean_and_create_directory(cli_options.io.sequences_directory)
 
-        # Create a specific directory for this mesh
-        output_directory = '%s/SOMA_MESH_360_%s' % (cli_options.io.sequences_directory,
-                                                    cli_options.morphology.label)
-        nmv.file.ops.clean_and_create_directory(output_directory)
-
-        # Render the frames
-        for i in range(360):
-
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.SomaRenderer.render_at_angle(
-                soma_mesh=soma_mesh,
-                angle=i,
-                view_extent=cli_options.soma.rendering_extent,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.soma.rendering_resolution,
-                image_name=image_name)
+        # Render the 360 sequence, the frames can be distributed among multiple workers
+        nmv.rendering.render_sequence(
+            scene_objects=[soma_mesh],
+            bounding_box=nmv.bbox.compute_unified_extent_bounding_box(
+                extent=cli_options.soma.rendering_extent),
+            frames_directory='%s/SOMA_MESH_360_%s' % (cli_options.io.sequences_directory,
+                                                      cli_options.morphology.label),
+            sequence_type=nmv.rendering.SEQUENCE_360,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.soma.rendering_resolution,
+            scheduler=cli_options.rendering.sequence_scheduler,
+            number_workers=cli_options.rendering.sequence_workers)
 
     # Render a progressive reconstruction of the soma
     if cli_options.soma.render_soma_mesh_progressive:
@@ -145,28 +139,20 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
         # Build the soft body of the soma
         soma_soft_body = soma_builder.build_soma_soft_body()
 
-        # Create a specific directory for this mesh
-        output_directory = '%s/SOMA_MESH_PROGRESSIVE_%s' % (cli_options.io.sequences_directory,
-                                                            cli_options.morphology.label)
-        nmv.file.ops.clean_and_create_directory(output_directory)
-
-        # Simulation
-        for i in range(nmv.consts.Simulation.MIN_FRAME, nmv.consts.Simulation.MAX_FRAME):
-
-            # Update the frame based on the soft body simulation
-            bpy.context.scene.frame_set(i)
-
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.SomaRenderer.render_at_angle(
-                soma_mesh=soma_mesh,
-                angle=i,
-                view_extent=cli_options.soma.rendering_extent,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.soma.rendering_resolution,
-                image_name=image_name)
+        # Render the progressive sequence, the workers replay the simulation up to their frames
+        nmv.rendering.render_sequence(
+            scene_objects=[soma_soft_body],
+            bounding_box=nmv.bbox.compute_unified_extent_bounding_box(
+                extent=cli_options.soma.rendering_extent),
+            frames_directory='%s/SOMA_MESH_PROGRESSIVE_%s' % (cli_options.io.sequences_directory,
+                                                              cli_options.morphology.label),
+            sequence_type=nmv.rendering.SEQUENCE_PROGRESSIVE,
+            number_frames=nmv.consts.Simulation.MAX_FRAME - nmv.consts.Simulation.MIN_FRAME,
+            first_frame=nmv.consts.Simulation.MIN_FRAME,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.soma.rendering_resolution,
+            scheduler=cli_options.rendering.sequence_scheduler,
+            number_workers=cli_options.rendering.sequence_workers)
 
         # Clear the scene again
         nmv.scene.ops.clear_scene()
@@ -15,12 +15,19 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .data import *
-from .about import *
-from .edit import *
-from .io import *
-from .soma import *
-from .analysis import *
-from .mesh import *
-from .morphology import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'common',
+    'jobs',
+    'data',
+    'about',
+    'edit',
+    'io',
+    'soma',
+    'analysis',
+    'mesh',
+    'morphology',
+))
@@ -78,160 +78,213 @@ def enable_or_disable_layout(layout):
 
 
 ####################################################################################################
-# @load_morphology
+# @get_morphology_loading_request
 ####################################################################################################
-def load_morphology(panel_object,
-                    context_scene):
-    """Load a given morphology from file.
+def get_morphology_loading_request(panel_object,
+                                   context_scene):
+    """Passes the input options from the UI to the system and checks if a new morphology must be
+    loaded or not.
 
     :param panel_object:
-        An object of a UI panel.
-
+        An object of a UI panel, used to report the issues, or None to log them.
     :param context_scene:
         Current scene in the rendering context.
+    :return:
+        A loading request, i.e. a tuple of the input source and the key of the morphology, if a
+        new morphology must be loaded, 'ALREADY_LOADED' if it is already loaded, or None if the
+        input is invalid.
     """
 
-    global current_morphology_label
-    global current_morphology_path
-
     # Read the data from a given morphology file either in .h5 or .swc formats
-    if bpy.context.scene.NMV_InputSource == nmv.enums.Input.H5_SWC_FILE:
+    if context_scene.NMV_InputSource == nmv.enums.Input.H5_SWC_FILE:
 
-        #try:
-        if True:
-            # Pass options from UI to system
-            nmv.interface.ui_options.morphology.morphology_file_path = context_scene.NMV_MorphologyFile
+        # Pass options from UI to system
+        nmv.interface.ui_options.morphology.morphology_file_path = context_scene.NMV_MorphologyFile
 
-            # Ensure that a file has been selected
-            if 'Select File' in context_scene.NMV_MorphologyFile:
-                return None
+        # Ensure that a file has been selected
+        if 'Select File' in context_scene.NMV_MorphologyFile:
+            return None
 
-            # If no morphologies are loaded
-            if current_morphology_path is None:
+        # If the same path, then return
+        if current_morphology_path == context_scene.NMV_MorphologyFile:
+            return 'ALREADY_LOADED'
 
-                # Update the morphology label
-                nmv.interface.ui_options.morphology.label = nmv.file.ops.get_file_name_from_path(
-                    context_scene.NMV_MorphologyFile)
+        # Update the morphology label
+        nmv.interface.ui_options.morphology.label = nmv.file.ops.get_file_name_from_path(
+            context_scene.NMV_MorphologyFile)
 
-                # Load the morphology file
-                # Load the morphology from the file
-                loading_flag, morphology_object = nmv.file.readers.read_morphology_from_file(
-                    options=nmv.interface.ui_options)
+        return nmv.enums.Input.H5_SWC_FILE, context_scene.NMV_MorphologyFile
 
-                # Verify the loading operation
-                if loading_flag:
+    # Read the data from a specific gid in a given circuit
+    elif context_scene.NMV_InputSource == nmv.enums.Input.CIRCUIT_GID:
 
-                    # Update the morphology
-                    nmv.interface.ui_morphology = morphology_object
+        # Pass options from UI to system
+        nmv.interface.ui_options.morphology.blue_config = context_scene.NMV_CircuitFile
+        nmv.interface.ui_options.morphology.gid = context_scene.NMV_Gid
 
-                    # Update the current morphology path
-                    current_morphology_path = context_scene.NMV_MorphologyFile
+        # Update the morphology label
+        nmv.interface.ui_options.morphology.label = 'neuron_' + str(context_scene.NMV_Gid)
 
-                    # New morphology loaded
-                    return 'NEW_MORPHOLOGY_LOADED'
+        # Check if the morphology is loaded before or not
+        if current_morphology_label == nmv.interface.ui_options.morphology.label:
+            return 'ALREADY_LOADED'
 
-                # Otherwise, report an ERROR
-                else:
+        return nmv.enums.Input.CIRCUIT_GID, nmv.interface.ui_options.morphology.label
 
-                    # Report the issue
-                    panel_object.report({'ERROR'}, 'Invalid Morphology File')
+    # Report an invalid input source
+    report_loading_issue(panel_object, 'Invalid Input Source')
+    return None
 
-                    # None
-                    return None
 
-            # If there is file that is loaded
-            else:
+####################################################################################################
+# @read_requested_morphology
+####################################################################################################
+def read_requested_morphology(loading_request):
+    """Reads the morphology of a given loading request.
 
-                # If the same path, then return
-                if current_morphology_path == \
-                   nmv.interface.ui_options.morphology.morphology_file_path:
-                    return 'ALREADY_LOADED'
+    This function does not access the Blender API, and therefore it can run in a background job.
 
-                # Load the new morphology file
-                else:
+    :param loading_request:
+        A loading request returned by get_morphology_loading_request.
+    :return:
+        The loaded morphology object, or None if the morphology cannot be loaded.
+    """
 
-                    # Update the morphology label
-                    nmv.interface.ui_options.morphology.label = \
-                        nmv.file.ops.get_file_name_from_path(context_scene.NMV_MorphologyFile)
+    # Load the morphology from the file
+    if loading_request[0] == nmv.enums.Input.H5_SWC_FILE:
+        loading_flag, morphology_object = nmv.file.readers.read_morphology_from_file(
+            options=nmv.interface.ui_options)
 
-                    # Load the morphology file
-                    # Load the morphology from the file
-                    loading_flag, morphology_object = nmv.file.readers.read_morphology_from_file(
-                        options=nmv.interface.ui_options)
+    # Load the morphology from the circuit
+    else:
+        loading_flag, morphology_object = nmv.file.readers.BBPReader.load_morphology_from_circuit(
+            blue_config=nmv.interface.ui_options.morphology.blue_config,
+            gid=nmv.interface.ui_options.morphology.gid)
 
-                    # Verify the loading operation
-                    if loading_flag:
+    if loading_flag:
+        return morphology_object
+    return None
 
-                        # Update the morphology
-                        nmv.interface.ui_morphology = morphology_object
 
-                        # Update the current morphology path
-                        current_morphology_path = context_scene.NMV_MorphologyFile
+####################################################################################################
+# @set_loaded_morphology
+####################################################################################################
+def set_loaded_morphology(panel_object,
+                          loading_request,
+                          morphology_object):
+    """Hands the loaded morphology over to the UI.
 
-                        # New morphology loaded
-                        return 'NEW_MORPHOLOGY_LOADED'
+    :param panel_object:
+        An object of a UI panel, used to report the issues, or None to log them.
+    :param loading_request:
+        The loading request of the morphology.
+    :param morphology_object:
+        The loaded morphology object, or None if the loading failed.
+    :return:
+        'NEW_MORPHOLOGY_LOADED' if the morphology is valid, otherwise None.
+    """
 
-                    # Otherwise, report an ERROR
-                    else:
+    global current_morphology_label
+    global current_morphology_path
 
-                        # Report the issue
-                        panel_object.report({'ERROR'}, 'Invalid Morphology File')
+    # Otherwise, report an ERROR
+    if morphology_object is None:
+        if loading_request[0] == nmv.enums.Input.H5_SWC_FILE:
+            report_loading_issue(panel_object, 'Invalid Morphology File')
+        else:
+            report_loading_issue(panel_object, 'Cannot Load Morphology from Circuit')
+        return None
 
-                        # None
-                        return None
+    # Update the morphology
+    nmv.interface.ui_morphology = morphology_object
 
-        # Invalid morphology file
-        #except ValueError:
-        else:
-            # Report the issue
-            panel_object.report({'ERROR'}, 'CANNOT load. Invalid Morphology File')
+    # Update the current morphology path or label
+    if loading_request[0] == nmv.enums.Input.H5_SWC_FILE:
+        current_morphology_path = loading_request[1]
+    else:
+        current_morphology_label = loading_request[1]
 
-            # None
-            return None
+    # New morphology loaded
+    return 'NEW_MORPHOLOGY_LOADED'
 
-    # Read the data from a specific gid in a given circuit
-    elif bpy.context.scene.NMV_InputSource == nmv.enums.Input.CIRCUIT_GID:
 
-        # Pass options from UI to system
-        nmv.interface.ui_options.morphology.blue_config = context_scene.NMV_CircuitFile
-        nmv.interface.ui_options.morphology.gid = context_scene.NMV_Gid
+####################################################################################################
+# @report_loading_issue
+####################################################################################################
+def report_loading_issue(panel_object,
+                         message):
+    """Reports an issue that happened while loading a morphology.
 
-        # Update the morphology label
-        nmv.interface.ui_options.morphology.label = 'neuron_' + str(context_scene.NMV_Gid)
+    :param panel_object:
+        An object of a UI panel, or None if the issue is reported from a job.
+    :param message:
+        The message of the issue.
+    """
 
-        # Check if the morphology is loaded before or not
-        if current_morphology_label is None:
-            current_morphology_label = nmv.interface.ui_options.morphology.label
-        else:
-            if current_morphology_label == nmv.interface.ui_options.morphology.label:
-                return 'ALREADY_LOADED'
+    if panel_object is None:
+        nmv.logger.error(message)
+    else:
+        panel_object.report({'ERROR'}, message)
 
-        # Load the morphology from the circuit
-        loading_flag, morphology_object = nmv.file.readers.BBPReader.load_morphology_from_circuit(
-                blue_config=nmv.interface.ui_options.morphology.blue_config,
-                gid=nmv.interface.ui_options.morphology.gid)
 
-        # Verify the loading operation
-        if loading_flag:
+####################################################################################################
+# @load_morphology
+####################################################################################################
+def load_morphology(panel_object,
+                    context_scene):
+    """Load a given morphology from file.
 
-            # Update the morphology
-            nmv.interface.ui_morphology = morphology_object
+    :param panel_object:
+        An object of a UI panel.
 
-        # Otherwise, report an ERROR
-        else:
-            panel_object.report({'ERROR'}, 'Cannot Load Morphology from Circuit')
+    :param context_scene:
+        Current scene in the rendering context.
+    """
 
-            # None
-            return None
+    # Check if a new morphology is needed
+    loading_request = get_morphology_loading_request(panel_object, context_scene)
+    if loading_request is None or loading_request == 'ALREADY_LOADED':
+        return loading_request
 
-    else:
-        # Report an invalid input source
-        panel_object.report({'ERROR'}, 'Invalid Input Source')
+    # Read and hand it over to the UI
+    return set_loaded_morphology(
+        panel_object, loading_request, read_requested_morphology(loading_request))
 
-        # None
-        return None
 
-    return 'NEW_MORPHOLOGY_LOADED'
+####################################################################################################
+# @add_morphology_loading_steps
+####################################################################################################
+def add_morphology_loading_steps(job,
+                                 context_scene):
+    """Adds the steps of loading the morphology to a given job, where the morphology is read in
+    the background and then handed over to the UI on the main thread.
+
+    :param job:
+        A given job.
+    :param context_scene:
+        Current scene in the rendering context.
+    :return:
+        True if the morphology is loaded or will be loaded by the job, or False if the input is
+        invalid.
+    """
+
+    # Check if a new morphology is needed
+    loading_request = get_morphology_loading_request(None, context_scene)
+    if loading_request is None:
+        return False
+    if loading_request == 'ALREADY_LOADED':
+        return True
+
+    # Read the morphology in the background
+    job.add_background_step('Reading Morphology', read_requested_morphology, loading_request)
+
+    # Hand it over on the main thread, and stop the job if it cannot be loaded
+    def hand_over_morphology():
+        morphology_object = job.get_result('Reading Morphology')
+        if set_loaded_morphology(None, loading_request, morphology_object) is None:
+            raise ValueError('Cannot load the morphology')
+    job.add_main_thread_step('Loading Morphology', hand_over_morphology)
+    return True
 
 
 ####################################################################################################
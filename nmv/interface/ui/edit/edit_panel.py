@@ -112,6 +112,12 @@ class EditPanel(bpy.types.Panel):
             save_morphology_buttons_column = layout.column(align=True)
             save_morphology_buttons_column.operator('export_morphology.swc', icon='GROUP_VERTEX')
 
+        # Undo the last update of the coordinates
+        if not in_edit_mode and morphology_editor is not None and \
+                morphology_editor.get_number_edits() > 0:
+            undo_column = layout.column(align=True)
+            undo_column.operator('undo.morphology_coordinates', icon='LOOP_BACK')
+
         # Enable or disable the layout
         nmv.interface.enable_or_disable_layout(layout)
 
@@ -202,9 +208,12 @@ class EditMorphologyCoordinates(bpy.types.Operator):
         nmv.interface.ui.sketch_morphology_skeleton_guide(
             morphology=nmv.interface.ui_morphology, options=options_clone)
 
-        # Sketch the morphological skeleton for repair
-        morphology_editor = nmv.edit.MorphologyEditor(
-            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+        # Sketch the morphological skeleton for repair, the editor of the same morphology is
+        # reused to keep its sample to vertex map and undo log
+        if morphology_editor is None or \
+                morphology_editor.morphology is not nmv.interface.ui_morphology:
+            morphology_editor = nmv.edit.MorphologyEditor(
+                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
         morphology_editor.sketch_morphology_skeleton()
 
         # Switch to the wire-frame mode
@@ -284,6 +293,46 @@ class UpdateMorphologyCoordinates(bpy.types.Operator):
         return {'FINISHED'}
 
 
+####################################################################################################
+# @UndoMorphologyCoordinates
+####################################################################################################
+class UndoMorphologyCoordinates(bpy.types.Operator):
+    """Revert the last update of the morphology coordinates.
+    """
+
+    # Operator parameters
+    bl_idname = "undo.morphology_coordinates"
+    bl_label = "Undo Last Update"
+
+    ################################################################################################
+    # @execute
+    ################################################################################################
+    def execute(self,
+                context):
+        """Execute the operator.
+
+        :param context:
+            Rendering context
+        :return:
+            'FINISHED'
+        """
+
+        # The editor is only read here, it is created by the edit operators
+        if morphology_editor is None or not morphology_editor.undo_last_edit():
+            self.report({'INFO'}, 'Nothing to undo')
+            return {'FINISHED'}
+
+        # Clear the scene
+        nmv.scene.ops.clear_scene()
+
+        # Plot the reverted morphology
+        nmv.interface.ui.sketch_morphology_skeleton_guide(
+            morphology=nmv.interface.ui_morphology,
+            options=copy.deepcopy(nmv.interface.ui_options))
+
+        return {'FINISHED'}
+
+
 ####################################################################################################
 # @ExportMorphologySWC
 ####################################################################################################
@@ -370,6 +419,7 @@ def register_panel():
     bpy.utils.register_class(SketchSkeleton)
     bpy.utils.register_class(EditMorphologyCoordinates)
     bpy.utils.register_class(UpdateMorphologyCoordinates)
+    bpy.utils.register_class(UndoMorphologyCoordinates)
     bpy.utils.register_class(ExportMorphologySWC)
 
 
@@ -388,4 +438,5 @@ def unregister_panel():
     bpy.utils.unregister_class(SketchSkeleton)
     bpy.utils.unregister_class(EditMorphologyCoordinates)
     bpy.utils.unregister_class(UpdateMorphologyCoordinates)
+    bpy.utils.unregister_class(UndoMorphologyCoordinates)
     bpy.utils.unregister_class(ExportMorphologySWC)
@@ -96,8 +96,12 @@ class IOPanel(bpy.types.Panel):
 
         import_button = layout.column()
         import_button.operator('nmv.load_morphology', icon='ANIM_DATA')
+        import_button.enabled = nmv.interface.ui.get_active_job() is None
         import_button.separator()
 
+        # Progress of the running job, if any
+        nmv.interface.ui.draw_job_progress(layout)
+
         # Stats
         if nmv.interface.ui_morphology is not None:
             morphology_stats_row = layout.row()
@@ -177,7 +181,65 @@ class IOPanel(bpy.types.Panel):
 
 
 ####################################################################################################
-# @SketchSkeleton
+# @draw_morphology_sketch
+####################################################################################################
+def draw_morphology_sketch(scene,
+                           start_time):
+    """Draws a sketch of the loaded morphology, as a step of the loading job.
+
+    :param scene:
+        The scene where the loading times are reported.
+    :param start_time:
+        The time when the loading started.
+    """
+
+    loading_time = time.time()
+    scene.NMV_MorphologyLoadingTime = loading_time - start_time
+
+    nmv.logger.header('Loading Morphology')
+    nmv.logger.info('Morphology: %s' % nmv.interface.ui_morphology.label)
+    nmv.logger.info('Morphology loaded in [%f] seconds' % scene.NMV_MorphologyLoadingTime)
+
+    # Clear the scene
+    nmv.scene.clear_scene()
+
+    # Create a builder object to build the morphology skeleton
+    import nmv.builders
+
+    # Always use meta builder to reconstruct the initial soma
+    options = copy.deepcopy(nmv.interface.ui_options)
+    options.morphology.set_default()
+    options.shading.set_default()
+
+    # Use branching order of 2 for the axons to ensure that we can see the whole morphology
+    options.morphology.axon_branch_order = 2
+
+    # Create the builder
+    builder = nmv.builders.DisconnectedSectionsBuilder(
+        morphology=nmv.interface.ui_morphology, options=options, force_meta_ball_soma=False)
+    nmv.interface.ui_reconstructed_skeleton = builder.draw_morphology_skeleton()
+
+    drawing_time = time.time()
+    scene.NMV_MorphologyDrawingTime = drawing_time - loading_time
+
+    nmv.logger.header('Stats.')
+    nmv.logger.info('Morphology drawn in [%f] seconds' % scene.NMV_MorphologyDrawingTime)
+
+
+####################################################################################################
+# @analyze_loaded_morphology
+####################################################################################################
+def analyze_loaded_morphology():
+    """Analyzes the loaded morphology, as the last step of the loading job.
+    """
+
+    analysis_time = time.time()
+    nmv.interface.analyze_morphology(morphology=nmv.interface.ui_morphology, context=bpy.context)
+    nmv.logger.info_done('Morphology analyzed in [%f] seconds' % (time.time() - analysis_time))
+
+
+####################################################################################################
+# @LoadMorphology
 ####################################################################################################
 class LoadMorphology(bpy.types.Operator):
     """Loads morphology
@@ -194,6 +256,9 @@ class LoadMorphology(bpy.types.Operator):
                 context):
         """Execute the operator.
 
+        The morphology is read in the background, and then drawn and analyzed on the main thread
+        without blocking the UI.
+
         :param context:
             Rendering context
         :return:
@@ -213,99 +278,28 @@ class LoadMorphology(bpy.types.Operator):
                                                          'nmv-logo.png'))
         logo_tex.extension = 'CLIP'
 
-        # Load the morphology file
+        # Load the morphology file in a job
         start_time = time.time()
-        loading_result = nmv.interface.ui.load_morphology(self, context.scene)
-        loading_time = time.time()
-        context.scene.NMV_MorphologyLoadingTime = loading_time - start_time
-
-        # If the result is None, report the issue
-        if loading_result is None:
+        job = nmv.utilities.Job('Loading Morphology')
+        if not nmv.interface.ui.add_morphology_loading_steps(job, context.scene):
             self.report({'ERROR'}, 'Please select a morphology file')
             return {'FINISHED'}
 
-        nmv.logger.header('Loading Morphology')
-        nmv.logger.info('Morphology: %s' % nmv.interface.ui_morphology.label)
-        nmv.logger.info('Morphology loaded in [%f] seconds' % context.scene.NMV_MorphologyLoadingTime)
-
-        # Clear the scene
-        import nmv.scene
-        nmv.scene.clear_scene()
-
-        # Create a builder object to build the morphology skeleton
-        import nmv.builders
-
-        # Always use meta builder to reconstruct the initial soma
-        options = copy.deepcopy(nmv.interface.ui_options)
-        options.morphology.set_default()
-        options.shading.set_default()
-
-        # Use branching order of 2 for the axons to ensure that we can see the whole morphology
-        options.morphology.axon_branch_order = 2
-
-        # Create the builder
-        builder = nmv.builders.DisconnectedSectionsBuilder(
-            morphology=nmv.interface.ui_morphology, options=options, force_meta_ball_soma=False)
-        nmv.interface.ui_reconstructed_skeleton = builder.draw_morphology_skeleton()
+        # Draw and analyze the morphology once loaded
+        job.add_main_thread_step('Drawing Morphology', draw_morphology_sketch, context.scene,
+                                 start_time)
+        job.add_main_thread_step('Analyzing Morphology', analyze_loaded_morphology)
 
-        drawing_time = time.time()
-        context.scene.NMV_MorphologyDrawingTime = drawing_time - loading_time
-
-        nmv.logger.header('Stats.')
-        nmv.logger.info('Morphology drawn in [%f] seconds' % context.scene.NMV_MorphologyDrawingTime)
-
-        # Switch to the top view
+        # Switch to the top view, this operation requires the context of the operator
         nmv.scene.view_axis()
 
-        # View all the objects in the scene
-        # nmv.scene.ops.view_all_scene()
-
         # Configure the output directory
         nmv.interface.configure_output_directory(options=nmv.interface.ui_options, context=context)
 
-        # Use the event timer to update the UI during the soma building
-        wm = context.window_manager
-        # self.event_timer = wm.event_timer_add(time_step=0.01, window=context.window)
-        wm.modal_handler_add(self)
-
-        # Modal
-        return {'RUNNING_MODAL'}
-
-    ###############################################################################################
-    # @modal
-    ################################################################################################
-    def modal(self,
-              context,
-              event):
-        """
-        Threading and non-blocking handling.
-
-        :param context:
-            Panel context.
-        :param event:
-            A given event for the panel.
-        """
-
-        # Analyze the morphology once loaded as well
-        analysis_time = time.time()
-        nmv.interface.analyze_morphology(morphology=nmv.interface.ui_morphology, context=context)
-        nmv.logger.info_done('Morphology analyzed in [%f] seconds' % (time.time() - analysis_time))
-
-        # Done
-        return {'FINISHED'}
-
-    ################################################################################################
-    # @cancel
-    ################################################################################################
-    def cancel(self, context):
-        """
-        Cancel the panel processing and return to the interaction mode.
-
-        :param context:
-            Panel context.
-        """
+        # Start the job
+        if not nmv.interface.ui.start_job(job):
+            self.report({'ERROR'}, 'Another operation is still running')
 
-        # Finished
         return {'FINISHED'}
 
 
@@ -25,8 +25,8 @@ import nmv.scene
 # Input options (what is the input source)
 bpy.types.Scene.NMV_InputSource = bpy.props.EnumProperty(
     items=[(nmv.enums.Input.H5_SWC_FILE,
-            'H5 or SWC File',
-            'Load individual h5 or swc file without a circuit'),
+            'H5, SWC or NMVB File',
+            'Load individual h5, swc or nmvb file without a circuit'),
            (nmv.enums.Input.CIRCUIT_GID,
             'BBP Circuit (GID)',
             'Load a specific GID from the circuit config')],
@@ -0,0 +1,206 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Blender imports
+import bpy
+
+# Internal imports
+import nmv
+import nmv.utilities
+
+# The job that is currently running in the user interface, only a single job is allowed at a time
+active_job = None
+
+# The interval in seconds between two consecutive ticks of the active job
+JOB_TICKING_INTERVAL = 0.01
+
+
+####################################################################################################
+# @get_active_job
+####################################################################################################
+def get_active_job():
+    """Gets the job that is currently running in the user interface.
+
+    :return:
+        A reference to the running job, or None if no job is running.
+    """
+
+    if active_job is not None and active_job.is_running():
+        return active_job
+    return None
+
+
+####################################################################################################
+# @redraw_user_interface
+####################################################################################################
+def redraw_user_interface():
+    """Requests redrawing all the areas of the user interface to update the progress reports.
+    """
+
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+####################################################################################################
+# @report_job_state
+####################################################################################################
+def report_job_state(job):
+    """Logs the final state of a job.
+
+    :param job:
+        A given job that is finished, cancelled or failed.
+    """
+
+    if job.state == nmv.utilities.JOB_FAILED:
+        nmv.logger.error(job.message)
+    else:
+        nmv.logger.info(job.message)
+
+
+####################################################################################################
+# @tick_active_job
+####################################################################################################
+def tick_active_job():
+    """Advances the active job by a single time slice, this function is registered as a timer.
+
+    :return:
+        The interval until the next tick, or None to unregister the timer.
+    """
+
+    global active_job
+    if active_job is None:
+        return None
+
+    # Advance the job
+    running = active_job.tick()
+    redraw_user_interface()
+    if running:
+        return JOB_TICKING_INTERVAL
+
+    # Done
+    active_job = None
+    return None
+
+
+####################################################################################################
+# @start_job
+####################################################################################################
+def start_job(job):
+    """Starts a job in the user interface.
+
+    On Blender 2.8 and later, the job is advanced from a timer and the interface remains
+    responsive, otherwise the job runs synchronously.
+
+    :param job:
+        The job to start.
+    :return:
+        True if the job has been started, or False if another job is already running.
+    """
+
+    global active_job
+    if get_active_job() is not None:
+        nmv.logger.warning('[%s] is still running' % active_job.name)
+        return False
+
+    job.add_finished_callback(report_job_state)
+
+    # Older versions of Blender have no application timers
+    if not nmv.utilities.is_blender_280():
+        job.run_synchronously()
+        return True
+
+    active_job = job
+    bpy.app.timers.register(tick_active_job, first_interval=JOB_TICKING_INTERVAL)
+    return True
+
+
+####################################################################################################
+# @draw_job_progress
+####################################################################################################
+def draw_job_progress(layout):
+    """Draws the progress of the active job and a button to cancel it.
+
+    :param layout:
+        The layout of the panel.
+    :return:
+        True if a job is running, otherwise False.
+    """
+
+    job = get_active_job()
+    if job is None:
+        return False
+
+    job_row = layout.row()
+    job_row.label(text='%s [%d%%]' % (job.message, int(100 * job.get_progress())), icon='TIME')
+    job_row.operator('nmv.cancel_job', text='', icon='CANCEL')
+    return True
+
+
+####################################################################################################
+# @CancelJob
+####################################################################################################
+class CancelJob(bpy.types.Operator):
+    """Cancel the running operation"""
+
+    # Operator parameters
+    bl_idname = "nmv.cancel_job"
+    bl_label = "Cancel"
+
+    ################################################################################################
+    # @execute
+    ################################################################################################
+    def execute(self,
+                context):
+        """Executes the operator.
+
+        :param context:
+            Operator context.
+        :return:
+            {'FINISHED'}
+        """
+
+        job = get_active_job()
+        if job is not None:
+            job.cancel()
+        return {'FINISHED'}
+
+
+####################################################################################################
+# @register_jobs
+####################################################################################################
+def register_jobs():
+    """Registers the classes of the jobs"""
+
+    bpy.utils.register_class(CancelJob)
+
+
+####################################################################################################
+# @unregister_jobs
+####################################################################################################
+def unregister_jobs():
+    """Un-registers the classes of the jobs"""
+
+    # Cancel any running job before unloading the add-on
+    job = get_active_job()
+    if job is not None:
+        job.cancel()
+
+    bpy.utils.unregister_class(CancelJob)
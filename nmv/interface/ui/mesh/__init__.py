@@ -15,7 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh_panel import *
-from .mesh_panel_options import *
-from .mesh_panel_ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'mesh_panel',
+    'mesh_panel_options',
+    'mesh_panel_ops',
+))
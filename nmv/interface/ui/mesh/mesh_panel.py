@@ -97,6 +97,9 @@ class MeshPanel(bpy.types.Panel):
         # Mesh reconstruction button
         draw_mesh_reconstruction_button(panel=self, scene=context.scene)
 
+        # Progress of the running job, if any
+        nmv.interface.ui.draw_job_progress(self.layout)
+
         # Profiling
         if is_mesh_reconstructed:
             morphology_stats_row = self.layout.row()
@@ -123,6 +126,47 @@ class MeshPanel(bpy.types.Panel):
         nmv.interface.enable_or_disable_layout(self.layout)
 
 
+####################################################################################################
+# @create_mesh_builder
+####################################################################################################
+def create_mesh_builder(meshing_technique):
+    """Creates the mesh builder of a given meshing technique for the loaded morphology.
+
+    :param meshing_technique:
+        The meshing technique selected in the UI.
+    :return:
+        A reference to the mesh builder, or None if the technique is invalid.
+    """
+
+    # Piece-wise watertight meshing
+    if meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
+        return nmv.builders.PiecewiseBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Union
+    elif meshing_technique == nmv.enums.Meshing.Technique.UNION:
+        return nmv.builders.UnionBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Skinning
+    elif meshing_technique == nmv.enums.Meshing.Technique.SKINNING:
+        return nmv.builders.SkinningBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Meta Balls
+    elif meshing_technique == nmv.enums.Meshing.Technique.META_OBJECTS:
+        return nmv.builders.MetaBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Voxelization
+    elif meshing_technique == nmv.enums.Meshing.Technique.VOXELIZATION:
+        return nmv.builders.VoxelBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Invalid method
+    return None
+
+
 ####################################################################################################
 # @ReconstructNeuronMesh
 ####################################################################################################
@@ -137,71 +181,72 @@ class ReconstructNeuronMesh(bpy.types.Operator):
     # @execute
     ################################################################################################
     def execute(self, context):
-        """Executes the operator
+        """Executes the operator.
+
+        The reconstruction runs as a job, where the morphology is read and the voxelized surface
+        is extracted in the background, while the Blender objects are created on the main thread.
 
         Keyword arguments:
         :param context:
             Operator context.
         :return:
-            {'FINISHED'}
+            {'FINISHED'}, or {'CANCELLED'} if another job is still running.
         """
 
-        import time
+        # Do not clear the scene while a running job is still building it
+        if nmv.interface.ui.get_active_job() is not None:
+            self.report({'ERROR'}, 'Another operation is still running')
+            return {'CANCELLED'}
 
         # Clear the scene
         nmv.scene.ops.clear_scene()
 
         # Load the morphology file
-        loading_result = nmv.interface.ui.load_morphology(self, context.scene)
-
-        # If the result is None, report the issue
-        if loading_result is None:
+        job = nmv.utilities.Job('Mesh Reconstruction')
+        if not nmv.interface.ui.add_morphology_loading_steps(job, context.scene):
             self.report({'ERROR'}, 'Please select a morphology file')
             return {'FINISHED'}
 
         # Meshing technique
         meshing_technique = nmv.interface.ui_options.mesh.meshing_technique
-
-        # Start reconstruction
-        start_time = time.time()
-
-        # Piece-wise watertight meshing
-        if meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
-            mesh_builder = nmv.builders.PiecewiseBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
-
-        # Union
-        elif meshing_technique == nmv.enums.Meshing.Technique.UNION:
-            mesh_builder = nmv.builders.UnionBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
-
-        # Skinning
-        elif meshing_technique == nmv.enums.Meshing.Technique.SKINNING:
-            mesh_builder = nmv.builders.SkinningBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
-
-        # Meta Balls
-        elif meshing_technique == nmv.enums.Meshing.Technique.META_OBJECTS:
-            mesh_builder = nmv.builders.MetaBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
-
+        scene = context.scene
+        start_time = [time.time()]
+
+        # Create the builder once the morphology is loaded
+        def create_builder():
+            start_time[0] = time.time()
+            mesh_builder = create_mesh_builder(meshing_technique)
+            if mesh_builder is None:
+                raise ValueError('Invalid Meshing Technique')
+            return mesh_builder
+        job.add_main_thread_step('Creating Builder', create_builder)
+
+        # The voxelized surface is extracted without accessing the Blender API
+        if meshing_technique == nmv.enums.Meshing.Technique.VOXELIZATION:
+            job.add_background_step(
+                'Extracting Surface', lambda: job.get_result('Creating Builder').build_surface())
+            job.add_main_thread_step(
+                'Creating Mesh', lambda: job.get_result('Creating Builder').complete_mesh())
         else:
-
-            # Invalid method
-            self.report({'ERROR'}, 'Invalid Meshing Technique')
-            return {'FINISHED'}
+            job.add_main_thread_step(
+                'Creating Mesh',
+                lambda: job.get_result('Creating Builder').reconstruct_mesh_incrementally())
 
         # Mesh reconstructed
-        reconstruction_time = time.time()
-        global is_mesh_reconstructed
-        is_mesh_reconstructed = True
-        context.scene.NMV_MeshReconstructionTime = reconstruction_time - start_time
-        nmv.logger.statistics('Mesh reconstructed in [%f] seconds' %
-                              context.scene.NMV_MeshReconstructionTime)
+        def report_reconstruction(finished_job):
+            if finished_job.state != nmv.utilities.JOB_FINISHED:
+                return
+            nmv.interface.ui_reconstructed_mesh = finished_job.get_result('Creating Mesh')
+            global is_mesh_reconstructed
+            is_mesh_reconstructed = True
+            scene.NMV_MeshReconstructionTime = time.time() - start_time[0]
+            nmv.logger.statistics('Mesh reconstructed in [%f] seconds' %
+                                  scene.NMV_MeshReconstructionTime)
+        job.add_finished_callback(report_reconstruction)
+
+        # Start the job
+        if not nmv.interface.ui.start_job(job):
+            self.report({'ERROR'}, 'Another operation is still running')
 
         return {'FINISHED'}
 
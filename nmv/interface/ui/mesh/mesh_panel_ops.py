@@ -292,6 +292,35 @@ def draw_meta_objects_meshing_options(panel,
     draw_spines_options(panel=panel, scene=scene)
 
 
+####################################################################################################
+# @draw_voxelization_meshing_options
+####################################################################################################
+def draw_voxelization_meshing_options(panel,
+                                      scene):
+    """Draws the options when the voxelization meshing technique is selected.
+
+    :param panel:
+        Blender UI panel.
+    :param scene:
+        Blender scene.
+    """
+
+    # Voxel size
+    voxel_size_row = panel.layout.row()
+    voxel_size_row.label(text='Voxel Size:')
+    voxel_size_row.prop(scene, 'NMV_VoxelSize')
+    nmv.interface.ui_options.mesh.voxel_size = scene.NMV_VoxelSize
+
+    # Number of processes
+    voxelization_processes_row = panel.layout.row()
+    voxelization_processes_row.label(text='Processes:')
+    voxelization_processes_row.prop(scene, 'NMV_VoxelizationProcesses')
+    nmv.interface.ui_options.mesh.voxelization_processes = scene.NMV_VoxelizationProcesses
+
+    # Tessellation options
+    draw_tessellation_options(panel=panel, scene=scene)
+
+
 ####################################################################################################
 # @draw_union_meshing_options
 ####################################################################################################
@@ -376,6 +405,8 @@ def draw_meshing_options(panel,
         draw_skinning_meshing_options(panel=panel, scene=scene)
     elif scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.UNION:
         draw_union_meshing_options(panel=panel, scene=scene)
+    elif scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.VOXELIZATION:
+        draw_voxelization_meshing_options(panel=panel, scene=scene)
     else:
         pass
 
@@ -465,7 +496,8 @@ def draw_color_options(panel,
                     spines_color_row.prop(scene, 'NMV_SpinesMeshColor')
                     nmv.interface.ui_options.shading.mesh_spines_color = scene.NMV_SpinesMeshColor
 
-        elif scene.NMV_MeshingTechnique == nmv.enums.Meshing.Technique.META_OBJECTS:
+        elif scene.NMV_MeshingTechnique in [nmv.enums.Meshing.Technique.META_OBJECTS,
+                                            nmv.enums.Meshing.Technique.VOXELIZATION]:
 
             neuron_color_row = layout.row()
             neuron_color_row.prop(scene, 'NMV_NeuronMeshColor')
@@ -642,6 +674,7 @@ def draw_mesh_reconstruction_button(panel,
     # Mesh reconstruction options
     mesh_reconstruction_row = layout.row()
     mesh_reconstruction_row.operator('nmv.reconstruct_neuron_mesh', icon='MESH_DATA')
+    mesh_reconstruction_row.enabled = nmv.interface.ui.get_active_job() is None
 
 
 ####################################################################################################
@@ -46,7 +46,12 @@ bpy.types.Scene.NMV_MeshingTechnique = bpy.props.EnumProperty(
             'MetaBalls',
             'Creates watertight mesh models using MetaBalls. This approach is extremely slow if '
             'the axons are included in the meshing process, so it is always recommended to use '
-            'first order branching for the axons when using this technique')],
+            'first order branching for the axons when using this technique'),
+           (nmv.enums.Meshing.Technique.VOXELIZATION,
+            'Voxelization',
+            'Creates watertight mesh models by extracting the surface of the union of the tapered '
+            'segments of the skeleton and the soma on a sparse voxel grid. The resolution of the '
+            'mesh is controlled by the voxel size')],
     name='Method',
     description='The technique that will be used to create the mesh, by default the '
                 'Piecewise Watertight one since it is the fastest one.',
@@ -212,6 +217,19 @@ bpy.types.Scene.NMV_MeshTessellationLevel = bpy.props.FloatProperty(
     description='Mesh tessellation level (between 0.1 and 1.0)',
     default=1.0, min=0.1, max=1.0)
 
+# The voxel size of the voxelization meshing
+bpy.types.Scene.NMV_VoxelSize = bpy.props.FloatProperty(
+    name='Size',
+    description='The size of the voxels in microns, smaller voxels create finer meshes. '
+                'Use 0.0 to derive the size from the radii of the morphology',
+    default=0.0, min=0.0, max=10.0)
+
+# The number of processes of the voxelization meshing
+bpy.types.Scene.NMV_VoxelizationProcesses = bpy.props.IntProperty(
+    name='Processes',
+    description='The number of processes used to evaluate the blocks of the voxel grid',
+    default=1, min=1, max=256)
+
 # Random spines percentage
 bpy.types.Scene.NMV_NumberSpinesPerMicron = bpy.props.FloatProperty(
     name='Density',
@@ -102,7 +102,10 @@ class MorphologyPanel(bpy.types.Panel):
         reconstruct_morphology_button_row.operator('nmv.reconstruct_morphology',
                                                    text=bpy.types.Scene.NMV_MorphologyButtonLabel,
                                                    icon='RNA_ADD')
-        reconstruct_morphology_button_row.enabled = True
+        reconstruct_morphology_button_row.enabled = nmv.interface.ui.get_active_job() is None
+
+        # Progress of the running job, if any
+        nmv.interface.ui.draw_job_progress(layout)
 
         global is_morphology_reconstructed
         if is_morphology_reconstructed:
@@ -133,7 +136,83 @@ class MorphologyPanel(bpy.types.Panel):
 
 
 ####################################################################################################
-# ReconstructMorphologyOperator
+# @create_morphology_builder
+####################################################################################################
+def create_morphology_builder():
+    """Creates the skeleton builder of the reconstruction method selected in the UI for the
+    loaded morphology.
+
+    :return:
+        A reference to the skeleton builder.
+    """
+
+    # Create a skeleton builder object to build the morphology skeleton
+    method = nmv.interface.ui_options.morphology.reconstruction_method
+    if method == nmv.enums.Skeleton.Method.DISCONNECTED_SEGMENTS:
+        return nmv.builders.DisconnectedSegmentsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Draw the morphology as a set of disconnected tubes, where each SECTION is a tube
+    elif method == nmv.enums.Skeleton.Method.DISCONNECTED_SECTIONS or \
+            method == nmv.enums.Skeleton.Method.ARTICULATED_SECTIONS:
+        return nmv.builders.DisconnectedSectionsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Draw the morphology as a set of spheres, where each SPHERE represents a sample
+    elif method == nmv.enums.Skeleton.Method.SAMPLES:
+        return nmv.builders.SamplesBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.CONNECTED_SECTIONS:
+        return nmv.builders.ConnectedSectionsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.PROGRESSIVE:
+        return nmv.builders.ProgressiveBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.DENDROGRAM:
+        return nmv.builders.DendrogramBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Default: DisconnectedSectionsBuilder
+    return nmv.builders.DisconnectedSectionsBuilder(
+        morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+
+####################################################################################################
+# @reconstruct_morphology_skeleton
+####################################################################################################
+def reconstruct_morphology_skeleton(scene):
+    """Draws the skeleton of the loaded morphology, as a step of the reconstruction job.
+
+    :param scene:
+        The scene where the reconstruction time is reported.
+    :return:
+        A generator that yields the fraction of the skeleton that is drawn after every arbor.
+    """
+
+    # Start reconstruction
+    start_time = time.time()
+
+    global morphology_builder
+    morphology_builder = create_morphology_builder()
+
+    # Draw the morphology skeleton and return a list of all the reconstructed objects
+    nmv.interface.ui_reconstructed_skeleton = \
+        yield from morphology_builder.draw_morphology_skeleton_incrementally()
+
+    # Morphology reconstructed
+    reconstruction_time = time.time()
+    global is_morphology_reconstructed
+    is_morphology_reconstructed = True
+    scene.NMV_MorphologyReconstructionTime = reconstruction_time - start_time
+    nmv.logger.statistics('Morphology reconstructed in [%f] seconds' %
+                          scene.NMV_MorphologyReconstructionTime)
+
+
+####################################################################################################
+# @ReconstructMorphologyOperator
 ####################################################################################################
 class ReconstructMorphologyOperator(bpy.types.Operator):
     """Morphology reconstruction operator"""
@@ -149,72 +228,35 @@ class ReconstructMorphologyOperator(bpy.types.Operator):
                 context):
         """Execute the operator.
 
+        The morphology is loaded and reconstructed in a job that does not block the UI.
+
         :param context:
             Context.
         :return:
-            'FINISHED'
+            'FINISHED', or 'CANCELLED' if another job is still running.
         """
 
+        # Do not clear the scene while a running job is still building it
+        if nmv.interface.ui.get_active_job() is not None:
+            self.report({'ERROR'}, 'Another operation is still running')
+            return {'CANCELLED'}
+
         # Clear the scene
         nmv.scene.ops.clear_scene()
 
         # Load the morphology file
-        loading_result = nmv.interface.ui.load_morphology(self, context.scene)
-
-        # If the result is None, report the issue
-        if loading_result is None:
+        job = nmv.utilities.Job('Morphology Reconstruction')
+        if not nmv.interface.ui.add_morphology_loading_steps(job, context.scene):
             self.report({'ERROR'}, 'Please select a valid morphology file')
             return {'FINISHED'}
 
-        # Start reconstruction
-        start_time = time.time()
-
-        global morphology_builder
+        # Draw the skeleton
+        job.add_main_thread_step('Building Skeleton', reconstruct_morphology_skeleton,
+                                 context.scene)
 
-        # Create a skeleton builder object to build the morphology skeleton
-        method = nmv.interface.ui_options.morphology.reconstruction_method
-        if method == nmv.enums.Skeleton.Method.DISCONNECTED_SEGMENTS:
-            morphology_builder = nmv.builders.DisconnectedSegmentsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Draw the morphology as a set of disconnected tubes, where each SECTION is a tube
-        elif method == nmv.enums.Skeleton.Method.DISCONNECTED_SECTIONS or \
-                method == nmv.enums.Skeleton.Method.ARTICULATED_SECTIONS:
-            morphology_builder = nmv.builders.DisconnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Draw the morphology as a set of spheres, where each SPHERE represents a sample
-        elif method == nmv.enums.Skeleton.Method.SAMPLES:
-            morphology_builder = nmv.builders.SamplesBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        elif method == nmv.enums.Skeleton.Method.CONNECTED_SECTIONS:
-            morphology_builder = nmv.builders.ConnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        elif method == nmv.enums.Skeleton.Method.PROGRESSIVE:
-            morphology_builder = nmv.builders.ProgressiveBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        elif method == nmv.enums.Skeleton.Method.DENDROGRAM:
-            morphology_builder = nmv.builders.DendrogramBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Default: DisconnectedSectionsBuilder
-        else:
-            morphology_builder = nmv.builders.DisconnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Draw the morphology skeleton and return a list of all the reconstructed objects
-        nmv.interface.ui_reconstructed_skeleton = morphology_builder.draw_morphology_skeleton()
-
-        # Morphology reconstructed
-        reconstruction_time = time.time()
-        global is_morphology_reconstructed
-        is_morphology_reconstructed = True
-        context.scene.NMV_MorphologyReconstructionTime = reconstruction_time - start_time
-        nmv.logger.statistics('Morphology reconstructed in [%f] seconds' %
-                              context.scene.NMV_MorphologyReconstructionTime)
+        # Start the job
+        if not nmv.interface.ui.start_job(job):
+            self.report({'ERROR'}, 'Another operation is still running')
 
         # Confirm operation done
         return {'FINISHED'}
@@ -24,6 +24,43 @@ import nmv.consts
 import nmv.enums
 
 
+####################################################################################################
+# @set_simplification_options
+####################################################################################################
+def set_simplification_options(layout,
+                               scene,
+                               options):
+    """Set the simplification options in the UI.
+
+    :param layout:
+        Panel layout.
+    :param scene:
+        Context scene.
+    :param options:
+        System options.
+    """
+
+    # Simplification method
+    simplification_row = layout.row()
+    simplification_row.label(text='Simplification:')
+    simplification_row.prop(scene, 'NMV_MorphologySimplification')
+    options.morphology.simplification_method = scene.NMV_MorphologySimplification
+
+    # If the sections are simplified, add the tolerances
+    if scene.NMV_MorphologySimplification != nmv.enums.Skeleton.Simplification.NONE:
+        tolerance_row = layout.row()
+        tolerance_row.label(text='Tolerance:')
+        tolerance_row.prop(scene, 'NMV_MorphologySimplificationTolerance')
+        options.morphology.simplification_tolerance = \
+            scene.NMV_MorphologySimplificationTolerance
+
+        radius_tolerance_row = layout.row()
+        radius_tolerance_row.label(text='Radius Tolerance:')
+        radius_tolerance_row.prop(scene, 'NMV_MorphologySimplificationRadiusTolerance')
+        options.morphology.simplification_radius_tolerance = \
+            scene.NMV_MorphologySimplificationRadiusTolerance
+
+
 ####################################################################################################
 # @set_resampling_options
 ####################################################################################################
@@ -53,6 +90,9 @@ def set_resampling_options(layout,
         resampling_step_row.prop(scene, 'NMV_MorphologyResamplingStep')
         options.morphology.resampling_step = scene.NMV_MorphologyResamplingStep
 
+    # Sections simplification
+    set_simplification_options(layout=layout, scene=scene, options=options)
+
 
 ####################################################################################################
 # @set_skeleton_options
@@ -233,6 +273,9 @@ def set_reconstruction_options(layout,
         resampling_step_row.prop(scene, 'NMV_MorphologyResamplingStep')
         options.morphology.resampling_step = scene.NMV_MorphologyResamplingStep
 
+    # Sections simplification
+    set_simplification_options(layout=layout, scene=scene, options=options)
+
     if not scene.NMV_MorphologyReconstructionTechnique == nmv.enums.Skeleton.Method.DENDROGRAM:
 
         # Sections diameters option
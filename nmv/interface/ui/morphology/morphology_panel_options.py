@@ -314,6 +314,37 @@ bpy.types.Scene.NMV_MorphologyResamplingStep = bpy.props.FloatProperty(
     description='The resampling step in case the Fixed Step method is selected',
     default=1.0, min=0.05, max=10.0)
 
+# Simplification
+bpy.types.Scene.NMV_MorphologySimplification = bpy.props.EnumProperty(
+    items=[(nmv.enums.Skeleton.Simplification.NONE,
+            'None',
+            'Do not simplify the sections at all'),
+           (nmv.enums.Skeleton.Simplification.DOUGLAS_PEUCKER,
+            'Douglas-Peucker',
+            'Remove the samples that can be interpolated from the kept ones within the given '
+            'positional and radial tolerances, by recursively splitting every section at its '
+            'farthest sample'),
+           (nmv.enums.Skeleton.Simplification.VISVALINGAM,
+            'Visvalingam',
+            'Remove the samples that can be interpolated from the kept ones within the given '
+            'positional and radial tolerances, by removing the samples with the smallest errors '
+            'first')],
+    name='',
+    default=nmv.enums.Skeleton.Simplification.NONE)
+
+# Simplification tolerance
+bpy.types.Scene.NMV_MorphologySimplificationTolerance = bpy.props.FloatProperty(
+    name='Tolerance (μm)',
+    description='The maximum distance between a removed sample and the simplified section',
+    default=0.1, min=0.001, max=10.0)
+
+# Simplification radius tolerance
+bpy.types.Scene.NMV_MorphologySimplificationRadiusTolerance = bpy.props.FloatProperty(
+    name='Radius Tolerance (μm)',
+    description='The maximum difference between the radius of a removed sample and the radius '
+                'interpolated along the simplified section',
+    default=0.05, min=0.001, max=5.0)
+
 # Skeleton style
 bpy.types.Scene.SkeletonizationTechnique = bpy.props.EnumProperty(
     items=[(nmv.enums.Skeleton.Style.ORIGINAL,
@@ -15,6 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma_panel import *
-from .soma_panel_options import *
-from .soma_panel_ops import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'soma_panel',
+    'soma_panel_options',
+    'soma_panel_ops',
+))
@@ -145,6 +145,10 @@ class SomaPanel(bpy.types.Panel):
         # Soma reconstruction button
         soma_reconstruction_buttons_row = layout.row(align=True)
         soma_reconstruction_buttons_row.operator('nmv.reconstruct_soma', icon='FORCE_LENNARDJONES')
+        soma_reconstruction_buttons_row.enabled = nmv.interface.ui.get_active_job() is None
+
+        # Progress of the running job, if any
+        nmv.interface.ui.draw_job_progress(layout)
 
         # Progress
         if scene.NMV_SomaReconstructionMethod == \
@@ -201,10 +205,12 @@ class SomaPanel(bpy.types.Panel):
         render_animations_buttons_row = layout.row(align=True)
         render_animations_buttons_row.operator('nmv.render_soma_360', icon='FORCE_MAGNETIC')
 
-        # Progressive rendering is only for the soft body physics
+        # Progressive rendering is only for the soft body physics, and it reloads the morphology
         if bpy.context.scene.NMV_SomaReconstructionMethod == nmv.enums.Soma.Representation.SOFT_BODY:
-            render_animations_buttons_row.operator('nmv.render_soma_progressive',
-                                                   icon='FORCE_HARMONIC')
+            render_progressive_column = render_animations_buttons_row.column(align=True)
+            render_progressive_column.operator('nmv.render_soma_progressive',
+                                               icon='FORCE_HARMONIC')
+            render_progressive_column.enabled = nmv.interface.ui.get_active_job() is None
 
         # Soma rendering progress bar
         soma_rendering_progress_row = layout.row()
@@ -259,6 +265,65 @@ class SomaPanel(bpy.types.Panel):
         nmv.interface.enable_or_disable_layout(layout)
 
 
+####################################################################################################
+# @start_morphology_loading_job
+####################################################################################################
+def start_morphology_loading_job(operator,
+                                 context):
+    """Starts a job that loads the morphology, and the modal handler of a given soma operator that
+    waits for this job before building the soma.
+
+    :param operator:
+        A given soma operator that has a modal handler.
+    :param context:
+        Operator context.
+    :return:
+        A reference to the started job, or None if the job cannot be started.
+    """
+
+    # Load the morphology file
+    job = nmv.utilities.Job('Morphology Loading')
+    if not nmv.interface.ui.add_morphology_loading_steps(job, context.scene):
+        operator.report({'ERROR'}, 'Please select a morphology file')
+        return None
+
+    # Start the job
+    if not nmv.interface.ui.start_job(job):
+        operator.report({'ERROR'}, 'Another operation is still running')
+        return None
+
+    # Use the event timer to wait for the job and then to update the UI during the soma building
+    wm = context.window_manager
+    operator.event_timer = wm.event_timer_add(time_step=0.01, window=context.window)
+    wm.modal_handler_add(operator)
+
+    # Return a reference to the job
+    return job
+
+
+####################################################################################################
+# @stop_morphology_loading_job
+####################################################################################################
+def stop_morphology_loading_job(operator,
+                                context):
+    """Stops the modal handler of a given soma operator that is waiting for the morphology, and
+    cancels the loading job if it is still running.
+
+    :param operator:
+        A given soma operator that has a modal handler.
+    :param context:
+        Operator context.
+    """
+
+    # Cancel the job
+    if operator.loading_job.is_running():
+        operator.loading_job.cancel()
+    operator.loading_job = None
+
+    # Remove the event timer
+    context.window_manager.event_timer_remove(operator.event_timer)
+
+
 ####################################################################################################
 # @ReconstructSoma
 ####################################################################################################
@@ -273,6 +338,9 @@ class ReconstructSomaOperator(bpy.types.Operator):
     event_timer = None
     timer_limits = 0
 
+    # The job that loads the morphology
+    loading_job = None
+
     # Builder parameters
     soma_builder = None
     soma_sphere_object = None
@@ -297,6 +365,10 @@ class ReconstructSomaOperator(bpy.types.Operator):
         # Get a reference to the scene
         scene = context.scene
 
+        # Wait for the morphology to be loaded
+        if self.loading_job is not None:
+            return self.wait_for_morphology(context)
+
         # Cancelling event, if using right click or exceeding the time limit of the simulation
         if event.type in {'RIGHTMOUSE', 'ESC'} or \
                 self.timer_limits > scene.NMV_SimulationSteps:
@@ -343,29 +415,47 @@ class ReconstructSomaOperator(bpy.types.Operator):
         return {'PASS_THROUGH'}
 
     ################################################################################################
-    # @execute
+    # @wait_for_morphology
     ################################################################################################
-    def execute(self,
-                context):
-        """Execute the operator.
+    def wait_for_morphology(self,
+                            context):
+        """Waits for the morphology loading job, and then reconstructs the soma.
 
         :param context:
             Panel context.
+        :return:
+            The state of the modal operator.
         """
 
-        # Get a reference to the scene
-        scene = context.scene
+        # The morphology is still loading
+        if self.loading_job.is_running():
+            return {'PASS_THROUGH'}
 
-        # Clear the scene
-        nmv.scene.ops.clear_scene()
+        # The job is cancelled or failed, and its state is already reported
+        if self.loading_job.state != nmv.utilities.JOB_FINISHED:
+            stop_morphology_loading_job(self, context)
+            return {'CANCELLED'}
 
-        # Load the morphology file
-        loading_result = nmv.interface.ui.load_morphology(self, scene)
+        # The morphology is loaded
+        self.loading_job = None
+        return self.reconstruct_soma(context)
 
-        # If the result is None, report the issue
-        if loading_result is None:
-            self.report({'ERROR'}, 'Please select a morphology file')
-            return {'FINISHED'}
+    ################################################################################################
+    # @reconstruct_soma
+    ################################################################################################
+    def reconstruct_soma(self,
+                         context):
+        """Reconstructs the soma of the loaded morphology, where the soft body simulation runs in
+        the modal handler.
+
+        :param context:
+            Panel context.
+        :return:
+            The state of the modal operator.
+        """
+
+        # Get a reference to the scene
+        scene = context.scene
 
         # Reconstruction time
         self.reconstruction_time = time.time()
@@ -397,6 +487,7 @@ class ReconstructSomaOperator(bpy.types.Operator):
             nmv.scene.ops.view_all_scene()
 
             # Finished
+            context.window_manager.event_timer_remove(self.event_timer)
             return {'FINISHED'}
 
         # MetaBall reconstruction
@@ -421,6 +512,7 @@ class ReconstructSomaOperator(bpy.types.Operator):
             nmv.scene.ops.view_all_scene()
 
             # Finished
+            context.window_manager.event_timer_remove(self.event_timer)
             return {'FINISHED'}
 
         # Softbody reconstruction
@@ -446,17 +538,42 @@ class ReconstructSomaOperator(bpy.types.Operator):
             else:
                 self.soma_sphere_object = self.soma_builder.build_soma_soft_body()
 
-            # Use the event timer to update the UI during the soma building
-            wm = context.window_manager
-            self.event_timer = wm.event_timer_add(time_step=0.01, window=context.window)
-            wm.modal_handler_add(self)
-
             # View all the objects in the scene
             nmv.scene.ops.view_all_scene()
 
-            # Modal
+            # Modal, the event timer updates the UI during the soma building
             return {'RUNNING_MODAL'}
 
+    ################################################################################################
+    # @execute
+    ################################################################################################
+    def execute(self,
+                context):
+        """Execute the operator.
+
+        The morphology is loaded in a job that does not block the UI, and the soma is
+        reconstructed in the modal handler once the morphology is loaded.
+
+        :param context:
+            Panel context.
+        """
+
+        # Do not clear the scene while a running job is still building it
+        if nmv.interface.ui.get_active_job() is not None:
+            self.report({'ERROR'}, 'Another operation is still running')
+            return {'CANCELLED'}
+
+        # Clear the scene
+        nmv.scene.ops.clear_scene()
+
+        # Load the morphology file
+        self.loading_job = start_morphology_loading_job(self, context)
+        if self.loading_job is None:
+            return {'FINISHED'}
+
+        # Modal
+        return {'RUNNING_MODAL'}
+
     ################################################################################################
     # @cancel
     ################################################################################################
@@ -467,6 +584,11 @@ class ReconstructSomaOperator(bpy.types.Operator):
             Panel context.
         """
 
+        # The morphology is still loading, and the soma is not built
+        if self.loading_job is not None:
+            stop_morphology_loading_job(self, context)
+            return
+
         # Get a reference to the scene
         scene = context.scene
 
@@ -804,6 +926,9 @@ class RenderSomaProgressive(bpy.types.Operator):
     # Morphology parameters
     morphology_object = None
 
+    # The job that loads the morphology
+    loading_job = None
+
     # Soma builder parameters
     soma_builder = None
     soma_sphere_object = None
@@ -826,6 +951,10 @@ class RenderSomaProgressive(bpy.types.Operator):
         # Get a reference to the scene
         scene = context.scene
 
+        # Wait for the morphology to be loaded
+        if self.loading_job is not None:
+            return self.wait_for_morphology(context)
+
         # Cancelling event, if using right click or exceeding the time limit of the simulation
         if event.type in {'RIGHTMOUSE', 'ESC'} or self.timer_limits > scene.NMV_SimulationSteps:
 
@@ -881,6 +1010,11 @@ class RenderSomaProgressive(bpy.types.Operator):
             Panel context.
         """
 
+        # Do not clear the scene while a running job is still building it
+        if nmv.interface.ui.get_active_job() is not None:
+            self.report({'ERROR'}, 'Another operation is still running')
+            return {'CANCELLED'}
+
         # Verify the output directory
         if not nmv.interface.validate_output_directory(self, context.scene):
             return {'FINISHED'}
@@ -899,14 +1033,54 @@ class RenderSomaProgressive(bpy.types.Operator):
             nmv.consts.Suffix.SOMA_PROGRESSIVE)
         nmv.file.ops.clean_and_create_directory(self.output_directory)
 
-        # Load the morphology file
-        loading_result = nmv.interface.ui.load_morphology(self, context.scene)
-
-        # If the result is None, report the issue
-        if loading_result is None:
-            self.report({'ERROR'}, 'Please select a morphology file')
+        # Load the morphology file, the soma is built once the morphology is loaded
+        self.loading_job = start_morphology_loading_job(self, context)
+        if self.loading_job is None:
             return {'FINISHED'}
 
+        # Modal
+        return {'RUNNING_MODAL'}
+
+    ################################################################################################
+    # @wait_for_morphology
+    ################################################################################################
+    def wait_for_morphology(self,
+                            context):
+        """Waits for the morphology loading job, and then builds the soma.
+
+        :param context:
+            Panel context.
+        :return:
+            The state of the modal operator.
+        """
+
+        # The morphology is still loading
+        if self.loading_job.is_running():
+            return {'PASS_THROUGH'}
+
+        # The job is cancelled or failed, and its state is already reported
+        if self.loading_job.state != nmv.utilities.JOB_FINISHED:
+            stop_morphology_loading_job(self, context)
+            return {'CANCELLED'}
+
+        # The morphology is loaded
+        self.loading_job = None
+        return self.build_soma(context)
+
+    ################################################################################################
+    # @build_soma
+    ################################################################################################
+    def build_soma(self,
+                   context):
+        """Builds the soft body of the soma of the loaded morphology, where the simulation is
+        rendered in the modal handler.
+
+        :param context:
+            Panel context.
+        :return:
+            The state of the modal operator.
+        """
+
         # Create a some builder object
         self.soma_builder = nmv.builders.SomaSoftBodyBuilder(
             nmv.interface.ui_morphology, nmv.interface.ui_options)
@@ -915,12 +1089,7 @@ class RenderSomaProgressive(bpy.types.Operator):
         # simulation now. Run the simulation in the '@modal' mode, to avoid freezing the UI
         self.soma_sphere_object = self.soma_builder.build_soma_soft_body()
 
-        # Use the event timer to update the UI during the soma building
-        wm = context.window_manager
-        self.event_timer = wm.event_timer_add(time_step=0.01, window=context.window)
-        wm.modal_handler_add(self)
-
-        # Modal
+        # Modal, the event timer updates the UI during the soma building
         return {'RUNNING_MODAL'}
 
     ################################################################################################
@@ -933,6 +1102,11 @@ class RenderSomaProgressive(bpy.types.Operator):
             Panel context.
         """
 
+        # The morphology is still loading, and the soma is not built
+        if self.loading_job is not None:
+            stop_morphology_loading_job(self, context)
+            return
+
         # Multi-threading
         wm = context.window_manager
         wm.event_timer_remove(self.event_timer)
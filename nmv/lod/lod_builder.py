@@ -0,0 +1,226 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import copy
+import numpy
+
+# Blender imports
+import bpy
+
+# Internal imports
+import nmv
+import nmv.enums
+import nmv.mesh
+import nmv.scene
+import nmv.skeleton
+from .lod_selection import *
+from .lod_geometry import *
+
+
+####################################################################################################
+# @create_lod_view_from_camera
+####################################################################################################
+def create_lod_view_from_camera(camera_object,
+                                scene=None):
+    """Creates a level-of-detail view from a camera in the scene.
+
+    :param camera_object:
+        A given camera object.
+    :param scene:
+        The scene that holds the rendering resolution, by default the current scene.
+    :return:
+        The view of the camera, LODView.
+    """
+
+    if scene is None:
+        scene = bpy.context.scene
+
+    scale = scene.render.resolution_percentage / 100.0
+    return LODView(matrix_world=[list(row) for row in camera_object.matrix_world],
+                   projection='PERSP' if camera_object.data.type == 'PERSP' else 'ORTHO',
+                   ortho_scale=camera_object.data.ortho_scale,
+                   field_of_view=camera_object.data.angle,
+                   resolution_x=int(scene.render.resolution_x * scale),
+                   resolution_y=int(scene.render.resolution_y * scale),
+                   clip_start=camera_object.data.clip_start,
+                   clip_end=camera_object.data.clip_end)
+
+
+####################################################################################################
+# @create_lod_mesh_object
+####################################################################################################
+def create_lod_mesh_object(name,
+                           tier,
+                           create_mesh_object,
+                           settings=None,
+                           cache=None,
+                           source_file=None):
+    """Creates the mesh object of a given tier, from the cache if it has been already built.
+
+    On a cache miss, the full resolution object is created, decimated with the ratio of the tier
+    and its geometry is saved to the cache for the following renders.
+
+    :param name:
+        The name of the mesh object, e.g. neuron_1234.
+    :param tier:
+        The level-of-detail tier, LOD_FULL, LOD_DECIMATED or LOD_COARSE.
+    :param create_mesh_object:
+        A function without arguments that creates the full resolution mesh object. It is only
+        called if the tier is not cached.
+    :param settings:
+        The settings of the tiers, LODSettings. The default settings are used if None.
+    :param cache:
+        An optional cache of the level-of-detail assets, LODCache.
+    :param source_file:
+        The file of the full resolution mesh, used to validate the cached assets.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    if settings is None:
+        settings = LODSettings()
+
+    decimation_ratio = settings.decimation_ratios[tier]
+    if tier == LOD_FULL or decimation_ratio >= 1.0:
+        return create_mesh_object()
+
+    # Cache hit
+    signature = None
+    if cache is not None:
+        signature = cache.compute_signature(source_file, 'mesh', decimation_ratio)
+        arrays = cache.load_arrays(name, tier, signature)
+        if arrays is not None:
+            return nmv.mesh.create_mesh_from_arrays(
+                vertices=arrays['vertices'], triangles=arrays['triangles'], name=name)
+
+    # Build the tier from the full resolution mesh
+    mesh_object = create_mesh_object()
+    nmv.mesh.decimate_mesh_object(mesh_object, decimation_ratio=decimation_ratio)
+    mesh_object.name = name
+
+    if cache is not None:
+        vertices, triangles = nmv.mesh.get_mesh_arrays(mesh_object)
+        cache.save_arrays(name, tier, signature, vertices=vertices, triangles=triangles)
+    return mesh_object
+
+
+####################################################################################################
+# @create_proxies_mesh_object
+####################################################################################################
+def create_proxies_mesh_object(centers,
+                               radii,
+                               settings=None,
+                               name='proxies'):
+    """Creates a single mesh object with the sphere proxies of a group of distant objects.
+
+    :param centers:
+        An Nx3 array of the centers of the proxies, typically the centers of the somata.
+    :param radii:
+        An array of N radii, typically the radii of the somata.
+    :param settings:
+        The settings of the tiers, LODSettings. The default settings are used if None.
+    :param name:
+        The name of the object.
+    :return:
+        A reference to the created mesh object, or None if there are no proxies.
+    """
+
+    if settings is None:
+        settings = LODSettings()
+
+    if len(radii) == 0:
+        return None
+
+    vertices, triangles = create_proxy_spheres_arrays(
+        centers=centers, radii=radii, subdivisions=settings.proxy_subdivisions)
+    return nmv.mesh.create_mesh_from_arrays(vertices=vertices, triangles=triangles, name=name)
+
+
+####################################################################################################
+# @create_simplified_morphology
+####################################################################################################
+def create_simplified_morphology(morphology,
+                                 tier,
+                                 settings=None,
+                                 cache=None,
+                                 source_file=None):
+    """Creates a copy of a morphology with simplified sections for a given tier.
+
+    The sections are simplified with a radius-aware Douglas-Peucker algorithm. The indices of the
+    kept samples are cached, so the simplification is not recomputed for the same morphology.
+
+    :param morphology:
+        A given morphology.
+    :param tier:
+        The level-of-detail tier, LOD_FULL, LOD_DECIMATED or LOD_COARSE.
+    :param settings:
+        The settings of the tiers, LODSettings. The default settings are used if None.
+    :param cache:
+        An optional cache of the level-of-detail assets, LODCache.
+    :param source_file:
+        The file of the morphology, used to validate the cached assets.
+    :return:
+        The simplified morphology, or the given morphology itself for the LOD_FULL tier.
+    """
+
+    if settings is None:
+        settings = LODSettings()
+
+    tolerance = settings.skeleton_tolerances[tier]
+    radius_tolerance = settings.radius_tolerances[tier]
+    if tier == LOD_FULL or (tolerance <= 0.0 and radius_tolerance <= 0.0):
+        return morphology
+
+    simplified_morphology = copy.deepcopy(morphology)
+    sections = nmv.skeleton.ops.get_morphology_sections(simplified_morphology)
+    number_samples = sum(len(section.samples) for section in sections)
+
+    # Reuse the kept samples from the cache
+    signature = None
+    if cache is not None:
+        signature = cache.compute_signature(source_file, 'skeleton', tolerance, radius_tolerance)
+        arrays = cache.load_arrays(morphology.label, tier, signature)
+        if arrays is not None and len(arrays['offsets']) == len(sections) + 1:
+            offsets = arrays['offsets'].tolist()
+            for i, section in enumerate(sections):
+                kept_indices = arrays['indices'][offsets[i]:offsets[i + 1]].tolist()
+                section.samples = [section.samples[j] for j in kept_indices]
+                section.reorder_samples()
+            return simplified_morphology
+
+    # Simplify all the sections at once and keep the original indices of the kept samples
+    offsets = numpy.cumsum([0] + [len(section.samples) for section in sections])
+    keep = nmv.skeleton.ops.simplify_morphology_sections(
+        morphology=simplified_morphology,
+        simplification_method=nmv.enums.Skeleton.Simplification.DOUGLAS_PEUCKER,
+        tolerance=tolerance, radius_tolerance=radius_tolerance)
+    kept_indices = [numpy.flatnonzero(keep[offsets[i]:offsets[i + 1]]).tolist()
+                    for i in range(len(sections))]
+
+    number_kept_samples = sum(len(indices) for indices in kept_indices)
+    nmv.logger.info('LOD [%s]: [%d] samples out of [%d] are kept' %
+                    (LOD_TIER_NAMES[tier], number_kept_samples, number_samples))
+
+    if cache is not None:
+        offsets = numpy.zeros(len(kept_indices) + 1, dtype=numpy.int64)
+        numpy.cumsum([len(indices) for indices in kept_indices], out=offsets[1:])
+        cache.save_arrays(morphology.label, tier, signature, offsets=offsets,
+                          indices=numpy.array([i for indices in kept_indices for i in indices],
+                                              dtype=numpy.int32))
+
+    return simplified_morphology
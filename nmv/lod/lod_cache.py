@@ -0,0 +1,166 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+import hashlib
+import numpy
+
+# Internal imports
+from .lod_selection import LOD_TIER_NAMES
+
+
+####################################################################################################
+# @LODCache
+####################################################################################################
+class LODCache:
+    """A directory of level-of-detail assets that are reused across renders.
+
+    Every asset is stored in a .npz file, whose name contains the name of the object, the tier
+    and a signature of the source file and the parameters of the tier. If the source file changes,
+    its signature changes and the stale asset is simply not found.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 directory):
+        """Constructor
+
+        :param directory:
+            The directory of the cache, it is created if it does not exist.
+        """
+
+        # Cache directory
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    ################################################################################################
+    # @compute_signature
+    ################################################################################################
+    @staticmethod
+    def compute_signature(source_file,
+                          *parameters):
+        """Computes a signature of a source file and the parameters used to derive an asset.
+
+        The signature uses the path, size and modification time of the file rather than its
+        contents, to avoid reading large files just to check the cache.
+
+        :param source_file:
+            The source file of the asset, or None.
+        :param parameters:
+            The parameters used to derive the asset.
+        :return:
+            A short hexadecimal signature.
+        """
+
+        key = list()
+        if source_file is not None and os.path.isfile(source_file):
+            stat = os.stat(source_file)
+            key.extend([os.path.abspath(source_file), stat.st_size, stat.st_mtime_ns])
+        else:
+            key.append(str(source_file))
+        key.extend(parameters)
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+
+    ################################################################################################
+    # @get_asset_path
+    ################################################################################################
+    def get_asset_path(self,
+                       name,
+                       tier,
+                       signature):
+        """Gets the path of an asset in the cache.
+
+        :param name:
+            The name of the object, e.g. neuron_1234.
+        :param tier:
+            The level-of-detail tier of the asset, or the name of an asset that is shared by all
+            the tiers, e.g. 'bounds'.
+        :param signature:
+            The signature of the asset.
+        :return:
+            The path of the asset.
+        """
+
+        if not isinstance(tier, str):
+            tier = LOD_TIER_NAMES[tier]
+        return '%s/%s.%s.%s.npz' % (self.directory, name, tier, signature)
+
+    ################################################################################################
+    # @load_arrays
+    ################################################################################################
+    def load_arrays(self,
+                    name,
+                    tier,
+                    signature):
+        """Loads the arrays of an asset from the cache.
+
+        :param name:
+            The name of the object.
+        :param tier:
+            The level-of-detail tier of the asset.
+        :param signature:
+            The signature of the asset.
+        :return:
+            A dictionary of the arrays of the asset, or None if the asset is not cached.
+        """
+
+        path = self.get_asset_path(name, tier, signature)
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with numpy.load(path) as data:
+                return {key: data[key] for key in data.files}
+
+        # A corrupted asset, e.g. an interrupted write, is rebuilt
+        except (OSError, ValueError):
+            return None
+
+    ################################################################################################
+    # @save_arrays
+    ################################################################################################
+    def save_arrays(self,
+                    name,
+                    tier,
+                    signature,
+                    **arrays):
+        """Saves the arrays of an asset to the cache.
+
+        The asset is written to a temporary file that is renamed afterwards, so concurrent renders
+        never read a partially written asset.
+
+        :param name:
+            The name of the object.
+        :param tier:
+            The level-of-detail tier of the asset.
+        :param signature:
+            The signature of the asset.
+        :param arrays:
+            The arrays of the asset.
+        :return:
+            The path of the asset.
+        """
+
+        path = self.get_asset_path(name, tier, signature)
+        temporary_path = '%s.%d.tmp.npz' % (path[:-len('.npz')], os.getpid())
+        numpy.savez(temporary_path, **arrays)
+        os.replace(temporary_path, path)
+        return path
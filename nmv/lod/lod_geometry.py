@@ -0,0 +1,40 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Internal imports
+import nmv.geometry
+
+
+####################################################################################################
+# @create_proxy_spheres_arrays
+####################################################################################################
+def create_proxy_spheres_arrays(centers,
+                                radii,
+                                subdivisions=2):
+    """Creates the geometry of a group of sphere proxies as a single set of arrays.
+
+    :param centers:
+        An Nx3 array of the centers of the spheres.
+    :param radii:
+        An array of N radii.
+    :param subdivisions:
+        The subdivision level of the ico-spheres as in Blender, 2 by default.
+    :return:
+        An array of vertices and an array of triangles of all the spheres.
+    """
+
+    return nmv.geometry.create_ico_spheres_arrays(centers, radii, subdivisions)
@@ -0,0 +1,307 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import math
+import numpy
+
+
+# The level-of-detail tiers, from the finest to the coarsest
+LOD_FULL = 0
+LOD_DECIMATED = 1
+LOD_COARSE = 2
+LOD_PROXY = 3
+
+# The objects that are outside the view are not loaded at all
+LOD_CULLED = 4
+
+# The names of the tiers, used for naming the objects and the cached assets
+LOD_TIER_NAMES = ['full', 'decimated', 'coarse', 'proxy', 'culled']
+
+
+####################################################################################################
+# @LODSettings
+####################################################################################################
+class LODSettings:
+    """The parameters of the level-of-detail tiers.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 pixel_thresholds=(256.0, 64.0, 8.0),
+                 decimation_ratios=(1.0, 0.25, 0.05),
+                 skeleton_tolerances=(0.0, 0.25, 1.0),
+                 radius_tolerances=(0.0, 0.1, 0.5),
+                 proxy_subdivisions=2):
+        """Constructor
+
+        :param pixel_thresholds:
+            The minimum projected sizes in pixels of the FULL, DECIMATED and COARSE tiers. Any
+            object that is smaller than the last threshold is drawn as a proxy.
+        :param decimation_ratios:
+            The decimation ratios of the meshes of the FULL, DECIMATED and COARSE tiers.
+        :param skeleton_tolerances:
+            The positional tolerances of the skeleton simplification of the three tiers, in
+            microns.
+        :param radius_tolerances:
+            The radial tolerances of the skeleton simplification of the three tiers, in microns.
+        :param proxy_subdivisions:
+            The subdivision level, as in Blender, of the ico-spheres that are used as proxies.
+        """
+
+        # Tier selection
+        self.pixel_thresholds = list(pixel_thresholds)
+
+        # Meshes
+        self.decimation_ratios = list(decimation_ratios)
+
+        # Skeletons
+        self.skeleton_tolerances = list(skeleton_tolerances)
+        self.radius_tolerances = list(radius_tolerances)
+
+        # Proxies
+        self.proxy_subdivisions = proxy_subdivisions
+
+
+####################################################################################################
+# @LODView
+####################################################################################################
+class LODView:
+    """A camera used to select the level-of-detail tiers, independent from Blender.
+
+    The camera follows the Blender convention, where it looks along its local -Z axis and its
+    local Y axis is up.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 matrix_world,
+                 projection='ORTHO',
+                 ortho_scale=1.0,
+                 field_of_view=math.radians(45.0),
+                 resolution_x=512,
+                 resolution_y=512,
+                 clip_start=0.0,
+                 clip_end=1e10):
+        """Constructor
+
+        :param matrix_world:
+            The 4x4 camera-to-world matrix of the camera.
+        :param projection:
+            The projection of the camera, 'ORTHO' or 'PERSP'.
+        :param ortho_scale:
+            The width of the view of an orthographic camera along the larger image dimension.
+        :param field_of_view:
+            The field of view of a perspective camera along the larger image dimension, in
+            radians.
+        :param resolution_x:
+            The width of the image in pixels.
+        :param resolution_y:
+            The height of the image in pixels.
+        :param clip_start:
+            The near clipping distance.
+        :param clip_end:
+            The far clipping distance.
+        """
+
+        matrix_world = numpy.array(matrix_world, dtype=numpy.float64)
+
+        # Camera frame, the columns of the rotation are the axes of the camera
+        self.rotation = matrix_world[:3, :3] / numpy.linalg.norm(matrix_world[:3, :3], axis=0)
+        self.location = matrix_world[:3, 3]
+
+        # Projection
+        self.projection = projection
+        self.ortho_scale = ortho_scale
+        self.field_of_view = field_of_view
+
+        # Image
+        self.resolution_x = resolution_x
+        self.resolution_y = resolution_y
+
+        # Clipping
+        self.clip_start = clip_start
+        self.clip_end = clip_end
+
+    ################################################################################################
+    # @transform_to_view_space
+    ################################################################################################
+    def transform_to_view_space(self,
+                                points):
+        """Transforms points to the space of the camera.
+
+        :param points:
+            An Nx3 array of points in the world space.
+        :return:
+            An Nx2 array of the lateral coordinates of the points and an array of N depths along
+            the viewing direction.
+        """
+
+        local = (numpy.asarray(points, dtype=numpy.float64) - self.location) @ self.rotation
+        return local[:, :2], -local[:, 2]
+
+    ################################################################################################
+    # @get_half_extents
+    ################################################################################################
+    def get_half_extents(self):
+        """Gets the half extents of the view at a unit depth for perspective cameras, or the half
+        extents of the view for orthographic ones.
+
+        :return:
+            The half width and half height of the view.
+        """
+
+        larger = float(max(self.resolution_x, self.resolution_y))
+        if self.projection == 'PERSP':
+            half = math.tan(0.5 * self.field_of_view)
+        else:
+            half = 0.5 * self.ortho_scale
+        return half * self.resolution_x / larger, half * self.resolution_y / larger
+
+
+####################################################################################################
+# @compute_projected_sizes
+####################################################################################################
+def compute_projected_sizes(view,
+                            centers,
+                            radii):
+    """Computes the sizes in pixels of the projections of bounding spheres on the image.
+
+    :param view:
+        The view of the camera, LODView.
+    :param centers:
+        An Nx3 array of the centers of the bounding spheres.
+    :param radii:
+        An array of N radii.
+    :return:
+        An array of N sizes in pixels. The depths of the spheres are clamped to the near plane,
+        therefore a sphere that crosses the camera plane gets a large size rather than zero,
+        and the spheres that are completely behind the camera are culled by the frustum test.
+    """
+
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+    larger = float(max(view.resolution_x, view.resolution_y))
+
+    if view.projection == 'PERSP':
+        _, depths = view.transform_to_view_space(centers)
+        depths = numpy.maximum(depths, max(view.clip_start, 1e-12))
+        visible_width = 2.0 * depths * math.tan(0.5 * view.field_of_view)
+        return 2.0 * radii / visible_width * larger
+
+    return 2.0 * radii / view.ortho_scale * larger
+
+
+####################################################################################################
+# @compute_frustum_visibility
+####################################################################################################
+def compute_frustum_visibility(view,
+                               centers,
+                               radii):
+    """Checks which bounding spheres intersect the view frustum of the camera, conservatively.
+
+    :param view:
+        The view of the camera, LODView.
+    :param centers:
+        An Nx3 array of the centers of the bounding spheres.
+    :param radii:
+        An array of N radii.
+    :return:
+        A boolean array, True for the visible spheres.
+    """
+
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+    lateral, depths = view.transform_to_view_space(centers)
+    half_width, half_height = view.get_half_extents()
+
+    # The extents of the view at the depth of every sphere
+    if view.projection == 'PERSP':
+        limits_x = numpy.maximum(depths, 0.0) * half_width + radii * math.hypot(1.0, half_width)
+        limits_y = numpy.maximum(depths, 0.0) * half_height + radii * math.hypot(1.0, half_height)
+    else:
+        limits_x = half_width + radii
+        limits_y = half_height + radii
+
+    return (numpy.abs(lateral[:, 0]) <= limits_x) & \
+           (numpy.abs(lateral[:, 1]) <= limits_y) & \
+           (depths + radii >= view.clip_start) & \
+           (depths - radii <= view.clip_end)
+
+
+####################################################################################################
+# @select_lod_tiers
+####################################################################################################
+def select_lod_tiers(views,
+                     centers,
+                     radii,
+                     settings=None):
+    """Selects the level-of-detail tier of every object from its bounding sphere.
+
+    If multiple views are given, e.g. the front and side views of the same scene, every object
+    gets the finest tier that is required by any of them.
+
+    :param views:
+        A list of views, LODView.
+    :param centers:
+        An Nx3 array of the centers of the bounding spheres of the objects.
+    :param radii:
+        An array of N radii.
+    :param settings:
+        The settings of the tiers, LODSettings. The default settings are used if None.
+    :return:
+        An array of N tiers.
+    """
+
+    if settings is None:
+        settings = LODSettings()
+
+    tiers = numpy.full(len(radii), LOD_CULLED, dtype=numpy.int32)
+    for view in views:
+
+        # Count the thresholds that the projected sizes do not reach
+        sizes = compute_projected_sizes(view, centers, radii)
+        view_tiers = numpy.zeros(len(radii), dtype=numpy.int32)
+        for threshold in settings.pixel_thresholds:
+            view_tiers += (sizes < threshold).astype(numpy.int32)
+
+        view_tiers[~compute_frustum_visibility(view, centers, radii)] = LOD_CULLED
+        numpy.minimum(tiers, view_tiers, out=tiers)
+
+    return tiers
+
+
+####################################################################################################
+# @compute_bounding_sphere
+####################################################################################################
+def compute_bounding_sphere(vertices):
+    """Computes a bounding sphere of a set of vertices, centered at the center of their box.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :return:
+        The center of the sphere and its radius.
+    """
+
+    vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+    if len(vertices) == 0:
+        return numpy.zeros(3), 0.0
+
+    center = 0.5 * (vertices.min(axis=0) + vertices.max(axis=0))
+    return center, float(numpy.linalg.norm(vertices - center, axis=1).max())
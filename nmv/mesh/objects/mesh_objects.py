@@ -295,3 +295,124 @@ def create_mesh_from_raw_data(verts,
 
     # Return a reference to the mesh object
     return mesh_object
+
+
+####################################################################################################
+# @create_mesh_from_arrays
+####################################################################################################
+def create_mesh_from_arrays(vertices,
+                            triangles=None,
+                            edges=None,
+                            name='Mesh',
+                            faces=None,
+                            face_sizes=None):
+    """Creates a mesh from numpy arrays in bulk, without converting the data into python lists.
+
+    :param vertices:
+        An Nx3 array of the vertices of the mesh.
+    :param triangles:
+        An Mx3 array of the vertex indices of the triangles of the mesh, or None.
+    :param edges:
+        An Ex2 array of the vertex indices of the loose edges of the mesh, or None.
+    :param name:
+        Mesh name.
+    :param faces:
+        A flat array of the vertex indices of polygons with any number of vertices, or None.
+        The polygons are used instead of the triangles if given.
+    :param face_sizes:
+        An array with the number of vertices of every polygon in faces.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    mesh = bpy.data.meshes.new(name)
+
+    # Vertices
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', numpy.ascontiguousarray(vertices, dtype=numpy.float32).ravel())
+
+    # Edges
+    if edges is not None and len(edges) > 0:
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set(
+            'vertices', numpy.ascontiguousarray(edges, dtype=numpy.int32).ravel())
+
+    # Polygons
+    if faces is not None and len(face_sizes) > 0:
+        face_sizes = numpy.ascontiguousarray(face_sizes, dtype=numpy.int32)
+        mesh.loops.add(len(faces))
+        mesh.loops.foreach_set(
+            'vertex_index', numpy.ascontiguousarray(faces, dtype=numpy.int32).ravel())
+        mesh.polygons.add(len(face_sizes))
+        mesh.polygons.foreach_set(
+            'loop_start', (numpy.cumsum(face_sizes) - face_sizes).astype(numpy.int32))
+        mesh.polygons.foreach_set('loop_total', face_sizes)
+
+    # Triangles
+    elif triangles is not None and len(triangles) > 0:
+        number_triangles = len(triangles)
+        mesh.loops.add(3 * number_triangles)
+        mesh.loops.foreach_set(
+            'vertex_index', numpy.ascontiguousarray(triangles, dtype=numpy.int32).ravel())
+        mesh.polygons.add(number_triangles)
+        mesh.polygons.foreach_set(
+            'loop_start', numpy.arange(0, 3 * number_triangles, 3, dtype=numpy.int32))
+        mesh.polygons.foreach_set('loop_total', numpy.full(number_triangles, 3, dtype=numpy.int32))
+
+    # Compute the edges of the faces and validate the mesh
+    mesh.update(calc_edges=True)
+    mesh.validate()
+
+    # Create the object and link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    # Return a reference to the mesh object
+    return mesh_object
+
+
+####################################################################################################
+# @get_mesh_arrays
+####################################################################################################
+def get_mesh_arrays(mesh_object):
+    """Gets the vertices and the triangles of a mesh object as numpy arrays in bulk.
+
+    The polygons of the mesh are triangulated as fans around their first vertices.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        An Nx3 array of the vertices of the mesh in its local space and an Mx3 array of the
+        vertex indices of its triangles.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    mesh = mesh_object.data
+
+    # Vertices
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', vertices)
+
+    # Polygons
+    loop_indices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get('vertex_index', loop_indices)
+    loop_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    # A polygon with K vertices is split into K - 2 triangles (first, i, i + 1)
+    number_fans = numpy.maximum(loop_totals - 2, 0)
+    polygon_starts = numpy.repeat(loop_starts, number_fans)
+    fan_offsets = numpy.arange(int(number_fans.sum()), dtype=numpy.int32) - \
+        numpy.repeat(numpy.cumsum(number_fans) - number_fans, number_fans)
+    triangles = numpy.stack((loop_indices[polygon_starts],
+                             loop_indices[polygon_starts + fan_offsets + 1],
+                             loop_indices[polygon_starts + fan_offsets + 2]), axis=1)
+
+    return vertices.reshape(-1, 3), triangles
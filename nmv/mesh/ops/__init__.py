@@ -15,7 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh_cleaning_ops import *
-from .mesh_face_ops import *
-from .mesh_object_ops import *
-from .mesh_vertex_ops import *
\ No newline at end of file
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'mesh_cleaning_ops',
+    'mesh_face_ops',
+    'mesh_object_ops',
+    'mesh_union_ops',
+    'mesh_vertex_ops',
+))
@@ -18,6 +18,7 @@
 # Blender imports
 import bpy
 from mathutils import Vector, Matrix
+from mathutils.kdtree import KDTree
 
 # Internal imports
 import nmv.scene
@@ -206,6 +207,74 @@ def get_largest_radius_in_face(mesh_object,
     return largest_radius
 
 
+####################################################################################################
+# @get_largest_radii_in_faces
+####################################################################################################
+def get_largest_radii_in_faces(mesh_object):
+    """Returns the largest radius of every face in the mesh, i.e. the largest distance between the
+    center of the face and its vertices, computed for all the faces at once.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        An array of the largest radii of the faces, in the order of the faces.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    mesh = mesh_object.data
+    if len(mesh.polygons) == 0:
+        return numpy.zeros(0, dtype=numpy.float64)
+
+    # The vertices and the vertex of every loop
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get('co', vertices)
+    vertices.shape = (-1, 3)
+    loops_vertices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get('vertex_index', loops_vertices)
+
+    # The loops of every face
+    loops_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_start', loops_starts)
+    loops_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_total', loops_totals)
+
+    # The loops of all the faces laid out contiguously, face after face
+    offsets = numpy.concatenate(([0], numpy.cumsum(loops_totals)[:-1]))
+    faces_indices = numpy.repeat(numpy.arange(len(mesh.polygons)), loops_totals)
+    loops_indices = numpy.arange(len(faces_indices)) + numpy.repeat(
+        loops_starts - offsets, loops_totals)
+
+    # The distance between every loop vertex and the center of its face
+    centers = get_faces_centers(mesh_object)
+    distances = numpy.linalg.norm(
+        vertices[loops_vertices[loops_indices]] - centers[faces_indices], axis=1)
+
+    # The largest distance per face
+    return numpy.maximum.reduceat(distances, offsets)
+
+
+####################################################################################################
+# @get_faces_normals
+####################################################################################################
+def get_faces_normals(mesh_object):
+    """Gets the normals of all the faces of a mesh object as a numpy array in bulk.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        An Nx3 array of the normals of the faces in the local space of the object.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    normals = numpy.empty(len(mesh_object.data.polygons) * 3, dtype=numpy.float64)
+    mesh_object.data.polygons.foreach_get('normal', normals)
+    return normals.reshape(-1, 3)
+
+
 ####################################################################################################
 # @extrude_face_to_face
 ####################################################################################################
@@ -371,6 +440,93 @@ def get_index_of_nearest_face_to_point(mesh_object,
     return nearest_face_index
 
 
+####################################################################################################
+# @get_faces_centers
+####################################################################################################
+def get_faces_centers(mesh_object):
+    """Gets the centers of all the faces of a mesh object as a numpy array in bulk.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        An Nx3 array of the centers of the faces in the local space of the object.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    centers = numpy.empty(len(mesh_object.data.polygons) * 3, dtype=numpy.float64)
+    mesh_object.data.polygons.foreach_get('center', centers)
+    return centers.reshape(-1, 3)
+
+
+####################################################################################################
+# @create_faces_centers_kd_tree
+####################################################################################################
+def create_faces_centers_kd_tree(mesh_object):
+    """Creates a spatial index of the centers of the faces of a mesh object, to find the nearest
+    faces to many points without scanning all the faces for every point.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A balanced KDTree of the face centers, where the index of every point is the face index.
+    """
+
+    centers = get_faces_centers(mesh_object)
+    kd_tree = KDTree(len(centers))
+    for i, center in enumerate(centers.tolist()):
+        kd_tree.insert(center, i)
+    kd_tree.balance()
+    return kd_tree
+
+
+####################################################################################################
+# @get_indices_of_nearest_faces_to_points
+####################################################################################################
+def get_indices_of_nearest_faces_to_points(mesh_object,
+                                           points,
+                                           unique=False):
+    """Gets the indices of the nearest faces of an object to a list of points in a single batch,
+    using a single spatial index of the face centers.
+
+    :param mesh_object:
+        A given mesh object.
+    :param points:
+        A list of points in the three-dimensional space.
+    :param unique:
+        If True, every point gets a different face, i.e. the nearest face that is not already
+        used by a previous point in the list.
+    :return:
+        A list of the indices of the nearest faces, one per point.
+    """
+
+    kd_tree = create_faces_centers_kd_tree(mesh_object)
+    number_faces = len(mesh_object.data.polygons)
+
+    faces_indices = list()
+    used_faces = set()
+    for point in points:
+
+        # The nearest face
+        face_index = kd_tree.find(point)[1]
+
+        # Or the nearest face that is not used yet
+        if unique and face_index in used_faces:
+            face_index = None
+            number_neighbours = 2
+            while face_index is None and number_neighbours <= 2 * number_faces:
+                for _, index, _ in kd_tree.find_n(point, min(number_neighbours, number_faces)):
+                    if index not in used_faces:
+                        face_index = index
+                        break
+                number_neighbours *= 2
+
+        faces_indices.append(face_index)
+        used_faces.add(face_index)
+    return faces_indices
+
+
 ####################################################################################################
 # @get_index_of_nearest_face_to_point
 ####################################################################################################
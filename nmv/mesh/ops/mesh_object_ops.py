@@ -508,10 +508,15 @@ def union_mesh_objects(mesh_object_1,
 
 
 ####################################################################################################
-# @union_mesh_objects_in_list
+# @union_mesh_objects_in_list_sequentially
 ####################################################################################################
-def union_mesh_objects_in_list(mesh_objects_list):
-    """Union a list of mesh objects into a single mesh.
+def union_mesh_objects_in_list_sequentially(mesh_objects_list):
+    """Union a list of mesh objects into a single mesh, by merging every mesh in the list into the
+    first one.
+
+    NOTE: The cost of this function grows quadratically with the number of meshes, use
+    union_mesh_objects_in_list instead.
+
     :param mesh_objects_list:
         A list of mesh objects to be merged into a single mesh relying on the union operator.
     :return:
@@ -534,13 +539,8 @@ def union_mesh_objects_in_list(mesh_objects_list):
         # Union the ith mesh object
         mesh_object_1 = union_mesh_objects(mesh_object_1, mesh_objects_list[i])
 
-        # Switch to edit mode to REMOVE THE DOUBLES
-        # TODO: Use the remove doubles function
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.remove_doubles()
-        bpy.ops.mesh.normals_make_consistent(inside=False)
-        bpy.ops.object.editmode_toggle()
+        # Remove the doubles and fix the normals
+        nmv.mesh.ops.clean_union_meshes([mesh_object_1])
 
         # Delete the other mesh
         nmv.scene.ops.delete_list_objects([mesh_objects_list[i]])
@@ -549,12 +549,40 @@ def union_mesh_objects_in_list(mesh_objects_list):
     nmv.utilities.time_line.show_iteration_progress(
         'Union', len(mesh_objects_list), len(mesh_objects_list), done=True)
 
-    # TODO: handle the case when this operation fails.
-
     # Return a reference to the final mesh
     return mesh_object_1
 
 
+####################################################################################################
+# @union_mesh_objects_in_list
+####################################################################################################
+def union_mesh_objects_in_list(mesh_objects_list,
+                               number_processes=1):
+    """Union a list of mesh objects into a single mesh.
+
+    The spatially neighbouring meshes are merged pairwise in a balanced binary tree. If more than
+    a single process is given, the independent subtrees are merged in background processes.
+
+    :param mesh_objects_list:
+        A list of mesh objects to be merged into a single mesh relying on the union operator.
+    :param number_processes:
+        The number of processes used to merge the independent subtrees, by default 1.
+    :return:
+        The final mesh resulting from the union operator.
+    """
+
+    # Ensure that the list has more than a single mesh to proceed.
+    if len(mesh_objects_list) == 1:
+        return mesh_objects_list[0]
+
+    # The failures of the worker processes are handled by merging their groups locally
+    if number_processes > 1:
+        return nmv.mesh.ops.union_mesh_objects_in_worker_processes(
+            mesh_objects_list, number_processes)
+
+    return nmv.mesh.ops.union_mesh_objects_in_balanced_tree(mesh_objects_list)
+
+
 ################################################################################
 # @intersect_mesh_objects
 ################################################################################
@@ -0,0 +1,336 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+import shutil
+import subprocess
+import tempfile
+
+# Blender imports
+import bpy
+from mathutils import Vector
+
+# Internal imports
+import nmv.mesh
+import nmv.scene
+import nmv.utilities
+
+
+# The command line interface that is executed by the union worker processes
+UNION_WORKER_CLI = '%s/../../interface/cli/mesh_union.py' % \
+                   os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @get_mesh_object_center
+####################################################################################################
+def get_mesh_object_center(mesh_object):
+    """Gets the center of the bounding box of a mesh object in the world space.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        The center of the object, Vector.
+    """
+
+    center = Vector((0.0, 0.0, 0.0))
+    for corner in mesh_object.bound_box:
+        center += mesh_object.matrix_world @ Vector(corner) if nmv.utilities.is_blender_280() \
+            else mesh_object.matrix_world * Vector(corner)
+    return center / 8.0
+
+
+####################################################################################################
+# @get_morton_code
+####################################################################################################
+def get_morton_code(x,
+                    y,
+                    z,
+                    bits=10):
+    """Interleaves the bits of three integer coordinates into a single Morton code.
+
+    :param x:
+        X coordinate, in [0, 2 ^ bits).
+    :param y:
+        Y coordinate, in [0, 2 ^ bits).
+    :param z:
+        Z coordinate, in [0, 2 ^ bits).
+    :param bits:
+        The number of bits per coordinate.
+    :return:
+        The Morton code.
+    """
+
+    code = 0
+    for bit in range(bits):
+        code |= ((x >> bit) & 1) << (3 * bit + 2)
+        code |= ((y >> bit) & 1) << (3 * bit + 1)
+        code |= ((z >> bit) & 1) << (3 * bit)
+    return code
+
+
+####################################################################################################
+# @order_mesh_objects_spatially
+####################################################################################################
+def order_mesh_objects_spatially(mesh_objects_list):
+    """Orders a list of mesh objects along a Morton space-filling curve, such that the objects
+    that are next to each other in the list are also close to each other in space.
+
+    :param mesh_objects_list:
+        A list of mesh objects.
+    :return:
+        A new list with the same objects ordered spatially.
+    """
+
+    if len(mesh_objects_list) < 3:
+        return list(mesh_objects_list)
+
+    centers = [get_mesh_object_center(mesh_object) for mesh_object in mesh_objects_list]
+    p_min = [min(center[i] for center in centers) for i in range(3)]
+    p_max = [max(center[i] for center in centers) for i in range(3)]
+    extent = [max(p_max[i] - p_min[i], 1e-6) for i in range(3)]
+
+    # Quantize the centers and compute their codes
+    codes = list()
+    for center in centers:
+        quantized = [int(1023 * (center[i] - p_min[i]) / extent[i]) for i in range(3)]
+        codes.append(get_morton_code(*quantized))
+
+    order = sorted(range(len(mesh_objects_list)), key=lambda i: codes[i])
+    return [mesh_objects_list[i] for i in order]
+
+
+####################################################################################################
+# @clean_union_meshes
+####################################################################################################
+def clean_union_meshes(mesh_objects_list):
+    """Removes the duplicate vertices and recalculates the normals of a list of meshes that
+    resulted from a union operation.
+
+    In Blender 2.8 and later, all the meshes are edited together in a single edit-mode session.
+
+    :param mesh_objects_list:
+        A list of mesh objects.
+    """
+
+    if len(mesh_objects_list) == 0:
+        return
+
+    # Group the meshes into editing sessions
+    if nmv.utilities.is_blender_280():
+        sessions = [mesh_objects_list]
+    else:
+        sessions = [[mesh_object] for mesh_object in mesh_objects_list]
+
+    for session in sessions:
+
+        # Select the meshes and activate one of them
+        nmv.scene.ops.deselect_all()
+        nmv.scene.ops.select_objects(session)
+        nmv.scene.ops.set_active_object(session[0])
+
+        # Clean them in the edit mode
+        bpy.ops.object.editmode_toggle()
+        bpy.ops.mesh.select_all(action='SELECT')
+        bpy.ops.mesh.remove_doubles()
+        bpy.ops.mesh.normals_make_consistent(inside=False)
+        bpy.ops.object.editmode_toggle()
+
+
+####################################################################################################
+# @union_mesh_objects_pairwise
+####################################################################################################
+def union_mesh_objects_pairwise(mesh_objects_list):
+    """Applies a single level of the union tree, where every two consecutive meshes in the list
+    are merged into one.
+
+    :param mesh_objects_list:
+        A list of mesh objects, ordered spatially.
+    :return:
+        A list of the merged meshes, with half the size of the input list.
+    """
+
+    merged_objects = list()
+    for i in range(0, len(mesh_objects_list) - 1, 2):
+
+        # Union the two meshes and delete the second one
+        merged_objects.append(nmv.mesh.ops.union_mesh_objects(
+            mesh_objects_list[i], mesh_objects_list[i + 1]))
+        nmv.scene.ops.delete_list_objects([mesh_objects_list[i + 1]])
+
+    # The odd mesh is carried over to the next level
+    if len(mesh_objects_list) % 2 == 1:
+        merged_objects.append(mesh_objects_list[-1])
+
+    return merged_objects
+
+
+####################################################################################################
+# @union_mesh_objects_in_balanced_tree
+####################################################################################################
+def union_mesh_objects_in_balanced_tree(mesh_objects_list):
+    """Union a list of mesh objects into a single mesh using a balanced binary tree.
+
+    The meshes are ordered spatially and then merged pairwise, level by level, such that every
+    boolean operation involves two meshes of a comparable size and the cleanup is applied once
+    per level. The number of levels is logarithmic in the number of meshes, compared to a linear
+    number of operations on an ever-growing mesh in the sequential case.
+
+    :param mesh_objects_list:
+        A list of mesh objects to be merged into a single mesh relying on the union operator.
+    :return:
+        The final mesh resulting from the union operator.
+    """
+
+    level_objects = order_mesh_objects_spatially(mesh_objects_list)
+    number_levels = 0
+    total_levels = max(1, (len(level_objects) - 1).bit_length())
+
+    while len(level_objects) > 1:
+
+        # Show progress
+        nmv.utilities.time_line.show_iteration_progress('Union', number_levels, total_levels)
+
+        # Merge the neighbours and clean the merged meshes once
+        level_objects = union_mesh_objects_pairwise(level_objects)
+        clean_union_meshes(level_objects)
+        number_levels += 1
+
+    # Report the progress
+    nmv.utilities.time_line.show_iteration_progress(
+        'Union', total_levels, total_levels, done=True)
+
+    # Return a reference to the final mesh
+    return level_objects[0]
+
+
+####################################################################################################
+# @get_union_worker_command
+####################################################################################################
+def get_union_worker_command(input_file,
+                             output_file):
+    """Gets the command that launches a union worker process.
+
+    :param input_file:
+        The .blend file that contains the meshes of the worker.
+    :param output_file:
+        The .blend file where the worker writes the merged mesh.
+    :return:
+        The command as a list of arguments.
+    """
+
+    return [bpy.app.binary_path, '-b', '--factory-startup',
+            '--python', os.path.abspath(UNION_WORKER_CLI), '--',
+            '--input-file', input_file, '--output-file', output_file]
+
+
+####################################################################################################
+# @load_mesh_objects_from_blend_file
+####################################################################################################
+def load_mesh_objects_from_blend_file(blend_file):
+    """Loads all the mesh objects from a .blend file and links them to the scene.
+
+    :param blend_file:
+        The path to the .blend file.
+    :return:
+        A list of the loaded mesh objects.
+    """
+
+    with bpy.data.libraries.load(blend_file, link=False) as (data_source, data_destination):
+        data_destination.objects = [name for name in data_source.objects]
+
+    mesh_objects = list()
+    for mesh_object in data_destination.objects:
+        if mesh_object is not None and mesh_object.type == 'MESH':
+            nmv.scene.ops.link_object_to_scene(mesh_object)
+            mesh_objects.append(mesh_object)
+    return mesh_objects
+
+
+####################################################################################################
+# @union_mesh_objects_in_worker_processes
+####################################################################################################
+def union_mesh_objects_in_worker_processes(mesh_objects_list,
+                                           number_processes):
+    """Union a list of mesh objects into a single mesh, where the independent subtrees of the
+    union tree are merged in parallel by background Blender processes.
+
+    The spatially-ordered list is split into contiguous groups, every group is written into a
+    .blend file and merged by a worker process, and the merged groups are finally merged in the
+    current process. If a worker fails, its group is merged in the current process, and if the
+    workers cannot be launched at all, the whole list is merged in the current process.
+
+    :param mesh_objects_list:
+        A list of mesh objects to be merged into a single mesh relying on the union operator.
+    :param number_processes:
+        The number of worker processes.
+    :return:
+        The final mesh resulting from the union operator.
+    """
+
+    ordered_objects = order_mesh_objects_spatially(mesh_objects_list)
+    number_processes = min(number_processes, len(ordered_objects) // 2)
+    if number_processes < 2:
+        return union_mesh_objects_in_balanced_tree(ordered_objects)
+
+    # Split the list into contiguous, and therefore spatially coherent, groups
+    group_size = (len(ordered_objects) + number_processes - 1) // number_processes
+    groups = [ordered_objects[i:i + group_size]
+              for i in range(0, len(ordered_objects), group_size)]
+
+    # Write the groups and launch the workers
+    temporary_directory = tempfile.mkdtemp(prefix='nmv_union_')
+    workers = list()
+    try:
+        for i, group in enumerate(groups):
+            input_file = '%s/group_%d.blend' % (temporary_directory, i)
+            output_file = '%s/group_%d_union.blend' % (temporary_directory, i)
+            bpy.data.libraries.write(input_file, set(group))
+            workers.append((subprocess.Popen(get_union_worker_command(input_file, output_file),
+                                             stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL),
+                            output_file))
+
+    # Nothing is deleted before the workers are collected, so the list can be merged locally
+    except (OSError, RuntimeError) as error:
+        nmv.logger.info('The union workers could not be launched [%s], merging locally' % error)
+        for worker, _ in workers:
+            worker.kill()
+            worker.wait()
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        return union_mesh_objects_in_balanced_tree(ordered_objects)
+
+    # Collect the results of the workers
+    merged_objects = list()
+    for group, (worker, output_file) in zip(groups, workers):
+        loaded_objects = list()
+        if worker.wait() == 0 and os.path.isfile(output_file):
+            loaded_objects = load_mesh_objects_from_blend_file(output_file)
+
+        if len(loaded_objects) == 1:
+            nmv.scene.ops.delete_list_objects(group)
+            merged_objects.append(loaded_objects[0])
+        else:
+            nmv.logger.info('A union worker failed, merging its group locally')
+            nmv.scene.ops.delete_list_objects(loaded_objects)
+            merged_objects.append(union_mesh_objects_in_balanced_tree(group))
+
+    shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    # Merge the results of the workers
+    return union_mesh_objects_in_balanced_tree(merged_objects)
@@ -15,10 +15,16 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .io_options import *
-from .mesh_options import *
-from .morphology_options import *
-from .soma_options import *
-from .rendering_options import *
-from .shading_options import *
-from .neuromorphovis_options import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'io_options',
+    'mesh_options',
+    'morphology_options',
+    'soma_options',
+    'rendering_options',
+    'shading_options',
+    'neuromorphovis_options',
+))
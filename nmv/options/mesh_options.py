@@ -68,6 +68,15 @@ class MeshOptions:
         # The shape of the skeleton that is used in the union meshing algorithm
         self.skeleton_shape = nmv.enums.Meshing.UnionMeshing.QUAD_SKELETON
 
+        # The number of background processes used to union the sections of every arbor
+        self.union_processes = 1
+
+        # The size of the voxels used by the voxelization builder, 0.0 to derive it from the radii
+        self.voxel_size = 0.0
+
+        # The number of processes used to evaluate the blocks of the voxelization builder
+        self.voxelization_processes = 1
+
         # SPINES OPTIONS ###########################################################################
         # The source where the spines will be loaded from, by default ignore the spines
         self.spines = nmv.enums.Meshing.Spines.Source.IGNORE
@@ -90,6 +90,15 @@ class MorphologyOptions:
         # Resampling step
         self.resampling_step = 1.0
 
+        # Simplification method
+        self.simplification_method = nmv.enums.Skeleton.Simplification.NONE
+
+        # The maximum positional deviation of a sample removed by the simplification, in microns
+        self.simplification_tolerance = 0.1
+
+        # The maximum radial deviation of a sample removed by the simplification, in microns
+        self.simplification_radius_tolerance = 0.05
+
         # The radii of the samples defined per section
         self.arbors_radii = nmv.enums.Skeleton.Radii.ORIGINAL
 
@@ -247,6 +256,9 @@ class MorphologyOptions:
         # Resampling method
         self.resampling_method = nmv.enums.Skeleton.Resampling.NONE
 
+        # Simplification method
+        self.simplification_method = nmv.enums.Skeleton.Simplification.NONE
+
         # Number of sides of the bevel object used to scale the sections
         # This parameter controls the quality of the reconstructed morphology
         self.bevel_object_sides = nmv.consts.Meshing.BEVEL_OBJECT_SIDES
@@ -159,6 +159,13 @@ class NeuroMorphoVisOptions:
         # Bevel object sides used for the branches reconstruction
         self.morphology.bevel_object_sides = arguments.bevel_sides
 
+        # Skeleton simplification
+        self.morphology.simplification_method = nmv.enums.Skeleton.Simplification.get_enum(
+            arguments.simplification)
+        self.morphology.simplification_tolerance = arguments.simplification_tolerance
+        self.morphology.simplification_radius_tolerance = \
+            arguments.simplification_radius_tolerance
+
         # Sections radii
         self.morphology.arbors_radii = nmv.enums.Skeleton.Radii.get_enum(
             arguments.samples_radii)
@@ -288,6 +295,13 @@ class NeuroMorphoVisOptions:
         self.mesh.soma_connection = nmv.enums.Meshing.SomaConnection.CONNECTED if \
             arguments.connect_soma_arbors else nmv.enums.Meshing.SomaConnection.DISCONNECTED
 
+        # The number of processes used to union the sections of the arbors
+        self.mesh.union_processes = arguments.union_processes
+
+        # The voxel size and the number of processes of the voxelization builder
+        self.mesh.voxel_size = arguments.voxel_size
+        self.mesh.voxelization_processes = arguments.voxelization_processes
+
         ############################################################################################
         # Shading options
         ############################################################################################
@@ -375,4 +389,11 @@ class NeuroMorphoVisOptions:
 
         # The file format of the image
         self.rendering.image_format = nmv.enums.Image.Extension.get_enum(
-            arguments.image_file_format)
\ No newline at end of file
+            arguments.image_file_format)
+
+        # The scheduler of the frames of the sequences
+        self.rendering.sequence_scheduler = nmv.enums.Rendering.Scheduler.get_enum(
+            arguments.sequence_scheduler)
+
+        # The number of workers rendering the frames of the sequences
+        self.rendering.sequence_workers = arguments.sequence_workers
@@ -82,4 +82,10 @@ class RenderingOptions:
         # Image extension
         self.image_format = nmv.enums.Image.Extension.PNG
 
+        # The scheduler of the frames of the rendered sequences
+        self.sequence_scheduler = nmv.enums.Rendering.Scheduler.SERIAL
+
+        # The number of workers that render the frames of the sequences
+        self.sequence_workers = 1
+
 
@@ -15,10 +15,16 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .drawing import *
-from .field import *
-from .particle import *
-from .surface_particle_system import *
-from .spatial_hash import *
-from .particle_remesher import *
-from .utilities import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'drawing',
+    'field',
+    'particle',
+    'surface_particle_system',
+    'spatial_hash',
+    'particle_remesher',
+    'utilities',
+))
@@ -26,7 +26,6 @@ import numpy
 import bpy
 import bmesh
 from mathutils import Vector
-from mathutils.geometry import barycentric_transform
 from mathutils.bvhtree import BVHTree
 from itertools import product
 
@@ -97,67 +96,136 @@ class Field:
         # A list of singularities
         self.singularities = list()
 
-        # A numpy array of the locations
-        self.locations = numpy.array([vert.co for vert in self.bm.verts], dtype=numpy.float32)
-
-        # A numpy array of the normals
-        self.normals = numpy.zeros((self.number_vertices, 3), dtype=numpy.float32)
-
-        # A numpy array for the adjacents
-        self.adjacent_counts = numpy.zeros((self.number_vertices,), dtype=numpy.float32)
-
-        # A numpy array for the fields
-        self.field = numpy.zeros((self.number_vertices, 3), dtype=numpy.float64)
-
-        # A numpy array for the scales
-        self.scale = numpy.zeros((self.number_vertices,), dtype=numpy.float64)
-
-        # A numpy array for the curvatures
-        self.curvature = numpy.zeros((self.number_vertices,), dtype=numpy.float64)
-
-        # A numpy array for the weights
-        self.weights = numpy.ones((self.number_vertices,), dtype=numpy.float64)
-
-        # A numpy array for the connectivity
-        self.connectivity = numpy.zeros((self.number_vertices, max_adjacent), dtype=numpy.int64)
-
         # Mask layer
         mask_layer = self.bm.verts.layers.paint_mask.verify()
 
-        # For each vertex in the bmesh object
-        for vertex in self.bm.verts:
-
-            # A reference to the vertex index
-            i = vertex.index
-
-            #
-            self.field[i] = nmv.physics.curvature_direction(vertex)
-
-            # Get the normal of the vertex
-            self.normals[i] = nmv.physics.vert_normal(vertex)
-
-            # Get the scale of the field from the mask layer
-            self.scale[i] = vertex[mask_layer]
-
-            # Get the average curvature of the vertex
-            self.curvature[i] = nmv.physics.average_curvature(vertex)
+        # Read the geometry of the triangulated mesh once, the rest is computed in bulk from it
+        self.locations = numpy.array(
+            [vert.co for vert in self.bm.verts], dtype=numpy.float32).reshape(-1, 3)
+        self.normals = numpy.array(
+            [vert.normal for vert in self.bm.verts], dtype=numpy.float32).reshape(-1, 3)
+        self.triangles = numpy.array(
+            [[vert.index for vert in face.verts] for face in self.bm.faces],
+            dtype=numpy.int64).reshape(-1, 3)
+        edges = numpy.array(
+            [(edge.verts[0].index, edge.verts[1].index) for edge in self.bm.edges],
+            dtype=numpy.int64).reshape(-1, 2)
+
+        # Get the scale of the field from the mask layer
+        self.scale = numpy.array([vert[mask_layer] for vert in self.bm.verts], dtype=numpy.float64)
+
+        # The vertex adjacency in the CSR format, the neighbors of the vertex i are
+        # adjacency[adjacency_starts[i]:adjacency_starts[i] + adjacent_counts[i]]
+        sources = numpy.concatenate((edges[:, 0], edges[:, 1]))
+        order = numpy.argsort(sources, kind='stable')
+        self.adjacency_sources = sources[order]
+        self.adjacency = numpy.concatenate((edges[:, 1], edges[:, 0]))[order]
+        self.adjacent_counts = numpy.bincount(sources, minlength=self.number_vertices)
+        self.adjacency_starts = numpy.concatenate(
+            ([0], numpy.cumsum(self.adjacent_counts)[:-1])).astype(numpy.int64)
+
+        # The boundary edges, i.e. with a single face, and their adjacency entries and vertices
+        boundary_edges = self.get_boundary_edges(edges)
+        adjacency_boundary = numpy.concatenate((boundary_edges, boundary_edges))[order]
+        boundary_vertices = numpy.bincount(
+            edges[boundary_edges].ravel(), minlength=self.number_vertices) > 0
+
+        # The normals of the neighbors with respect to the normals of the vertices
+        normals = self.normals.astype(numpy.float64)
+        normals_dots = (normals[self.adjacency] * normals[self.adjacency_sources]).sum(axis=1)
+
+        # Get the average curvature of the vertices
+        self.curvature = numpy.bincount(
+            self.adjacency_sources, weights=numpy.abs(normals_dots),
+            minlength=self.number_vertices) / numpy.maximum(self.adjacent_counts, 1)
+
+        # The initial field follows the curvature directions
+        self.field = self.compute_curvature_directions(
+            normals_dots, adjacency_boundary, boundary_vertices)
+
+        # The boundary vertices have zero weights to avoid creating distorted meshes
+        self.weights = numpy.ones((self.number_vertices,), dtype=numpy.float64)
+        self.weights[boundary_vertices] = 0
 
-            # Get the adjacent vertices
-            self.adjacent_counts[i] = min(len(vertex.link_edges), max_adjacent)
+    ################################################################################################
+    # @get_boundary_edges
+    ################################################################################################
+    def get_boundary_edges(self,
+                           edges):
+        """Finds the boundary edges of the mesh, i.e. the edges that are linked to a single face.
 
-            # If this is a boundary vertex, set its weight to zero to avoid creating distorted mesh
-            if vertex.is_boundary:
-                self.weights[vertex.index] = 0
+        :param edges:
+            An Nx2 array of the vertices of the edges.
+        :return:
+            A mask of the boundary edges.
+        """
 
-            # Update the connectivity matrix
-            for j, edge in enumerate(vertex.link_edges):
+        # Count the faces of every edge from the edges of the triangles
+        triangles_edges = numpy.sort(numpy.concatenate(
+            (self.triangles[:, [0, 1]], self.triangles[:, [1, 2]], self.triangles[:, [2, 0]])),
+            axis=1)
+        keys, counts = numpy.unique(
+            triangles_edges[:, 0] * self.number_vertices + triangles_edges[:, 1],
+            return_counts=True)
+        if len(keys) == 0:
+            return numpy.zeros((len(edges),), dtype=bool)
+
+        # Look the edges up
+        edges = numpy.sort(edges, axis=1)
+        edges_keys = edges[:, 0] * self.number_vertices + edges[:, 1]
+        slots = numpy.minimum(numpy.searchsorted(keys, edges_keys), len(keys) - 1)
+        return (keys[slots] == edges_keys) & (counts[slots] == 1)
 
-                # Reached maximum adjacent edges
-                if j >= max_adjacent:
-                    continue
+    ################################################################################################
+    # @compute_curvature_directions
+    ################################################################################################
+    def compute_curvature_directions(self,
+                                     normals_dots,
+                                     adjacency_boundary,
+                                     boundary_vertices):
+        """Computes the curvature directions of all the vertices, the array version of
+        nmv.physics.curvature_direction.
+
+        :param normals_dots:
+            The dot products of the normals of every adjacency entry.
+        :param adjacency_boundary:
+            A mask of the adjacency entries that belong to boundary edges.
+        :param boundary_vertices:
+            A mask of the boundary vertices.
+        :return:
+            An Nx3 array of the curvature directions.
+        """
 
-                # Update the connectivity matrix
-                self.connectivity[i, j] = edge.other_vert(vertex).index
+        locations = self.locations.astype(numpy.float64)
+        normals = self.normals.astype(numpy.float64)
+
+        # The neighbor with the most different normal
+        order = numpy.lexsort((normals_dots, self.adjacency_sources))
+        firsts = numpy.unique(self.adjacency_sources[order], return_index=True)[1]
+        others = numpy.full((self.number_vertices,), -1, dtype=numpy.int64)
+        others[self.adjacency_sources[order][firsts]] = self.adjacency[order][firsts]
+
+        # The curvature direction is orthogonal to both normals
+        directions = numpy.zeros((self.number_vertices, 3), dtype=numpy.float64)
+        valid = others >= 0
+        directions[valid] = numpy.cross(normals[others[valid]], normals[valid])
+        lengths = numpy.sqrt((directions ** 2).sum(axis=1))
+        directions /= numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+
+        # Otherwise, a random direction
+        invalid = lengths == 0
+        directions[invalid] = nmv.physics.random_tangent_vectors_array(normals[invalid])
+
+        # The boundary vertices follow their first boundary edge
+        entries = numpy.nonzero(adjacency_boundary)[0]
+        firsts = numpy.unique(self.adjacency_sources[entries], return_index=True)[1]
+        vertices = self.adjacency_sources[entries][firsts]
+        others = self.adjacency[entries][firsts]
+        vectors = locations[vertices] - locations[others]
+        lengths = numpy.sqrt((vectors ** 2).sum(axis=1))
+        directions[vertices] = vectors / numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+
+        return directions
 
     ################################################################################################
     # @initialize_from_grease_pencil
@@ -228,31 +296,29 @@ class Field:
     ################################################################################################
     def walk_edges(self,
                    depth=0):
-        """
+        """Walks a random path of a given depth along the edges from every vertex.
 
         :param depth:
+            The number of the extra edges in every path.
         :return:
+            An array of the vertices at the ends of the paths.
         """
 
+        vertices = numpy.arange(self.number_vertices)
+        if len(self.adjacency) == 0:
+            return vertices
 
-        cols = numpy.arange(self.number_vertices)
-
-        ids = numpy.random.randint(0, self.max_adjacent,
-                                   (self.number_vertices,)) % self.adjacent_counts
-
-        ids = ids.astype(numpy.int_)
-
-        adjacent_edges = self.connectivity[cols, ids]
-
-        for _ in range(depth):
+        # Only the first max_adjacent neighbors of every vertex are visited
+        counts = numpy.minimum(self.adjacent_counts, self.max_adjacent)
+        for _ in range(depth + 1):
+            vertices_counts = counts[vertices]
             ids = numpy.random.randint(0, self.max_adjacent, (self.number_vertices,)) % \
-                  self.adjacent_counts[adjacent_edges]
-
-            ids = ids.astype(numpy.int_)
-
-            adjacent_edges = self.connectivity[adjacent_edges, ids]
+                numpy.maximum(vertices_counts, 1)
+            neighbors = self.adjacency[numpy.minimum(self.adjacency_starts[vertices] + ids,
+                                                     len(self.adjacency) - 1)]
+            vertices = numpy.where(vertices_counts > 0, neighbors, vertices)
 
-        return adjacent_edges
+        return vertices
 
     ################################################################################################
     # @smooth
@@ -314,32 +380,59 @@ class Field:
 
         self.field = nmv.physics.normalize_vectors_array(self.field)
 
+    ################################################################################################
+    # @get_symmetry_space_array
+    ################################################################################################
+    def get_symmetry_space_array(self,
+                                 vertices):
+        """Gets the symmetry spaces of the field at given vertices.
+
+        :param vertices:
+            An array of the indices of the vertices.
+        :return:
+            A KxNx3 array of the symmetric vectors of the field at the vertices.
+        """
+
+        if self.hex_mode:
+            return nmv.physics.hex_symmetry_space_array(self.field[vertices],
+                                                        self.normals[vertices])
+        return nmv.physics.symmetry_space_array(self.field[vertices], self.normals[vertices])
+
+    ################################################################################################
+    # @get_corners
+    ################################################################################################
+    def get_corners(self):
+        """Gets the corners of all the triangles, where every corner is a vertex of a triangle
+        and the two next vertices of the triangle, like the loops of a vertex.
+
+        :return:
+            Three arrays of the vertices, the next vertices and the next-next vertices.
+        """
+
+        return (self.triangles.ravel(),
+                self.triangles[:, [1, 2, 0]].ravel(),
+                self.triangles[:, [2, 0, 1]].ravel())
+
     ################################################################################################
     # @autoscale
     ################################################################################################
     def autoscale(self):
-        symmetry = nmv.physics.hex_symmetry_space if self.hex_mode else nmv.physics.symmetry_space
 
-        for vert in self.bm.verts:
-            u = Vector(self.field[vert.index])
-            v = u.cross(vert.normal)
-            ang = 0
-            last_vec = u
-            for loop in vert.link_loops:
-                vert1 = loop.link_loop_next.vert
-                vert2 = loop.link_loop_next.link_loop_next.vert
-                if not last_vec:
-                    vert1_vec = Vector(self.field[vert1.index])
-                else:
-                    vert1_vec = last_vec
-
-                vert2_vec = nmv.physics.best_matching_vector(symmetry(self.field[vert2.index], vert2.normal), vert1_vec)
-
-                vert1_vec = Vector((vert1_vec.dot(u), vert1_vec.dot(v)))
-                vert2_vec = Vector((vert2_vec.dot(u), vert2_vec.dot(v)))
-
-                ang += vert1_vec.angle_signed(vert2_vec)
-            self.scale[vert.index] = ang
+        # The corners of the triangles around every vertex
+        vertices, _, next_next_vertices = self.get_corners()
+
+        # The field and its tangent at every corner
+        u = self.field[vertices]
+        v = numpy.cross(u, self.normals[vertices])
+
+        # The field at the next-next vertex that matches the field at the corner
+        matches = nmv.physics.best_matching_vectors_array(
+            self.get_symmetry_space_array(next_next_vertices), u)
+
+        # Accumulate the signed angles between the matching fields per vertex
+        self.scale = numpy.bincount(vertices, weights=get_signed_angles(u, matches, u, v),
+                                    minlength=self.number_vertices)
+
         for i in range(20):
             self.scale += self.scale[self.walk_edges(0)]
             self.scale /= 2
@@ -350,98 +443,159 @@ class Field:
     # @mirror
     ################################################################################################
     def mirror(self, axis=0):
-        mirror_vec = Vector()
+        mirror_vec = numpy.zeros((3,), dtype=numpy.float64)
         mirror_vec[axis] = -1
-        for vert in self.bm.verts:
-            if vert.co[axis] < 0:
-                mirror_co = vert.co.copy()
-                mirror_co[axis] *= -1
-                location, normal, vec, s, c = self.sample_point(mirror_co)
-                self.field[vert.index] = vec - vec.dot(mirror_vec) * 2 * mirror_vec
+
+        # Sample the field at the mirrored locations of the vertices on the negative side
+        vertices = numpy.nonzero(self.locations[:, axis] < 0)[0]
+        mirror_co = self.locations[vertices].astype(numpy.float64)
+        mirror_co[:, axis] *= -1
+        _, _, vectors, _, _, found = self.sample_points(mirror_co)
+
+        vectors = vectors[found]
+        self.field[vertices[found]] = \
+            vectors - (vectors @ mirror_vec)[:, numpy.newaxis] * 2 * mirror_vec
 
     ################################################################################################
     # @detect_singularities
     ################################################################################################
     def detect_singularities(self):
-        symmetry = nmv.physics.hex_symmetry_space if self.hex_mode else nmv.physics.symmetry_space
-        cache = {}
-
-        def symmetry_cached(vert):
-            if vert in cache:
-                return cache[vert]
-            else:
-                s = symmetry(self.field[vert.index], vert.normal)
-                cache[vert] = s
-                return s
-
-        singularities = []
 
         if not self.hex_mode:
-            for face in self.bm.faces:
-                v0 = face.verts[0]
-                v1 = face.verts[1]
-                v2 = face.verts[2]
-                vec0 = self.field[v0.index]
-                vec1 = nmv.physics.best_matching_vector(symmetry_cached(v1), vec0)
-                v2_symmetry = symmetry_cached(v2)
-                match0 = nmv.physics.best_matching_vector(v2_symmetry, vec0)
-                match1 = nmv.physics.best_matching_vector(v2_symmetry, vec1)
-                if match0.dot(match1) < 0.5:
-                    singularities.append(face.calc_center_median())
-        else:
-            for vert in self.bm.verts:
-                ang = 0
-                u = nmv.physics.random_tangent_vector(vert.normal)
-                v = u.cross(vert.normal)
-                last_vec = None
-                for loop in vert.link_loops:
-                    vert1 = loop.link_loop_next.vert
-                    vert2 = loop.link_loop_next.link_loop_next.vert
-                    if not last_vec:
-                        vert1_vec = symmetry_cached(vert1)[0]
-                    else:
-                        vert1_vec = last_vec
-                    vert2_vec = nmv.physics.best_matching_vector(symmetry_cached(vert2), vert1_vec)
-                    last_vec = vert2_vec
-                    vert1_vec = Vector((vert1_vec.dot(u), vert1_vec.dot(v)))
-                    vert2_vec = Vector((vert2_vec.dot(u), vert2_vec.dot(v)))
-                    ang += vert1_vec.angle_signed(vert2_vec)
-                if ang > 0.9:
-                    singularities.append(vert.co)
-
-        self.singularities = singularities
+            v0, v1, v2 = self.triangles.T
+
+            # Match the fields around every triangle
+            vec0 = self.field[v0]
+            vec1 = nmv.physics.best_matching_vectors_array(self.get_symmetry_space_array(v1), vec0)
+            v2_symmetry = self.get_symmetry_space_array(v2)
+            match0 = nmv.physics.best_matching_vectors_array(v2_symmetry, vec0)
+            match1 = nmv.physics.best_matching_vectors_array(v2_symmetry, vec1)
+
+            # The singularities are at the centers of the triangles where the fields do not match
+            singular = (match0 * match1).sum(axis=1) < 0.5
+            centers = self.locations[self.triangles[singular]].astype(numpy.float64).mean(axis=1)
+            self.singularities = [Vector(center) for center in centers]
+            return
+
+        # The next corner around every vertex, i.e. the corner whose next vertex is the
+        # next-next vertex of the current corner
+        vertices, next_vertices, next_next_vertices = self.get_corners()
+        keys = vertices * self.number_vertices + next_vertices
+        order = numpy.argsort(keys)
+        keys = keys[order]
+        next_keys = vertices * self.number_vertices + next_next_vertices
+        slots = numpy.minimum(numpy.searchsorted(keys, next_keys), max(len(keys) - 1, 0))
+        next_corners = numpy.where(keys[slots] == next_keys, order[slots], -1)
+
+        # Start the walk around every vertex from a corner without a previous one, if any
+        has_previous = numpy.zeros((len(vertices),), dtype=bool)
+        has_previous[next_corners[next_corners >= 0]] = True
+        order = numpy.lexsort((has_previous, vertices))
+        firsts = numpy.unique(vertices[order], return_index=True)[1]
+        walked_vertices = vertices[order][firsts]
+        corners = order[firsts]
+        corners_counts = numpy.bincount(vertices, minlength=self.number_vertices)[walked_vertices]
+
+        # A random tangent space per vertex
+        normals = self.normals[walked_vertices]
+        u = nmv.physics.random_tangent_vectors_array(normals)
+        v = numpy.cross(u, normals)
+
+        # Accumulate the angles between the matching fields while walking around the vertices
+        last_vectors = self.field[next_vertices[corners]]
+        angles = numpy.zeros((len(walked_vertices),), dtype=numpy.float64)
+        for step in range(int(corners_counts.max()) if len(corners_counts) else 0):
+            active = numpy.nonzero((corners >= 0) & (step < corners_counts))[0]
+            if len(active) == 0:
+                break
+            active_corners = corners[active]
+            vectors = nmv.physics.best_matching_vectors_array(
+                self.get_symmetry_space_array(next_next_vertices[active_corners]),
+                last_vectors[active])
+            angles[active] += get_signed_angles(
+                last_vectors[active], vectors, u[active], v[active])
+            last_vectors[active] = vectors
+            corners[active] = next_corners[active_corners]
+
+        singular = walked_vertices[angles > 0.9]
+        self.singularities = [Vector(co) for co in self.locations[singular].astype(numpy.float64)]
 
     ################################################################################################
-    # @detect_singularities
+    # @sample_point
     ################################################################################################
     def sample_point(self, point, ref_dir=None):
-        location, normal, index, distance = self.bvh.find_nearest(point)
-        if location:
-            face = self.bm.faces[index]
-            face_verts_co = [vert.co for vert in face.verts]
-            if not ref_dir:
-                ref_dir = self.field[face.verts[0].index]
-
-            field = [
-                nmv.physics.best_matching_vector(
-                    nmv.physics.symmetry_space(
-                        self.field[vert.index], vert.normal) if not self.hex_mode
-                    else nmv.physics.hex_symmetry_space(self.field[vert.index], vert.normal),
-                    reference=ref_dir
-                )
-                for vert in face.verts
-            ]
-
-            dir = barycentric_transform(point, *face_verts_co, *field)
-            scale_curv = [Vector((self.scale[vert.index], self.curvature[vert.index], 0)) for vert in face.verts]
-            scale_curv = barycentric_transform(point, *face_verts_co, *scale_curv)
-            scale = scale_curv[0]
-            curv = scale_curv[1]
-            dir -= normal * normal.dot(dir)
-            dir.normalize()
-            return location, normal, dir, scale, curv
+        references = None if ref_dir is None else numpy.array([ref_dir], dtype=numpy.float64)
+        locations, normals, directions, scales, curvatures, found = self.sample_points(
+            numpy.array([point], dtype=numpy.float64), references)
+        if found[0]:
+            return (Vector(locations[0]), Vector(normals[0]), Vector(directions[0]),
+                    float(scales[0]), float(curvatures[0]))
         else:
             return None, None, None, None
+
+    ################################################################################################
+    # @sample_points
+    ################################################################################################
+    def sample_points(self,
+                      points,
+                      reference_directions=None):
+        """Samples the field at many points at once. Only the nearest point queries use the BVH
+        point by point, the field is interpolated on the arrays of all the points.
+
+        :param points:
+            An Nx3 array of points.
+        :param reference_directions:
+            An optional Nx3 array of the reference directions to match the field against.
+        :return:
+            Nx3 arrays of the locations, normals and directions, arrays of the scales and
+            curvatures, and a mask of the points that were found on the surface.
+        """
+
+        points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        number_points = len(points)
+        locations = numpy.zeros((number_points, 3), dtype=numpy.float64)
+        normals = numpy.zeros((number_points, 3), dtype=numpy.float64)
+        directions = numpy.zeros((number_points, 3), dtype=numpy.float64)
+        scales = numpy.zeros((number_points,), dtype=numpy.float64)
+        curvatures = numpy.zeros((number_points,), dtype=numpy.float64)
+        faces = numpy.full((number_points,), -1, dtype=numpy.int64)
+
+        # The nearest points on the surface
+        for i, point in enumerate(points.tolist()):
+            location, normal, index, distance = self.bvh.find_nearest(point)
+            if location is not None:
+                locations[i] = location
+                normals[i] = normal
+                faces[i] = index
+        found = faces >= 0
+        if not found.any():
+            return locations, normals, directions, scales, curvatures, found
+
+        # The barycentric weights of the nearest points in their triangles
+        triangles = self.triangles[faces[found]]
+        corners = self.locations[triangles].astype(numpy.float64)
+        weights = nmv.physics.barycentric_weights_array(
+            locations[found], corners[:, 0], corners[:, 1], corners[:, 2])
+
+        # The fields at the vertices of the triangles that match the references
+        if reference_directions is not None:
+            references = numpy.asarray(reference_directions, dtype=numpy.float64)[found]
+        else:
+            references = self.field[triangles[:, 0]]
+        fields = numpy.stack([nmv.physics.best_matching_vectors_array(
+            self.get_symmetry_space_array(triangles[:, i]), references) for i in range(3)],
+            axis=1)
+
+        # Interpolate the field in the tangent plane, and the scale and the curvature
+        found_normals = normals[found]
+        vectors = (fields * weights[:, :, numpy.newaxis]).sum(axis=1)
+        vectors -= found_normals * (found_normals * vectors).sum(axis=1)[:, numpy.newaxis]
+        lengths = numpy.sqrt((vectors ** 2).sum(axis=1))
+        directions[found] = vectors / numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+        scales[found] = (self.scale[triangles] * weights).sum(axis=1)
+        curvatures[found] = (self.curvature[triangles] * weights).sum(axis=1)
+
+        return locations, normals, directions, scales, curvatures, found
     '''
     ################################################################################################
     # @detect_singularities
@@ -491,4 +645,33 @@ class Field:
         draw.line_colors[0::2] = numpy.repeat(blue, [self.number_vertices], axis=0)
         draw.line_colors[1::2] = numpy.repeat(white, [self.number_vertices], axis=0)
         self.draw.update_batch()
-    '''
\ No newline at end of file
+    '''
+
+
+####################################################################################################
+# @get_signed_angles
+####################################################################################################
+def get_signed_angles(vectors_1,
+                      vectors_2,
+                      u,
+                      v):
+    """Computes the signed angles between pairs of vectors in given tangent spaces, the array
+    version of projecting the vectors on (u, v) and calling Vector.angle_signed.
+
+    :param vectors_1:
+        An Nx3 array of the first vectors.
+    :param vectors_2:
+        An Nx3 array of the second vectors.
+    :param u:
+        An Nx3 array of the first axes of the tangent spaces.
+    :param v:
+        An Nx3 array of the second axes of the tangent spaces.
+    :return:
+        An array of the signed angles, clockwise is positive.
+    """
+
+    x1 = (vectors_1 * u).sum(axis=1)
+    y1 = (vectors_1 * v).sum(axis=1)
+    x2 = (vectors_2 * u).sum(axis=1)
+    y2 = (vectors_2 * v).sum(axis=1)
+    return numpy.arctan2(y1 * x2 - x1 * y2, x1 * x2 + y1 * y2)
@@ -51,8 +51,11 @@ class ParticleRemesher:
                  particle_relaxation= 1.0,
                  repulsion_iterations=5,
                  repulsion_strength=0.05,
+                 repulsion_tolerance=0.0,
+                 propagation_steps=None,
                  subdivisions=1,
-                 polygon_mode='TRIANGLES'):
+                 polygon_mode='TRIANGLES',
+                 simulation_method='VECTORIZED'):
 
         self.field_resolution = field_resolution
         self.resolution = resolution
@@ -65,16 +68,41 @@ class ParticleRemesher:
 
         self.repulsion_iterations = repulsion_iterations
         self.repulsion_strength = repulsion_strength
+
+        # Stop the repulsion once the mean displacement of the particles relative to their radii
+        # drops below this tolerance, and limit the propagation of the front, None is unlimited
+        self.repulsion_tolerance = repulsion_tolerance
+        self.propagation_steps = propagation_steps
+
         self.subdivisions = subdivisions
         self.polygon_mode = polygon_mode
 
+        # 'VECTORIZED' simulates the particles in bulk, 'SEQUENTIAL' one particle at a time
+        self.simulation_method = simulation_method
+
         self.field_smoothing_iterations = [30, 30, 100]
         self.field_smoothing_depth = [100, 30, 0]
         self.mirror_axes = [False, False, False]
         self.sharp_angle = 20 * (math.pi / 180.0)
 
+        # Set by finish() to skip the rest of the simulation and tessellate the current particles
+        self.finish_now = False
+
+    ################################################################################################
+    # @finish
+    ################################################################################################
+    def finish(self):
+        """Stops the particle simulation at its next step, such that the following steps of run
+        directly create the mesh from the current particles.
+        """
+
+        self.finish_now = True
+
     def run(self, mesh_object, context, interactive=False, decimate_input=False):
 
+        # A new run simulates the particles until they converge, unless finish() is called
+        self.finish_now = False
+
         # Create a new bmesh from the given mesh object to improve the performance
         nmv.logger.info('Converting to BMesh')
         bmesh_object = bmesh.new()
@@ -175,12 +203,25 @@ class ParticleRemesher:
             nmv.logger.info('Curvature')
             particle_manager.curvature_spawn_particles(5)
 
+        # The particles are either simulated in bulk or one by one
+        if self.simulation_method == 'SEQUENTIAL':
+            propagate_particles = particle_manager.propagate_particles_sequentially
+            repeal_particles = particle_manager.repeal_particles_sequentially
+        else:
+            propagate_particles = particle_manager.propagate_particles
+            repeal_particles = particle_manager.repeal_particles
+
         # Propagate the results
         for i, _ in enumerate(
-                particle_manager.propagate_particles(self.relaxation_steps,
-                                                     self.particle_relaxation)):
+                propagate_particles(self.relaxation_steps,
+                                    self.particle_relaxation,
+                                    max_steps=self.propagation_steps)):
             nmv.logger.detail('Propagating particles [%d]' % i)
 
+            # Keep the particles that are already spawned
+            if self.finish_now:
+                break
+
             '''
             if interactive:
                 particle_manager.draw_particles(self.relaxation_steps)
@@ -190,12 +231,17 @@ class ParticleRemesher:
                 yield
 
         for i, _ in enumerate(
-                particle_manager.repeal_particles(iterations=self.repulsion_iterations,
-                                                  factor=self.repulsion_strength)):
+                repeal_particles(iterations=self.repulsion_iterations,
+                                 factor=self.repulsion_strength,
+                                 tolerance=self.repulsion_tolerance)):
             # NOTE: We don't need any drawing functions
             # particle_manager.draw_particles()
             # DebugText.lines = ["Particle repulsion:",
             #                   f"Step {i + 1}"]
+
+            # Keep the current positions of the particles
+            if self.finish_now:
+                break
             yield
 
         for i in range(3):
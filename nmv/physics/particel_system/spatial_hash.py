@@ -20,6 +20,7 @@
 ####################################################################################################
 # System imports
 import math
+import numpy
 
 
 ####################################################################################################
@@ -98,6 +99,22 @@ class SpatialHash:
         self.items[item].remove(item)
         del self.items[item]
 
+    ################################################################################################
+    # @rebuild
+    ################################################################################################
+    def rebuild(self,
+                items):
+        """Clears the hash table and inserts a given list of elements, after moving them in bulk.
+
+        :param items:
+            A list of elements.
+        """
+
+        self.buckets = {}
+        self.items = {}
+        for item in items:
+            self.insert(item)
+
     ################################################################################################
     # @update
     ################################################################################################
@@ -140,3 +157,176 @@ class SpatialHash:
                                     continue
                                 yield item
 
+
+
+####################################################################################################
+# PointsGrid
+####################################################################################################
+class PointsGrid:
+    """A uniform grid of a fixed set of points that is built in bulk and queried with many points
+    at once. The grid is rebuilt, rather than updated, when the points move.
+
+    The queries only visit the 27 cells around every query point, therefore the search radius must
+    not exceed the size of the cell.
+    """
+
+    # The offsets of the 27 cells around a cell, including the cell itself
+    NEIGHBOR_OFFSETS = numpy.array(
+        [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=numpy.int64)
+
+    # The number of bits of every axis in the key of a cell
+    KEY_BITS = 21
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 points,
+                 cell_size):
+        """Constructor
+
+        :param points:
+            An Nx3 array of points.
+        :param cell_size:
+            The size of the cell in the grid.
+        """
+
+        self.points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        self.size = float(cell_size)
+
+        # The cells of the points, relative to an origin that keeps the neighbor cells positive
+        cells = numpy.floor(self.points / self.size).astype(numpy.int64)
+        self.origin = cells.min(axis=0) - 1 if len(cells) else numpy.zeros(3, dtype=numpy.int64)
+
+        # Sort the points by their cells, and store the range of every occupied cell
+        keys = self.get_keys(cells)
+        self.order = numpy.argsort(keys, kind='stable')
+        self.keys, self.starts, self.counts = numpy.unique(
+            keys[self.order], return_index=True, return_counts=True)
+
+    ################################################################################################
+    # @get_keys
+    ################################################################################################
+    def get_keys(self,
+                 cells):
+        """Returns the keys of given cells, or -1 for the cells that are outside the grid.
+
+        :param cells:
+            An Nx3 array of integer cell coordinates.
+        :return:
+            An array of the keys of the cells.
+        """
+
+        cells = cells - self.origin
+        limit = 1 << self.KEY_BITS
+        valid = numpy.all((cells >= 0) & (cells < limit), axis=1)
+        keys = (cells[:, 0] << (2 * self.KEY_BITS)) | (cells[:, 1] << self.KEY_BITS) | cells[:, 2]
+        keys[~valid] = -1
+        return keys
+
+    ################################################################################################
+    # @get_candidate_pairs
+    ################################################################################################
+    def get_candidate_pairs(self,
+                            queries):
+        """Returns all the pairs of query points and grid points in the cells around the queries.
+
+        :param queries:
+            An Mx3 array of query points.
+        :return:
+            The indices of the query points and the indices of the grid points of the pairs.
+        """
+
+        queries = numpy.asarray(queries, dtype=numpy.float64).reshape(-1, 3)
+        if len(self.keys) == 0 or len(queries) == 0:
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+
+        cells = numpy.floor(queries / self.size).astype(numpy.int64)
+        queries_indices = list()
+        points_indices = list()
+        for offset in self.NEIGHBOR_OFFSETS:
+
+            # Find the occupied cells at this offset
+            keys = self.get_keys(cells + offset)
+            slots = numpy.minimum(numpy.searchsorted(self.keys, keys), len(self.keys) - 1)
+            found = numpy.nonzero((self.keys[slots] == keys) & (keys >= 0))[0]
+            if len(found) == 0:
+                continue
+
+            # Expand the ranges of the cells into pairs
+            starts = self.starts[slots[found]]
+            counts = self.counts[slots[found]]
+            offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts,
+                                                                counts)
+            queries_indices.append(numpy.repeat(found, counts))
+            points_indices.append(self.order[numpy.repeat(starts, counts) + offsets])
+
+        if len(queries_indices) == 0:
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+        return numpy.concatenate(queries_indices), numpy.concatenate(points_indices)
+
+    ################################################################################################
+    # @query_radius
+    ################################################################################################
+    def query_radius(self,
+                     queries,
+                     radii):
+        """Finds all the grid points within a given radius from every query point.
+
+        :param queries:
+            An Mx3 array of query points.
+        :param radii:
+            The search radius, a single value or an array of a radius per query.
+        :return:
+            The indices of the query points, the indices of the grid points and their distances,
+            sorted by query and then by distance.
+        """
+
+        queries = numpy.asarray(queries, dtype=numpy.float64).reshape(-1, 3)
+        queries_indices, points_indices = self.get_candidate_pairs(queries)
+        distances = numpy.linalg.norm(
+            self.points[points_indices] - queries[queries_indices], axis=1)
+
+        # Filter the pairs by the radius of their queries
+        radii = numpy.broadcast_to(numpy.asarray(radii, dtype=numpy.float64), (len(queries),))
+        inside = distances <= radii[queries_indices]
+        queries_indices = queries_indices[inside]
+        points_indices = points_indices[inside]
+        distances = distances[inside]
+
+        order = numpy.lexsort((distances, queries_indices))
+        return queries_indices[order], points_indices[order], distances[order]
+
+    ################################################################################################
+    # @find_nearest
+    ################################################################################################
+    def find_nearest(self,
+                     queries,
+                     k):
+        """Finds the k nearest grid points to every query point, within the cells around it.
+
+        :param queries:
+            An Mx3 array of query points.
+        :param k:
+            The number of the nearest points.
+        :return:
+            An Mxk array of the indices of the nearest points, padded with -1, and an Mxk array of
+            their distances, padded with infinity.
+        """
+
+        queries = numpy.asarray(queries, dtype=numpy.float64).reshape(-1, 3)
+        queries_indices, points_indices = self.get_candidate_pairs(queries)
+        distances = numpy.linalg.norm(
+            self.points[points_indices] - queries[queries_indices], axis=1)
+
+        # Sort the pairs by query and then by distance, and rank them within every query
+        order = numpy.lexsort((distances, queries_indices))
+        queries_indices = queries_indices[order]
+        ranks = numpy.arange(len(order)) - numpy.searchsorted(queries_indices, queries_indices)
+        nearest = ranks < k
+
+        indices = numpy.full((len(queries), k), -1, dtype=numpy.int64)
+        nearest_distances = numpy.full((len(queries), k), numpy.inf, dtype=numpy.float64)
+        indices[queries_indices[nearest], ranks[nearest]] = points_indices[order][nearest]
+        nearest_distances[queries_indices[nearest], ranks[nearest]] = distances[order][nearest]
+        return indices, nearest_distances
@@ -71,16 +71,17 @@ class SurfaceParticleSystem:
 
         d_sqr = self.particle_size * self.particle_size
 
-        verts = sorted(self.field.bm.verts, key=nmv.physics.average_curvature)
-        for i in range(n):
-            vert = verts[i]
+        # The vertices with the smallest average curvatures, precomputed by the field
+        vertices = numpy.argsort(self.field.curvature, kind='stable')[:n]
+        for i in vertices:
+            co = Vector(self.field.locations[i])
             not_valid = False
             for particle in self.particles:
-                if (vert.co - particle.co).length_squared < d_sqr:
+                if (co - particle.co).length_squared < d_sqr:
                     not_valid = True
                     break
             if not not_valid:
-                self.new_particle(vert.co)
+                self.new_particle(co)
 
     ################################################################################################
     # @grease_pencil_gp_spawn_particles
@@ -171,15 +172,301 @@ class SurfaceParticleSystem:
             if valid:
                 sharp_particle_from_vert(vert)
 
+    ################################################################################################
+    # @get_particles_arrays
+    ################################################################################################
+    @staticmethod
+    def get_particles_arrays(particles):
+        """Gathers the state of a list of particles into arrays.
+
+        :param particles:
+            A list of particles.
+        :return:
+            Nx3 arrays of the locations, normals and directions, an array of the radii and a mask
+            of the movable particles, i.e. neither sharp nor grease particles.
+        """
+
+        locations = numpy.array([particle.co for particle in particles],
+                                dtype=numpy.float64).reshape(-1, 3)
+        normals = numpy.array([particle.normal for particle in particles],
+                              dtype=numpy.float64).reshape(-1, 3)
+        directions = numpy.array([particle.dir for particle in particles],
+                                 dtype=numpy.float64).reshape(-1, 3)
+        radii = numpy.array([particle.radius for particle in particles], dtype=numpy.float64)
+        movable = numpy.array([particle.tag not in {"SHARP", "GREASE"} for particle in particles],
+                              dtype=bool)
+        return locations, normals, directions, radii, movable
+
+    ################################################################################################
+    # @remove_colliding_particles
+    ################################################################################################
+    def remove_colliding_particles(self,
+                                   front):
+        """Removes the particles of the front that collide with other particles, and merges the
+        pairs of particles that are too close to each other.
+
+        :param front:
+            A list of the particles of the front.
+        :return:
+            The particles of the front that were not removed.
+        """
+
+        particles = list(self.particles)
+        locations, _, _, radii, movable = self.get_particles_arrays(particles)
+        indices = {particle: i for i, particle in enumerate(particles)}
+        front_indices = numpy.array([indices[particle] for particle in front], dtype=numpy.int64)
+
+        # Find the intruders of all the movable particles of the front in bulk
+        queries = front_indices[movable[front_indices]]
+        grid = nmv.physics.PointsGrid(locations, cell_size=max(radii.max() * 1.5, 1e-12))
+        queries_indices, intruders, distances = grid.query_radius(
+            locations[queries], radii[queries] * 1.5)
+        particles_indices = queries[queries_indices]
+        pairs = intruders != particles_indices
+        particles_indices = particles_indices[pairs]
+        intruders = intruders[pairs]
+        distances = distances[pairs]
+
+        # Only the pairs that are close enough are resolved
+        average_radii = (radii[particles_indices] + radii[intruders]) * 0.5
+        colliding = ((~movable[intruders]) & (distances < average_radii * 0.7)) | \
+                    (distances < average_radii * 0.5)
+        colliding_particles = set(particles_indices[colliding].tolist())
+        if not colliding_particles:
+            return front
+
+        # Resolve them in the order of the front, since every removal affects the next ones
+        candidates = dict()
+        for i, j in zip(particles_indices.tolist(), intruders.tolist()):
+            if i in colliding_particles:
+                candidates.setdefault(i, list()).append(j)
+
+        survivors = list()
+        for particle in front:
+            i = indices[particle]
+            if particle.tag == "REMOVED":
+                continue
+            if i not in candidates:
+                survivors.append(particle)
+                continue
+
+            remove = False
+            for j in candidates[i]:
+                intruder = particles[j]
+                if intruder.tag == "REMOVED":
+                    continue
+                average_radius = (intruder.radius + particle.radius) * 0.5
+                distance = (intruder.co - particle.co).length
+                if intruder.tag in {"SHARP", "GREASE"} and distance < average_radius * 0.7:
+                    remove = True
+                    break
+                elif distance < average_radius * 0.5:
+                    remove = True
+                    intruder.co = (intruder.co + particle.co) * 0.5
+                    self.grid.update(intruder)
+                    break
+
+            if remove:
+                self.remove_particle(particle)
+            else:
+                survivors.append(particle)
+
+        return survivors
+
+    ################################################################################################
+    # @sample_front_candidates
+    ################################################################################################
+    def sample_front_candidates(self,
+                                locations,
+                                normals,
+                                directions,
+                                radii):
+        """Samples the locations of the new particles around the particles of a front in bulk,
+        following the symmetry directions of the field.
+
+        :param locations:
+            An Nx3 array of the locations of the front.
+        :param normals:
+            An Nx3 array of the normals of the front.
+        :param directions:
+            An Nx3 array of the directions of the front.
+        :param radii:
+            An array of the radii of the front.
+        :return:
+            The index of the front particle of every candidate, the locations and the directions
+            of the candidates that were found on the surface.
+        """
+
+        # Three directions per particle, in the same order as the symmetry spaces
+        x = directions
+        y = numpy.cross(directions, normals)
+        if self.triangle_mode:
+            e = x * 0.5 + y * 0.866025
+            vectors = numpy.stack((x, e, -e), axis=1)
+        else:
+            vectors = numpy.stack((x, y, -y), axis=1)
+
+        spawners = numpy.repeat(numpy.arange(len(locations)), 3)
+        vectors = vectors.reshape(-1, 3)
+        co = locations[spawners]
+        r = radii[spawners][:, numpy.newaxis]
+
+        if self.field_sampling_method == "EULER":
+            location, normal, direction, s, c, found = self.field.sample_points(
+                co + vectors * r, vectors)
+
+        elif self.field_sampling_method == "MIDPOINT":
+            location, normal, direction, s, c, found = self.field.sample_points(
+                co + vectors * r * 0.5, vectors)
+            n = normal * r * 0.1 * numpy.where(c > 0, 1.0, -1.0)[:, numpy.newaxis]
+            direction = nmv.physics.normalize_vectors_array(location - co + (direction * r * 0.5))
+            location, normal, _, s, c, found_2 = self.field.sample_points(
+                n + co + direction * r, direction)
+            found &= found_2
+
+        else:
+            location, normal, direction_1, s, c, found = self.field.sample_points(
+                co + vectors * r * 0.3, vectors)
+            n = normal * r * 0.1 * numpy.where(c > 0, 1.0, -1.0)[:, numpy.newaxis]
+            location, normal, direction_2, s, c, found_2 = self.field.sample_points(
+                n + co + direction_1 * r * 0.5, direction_1)
+            location, normal, _, s, c, found_3 = self.field.sample_points(
+                n + co + direction_2 * r, direction_2)
+            direction = vectors + 2 * direction_1 + 2 * direction_2 + vectors
+            n = normal * r * 0.1 * numpy.where(c > 0, 1.0, -1.0)[:, numpy.newaxis]
+            location, normal, direction, s, c, found_4 = self.field.sample_points(
+                n + co + direction_2 * r, direction)
+            found &= found_2 & found_3 & found_4
+
+        return spawners[found], location[found], direction[found]
+
     ################################################################################################
     # @propagate_particles
     ################################################################################################
     def propagate_particles(self,
                             relaxation=3,
-                            factor=0.5):
+                            factor=0.5,
+                            max_steps=None):
+        """Propagates the particles on the surface front by front, where all the particles of a
+        front are sampled and tested against the other particles in bulk.
+
+        :param relaxation:
+            The number of fronts in which every particle is relaxed.
+        :param factor:
+            The weight of the location samples of the particles that block new ones.
+        :param max_steps:
+            The maximum number of fronts, None is unlimited.
+        """
+
+        current_front = list(self.particles)
+        steps = 0
+        while len(current_front) > 0:
+
+            # Stop if the front is still not empty after the maximum number of steps
+            if max_steps is not None and steps >= max_steps:
+                nmv.logger.detail('The particles front did not converge in [%d] steps' % steps)
+                break
+            steps += 1
+
+            yield
+
+            # Remove the particles that collide with the others
+            current_front = self.remove_colliding_particles(current_front)
+            if len(current_front) == 0:
+                break
+
+            # Sample the new particles around the front
+            locations, normals, directions, radii, _ = self.get_particles_arrays(current_front)
+            spawners, candidates, candidates_directions = self.sample_front_candidates(
+                locations, normals, directions, radii)
+
+            # Find the existing particles that block the candidates, except their own spawners
+            particles = list(self.particles)
+            particles_locations, _, _, particles_radii, movable = \
+                self.get_particles_arrays(particles)
+            indices = {particle: i for i, particle in enumerate(particles)}
+            spawners_indices = numpy.array([indices[current_front[i]] for i in spawners],
+                                           dtype=numpy.int64)
+            grid = nmv.physics.PointsGrid(particles_locations,
+                                          cell_size=max(particles_radii.max() * 0.7, 1e-12))
+            queries_indices, neighbors, _ = grid.query_radius(candidates, radii[spawners] * 0.7)
+            pairs = neighbors != spawners_indices[queries_indices]
+            queries_indices = queries_indices[pairs]
+            neighbors = neighbors[pairs]
+
+            # The nearest blocking particle of every candidate
+            blocked = numpy.full((len(candidates),), -1, dtype=numpy.int64)
+            firsts = numpy.unique(queries_indices, return_index=True)[1]
+            blocked[queries_indices[firsts]] = neighbors[firsts]
+
+            # The movable blocking particles are pulled towards the candidates
+            for i in numpy.nonzero(blocked >= 0)[0].tolist():
+                neighbor = particles[blocked[i]]
+                particle = current_front[spawners[i]]
+                if movable[blocked[i]] and neighbor is not particle.parent:
+                    neighbor.add_location_sample(Vector(candidates[i]), weight=factor)
+                    self.grid.update(neighbor)
+
+            # The remaining candidates can still block each other within the front
+            new_front = list()
+            front_grid = nmv.physics.SpatialHash(self.grid.size)
+            for i in numpy.nonzero(blocked < 0)[0].tolist():
+                particle = current_front[spawners[i]]
+                location = Vector(candidates[i])
+
+                valid = True
+                for neighbor in front_grid.test_sphere(location, particle.radius * 0.7):
+                    if neighbor.tag not in {"SHARP", "GREASE"} and \
+                            neighbor is not particle.parent:
+                        neighbor.add_location_sample(location, weight=factor)
+                        self.grid.update(neighbor)
+                        front_grid.update(neighbor)
+                    valid = False
+                    break
+
+                if valid:
+                    p = self.new_particle(location, Vector(candidates_directions[i]))
+                    radius_diff = p.radius - particle.radius
+                    if abs(radius_diff) > 0.5 * particle.radius:
+                        p.radius = particle.radius * 1.5 if radius_diff > 0 else \
+                            particle.radius * 0.5
+                    p.parent = particle
+                    front_grid.insert(p)
+                    new_front.append(p)
+
+            # Relax the particles of the front on the field in bulk
+            locations, normals, directions, _, _, found = self.field.sample_points(
+                self.get_particles_arrays(current_front)[0])
+            for i, particle in enumerate(current_front):
+                if found[i]:
+                    particle.co = Vector(locations[i])
+                    particle.normal = Vector(normals[i])
+                    particle.dir = Vector(directions[i])
+                    self.grid.update(particle)
+                if particle.tag_number < relaxation:
+                    new_front.append(particle)
+                    particle.tag_number += 1
+
+            current_front = new_front
+
+    ################################################################################################
+    # @propagate_particles_sequentially
+    ################################################################################################
+    def propagate_particles_sequentially(self,
+                            relaxation=3,
+                            factor=0.5,
+                            max_steps=None):
         grid = self.grid
         current_front = list(self.particles)
+        steps = 0
         while len(current_front) > 0:
+
+            # Stop if the front is still not empty after the maximum number of steps
+            if max_steps is not None and steps >= max_steps:
+                nmv.logger.detail('The particles front did not converge in [%d] steps' % steps)
+                break
+            steps += 1
+
             yield
             new_front = []
             for particle in current_front:
@@ -273,7 +560,92 @@ class SurfaceParticleSystem:
     ################################################################################################
     # @repeal_particles
     ################################################################################################
-    def repeal_particles(self, iterations=20, factor=0.01):
+    def repeal_particles(self,
+                         iterations=20,
+                         factor=0.01,
+                         tolerance=0.0):
+        """Repels the particles from each other, where the state of the particles is kept in
+        arrays and the forces of every iteration are computed in bulk from the nearest neighbors.
+
+        :param iterations:
+            The number of iterations.
+        :param factor:
+            The strength of the repulsion, relative to the radii of the particles.
+        :param tolerance:
+            The iterations stop once the mean displacement of the particles relative to their
+            radii drops below this tolerance.
+        """
+
+        particles = list(self.particles)
+        if len(particles) == 0:
+            return
+        locations, normals, directions, radii, movable = self.get_particles_arrays(particles)
+        movable_indices = numpy.nonzero(movable)[0]
+        cell_size = max(radii.max() * 2, 1e-12)
+
+        try:
+            for i in range(iterations):
+
+                # The three nearest particles of every particle, including the particle itself
+                grid = nmv.physics.PointsGrid(locations, cell_size)
+                neighbors, distances = grid.find_nearest(locations, 3)
+                valid = (neighbors >= 0) & (distances > 0)
+                neighbors = numpy.where(valid, neighbors, 0)
+                distances = numpy.where(valid, distances, 1.0)
+                weights = valid[..., numpy.newaxis]
+
+                # Inverse square forces from the neighbors
+                vectors = locations[:, numpy.newaxis, :] - locations[neighbors]
+                forces = (vectors / distances[..., numpy.newaxis] ** 3 * weights).sum(axis=1)
+
+                # Attractions towards the square lattice positions around the neighbors
+                if not self.triangle_mode:
+                    u = directions
+                    v = numpy.cross(u, normals)
+                    for vector in (u + v, u - v, -u + v, -u - v):
+                        vectors = (vector * radii[:, numpy.newaxis])[:, numpy.newaxis, :] + \
+                                  locations[neighbors] - locations[:, numpy.newaxis, :]
+                        lengths = numpy.linalg.norm(vectors, axis=2)
+                        lengths = numpy.where(lengths > 0, lengths, numpy.inf)
+                        forces -= (vectors * 0.3 / lengths[..., numpy.newaxis] ** 3 *
+                                   weights).sum(axis=1)
+
+                # Normalize the forces, the particles without neighbors do not move
+                lengths = numpy.linalg.norm(forces, axis=1)
+                forces /= numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+
+                # Move the movable particles and project them back on the surface
+                targets = locations[movable_indices] + forces[movable_indices] * \
+                    (radii[movable_indices] * factor)[:, numpy.newaxis]
+                new_locations, new_normals, new_directions, _, _, found = \
+                    self.field.sample_points(targets)
+                moved = movable_indices[found]
+                displacements = numpy.linalg.norm(
+                    new_locations[found] - locations[moved], axis=1) / radii[moved]
+                locations[moved] = new_locations[found]
+                normals[moved] = new_normals[found]
+                directions[moved] = new_directions[found]
+
+                yield i
+
+                # Converged, the particles barely move anymore
+                if len(moved) == 0 or displacements.mean() < tolerance:
+                    break
+
+        finally:
+
+            # Write the state back to the particles, and update the grid once
+            for particle, location, normal, direction in zip(
+                    particles, locations, normals, directions):
+                particle.co = Vector(location)
+                particle.normal = Vector(normal)
+                particle.dir = Vector(direction)
+            self.grid.rebuild(particles)
+
+    ################################################################################################
+    # @repeal_particles_sequentially
+    ################################################################################################
+    def repeal_particles_sequentially(self, iterations=20, factor=0.01, tolerance=0.0):
         particles = list(self.particles)
         tree = KDTree(len(particles))
         for index, particle in enumerate(particles):
@@ -281,6 +653,11 @@ class SurfaceParticleSystem:
         tree.balance()
 
         for i in range(iterations):
+
+            # The total displacement of the moved particles, relative to their radii
+            displacement = 0.0
+            moved_particles = 0
+
             new_tree = KDTree(len(self.particles))
             for index, particle in enumerate(particles):
                 if particle.tag in {"SHARP", "GREASE"}:
@@ -309,6 +686,8 @@ class SurfaceParticleSystem:
                 d.normalize()
                 location, normal, dir, s, c = self.field.sample_point(particle.co + (d * factor * particle.radius))
                 if location:
+                    displacement += (location - particle.co).length / particle.radius
+                    moved_particles += 1
                     particle.co = location
                     particle.normal = normal
                     self.grid.update(particle)
@@ -320,6 +699,10 @@ class SurfaceParticleSystem:
 
             yield i
 
+            # Converged, the particles barely move anymore
+            if moved_particles == 0 or displacement / moved_particles < tolerance:
+                break
+
     ################################################################################################
     # @mirror_particles
     ################################################################################################
@@ -486,9 +869,6 @@ class SurfaceParticleSystem:
         # Particle mapping list
         particles_mapping = numpy.full((number_vertices,), -1, dtype=numpy.int64)
 
-        # Current front surface of the mesh
-        current_front = set()
-
         # For each particle
         for i in range(len(self.particles)):
 
@@ -506,74 +886,58 @@ class SurfaceParticleSystem:
                            key=lambda v: (v.co - Vector(co)).length_squared * (
                                2 if particles_mapping[v.index] == -1 else 1))
 
-                # Update the tag
-                vert.tag = True
-
                 # Update the particle mapping list
                 particles_mapping[vert.index] = i
 
-                # Add the new vertex to the front array
-                current_front.add(vert)
-
-        # As long as this set is filled
-        while current_front:
-
-            # An empty new set
-            new_front = set()
-
-            # For every vertex along the current front
-            for vert in current_front:
-
-                # For each edge connected to this vertex
-                for edge in vert.link_edges:
-
-                    # Get the other vertex
-                    other_vertex = edge.other_vert(vert)
-
-                    # If the tag of the other vertex is False
-                    if not other_vertex.tag:
+        # The indices of the vertices of the edges, read once, and the vertex adjacency as CSR
+        edges_vertices = numpy.array([(edge.verts[0].index, edge.verts[1].index)
+                                      for edge in bmesh_object.edges],
+                                     dtype=numpy.int64).reshape(-1, 2)
+        sources = numpy.concatenate((edges_vertices[:, 0], edges_vertices[:, 1]))
+        targets = numpy.concatenate((edges_vertices[:, 1], edges_vertices[:, 0]))
+        order = numpy.argsort(sources, kind='stable')
+        adjacency = targets[order]
+        adjacency_counts = numpy.bincount(sources, minlength=number_vertices)
+        adjacency_starts = numpy.concatenate(([0], numpy.cumsum(adjacency_counts)[:-1]))
+
+        # Current front surface of the mesh, the vertices that are mapped to the particles
+        current_front = numpy.nonzero(particles_mapping >= 0)[0]
+        tagged = particles_mapping >= 0
+
+        # As long as the front is not empty, propagate the mapping to the untagged neighbors
+        while len(current_front) > 0:
 
-                        # Add the other vertex to the new front
-                        new_front.add(other_vertex)
+            # The neighbors of all the vertices of the front
+            counts = adjacency_counts[current_front]
+            offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts,
+                                                                counts)
+            front_vertices = numpy.repeat(current_front, counts)
+            neighbors = adjacency[numpy.repeat(adjacency_starts[current_front], counts) + offsets]
 
-                        # Update the mapping
-                        particles_mapping[other_vertex.index] = particles_mapping[vert.index]
+            # Update the mapping of the untagged ones
+            untagged = ~tagged[neighbors]
+            particles_mapping[neighbors[untagged]] = particles_mapping[front_vertices[untagged]]
+            tagged[neighbors[untagged]] = True
 
-                        # Update the tag
-                        other_vertex.tag = True
-
-            # Current front is the new front
-            current_front = new_front
+            # The new front
+            current_front = numpy.unique(neighbors[untagged])
 
         edges_limit = 10
 
-        # Create an array of edges
+        # Create an array of edges, with up to edges_limit neighbors per vertex
         edges = numpy.empty((number_vertices, edges_limit), dtype=numpy.int64)
+        ranks = numpy.arange(len(adjacency)) - numpy.repeat(adjacency_starts, adjacency_counts)
+        sorted_sources = sources[order]
+        within_limit = ranks < edges_limit
+        edges[sorted_sources[within_limit], ranks[within_limit]] = adjacency[within_limit]
 
         # Compute the edge counts
-        edges_count = numpy.empty((number_vertices,), dtype=numpy.int64)
-
-        # For every vertex in the bmesh object
-        for vert in bmesh_object.verts:
-
-            # Update the edges connected to this vertex
-            edges_count[vert.index] = min(edges_limit, len(vert.link_edges))
-
-            # For every edge in the edges connected to the vertex
-            for i, edge in enumerate(vert.link_edges):
-
-                # If the index is beyond the limit, break
-                if i >= edges_limit:
-                    break
-
-                # Otherwise, update the connected vertex
-                other_vertex = edge.other_vert(vert)
-                edges[vert.index][i] = other_vertex.index
+        edges_count = numpy.minimum(adjacency_counts, edges_limit)
 
         # Create an array of the IDs
         ids = numpy.arange(number_vertices)
 
-        # TODO: What is this?
+        # Let every vertex adopt the particle of a random neighbor if it is closer
         for i in range(30):
             cols = numpy.random.randint(0, edges_limit) % edges_count
             edge_indexes = edges[ids, cols]
@@ -597,20 +961,22 @@ class SurfaceParticleSystem:
                 # Update the vertex tag to True
                 verts[index].tag = True
 
-        # For each face in the bmesh object
-        for face in bmesh_object.faces:
-
-            # Get the indices of the particles after the mapping
-            particles_indexes = set(particles_mapping[vert.index] for vert in face.verts)
-
-            # With three-particles (vertices)
-            if len(particles_indexes) == 3:
-
-                # Compile a new face in the new bmesh object
-                try:
-                    new_bmesh_object.faces.new((verts[i] for i in particles_indexes))
-                except ValueError:
-                    pass
+        # The particles of the triangles after the mapping
+        triangles = numpy.array([[vert.index for vert in face.verts]
+                                 for face in bmesh_object.faces if len(face.verts) == 3],
+                                dtype=numpy.int64).reshape(-1, 3)
+        triangles = numpy.sort(particles_mapping[triangles], axis=1)
+
+        # Only the triangles that map to three different particles, every one of them once
+        distinct = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+        triangles = numpy.unique(triangles[distinct], axis=0)
+
+        # For each triangle, compile a new face in the new bmesh object
+        for triangle in triangles.tolist():
+            try:
+                new_bmesh_object.faces.new([verts[i] for i in triangle])
+            except ValueError:
+                pass
 
         # Recalculate the normals of the new mesh after adding the new vertices
         bmesh.ops.recalc_face_normals(new_bmesh_object, faces=new_bmesh_object.faces)
@@ -81,6 +81,118 @@ def hex_symmetry_space(vec, normal):
     return x, e, f, -x, -e, -f
 
 
+####################################################################################################
+# @random_tangent_vectors_array
+####################################################################################################
+def random_tangent_vectors_array(normals):
+    """Returns random tangent vectors of an array of normals.
+
+    :param normals:
+        An Nx3 array of normals.
+    :return:
+        An Nx3 array of random tangent vectors.
+    """
+
+    tangents = numpy.cross(normals, numpy.random.sample((len(normals), 3)) - 0.5)
+    lengths = numpy.sqrt((tangents ** 2).sum(axis=1))
+    return tangents / numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+
+
+####################################################################################################
+# @symmetry_space_array
+####################################################################################################
+def symmetry_space_array(vectors, normals):
+    """The array version of symmetry_space, for N vectors at once.
+
+    :param vectors:
+        An Nx3 array of vectors.
+    :param normals:
+        An Nx3 array of normals.
+    :return:
+        A 4xNx3 array of the symmetric vectors.
+    """
+
+    x = numpy.asarray(vectors, dtype=numpy.float64)
+    y = numpy.cross(x, normals)
+    return numpy.stack((x, y, -x, -y), axis=0)
+
+
+####################################################################################################
+# @hex_symmetry_space_array
+####################################################################################################
+def hex_symmetry_space_array(vectors, normals):
+    """The array version of hex_symmetry_space, for N vectors at once.
+
+    :param vectors:
+        An Nx3 array of vectors.
+    :param normals:
+        An Nx3 array of normals.
+    :return:
+        A 6xNx3 array of the symmetric vectors.
+    """
+
+    x = numpy.asarray(vectors, dtype=numpy.float64)
+    y = numpy.cross(x, normals)
+    e = x * 0.5 + y * 0.866025
+    f = x * -0.5 + y * 0.866025
+    return numpy.stack((x, e, f, -x, -e, -f), axis=0)
+
+
+####################################################################################################
+# @best_matching_vectors_array
+####################################################################################################
+def best_matching_vectors_array(tests, references):
+    """The array version of best_matching_vector, for N references at once.
+
+    :param tests:
+        A KxNx3 array of K test vectors per reference.
+    :param references:
+        An Nx3 array of the references.
+    :return:
+        An Nx3 array of the test vectors that match the references best.
+    """
+
+    scores = (tests * references[numpy.newaxis]).sum(axis=2)
+    return tests[scores.argmax(axis=0), numpy.arange(tests.shape[1])]
+
+
+####################################################################################################
+# @barycentric_weights_array
+####################################################################################################
+def barycentric_weights_array(points, a, b, c):
+    """Computes the barycentric weights of N points in N triangles.
+
+    :param points:
+        An Nx3 array of points, on the planes of the triangles.
+    :param a:
+        An Nx3 array of the first vertices of the triangles.
+    :param b:
+        An Nx3 array of the second vertices of the triangles.
+    :param c:
+        An Nx3 array of the third vertices of the triangles.
+    :return:
+        An Nx3 array of the weights, degenerate triangles use their first vertex.
+    """
+
+    v0 = b - a
+    v1 = c - a
+    v2 = points - a
+    d00 = (v0 * v0).sum(axis=1)
+    d01 = (v0 * v1).sum(axis=1)
+    d11 = (v1 * v1).sum(axis=1)
+    d20 = (v2 * v0).sum(axis=1)
+    d21 = (v2 * v1).sum(axis=1)
+    denominator = d00 * d11 - d01 * d01
+    degenerate = denominator == 0
+    denominator[degenerate] = 1.0
+
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+    v[degenerate] = 0
+    w[degenerate] = 0
+    return numpy.stack((1.0 - v - w, v, w), axis=1)
+
+
 ####################################################################################################
 # @get_grease_pencil_frame
 ####################################################################################################
@@ -471,17 +471,16 @@ class Camera:
             self.rotate_camera_for_front_view()
 
     ################################################################################################
-    # @render_scene
+    # @setup
     ################################################################################################
-    def render_scene(self,
-                     bounding_box,
-                     camera_view=nmv.enums.Camera.View.FRONT,
-                     image_resolution=512,
-                     image_name='IMAGE',
-                     image_format=nmv.enums.Image.Extension.PNG,
-                     camera_projection=nmv.enums.Camera.Projection.ORTHOGRAPHIC,
-                     keep_camera_in_scene=True):
-        """Render scene using an orthographic camera.
+    def setup(self,
+              bounding_box,
+              camera_view=nmv.enums.Camera.View.FRONT,
+              image_resolution=512,
+              camera_projection=nmv.enums.Camera.Projection.ORTHOGRAPHIC):
+        """Creates the camera and sets up its location, orientation and film resolution to frame
+        a given bounding box. The camera can then be used to render multiple frames with
+        @render_image without being recomputed.
 
         :param bounding_box:
             The bounding box of all the objects that should be rendered.
@@ -489,14 +488,8 @@ class Camera:
             The view of the camera: TOP, FRONT, or SIDE, by default FRONT.
         :param image_resolution:
             The 'base' resolution of the image, by default 512.
-        :param image_name:
-            The name of the image, by default 'IMAGE'.
-        :param image_format:
-            The file format of the image, by default .PNG.
         :param camera_projection:
             Camera projection either orthographic or perspective.
-        :param keep_camera_in_scene:
-            Keep the camera in the scene after rendering.
         """
 
         # Transparent background
@@ -514,10 +507,74 @@ class Camera:
             resolution=image_resolution, camera_view=camera_view, bounds=bounding_box.bounds)
         if camera_projection == nmv.enums.Camera.Projection.PERSPECTIVE:
             self.camera.data.type = 'PERSP'
-            bpy.context.object.data.angle = math.radians(45.0)
+            self.camera.data.angle = math.radians(45.0)
         else:
             self.camera.data.type = 'ORTHO'
 
+    ################################################################################################
+    # @setup_to_scale
+    ################################################################################################
+    def setup_to_scale(self,
+                       bounding_box,
+                       camera_view=nmv.enums.Camera.View.FRONT,
+                       scale_factor=1.0):
+        """Creates the camera and sets up its location, orientation and film resolution to frame
+        a given bounding box to scale.
+
+        :param bounding_box:
+            The bounding box of all the objects that should be rendered.
+        :param camera_view:
+            The view of the camera: TOP, FRONT, or SIDE, by default FRONT.
+        :param scale_factor:
+            A factor to scale the resolution of the image.
+        """
+
+        # Get the scene bounding box to adjust the camera accordingly, if the bounds are not set
+        if bounding_box is None:
+            bounding_box = nmv.bbox.compute_scene_bounding_box()
+
+        # Setup the camera
+        self.setup_camera_for_scene(bounding_box, camera_view)
+
+        # Update the camera resolution
+        self.update_camera_resolution_to_scale(
+            scale_factor=scale_factor, camera_view=camera_view, bounds=bounding_box.bounds)
+
+    ################################################################################################
+    # @render_scene
+    ################################################################################################
+    def render_scene(self,
+                     bounding_box,
+                     camera_view=nmv.enums.Camera.View.FRONT,
+                     image_resolution=512,
+                     image_name='IMAGE',
+                     image_format=nmv.enums.Image.Extension.PNG,
+                     camera_projection=nmv.enums.Camera.Projection.ORTHOGRAPHIC,
+                     keep_camera_in_scene=True):
+        """Render scene using an orthographic camera.
+
+        :param bounding_box:
+            The bounding box of all the objects that should be rendered.
+        :param camera_view:
+            The view of the camera: TOP, FRONT, or SIDE, by default FRONT.
+        :param image_resolution:
+            The 'base' resolution of the image, by default 512.
+        :param image_name:
+            The name of the image, by default 'IMAGE'.
+        :param image_format:
+            The file format of the image, by default .PNG.
+        :param camera_projection:
+            Camera projection either orthographic or perspective.
+        :param keep_camera_in_scene:
+            Keep the camera in the scene after rendering.
+        """
+
+        # Create and setup the camera
+        self.setup(bounding_box=bounding_box,
+                   camera_view=camera_view,
+                   image_resolution=image_resolution,
+                   camera_projection=camera_projection)
+
         # Deselect all the object in the scene
         nmv.scene.ops.deselect_all()
 
@@ -557,12 +614,10 @@ class Camera:
             Keep the camera in the scene after rendering.
         """
 
-        # Setup the camera
-        self.setup_camera_for_scene(bounding_box, camera_view)
-
-        # Update the camera resolution
-        self.update_camera_resolution_to_scale(
-            scale_factor=scale_factor, camera_view=camera_view, bounds=bounding_box.bounds)
+        # Create and setup the camera
+        self.setup_to_scale(bounding_box=bounding_box,
+                            camera_view=camera_view,
+                            scale_factor=scale_factor)
 
         # Deselect all the object in the scene
         nmv.scene.ops.deselect_all()
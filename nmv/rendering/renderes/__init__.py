@@ -15,7 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .renderer import *
-from .soma_renderer import *
-from .skeleton_renderer import *
-from .mesh_renderer import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'renderer',
+    'soma_renderer',
+    'skeleton_renderer',
+    'mesh_renderer',
+    'sequence_renderer',
+))
@@ -0,0 +1,743 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import json
+import math
+import subprocess
+
+# Blender imports
+import bpy
+from mathutils import Vector
+
+# Internal imports
+import nmv.bbox
+import nmv.consts
+import nmv.enums
+import nmv.file
+import nmv.rendering
+import nmv.scene
+import nmv.utilities
+
+
+# Sequence types
+SEQUENCE_360 = '360'
+SEQUENCE_PROGRESSIVE = 'PROGRESSIVE'
+
+# The names of the files that are shared between the workers of a sequence
+SEQUENCE_SCENE_FILE = 'sequence.blend'
+SEQUENCE_DESCRIPTION_FILE = 'sequence.json'
+SEQUENCE_SLURM_SCRIPT_FILE = 'sequence.sh'
+SEQUENCE_SLURM_FINALIZE_SCRIPT_FILE = 'sequence-finalize.sh'
+
+# The path to the worker command line interface
+SEQUENCE_WORKER_CLI = '%s/../../interface/cli/sequence_rendering.py' % \
+                      os.path.dirname(os.path.realpath(__file__))
+
+
+####################################################################################################
+# @get_frame_prefix
+####################################################################################################
+def get_frame_prefix(frames_directory,
+                     frame_index):
+    """Gets the path prefix of a frame in the sequence, i.e. w/o extension.
+
+    :param frames_directory:
+        The directory where the frames of the sequence are rendered.
+    :param frame_index:
+        The index of the frame.
+    :return:
+        The path prefix of the frame.
+    """
+
+    return '%s/%s' % (frames_directory, '{0:05d}'.format(frame_index))
+
+
+####################################################################################################
+# @is_frame_rendered
+####################################################################################################
+def is_frame_rendered(frames_directory,
+                      frame_index):
+    """Checks if a frame has been already rendered to the frames directory or not.
+
+    NOTE: The frames are rendered to temporary files and then renamed, therefore a frame that
+    exists on the disk is always complete, even if the rendering job was killed.
+
+    :param frames_directory:
+        The directory where the frames of the sequence are rendered.
+    :param frame_index:
+        The index of the frame.
+    :return:
+        True if the frame exists, otherwise False.
+    """
+
+    frame_path = '%s.png' % get_frame_prefix(frames_directory, frame_index)
+    return os.path.isfile(frame_path) and os.path.getsize(frame_path) > 0
+
+
+####################################################################################################
+# @get_pending_frames
+####################################################################################################
+def get_pending_frames(frames_directory,
+                       frames):
+    """Gets a list of the frames that are not rendered yet.
+
+    :param frames_directory:
+        The directory where the frames of the sequence are rendered.
+    :param frames:
+        A list of frame indices.
+    :return:
+        A list of the indices of the frames that are not rendered yet.
+    """
+
+    return [frame for frame in frames if not is_frame_rendered(frames_directory, frame)]
+
+
+####################################################################################################
+# @partition_frames
+####################################################################################################
+def partition_frames(frames,
+                     worker_index,
+                     number_workers,
+                     contiguous=False):
+    """Gets the subset of frames that must be rendered by a specific worker.
+
+    Interleaved partitions are balanced for 360 sequences. Contiguous partitions are used for
+    progressive sequences, where each frame depends on the state of the previous ones.
+
+    :param frames:
+        A list of all the frames in the sequence.
+    :param worker_index:
+        The index of the worker, starting from zero.
+    :param number_workers:
+        The total number of workers.
+    :param contiguous:
+        If True, every worker gets a contiguous block of frames, otherwise the frames are
+        interleaved.
+    :return:
+        A list of the frames that will be rendered by the worker.
+    """
+
+    # A single worker renders all the frames
+    if number_workers <= 1:
+        return list(frames)
+
+    # Contiguous blocks
+    if contiguous:
+        block_size = int(math.ceil(len(frames) / float(number_workers)))
+        return list(frames[worker_index * block_size:(worker_index + 1) * block_size])
+
+    # Interleaved frames
+    return list(frames[worker_index::number_workers])
+
+
+####################################################################################################
+# @create_sequence_description
+####################################################################################################
+def create_sequence_description(scene_objects,
+                                bounding_box,
+                                frames_directory,
+                                sequence_type=SEQUENCE_360,
+                                number_frames=nmv.consts.Image.SEQUENCE_360_FRAMES,
+                                first_frame=0,
+                                camera_view=nmv.enums.Camera.View.FRONT_360,
+                                resolution_basis=nmv.enums.Rendering.Resolution.FIXED,
+                                image_resolution=nmv.consts.Image.DEFAULT_RESOLUTION,
+                                image_scale_factor=nmv.consts.Image.DEFAULT_IMAGE_SCALE_FACTOR):
+    """Creates a description of a sequence that can be shared with other rendering processes.
+
+    :param scene_objects:
+        A list of the objects that are rotated in the 360 sequences.
+    :param bounding_box:
+        The bounding box of the view of the sequence.
+    :param frames_directory:
+        The directory where the frames will be rendered.
+    :param sequence_type:
+        The type of the sequence, either SEQUENCE_360 or SEQUENCE_PROGRESSIVE.
+    :param number_frames:
+        The number of frames in the sequence.
+    :param first_frame:
+        The index of the first frame in the time-line, used for progressive sequences.
+    :param camera_view:
+        The view of the camera.
+    :param resolution_basis:
+        Render the frames to scale or at a fixed resolution.
+    :param image_resolution:
+        The resolution of the frames, if rendered at a fixed resolution.
+    :param image_scale_factor:
+        The scale factor of the frames, if rendered to scale.
+    :return:
+        A dictionary that describes the sequence.
+    """
+
+    return {
+        'sequence_type': sequence_type,
+        'frames_directory': os.path.abspath(frames_directory),
+        'number_frames': number_frames,
+        'first_frame': first_frame,
+        'objects': [scene_object.name for scene_object in scene_objects],
+        'p_min': [bounding_box.p_min[0], bounding_box.p_min[1], bounding_box.p_min[2]],
+        'p_max': [bounding_box.p_max[0], bounding_box.p_max[1], bounding_box.p_max[2]],
+        'camera_view': camera_view,
+        'resolution_basis': resolution_basis,
+        'image_resolution': image_resolution,
+        'image_scale_factor': image_scale_factor}
+
+
+####################################################################################################
+# @write_sequence_description
+####################################################################################################
+def write_sequence_description(description,
+                               description_file):
+    """Writes the description of the sequence to a .json file.
+
+    :param description:
+        The description of the sequence.
+    :param description_file:
+        The path to the output file.
+    """
+
+    with open(description_file, 'w') as output_file:
+        json.dump(description, output_file, indent=4)
+
+
+####################################################################################################
+# @read_sequence_description
+####################################################################################################
+def read_sequence_description(description_file):
+    """Reads the description of a sequence from a .json file.
+
+    :param description_file:
+        The path to the description file.
+    :return:
+        A dictionary that describes the sequence.
+    """
+
+    with open(description_file, 'r') as input_file:
+        return json.load(input_file)
+
+
+####################################################################################################
+# @get_sequence_frames
+####################################################################################################
+def get_sequence_frames(description):
+    """Gets a list of the indices of all the frames in a sequence.
+
+    :param description:
+        The description of the sequence.
+    :return:
+        A list of frame indices.
+    """
+
+    first_frame = description['first_frame']
+    return list(range(first_frame, first_frame + description['number_frames']))
+
+
+####################################################################################################
+# @create_sequence_camera
+####################################################################################################
+def create_sequence_camera(description,
+                           bounding_box):
+    """Creates a single camera that is used to render all the frames of a sequence.
+
+    The bounding box of a 360 sequence is invariant to the rotation of the objects, and therefore
+    the location, orientation and resolution of the camera are computed only once.
+
+    :param description:
+        The description of the sequence.
+    :param bounding_box:
+        The bounding box of the view of the sequence.
+    :return:
+        A reference to the camera, nmv.rendering.Camera.
+    """
+
+    camera = nmv.rendering.Camera('SequenceCamera_%s' % description['camera_view'])
+    if description['resolution_basis'] == nmv.enums.Rendering.Resolution.TO_SCALE:
+        camera.setup_to_scale(bounding_box=bounding_box,
+                              camera_view=description['camera_view'],
+                              scale_factor=description['image_scale_factor'])
+    else:
+        camera.setup(bounding_box=bounding_box,
+                     camera_view=description['camera_view'],
+                     image_resolution=description['image_resolution'])
+    return camera
+
+
+####################################################################################################
+# @render_frame
+####################################################################################################
+def render_frame(description,
+                 frame_index,
+                 scene_objects,
+                 camera):
+    """Renders a single frame of the sequence.
+
+    The frame is rendered to a temporary image that is renamed when the rendering is complete to
+    avoid leaving partial frames on the disk if the process is killed.
+
+    :param description:
+        The description of the sequence.
+    :param frame_index:
+        The index of the frame.
+    :param scene_objects:
+        A list of the objects that are rotated in the 360 sequences.
+    :param camera:
+        The camera of the sequence, created with @create_sequence_camera.
+    """
+
+    # The prefix of the frame and its temporary image
+    frame_prefix = get_frame_prefix(description['frames_directory'], frame_index)
+    partial_frame_prefix = '%s.partial' % frame_prefix
+
+    # 360 sequences rotate the objects, the progressive ones rely on the time-line
+    if description['sequence_type'] == SEQUENCE_360:
+        angle = (frame_index - description['first_frame']) * 360.0 / description['number_frames']
+        for scene_object in scene_objects:
+            scene_object.rotation_euler[1] = math.radians(angle)
+
+    # Render the frame
+    camera.render_image(image_name=partial_frame_prefix)
+
+    # The frame is complete, rename it
+    os.replace('%s.png' % partial_frame_prefix, '%s.png' % frame_prefix)
+
+
+####################################################################################################
+# @render_sequence_frames
+####################################################################################################
+def render_sequence_frames(description,
+                           frames):
+    """Renders a subset of the frames of a sequence in the current process.
+
+    The frames that already exist in the frames directory are skipped, which allows resuming
+    killed jobs.
+
+    :param description:
+        The description of the sequence.
+    :param frames:
+        A list of the indices of the frames that will be rendered.
+    :return:
+        The number of frames that were rendered.
+    """
+
+    # Skip the frames that are already rendered
+    pending_frames = get_pending_frames(description['frames_directory'], frames)
+    if len(pending_frames) == 0:
+        return 0
+
+    # Get the objects of the sequence from the scene
+    scene_objects = list()
+    for object_name in description['objects']:
+        if object_name in bpy.data.objects:
+            scene_objects.append(bpy.data.objects[object_name])
+
+    # The bounding box of the view
+    bounding_box = nmv.bbox.BoundingBox(p_min=Vector(description['p_min']),
+                                        p_max=Vector(description['p_max']))
+
+    # A single camera for all the frames
+    camera = create_sequence_camera(description, bounding_box)
+
+    # 360 sequences are independent per frame
+    if description['sequence_type'] == SEQUENCE_360:
+        for i, frame_index in enumerate(pending_frames):
+            nmv.utilities.show_iteration_progress('Frames', i, len(pending_frames))
+            render_frame(description, frame_index, scene_objects, camera)
+
+    # Progressive sequences must replay the time-line from the first frame, because the state of
+    # each frame (e.g. a soft body simulation) depends on the previous ones
+    else:
+        rendered_frames = 0
+        for frame_index in range(description['first_frame'], pending_frames[-1] + 1):
+            bpy.context.scene.frame_set(frame_index)
+            if frame_index in pending_frames:
+                nmv.utilities.show_iteration_progress(
+                    'Frames', rendered_frames, len(pending_frames))
+                render_frame(description, frame_index, scene_objects, camera)
+                rendered_frames += 1
+
+    nmv.utilities.show_iteration_progress(
+        'Frames', len(pending_frames), len(pending_frames), done=True)
+
+    # Delete the camera
+    nmv.scene.ops.delete_object_in_scene(camera.camera)
+
+    # Return the number of frames that were rendered in this process
+    return len(pending_frames)
+
+
+####################################################################################################
+# @save_sequence_scene
+####################################################################################################
+def save_sequence_scene(sequence_directory):
+    """Saves a copy of the prepared scene to be loaded by the rendering workers.
+
+    :param sequence_directory:
+        The directory where the scene will be saved.
+    :return:
+        The path to the saved .blend file.
+    """
+
+    scene_file = '%s/%s' % (sequence_directory, SEQUENCE_SCENE_FILE)
+    bpy.ops.wm.save_as_mainfile(filepath=scene_file, copy=True)
+    return scene_file
+
+
+####################################################################################################
+# @get_worker_command
+####################################################################################################
+def get_worker_command(scene_file,
+                       description_file,
+                       number_workers,
+                       worker_index=None,
+                       blender_executable=None,
+                       finalize=False,
+                       create_movie=True):
+    """Gets the shell command that launches a single rendering worker, or the worker that
+    finalizes the sequence after all the frames are rendered.
+
+    :param scene_file:
+        The path to the saved .blend file of the sequence.
+    :param description_file:
+        The path to the description of the sequence.
+    :param number_workers:
+        The total number of workers.
+    :param worker_index:
+        The index of the worker. If None, the index is read from the SLURM_ARRAY_TASK_ID.
+    :param blender_executable:
+        The path to the Blender executable, by default the running one.
+    :param finalize:
+        Finalize the sequence with @finalize_sequence instead of rendering frames. The scene is
+        not loaded, since it is removed by the finalization.
+    :param create_movie:
+        Assemble the frames into a movie when the sequence is finalized.
+    :return:
+        A list of the command arguments.
+    """
+
+    if blender_executable is None:
+        blender_executable = bpy.app.binary_path
+
+    # The finalizing worker does not need the scene
+    command = [blender_executable, '-b']
+    if not finalize:
+        command.append(scene_file)
+    command.extend(['--verbose', '0',
+                    '--python', os.path.abspath(SEQUENCE_WORKER_CLI), '--',
+                    '--sequence-description', description_file,
+                    '--number-workers', str(number_workers)])
+    if worker_index is not None:
+        command.extend(['--worker-index', str(worker_index)])
+    if finalize:
+        command.append('--finalize')
+        if not create_movie:
+            command.append('--no-movie')
+    return command
+
+
+####################################################################################################
+# @render_sequence_with_local_workers
+####################################################################################################
+def render_sequence_with_local_workers(scene_file,
+                                       description_file,
+                                       number_workers):
+    """Renders the sequence by splitting its frames among multiple local Blender processes.
+
+    :param scene_file:
+        The path to the saved .blend file of the sequence.
+    :param description_file:
+        The path to the description of the sequence.
+    :param number_workers:
+        The number of worker processes.
+    :return:
+        True if all the workers have finished successfully, otherwise False.
+    """
+
+    # Launch all the workers
+    workers = list()
+    for worker_index in range(number_workers):
+        command = get_worker_command(scene_file, description_file, number_workers, worker_index)
+        workers.append(subprocess.Popen(command,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+    # Wait for them to finish
+    success = True
+    for worker_index, worker in enumerate(workers):
+        if worker.wait() != 0:
+            nmv.logger.warning('Rendering worker [%d] has failed' % worker_index)
+            success = False
+    return success
+
+
+####################################################################################################
+# @create_sequence_slurm_array_job
+####################################################################################################
+def create_sequence_slurm_array_job(scene_file,
+                                    description_file,
+                                    number_workers,
+                                    sequence_directory,
+                                    partition='prod',
+                                    session_time='1:00:00',
+                                    memory_mb=4000,
+                                    submit=True,
+                                    create_movie=True):
+    """Creates a SLURM array job that splits the frames of the sequence among its tasks, and a
+    job that depends on it to finalize the sequence with @finalize_sequence once all the tasks
+    have succeeded.
+
+    The frames and the movie are not available when this function returns, they are created
+    asynchronously by the submitted jobs.
+
+    :param scene_file:
+        The path to the saved .blend file of the sequence.
+    :param description_file:
+        The path to the description of the sequence.
+    :param number_workers:
+        The number of tasks in the array.
+    :param sequence_directory:
+        The directory where the job script and its logs will be written.
+    :param partition:
+        The SLURM partition.
+    :param session_time:
+        The time limit of each task.
+    :param memory_mb:
+        The memory required per task in MBytes.
+    :param submit:
+        Submit the jobs with sbatch after creating their scripts.
+    :param create_movie:
+        Assemble the frames into a movie when they are all rendered.
+    :return:
+        The path to the array job script.
+    """
+
+    # Each task reads its worker index from the SLURM_ARRAY_TASK_ID
+    command = get_worker_command(scene_file, description_file, number_workers)
+
+    script = '#!/bin/bash\n'
+    script += '#SBATCH --job-name="NMV_SEQUENCE"\n'
+    script += '#SBATCH --array=0-%d\n' % (number_workers - 1)
+    script += '#SBATCH --nodes=1\n'
+    script += '#SBATCH --ntasks=1\n'
+    script += '#SBATCH --mem=%s\n' % str(memory_mb)
+    script += '#SBATCH --time=%s\n' % session_time
+    script += '#SBATCH --partition=%s\n' % partition
+    script += '#SBATCH --output=%s/slurm-%%A_%%a.out\n' % sequence_directory
+    script += '#SBATCH --error=%s/slurm-%%A_%%a.err\n\n' % sequence_directory
+    script += '%s\n' % ' '.join(command)
+
+    # Write the script
+    script_file = '%s/%s' % (sequence_directory, SEQUENCE_SLURM_SCRIPT_FILE)
+    with open(script_file, 'w') as output_file:
+        output_file.write(script)
+
+    # The finalizing job verifies the frames, assembles the movie and removes the scene
+    command = get_worker_command(scene_file, description_file, number_workers,
+                                 finalize=True, create_movie=create_movie)
+
+    script = '#!/bin/bash\n'
+    script += '#SBATCH --job-name="NMV_SEQUENCE_FINALIZE"\n'
+    script += '#SBATCH --nodes=1\n'
+    script += '#SBATCH --ntasks=1\n'
+    script += '#SBATCH --mem=%s\n' % str(memory_mb)
+    script += '#SBATCH --time=%s\n' % session_time
+    script += '#SBATCH --partition=%s\n' % partition
+    script += '#SBATCH --output=%s/slurm-%%j-finalize.out\n' % sequence_directory
+    script += '#SBATCH --error=%s/slurm-%%j-finalize.err\n\n' % sequence_directory
+    script += '%s\n' % ' '.join(command)
+
+    # Write the finalizing script
+    finalize_script_file = '%s/%s' % (sequence_directory, SEQUENCE_SLURM_FINALIZE_SCRIPT_FILE)
+    with open(finalize_script_file, 'w') as output_file:
+        output_file.write(script)
+
+    # Submit the array job, and the finalizing job to run after all its tasks have succeeded
+    if submit:
+        try:
+            job_id = subprocess.check_output(['sbatch', '--parsable', script_file])
+        except (OSError, subprocess.CalledProcessError) as error:
+            nmv.logger.warning('Cannot submit the sequence job [%s]' % str(error))
+            return script_file
+
+        # The parsable output is the job ID, optionally followed by the name of the cluster
+        job_id = job_id.decode().strip().split(';')[0]
+        subprocess.call(['sbatch', '--dependency=afterok:%s' % job_id, finalize_script_file])
+
+    # Return the path to the script
+    return script_file
+
+
+####################################################################################################
+# @create_sequence_movie
+####################################################################################################
+def create_sequence_movie(frames_directory,
+                          movie_path,
+                          first_frame=0,
+                          frame_rate=nmv.consts.Image.SEQUENCE_FRAME_RATE):
+    """Assembles the frames of a sequence into a movie using ffmpeg.
+
+    :param frames_directory:
+        The directory where the frames of the sequence are rendered.
+    :param movie_path:
+        The path to the output movie.
+    :param first_frame:
+        The index of the first frame in the sequence.
+    :param frame_rate:
+        The frame rate of the movie.
+    :return:
+        True if the movie is created, otherwise False.
+    """
+
+    # We cannot assemble the movie without ffmpeg
+    if not nmv.utilities.command_exists('ffmpeg'):
+        nmv.logger.warning('ffmpeg is not installed, the movie [%s] will not be created' %
+                           movie_path)
+        return False
+
+    command = ['ffmpeg', '-y', '-loglevel', 'error',
+               '-framerate', str(frame_rate),
+               '-start_number', str(first_frame),
+               '-i', '%s/%%05d.png' % frames_directory,
+               '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+               '-pix_fmt', 'yuv420p', movie_path]
+    return subprocess.call(command) == 0
+
+
+####################################################################################################
+# @finalize_sequence
+####################################################################################################
+def finalize_sequence(description_file,
+                      create_movie=True):
+    """Verifies that all the frames of a sequence are rendered, assembles the movie and removes
+    the scene that was saved for the workers.
+
+    :param description_file:
+        The path to the description of the sequence.
+    :param create_movie:
+        Create a movie from the frames.
+    :return:
+        True if the sequence is complete, otherwise False.
+    """
+
+    description = read_sequence_description(description_file)
+    frames_directory = description['frames_directory']
+
+    # Make sure that all the frames are there
+    pending_frames = get_pending_frames(frames_directory, get_sequence_frames(description))
+    if len(pending_frames) > 0:
+        nmv.logger.warning('The sequence [%s] is missing [%d] frames, re-run it to resume' %
+                           (frames_directory, len(pending_frames)))
+        return False
+
+    # Assemble the movie next to the frames directory
+    if create_movie:
+        create_sequence_movie(frames_directory=frames_directory,
+                              movie_path='%s.mp4' % frames_directory,
+                              first_frame=description['first_frame'])
+
+    # The scene of the workers is not needed anymore
+    scene_file = '%s/%s' % (frames_directory, SEQUENCE_SCENE_FILE)
+    if os.path.isfile(scene_file):
+        os.remove(scene_file)
+    return True
+
+
+####################################################################################################
+# @render_sequence
+####################################################################################################
+def render_sequence(scene_objects,
+                    bounding_box,
+                    frames_directory,
+                    sequence_type=SEQUENCE_360,
+                    number_frames=nmv.consts.Image.SEQUENCE_360_FRAMES,
+                    first_frame=0,
+                    camera_view=nmv.enums.Camera.View.FRONT_360,
+                    resolution_basis=nmv.enums.Rendering.Resolution.FIXED,
+                    image_resolution=nmv.consts.Image.DEFAULT_RESOLUTION,
+                    image_scale_factor=nmv.consts.Image.DEFAULT_IMAGE_SCALE_FACTOR,
+                    scheduler=nmv.enums.Rendering.Scheduler.SERIAL,
+                    number_workers=1,
+                    create_movie=True):
+    """Renders a 360 or a progressive sequence, either in the current process or distributed among
+    multiple local processes or SLURM array tasks.
+
+    The frames directory is NOT cleaned, and the frames that exist already are skipped, therefore
+    calling this function again after a killed job resumes the rendering.
+
+    :param scene_objects:
+        A list of the objects that are rotated in the 360 sequences.
+    :param bounding_box:
+        The bounding box of the view of the sequence.
+    :param frames_directory:
+        The directory where the frames will be rendered.
+    :param sequence_type:
+        The type of the sequence, either SEQUENCE_360 or SEQUENCE_PROGRESSIVE.
+    :param number_frames:
+        The number of frames in the sequence.
+    :param first_frame:
+        The index of the first frame in the time-line, used for progressive sequences.
+    :param camera_view:
+        The view of the camera.
+    :param resolution_basis:
+        Render the frames to scale or at a fixed resolution.
+    :param image_resolution:
+        The resolution of the frames, if rendered at a fixed resolution.
+    :param image_scale_factor:
+        The scale factor of the frames, if rendered to scale.
+    :param scheduler:
+        The scheduler of the frames, SERIAL, LOCAL or SLURM.
+    :param number_workers:
+        The number of the worker processes or array tasks.
+    :param create_movie:
+        Assemble the frames into a movie when they are all rendered.
+    :return:
+        True if the sequence is complete, otherwise False. Sequences submitted to SLURM are
+        completed, and finalized, asynchronously by the submitted jobs.
+    """
+
+    # Create the frames directory if it does not exist, but keep any existing frames
+    if not nmv.file.ops.path_exists(frames_directory):
+        nmv.file.ops.create_directory(frames_directory)
+
+    # Describe the sequence and write the description next to the frames
+    description = create_sequence_description(
+        scene_objects=scene_objects, bounding_box=bounding_box, frames_directory=frames_directory,
+        sequence_type=sequence_type, number_frames=number_frames, first_frame=first_frame,
+        camera_view=camera_view, resolution_basis=resolution_basis,
+        image_resolution=image_resolution, image_scale_factor=image_scale_factor)
+    description_file = '%s/%s' % (frames_directory, SEQUENCE_DESCRIPTION_FILE)
+    write_sequence_description(description, description_file)
+
+    # Render in the current process
+    if scheduler == nmv.enums.Rendering.Scheduler.SERIAL or number_workers <= 1:
+        render_sequence_frames(description, get_sequence_frames(description))
+        return finalize_sequence(description_file, create_movie)
+
+    # Save the scene to be loaded by the workers
+    scene_file = save_sequence_scene(frames_directory)
+
+    # Submit an array job to the cluster
+    if scheduler == nmv.enums.Rendering.Scheduler.SLURM:
+        nmv.logger.info('Submitting the sequence to SLURM [%d] tasks' % number_workers)
+        create_sequence_slurm_array_job(scene_file, description_file, number_workers,
+                                        frames_directory, create_movie=create_movie)
+        return False
+
+    # Run multiple workers on the local machine
+    nmv.logger.info('Rendering the sequence with [%d] local workers' % number_workers)
+    render_sequence_with_local_workers(scene_file, description_file, number_workers)
+    return finalize_sequence(description_file, create_movie)
@@ -391,7 +391,10 @@ def clear_scene():
         nmv.utilities.enable_std_output()
 
     # Select all the scene materials, unlink them and clear their data
+    # NOTE: The materials with a fake user, i.e. the shader templates, are kept
     for scene_material in bpy.data.materials:
+        if scene_material.use_fake_user:
+            continue
         nmv.utilities.disable_std_output()
         bpy.data.materials.remove(scene_material, do_unlink=True)
         nmv.utilities.enable_std_output()
@@ -16,5 +16,13 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .illumination import *
-from .materials import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'illumination',
+    'material_registry',
+    'shader_library',
+    'materials',
+))
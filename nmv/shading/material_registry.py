@@ -0,0 +1,212 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Blender imports
+import bpy
+
+
+####################################################################################################
+# @MaterialRegistry
+####################################################################################################
+class MaterialRegistry:
+    """A registry that interns the materials by their shader, color, alpha and parameters, such
+    that all the objects that share the same appearance share a single material instead of
+    creating a new node tree per object.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # Key -> material
+        self.materials = dict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    ################################################################################################
+    # @get_key
+    ################################################################################################
+    @staticmethod
+    def get_key(material_type,
+                color,
+                alpha=1.0,
+                parameters=None):
+        """Gets the key that identifies a material in the registry.
+
+        The color components are rounded to avoid creating different materials for colors that
+        only differ by the floating point precision.
+
+        :param material_type:
+            Material type, i.e. shader.
+        :param color:
+            Material color.
+        :param alpha:
+            Material alpha.
+        :param parameters:
+            A dictionary of any other parameters that affect the material.
+        :return:
+            A hashable key.
+        """
+
+        color_key = tuple(round(float(component), 6) for component in color)
+        alpha_key = None if alpha is None else round(float(alpha), 6)
+        parameters_key = tuple(sorted(parameters.items())) if parameters else ()
+        return material_type, color_key, alpha_key, parameters_key
+
+    ################################################################################################
+    # @is_valid
+    ################################################################################################
+    @staticmethod
+    def is_valid(material):
+        """Checks if a registered material still exists in the blend data, for example it was not
+        removed when the scene was cleared.
+
+        :param material:
+            A registered material.
+        :return:
+            True if the material can still be used, otherwise False.
+        """
+
+        try:
+            return bpy.data.materials.get(material.name) == material
+        except ReferenceError:
+            return False
+
+    ################################################################################################
+    # @get_material
+    ################################################################################################
+    def get_material(self,
+                     key):
+        """Gets a registered material.
+
+        :param key:
+            The key of the material.
+        :return:
+            A reference to the material, or None if it does not exist.
+        """
+
+        material = self.materials.get(key)
+        if material is not None and not self.is_valid(material):
+            del self.materials[key]
+            material = None
+
+        if material is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return material
+
+    ################################################################################################
+    # @register_material
+    ################################################################################################
+    def register_material(self,
+                          key,
+                          material):
+        """Adds a new material to the registry.
+
+        :param key:
+            The key of the material.
+        :param material:
+            A reference to the material.
+        """
+
+        self.materials[key] = material
+
+    ################################################################################################
+    # @remove_unused_materials
+    ################################################################################################
+    def remove_unused_materials(self):
+        """Removes the registered materials that are not assigned to any object anymore from the
+        blend data, and drops them from the registry. The materials that are still in use are kept.
+
+        :return:
+            The number of removed materials.
+        """
+
+        number_removed_materials = 0
+        for key, material in list(self.materials.items()):
+
+            # Already removed, for example when the scene was cleared
+            if not self.is_valid(material):
+                del self.materials[key]
+                continue
+
+            # Still in use
+            if material.users > 0:
+                continue
+
+            del self.materials[key]
+            bpy.data.materials.remove(material, do_unlink=True)
+            number_removed_materials += 1
+
+        return number_removed_materials
+
+    ################################################################################################
+    # @clear
+    ################################################################################################
+    def clear(self):
+        """Clears the registry.
+        """
+
+        self.materials.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# A single registry that is shared by all the builders
+material_registry = MaterialRegistry()
+
+
+####################################################################################################
+# @get_material_registry
+####################################################################################################
+def get_material_registry():
+    """Gets the material registry that is shared by all the builders.
+
+    :return:
+        A reference to the shared MaterialRegistry.
+    """
+
+    return material_registry
+
+
+####################################################################################################
+# @remove_unused_materials
+####################################################################################################
+def remove_unused_materials():
+    """Removes the materials of the shared registry that are not used by any object.
+
+    :return:
+        The number of removed materials.
+    """
+
+    return material_registry.remove_unused_materials()
+
+
+####################################################################################################
+# @clear_material_registry
+####################################################################################################
+def clear_material_registry():
+    """Clears the shared material registry.
+    """
+
+    material_registry.clear()
@@ -16,9 +16,6 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-# System imports
-import os 
-
 # Blender imports
 import bpy
 import mathutils
@@ -36,26 +33,44 @@ import nmv.utilities
 def import_shader(shader_name):
     """Import a shader from  the NeuroMorphoVis shading library.
 
+    The shader is created from a template that is loaded only once per session, see
+    nmv.shading.ShaderLibrary.
+
     :param shader_name:
         The name of the shader file in the library.
     :return:
         A reference to the shader after being loaded into blender.
     """
 
-    # Get the path of this file
-    current_file = os.path.dirname(os.path.realpath(__file__))
-    shaders_directory = '%s/shaders/%s.blend/Material' % (current_file, shader_name)
-
-    # Import the material
-    bpy.ops.wm.append(filename='material', directory=shaders_directory)
-
-    # Get a reference to the material
-    material_reference = bpy.data.materials['material']
+    # Copy the cached template of the shader, the library file is loaded only once
+    material_reference = nmv.shading.get_shader_library().create_material(shader_name)
 
     # Return a reference to the material
     return material_reference
 
 
+####################################################################################################
+# @set_color_ramp_colors
+####################################################################################################
+def set_color_ramp_colors(material_reference,
+                          first_color,
+                          second_color):
+    """Sets the colors of the two elements of the color ramp of a library material, each in a
+    single assignment.
+
+    :param material_reference:
+        A material imported from the shading library.
+    :param first_color:
+        The RGB color of the first element.
+    :param second_color:
+        The RGB color of the second element.
+    """
+
+    elements = material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements
+    elements[0].color[:3] = first_color[:3]
+    elements[1].color[:3] = second_color[:3]
+
+
 ####################################################################################################
 # @switch_freestyle
 ####################################################################################################
@@ -103,12 +118,7 @@ def create_shadow_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2] / 2.0
+    set_color_ramp_colors(material_reference, color, [c / 2.0 for c in color[:3]])
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -148,12 +158,7 @@ def create_super_electron_light_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2] / 2.0
+    set_color_ramp_colors(material_reference, color, [c / 2.0 for c in color[:3]])
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -217,12 +222,7 @@ def create_super_electron_dark_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2] / 2.0
+    set_color_ramp_colors(material_reference, color, [c / 2.0 for c in color[:3]])
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -287,12 +287,7 @@ def create_flat_material(name,
         material_reference.name = str(name)
 
         # Update the color gradient
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2]
+        set_color_ramp_colors(material_reference, color, color)
 
         # Switch the view port shading
         nmv.scene.switch_scene_shading('MATERIAL')
@@ -361,12 +356,7 @@ def create_transparent_material(name,
         material_reference.name = str(name)
 
         # Update the color gradient
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2]
+        set_color_ramp_colors(material_reference, color, color)
 
         # Switch the view port shading
         nmv.scene.switch_scene_shading('MATERIAL')
@@ -431,12 +421,7 @@ def create_toon_material(name,
         material_reference.name = str(name)
 
         # Update the color gradient
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1]
-        material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2]
+        set_color_ramp_colors(material_reference, color, color)
 
         # Switch the view port shading
         nmv.scene.switch_scene_shading('MATERIAL')
@@ -473,12 +458,7 @@ def create_voronoi_cells_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2]
+    set_color_ramp_colors(material_reference, color, color)
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -518,12 +498,7 @@ def create_wire_frame_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2]
+    set_color_ramp_colors(material_reference, color, color)
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -563,12 +538,7 @@ def create_electron_light_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2] / 2.0
+    set_color_ramp_colors(material_reference, color, [c / 2.0 for c in color[:3]])
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -608,12 +578,7 @@ def create_electron_dark_material(name,
     material_reference.name = str(name)
 
     # Update the color gradient
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[0] = color[0]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[1] = color[1]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[0].color[2] = color[2]
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[0] = color[0] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[1] = color[1] / 2.0
-    material_reference.node_tree.nodes['ColorRamp'].color_ramp.elements[1].color[2] = color[2] / 2.0
+    set_color_ramp_colors(material_reference, color, [c / 2.0 for c in color[:3]])
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -811,9 +776,7 @@ def create_glossy_material(name,
     # Rename the material
     material_reference.name = str(name)
 
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[0] = color[0]
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[1] = color[1]
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[2] = color[2]
+    material_reference.node_tree.nodes['RGB'].outputs[0].default_value[:3] = color[:3]
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -852,9 +815,7 @@ def create_glossy_bumpy_material(name,
     # Rename the material
     material_reference.name = str(name)
 
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[0] = color[0]
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[1] = color[1]
-    material_reference.node_tree.nodes["RGB"].outputs[0].default_value[2] = color[2]
+    material_reference.node_tree.nodes['RGB'].outputs[0].default_value[:3] = color[:3]
 
     # Switch the view port shading
     nmv.scene.switch_scene_shading('MATERIAL')
@@ -864,21 +825,13 @@ def create_glossy_bumpy_material(name,
 
 
 ####################################################################################################
-# @create_material
+# @prepare_scene_for_material
 ####################################################################################################
-def create_material(name,
-                    color,
-                    material_type=nmv.enums.Shader.LAMBERT_WARD):
-    """Create a specific material given its type and color.
+def prepare_scene_for_material(material_type=nmv.enums.Shader.LAMBERT_WARD):
+    """Adjusts the color management and the transparency of the scene for a given material type.
 
-    :param name:
-        Material name.
-    :param color:
-        Material color.
     :param material_type:
         Material type.
-    :return:
-        A reference to the created material
     """
 
     # By default, set colors to filmic
@@ -890,6 +843,66 @@ def create_material(name,
     # Turn off the free-style modes
     switch_freestyle(use_freestyle=False)
 
+    # Always set the colors to raw when using the flat material
+    if material_type == nmv.enums.Shader.FLAT:
+        nmv.scene.set_colors_to_raw()
+
+
+####################################################################################################
+# @set_material_alpha
+####################################################################################################
+def set_material_alpha(material,
+                       alpha):
+    """Sets the transparency of a given material.
+
+    :param material:
+        A reference to the material.
+    :param alpha:
+        Material alpha, where 1.0 is opaque.
+    """
+
+    # Blender 2.8
+    if nmv.utilities.is_blender_280():
+
+        # The viewport color
+        material.diffuse_color[3] = alpha
+
+        # The shaders that have an alpha input
+        if material.use_nodes:
+            for node in material.node_tree.nodes:
+                if 'Alpha' in node.inputs:
+                    node.inputs['Alpha'].default_value = alpha
+
+        # Blend the transparent materials
+        if alpha < 1.0:
+            material.blend_method = 'BLEND'
+
+    else:
+        material.use_transparency = alpha < 1.0
+        material.alpha = alpha
+
+
+####################################################################################################
+# @create_unique_material
+####################################################################################################
+def create_unique_material(name,
+                           color,
+                           material_type=nmv.enums.Shader.LAMBERT_WARD):
+    """Create a new material given its type and color, without looking up the registry.
+
+    :param name:
+        Material name.
+    :param color:
+        Material color.
+    :param material_type:
+        Material type.
+    :return:
+        A reference to the created material
+    """
+
+    # Adjust the scene for the material
+    prepare_scene_for_material(material_type)
+
     # Lambert Ward
     if material_type == nmv.enums.Shader.LAMBERT_WARD:
         return create_lambert_ward_material(name='%s_color' % name, color=color)
@@ -932,8 +945,6 @@ def create_material(name,
 
     # Flat
     elif material_type == nmv.enums.Shader.FLAT:
-        # Always set the colors to raw when using the flat material
-        nmv.scene.set_colors_to_raw()
         return create_flat_material(name='%s_color' % name, color=color)
 
     # Toon
@@ -949,6 +960,52 @@ def create_material(name,
         return create_lambert_ward_material(name='%s_color' % name, color=color)
 
 
+####################################################################################################
+# @create_material
+####################################################################################################
+def create_material(name,
+                    color,
+                    material_type=nmv.enums.Shader.LAMBERT_WARD,
+                    alpha=1.0,
+                    parameters=None):
+    """Gets a material of a specific type and color from the material registry, or creates it if
+    it was not created before.
+
+    The materials are shared between all the objects that have the same shader, color, alpha and
+    parameters, therefore the name of the material is only used when it is created for the first
+    time.
+
+    :param name:
+        Material name.
+    :param color:
+        Material color.
+    :param material_type:
+        Material type.
+    :param alpha:
+        Material alpha.
+    :param parameters:
+        A dictionary of any other parameters that distinguish the material.
+    :return:
+        A reference to the material
+    """
+
+    registry = nmv.shading.get_material_registry()
+    key = registry.get_key(material_type, color, alpha, parameters)
+
+    # Shared material, only update the scene settings that the material requires
+    material = registry.get_material(key)
+    if material is not None:
+        prepare_scene_for_material(material_type)
+        return material
+
+    # New material
+    material = create_unique_material(name=name, color=color, material_type=material_type)
+    if alpha is not None and alpha < 1.0:
+        set_material_alpha(material, alpha)
+    registry.register_material(key, material)
+    return material
+
+
 ####################################################################################################
 # @set_material_to_object
 ####################################################################################################
@@ -1009,7 +1066,7 @@ def create_materials(material_type,
         The code of the given colors.
     :return:
         A list of two elements (different or same colors) where we can apply later to the drawn
-        sections or segments.
+        sections or segments. The two materials are always distinct instances.
     """
 
     # By default, no transparency
@@ -1024,7 +1081,8 @@ def create_materials(material_type,
 
         # Create the material
         material = nmv.shading.create_material(name='%s_color_%d' % (name, i), color=color,
-                                               material_type=material_type)
+                                               material_type=material_type,
+                                               parameters={'instance': i})
 
         # Append the material to the materials list
         materials_list.append(material)
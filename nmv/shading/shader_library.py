@@ -0,0 +1,192 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+
+# Blender imports
+import bpy
+
+
+####################################################################################################
+# @ShaderLibrary
+####################################################################################################
+class ShaderLibrary:
+    """A cache of the template materials of the NeuroMorphoVis shading library.
+
+    Every shader is loaded from its .blend file only once per session, and the new materials are
+    created by copying the node tree of the cached template instead of appending the file again.
+    The templates are kept with a fake user, so they are not removed when the scene is cleared.
+    """
+
+    # The name of the material in every .blend file of the library
+    LIBRARY_MATERIAL = 'material'
+
+    # The prefix of the names of the templates in the blend data
+    TEMPLATE_PREFIX = 'nmv_shader_template_'
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # Shader name -> template material
+        self.templates = dict()
+
+        # Statistics
+        self.loads = 0
+        self.copies = 0
+
+    ################################################################################################
+    # @get_shader_file
+    ################################################################################################
+    @staticmethod
+    def get_shader_file(shader_name):
+        """Gets the path to the .blend file of a shader in the library.
+
+        :param shader_name:
+            The name of the shader file in the library.
+        :return:
+            The path to the .blend file.
+        """
+
+        return '%s/shaders/%s.blend' % (os.path.dirname(os.path.realpath(__file__)), shader_name)
+
+    ################################################################################################
+    # @is_valid
+    ################################################################################################
+    @staticmethod
+    def is_valid(template):
+        """Checks if a template still exists in the blend data.
+
+        :param template:
+            A template material.
+        :return:
+            True if the template can still be used, otherwise False.
+        """
+
+        try:
+            return bpy.data.materials.get(template.name) == template
+        except ReferenceError:
+            return False
+
+    ################################################################################################
+    # @load_template
+    ################################################################################################
+    def load_template(self,
+                      shader_name):
+        """Loads the template material of a shader from the library.
+
+        :param shader_name:
+            The name of the shader file in the library.
+        :return:
+            A reference to the template material.
+        """
+
+        # Load the material data-block directly without the overhead of the append operator
+        with bpy.data.libraries.load(self.get_shader_file(shader_name), link=False) as \
+                (data_from, data_to):
+            data_to.materials = [self.LIBRARY_MATERIAL]
+
+        template = data_to.materials[0]
+        template.name = self.TEMPLATE_PREFIX + shader_name
+        template.use_fake_user = True
+
+        self.templates[shader_name] = template
+        self.loads += 1
+        return template
+
+    ################################################################################################
+    # @get_template
+    ################################################################################################
+    def get_template(self,
+                     shader_name):
+        """Gets the template material of a shader, and loads it if it is not loaded yet.
+
+        :param shader_name:
+            The name of the shader file in the library.
+        :return:
+            A reference to the template material.
+        """
+
+        template = self.templates.get(shader_name)
+        if template is None or not self.is_valid(template):
+            template = self.load_template(shader_name)
+        return template
+
+    ################################################################################################
+    # @create_material
+    ################################################################################################
+    def create_material(self,
+                        shader_name):
+        """Creates a new material from the template of a shader.
+
+        :param shader_name:
+            The name of the shader file in the library.
+        :return:
+            A reference to the new material, that must be renamed by the caller.
+        """
+
+        material = self.get_template(shader_name).copy()
+        material.use_fake_user = False
+
+        self.copies += 1
+        return material
+
+    ################################################################################################
+    # @clear
+    ################################################################################################
+    def clear(self):
+        """Removes all the templates from the blend data and clears the cache.
+        """
+
+        for template in self.templates.values():
+            if self.is_valid(template):
+                bpy.data.materials.remove(template, do_unlink=True)
+
+        self.templates.clear()
+        self.loads = 0
+        self.copies = 0
+
+
+# A single library that is shared by all the materials
+shader_library = ShaderLibrary()
+
+
+####################################################################################################
+# @get_shader_library
+####################################################################################################
+def get_shader_library():
+    """Gets the shader library that is shared by all the materials.
+
+    :return:
+        A reference to the shared ShaderLibrary.
+    """
+
+    return shader_library
+
+
+####################################################################################################
+# @clear_shader_library
+####################################################################################################
+def clear_shader_library():
+    """Clears the shared shader library.
+    """
+
+    shader_library.clear()
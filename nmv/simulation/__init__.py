@@ -16,6 +16,11 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .simulation_mesh_renderer import *
-from .colormap import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'simulation_mesh_renderer',
+    'colormap',
+))
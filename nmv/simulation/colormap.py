@@ -19,6 +19,7 @@
 from mathutils import Vector
 
 # Internal imports
+import nmv.enums
 import nmv.shading
 
 
@@ -105,7 +106,9 @@ def create_colormap_materials(colormap):
     # A list that will contain all the materials
     materials = list()
     for i in range(number_materials):
-        materials.append(nmv.shading.create_lambert_ward_material('color_%d' % i, colormap[i]))
+        materials.append(nmv.shading.create_material(
+            name='color_%d' % i, color=colormap[i],
+            material_type=nmv.enums.Shader.LAMBERT_WARD))
 
     # Return the materials list
     return materials
@@ -95,8 +95,9 @@ class SimulationMeshRender:
         cmap = matplotlib.cm.get_cmap(self.colormap, self.colormap_resolution)
 
         for i in range(self.colormap_resolution):
-            self.materials.append(nmv.shading.create_lambert_ward_material(
-                name='color_%d' % i, color=Vector((cmap(i)[0], cmap(i)[1], cmap(i)[2]))))
+            self.materials.append(nmv.shading.create_material(
+                name='color_%d' % i, color=Vector((cmap(i)[0], cmap(i)[1], cmap(i)[2])),
+                material_type=nmv.enums.Shader.LAMBERT_WARD))
 
     ################################################################################################
     # @assign_colors_to_faces_based_on_index
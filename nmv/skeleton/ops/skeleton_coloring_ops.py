@@ -41,7 +41,8 @@ def create_skeleton_materials(name,
         The code of the given colors.
     :return:
         A list of two elements (different or even same colors) where we can apply later to the
-        drawn sections or segments.
+        drawn sections or segments. The two materials are always distinct instances, even if
+        they have the same color, to keep the alternating sections separable.
     """
 
     # A list of the created materials
@@ -61,7 +62,8 @@ def create_skeleton_materials(name,
 
             # Create the material and append it to the list
             material = nmv.shading.create_material(
-                name='%s_random_%d' % (name, i), color=color_vector, material_type=material_type)
+                name='%s_random_%d' % (name, i), color=color_vector, material_type=material_type,
+                parameters={'instance': i})
             materials_list.append(material)
 
     # If set to black / white
@@ -69,12 +71,14 @@ def create_skeleton_materials(name,
 
         # Create the material and append it to the list
         material = nmv.shading.create_material(
-            name='%s_bw_0' % name, color=nmv.consts.Color.MATT_BLACK , material_type=material_type)
+            name='%s_bw_0' % name, color=nmv.consts.Color.MATT_BLACK , material_type=material_type,
+            parameters={'instance': 0})
         materials_list.append(material)
 
         # Create the material and append it to the list
         material = nmv.shading.create_material(
-            name='%s_bw_1' % name, color=nmv.consts.Color.WHITE, material_type=material_type)
+            name='%s_bw_1' % name, color=nmv.consts.Color.WHITE, material_type=material_type,
+            parameters={'instance': 1})
         materials_list.append(material)
 
     # Specified colors
@@ -83,7 +87,8 @@ def create_skeleton_materials(name,
 
             # Create the material and append it to the list
             material = nmv.shading.create_material(
-                name='%s_color_%d' % (name, i), color=color, material_type=material_type)
+                name='%s_color_%d' % (name, i), color=color, material_type=material_type,
+                parameters={'instance': i})
             materials_list.append(material)
 
     # Return the list
@@ -21,6 +21,7 @@ import time
 
 # Blender imports
 import bpy
+import bmesh
 from mathutils import Vector, Matrix
 
 # Internal imports
@@ -681,6 +682,105 @@ def connect_arbor_to_soft_body_soma(soma_mesh,
     return soma_mesh
 
 
+####################################################################################################
+# @connect_arbors_to_soft_body_soma
+####################################################################################################
+def connect_arbors_to_soft_body_soma(soma_mesh,
+                                     arbors):
+    """Connects the root sections of a list of arbors to the soma in a single pass.
+
+    This function is equivalent to calling connect_arbor_to_soft_body_soma for every arbor, but
+    the faces of the soma are indexed once and the target faces of all the arbors are resolved
+    in a single batched query. The arbors are then joined to the soma at once and all the bridges
+    are created in a single bmesh session, instead of joining and bridging every arbor in the
+    edit mode.
+
+    :param soma_mesh:
+        The mesh object of the soma.
+    :param arbors:
+        A list of arbors, i.e. root sections, that have their meshes reconstructed.
+    :return:
+        A reference to the soma mesh after the connection.
+    """
+
+    # Lazy import, numpy is only needed by the bulk functions
+    import numpy
+
+    # Only the valid arbors that are connected to the soma
+    connected_arbors = list()
+    for arbor in arbors:
+        if arbor is None:
+            continue
+        if not arbor.connected_to_soma:
+            nmv.logger.further_detail('%s is not connected to the soma' % arbor.label)
+            continue
+        connected_arbors.append(arbor)
+    if len(connected_arbors) == 0:
+        return soma_mesh
+
+    # The intersection points between the soma and the arbors
+    intersection_points = list()
+    for arbor in connected_arbors:
+        branch_direction = arbor.samples[0].point.normalized()
+        intersection_points.append(arbor.samples[0].point - 0.75 * branch_direction)
+
+    # Resolve the faces of the soma for all the arbors at once, every arbor gets its own face
+    soma_faces_indices = nmv.mesh.ops.get_indices_of_nearest_faces_to_points(
+        soma_mesh, intersection_points, unique=True)
+    number_soma_faces = len(soma_mesh.data.polygons)
+
+    # The nearest face of every arbor mesh to its starting point, in the space of the soma, since
+    # the meshes are joined into the soma
+    soma_inverse_matrix = soma_mesh.matrix_world.inverted()
+    arbors_faces_centers = list()
+    for arbor in connected_arbors:
+        centers = nmv.mesh.ops.get_faces_centers(arbor.mesh)
+        point = numpy.array(arbor.samples[0].point[:])
+        face_center = centers[numpy.argmin(((centers - point) ** 2).sum(axis=1))]
+        arbors_faces_centers.append(
+            soma_inverse_matrix @ arbor.mesh.matrix_world @ Vector(face_center.tolist()))
+
+    # Join all the arbors to the soma in a single operation, the soma faces remain first
+    soma_mesh = nmv.mesh.ops.join_mesh_objects(
+        [soma_mesh] + [arbor.mesh for arbor in connected_arbors], name=soma_mesh.name)
+
+    # Find the faces of the arbors after the join among the faces that follow the soma faces
+    centers = nmv.mesh.ops.get_faces_centers(soma_mesh)[number_soma_faces:]
+    arbors_faces_indices = list()
+    for face_center in arbors_faces_centers:
+        distances = ((centers - numpy.array(face_center[:])) ** 2).sum(axis=1)
+        arbors_faces_indices.append(number_soma_faces + int(numpy.argmin(distances)))
+
+    # Bridge all the pairs of faces in a single bmesh session
+    bmesh_object = bmesh.new()
+    bmesh_object.from_mesh(soma_mesh.data)
+    bmesh_object.faces.ensure_lookup_table()
+
+    # Get the references of the faces before deleting any of them, since the indices change
+    faces_pairs = [(bmesh_object.faces[soma_face_index], bmesh_object.faces[arbor_face_index])
+                   for soma_face_index, arbor_face_index in zip(soma_faces_indices,
+                                                                arbors_faces_indices)
+                   if soma_face_index is not None]
+
+    for soma_face, arbor_face in faces_pairs:
+
+        # Remove the two faces, and keep their boundaries as two edge loops
+        edges = soma_face.edges[:] + arbor_face.edges[:]
+        bmesh.ops.delete(bmesh_object, geom=[soma_face, arbor_face], context='FACES_ONLY')
+
+        # Bridge the edge loops, and smooth the connection
+        bridge = bmesh.ops.bridge_loops(bmesh_object, edges=edges)
+        for face in bridge['faces']:
+            face.smooth = True
+
+    # Update the soma mesh
+    bmesh_object.to_mesh(soma_mesh.data)
+    bmesh_object.free()
+    soma_mesh.data.update()
+
+    return soma_mesh
+
+
 ####################################################################################################
 # @connect_arbor_to_meta_ball_soma
 # TODO: Remove this function.
@@ -23,6 +23,8 @@ from mathutils import Vector, Matrix
 
 # Internal imports
 import nmv.bbox
+import nmv.file
+import nmv.geometry
 import nmv.skeleton
 
 
@@ -202,51 +204,14 @@ def get_transformation_matrix(blue_config,
 
     """
 
-    # Import BluePy
-    try:
-        import bluepy.v2
-    except ImportError:
-        print('ERROR: Cannot import [BluePy], please install it')
+    # Get the session of the circuit, the circuit is opened only once
+    session = nmv.file.get_circuit_session(blue_config)
+    if session is None:
         return None
 
-    # Loading a circuit
-    from bluepy.v2 import Circuit
-    circuit = Circuit(blue_config)
-
-    # Get the neuron
-    neuron = circuit.cells.get(int(gid))
-
-    # Translation
-    translation = Vector((neuron['x'], neuron['y'], neuron['z']))
-
-    # Orientation
-    o = neuron['orientation']
-    o0 = Vector((o[0][0], o[0][1], o[0][2]))
-    o1 = Vector((o[1][0], o[1][1], o[1][2]))
-    o2 = Vector((o[2][0], o[2][1], o[2][2]))
-
-    # Initialize the transformation matrix to I
-    transformation_matrix = Matrix()
-
-    transformation_matrix[0][0] = o0[0]
-    transformation_matrix[0][1] = o0[1]
-    transformation_matrix[0][2] = o0[2]
-    transformation_matrix[0][3] = translation[0]
-
-    transformation_matrix[1][0] = o1[0]
-    transformation_matrix[1][1] = o1[1]
-    transformation_matrix[1][2] = o1[2]
-    transformation_matrix[1][3] = translation[1]
-
-    transformation_matrix[2][0] = o2[0]
-    transformation_matrix[2][1] = o2[1]
-    transformation_matrix[2][2] = o2[2]
-    transformation_matrix[2][3] = translation[2]
-
-    transformation_matrix[2][0] = 0.0
-    transformation_matrix[2][1] = 0.0
-    transformation_matrix[2][2] = 0.0
-    transformation_matrix[2][3] = 1.0
+    # The orientation and the translation of the neuron in a single 4x4 matrix
+    matrix = session.get_transformation_matrices([int(gid)])[0]
+    transformation_matrix = Matrix(matrix.tolist())
 
     return transformation_matrix
 
@@ -18,9 +18,14 @@
 # System imports
 import os, copy, math
 
+# Blender imports
+from mathutils import Vector
+
 # Internal import
 import nmv.consts
+import nmv.enums
 import nmv.geometry
+import nmv
 import nmv.skeleton
 
 
@@ -154,6 +159,81 @@ def update_samples_indices_per_morphology(morphology_object,
             update_samples_indices_per_arbor_globally(arbor, samples_global_morphology_index)
 
 
+####################################################################################################
+# @get_section_profile
+####################################################################################################
+def get_section_profile(section):
+    """Gets the points and radii of the samples of a section as arrays.
+
+    :param section:
+        A given section.
+    :return:
+        An Nx3 array of points and an array of N radii.
+    """
+
+    import numpy
+
+    points = numpy.array([sample.point[:] for sample in section.samples], dtype=numpy.float64)
+    radii = numpy.array([sample.radius for sample in section.samples], dtype=numpy.float64)
+    return points, radii
+
+
+####################################################################################################
+# @set_section_profile
+####################################################################################################
+def set_section_profile(section,
+                        points,
+                        radii):
+    """Rebuilds the samples list of a section at once from a resampled profile.
+
+    The first and last samples of the section are kept intact, and the new samples in between
+    are auxiliary samples with an index of -1 before the samples are re-ordered.
+
+    :param section:
+        A given section.
+    :param points:
+        An Mx3 array of points, where the first and last points are those of the section.
+    :param radii:
+        An array of M radii.
+    """
+
+    first_sample = section.samples[0]
+    last_sample = section.samples[-1]
+    sample_type = first_sample.type
+
+    samples = [first_sample]
+    for point, radius in zip(points[1:-1].tolist(), radii[1:-1].tolist()):
+        samples.append(nmv.skeleton.Sample(
+            point=Vector(point), radius=radius, index=-1, section=section, type=sample_type))
+    samples.append(last_sample)
+    section.samples = samples
+
+    # After resampling the section, update the logical indexes of the samples
+    section.reorder_samples()
+
+
+####################################################################################################
+# @resample_section_profile
+####################################################################################################
+def resample_section_profile(section,
+                             mode,
+                             sampling_step=1.0):
+    """Resamples a section in a single pass using the arc length and radius profile of the section.
+
+    :param section:
+        A given section to resample, with at least two samples.
+    :param mode:
+        The resampling mode, one of the nmv.geometry.RESAMPLING_* modes.
+    :param sampling_step:
+        The sampling step of the fixed-step mode.
+    """
+
+    points, radii = get_section_profile(section)
+    points, radii = nmv.geometry.resample_poly_line_profile(
+        points=points, radii=radii, mode=mode, sampling_step=sampling_step)
+    set_section_profile(section, points, radii)
+
+
 ####################################################################################################
 # @resample_section_at_fixed_step
 ####################################################################################################
@@ -181,71 +261,9 @@ def resample_section_at_fixed_step(section,
                          (section.get_type_string(), section.index))
         return
 
-    # If the section length is less than the sampling step, then adaptively resample it
-    if nmv.skeleton.compute_section_length(section=section) < sampling_step:
-
-        # Get a good sampling step that would match this small section
-        section_length = nmv.skeleton.compute_section_length(section=section)
-        section_number_samples = len(section.samples)
-        section_step = section_length / section_number_samples
-
-        # Resample the section at this sampling step
-        resample_section_at_fixed_step(section=section, sampling_step=section_step)
-        return
-
-    # Sample index
-    i = 0
-
-    # Just keep moving along the section till you hit the last section
-    while True:
-
-        # Break if we reach the last sample
-        if i >= len(section.samples) - 1:
-            break
-
-        # Compute the distance between the current sample and the next one
-        distance = (section.samples[i + 1].point - section.samples[i].point).length
-
-        # If the distance is less than the resampling step, then remove this sample  at [i + 1]
-        if distance < sampling_step:
-
-            if i >= len(section.samples) - 2:
-                break
-
-            # Remove the sample
-            section.samples.remove(section.samples[i + 1])
-
-            # Proceed to the next sample
-            continue
-
-        # If the sample is at a greater step, then add a new sample exactly at the current step
-        else:
-
-            # Compute the auxiliary sample radius based on the previous and next samples
-            radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
-
-            # Compute the direction
-            direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
-
-            # Compute the auxiliary sample point, use epsilon for floating point comparison
-            point = section.samples[i].point + (direction * sampling_step)
-
-            # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-            auxiliary_sample = nmv.skeleton.Sample(
-                point=point, radius=radius, index=-1, section=section, type=section.samples[i].type)
-
-            # Update the samples list
-            section.samples.insert(i + 1, auxiliary_sample)
-
-            # Move to the nex sample
-            i += 1
-
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
-
-    # After resampling the section, update the logical indexes of the samples
-    section.reorder_samples()
+    # Place the samples along the section at the given step
+    resample_section_profile(section=section, mode=nmv.geometry.RESAMPLING_FIXED_STEP,
+                             sampling_step=sampling_step)
 
 
 ####################################################################################################
@@ -281,63 +299,8 @@ def resample_section_adaptively(section):
     # The section has more than two samples, can be resampled
     else:
 
-        # Sample index
-        i = 0
-
-        # Just keep moving along the section till you hit the last section
-        while True:
-
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
-
-            # Compute the distance between the current sample and the next one
-            distance = (section.samples[i + 1].point - section.samples[i].point).length
-
-            # Get the extent of the sample, where no other samples should be located
-            extent = section.samples[i].radius
-
-            # If the next sample is located within the extent of this sample, then remove it
-            if distance < extent:
-
-                if i >= len(section.samples) - 2:
-                    break
-
-                # Remove the sample
-                section.samples.remove(section.samples[i + 1])
-
-                # Proceed to the next sample
-                continue
-
-            # If the sample is at a greater step, then add a new sample exactly at the current step
-            else:
-
-                # Compute the auxiliary sample radius based on the previous and next samples
-                radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
-
-                # Compute the direction
-                direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
-
-                # Compute the auxiliary sample point, use epsilon for floating point comparison
-                point = section.samples[i].point + (direction * section.samples[i].radius)
-
-                # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-                auxiliary_sample = nmv.skeleton.Sample(
-                    point=point, radius=radius, index=-1, section=section,
-                    type=section.samples[i].type)
-
-                # Update the samples list
-                section.samples.insert(i + 1, auxiliary_sample)
-
-                # Move to the nex sample
-                i += 1
-
-                # Break if we reach the last sample
-                if i >= len(section.samples) - 1:
-                    break
-
-        # After resampling the section, update the logical indexes of the samples
-        section.reorder_samples()
+        # Place every sample at the radius of the previous one
+        resample_section_profile(section=section, mode=nmv.geometry.RESAMPLING_ADAPTIVE_PACKED)
 
 
 ####################################################################################################
@@ -373,64 +336,164 @@ def resample_section_adaptively_relaxed(section):
     # The section has more than two samples, can be resampled
     else:
 
-        # Sample index
-        i = 0
+        # Place every sample at the sum of its radius and the radius of the previous one
+        resample_section_profile(section=section, mode=nmv.geometry.RESAMPLING_ADAPTIVE_RELAXED)
 
-        # Just keep moving along the section till you hit the last section
-        while True:
 
-            # Break if we reach the last sample
-            if i >= len(section.samples) - 1:
-                break
+####################################################################################################
+# @get_morphology_sections
+####################################################################################################
+def get_morphology_sections(morphology):
+    """Gets a flat list of all the sections of all the arbors of a morphology.
 
-            # Compute the distance between the current sample and the next one
-            distance = (section.samples[i + 1].point - section.samples[i].point).length
+    :param morphology:
+        A given morphology.
+    :return:
+        A list of sections.
+    """
 
-            # Get the extent of the sample, where no other samples should be located
-            extent = section.samples[i + 1].radius + section.samples[i].radius
+    sections = list()
+    roots = list()
+    if morphology.has_apical_dendrites():
+        roots.extend(morphology.apical_dendrites)
+    if morphology.has_basal_dendrites():
+        roots.extend(morphology.basal_dendrites)
+    if morphology.has_axons():
+        roots.extend(morphology.axons)
 
-            # If the next sample is located within the extent of this sample, then remove it
-            if distance < extent:
+    stack = list(reversed(roots))
+    while len(stack) > 0:
+        section = stack.pop()
+        sections.append(section)
+        stack.extend(reversed(section.children))
+    return sections
 
-                if i >= len(section.samples) - 2:
-                    break
 
-                # Remove the sample
-                section.samples.remove(section.samples[i + 1])
+####################################################################################################
+# @resample_morphology_sections
+####################################################################################################
+def resample_morphology_sections(morphology,
+                                 resampling_method,
+                                 sampling_step=1.0):
+    """Resamples all the sections of a morphology in bulk.
+
+    The profiles of all the sections are gathered into concatenated arrays once. The fixed-step
+    resampling of all the sections is then computed with array operations at once, and the
+    adaptive resampling is computed in a single pass per section. Finally, the samples list of
+    every section is rebuilt once.
+
+    :param morphology:
+        A given morphology.
+    :param resampling_method:
+        The resampling method, nmv.enums.Skeleton.Resampling.
+    :param sampling_step:
+        The sampling step of the fixed-step resampling.
+    """
 
-                # Proceed to the next sample
-                continue
+    import numpy
 
-            # If the sample is at a greater step, then add a new sample exactly at the current step
-            else:
+    # Map the method to a resampling mode and the minimum number of samples of a section
+    if resampling_method == nmv.enums.Skeleton.Resampling.FIXED_STEP:
+        mode, minimum_samples = nmv.geometry.RESAMPLING_FIXED_STEP, 2
+    elif resampling_method == nmv.enums.Skeleton.Resampling.ADAPTIVE_PACKED:
+        mode, minimum_samples = nmv.geometry.RESAMPLING_ADAPTIVE_PACKED, 3
+    elif resampling_method == nmv.enums.Skeleton.Resampling.ADAPTIVE_RELAXED:
+        mode, minimum_samples = nmv.geometry.RESAMPLING_ADAPTIVE_RELAXED, 3
+    else:
+        return
 
-                # Compute the auxiliary sample radius based on the previous and next samples
-                radius = (section.samples[i + 1].radius + section.samples[i].radius) / 2.0
+    # Only the sections that have enough samples can be resampled
+    sections = [section for section in get_morphology_sections(morphology)
+                if len(section.samples) >= minimum_samples]
+    if len(sections) == 0:
+        return
 
-                # Compute the direction
-                direction = (section.samples[i + 1].point - section.samples[i].point).normalized()
+    # Gather the profiles of all the sections
+    samples = [sample for section in sections for sample in section.samples]
+    points = numpy.array([sample.point[:] for sample in samples], dtype=numpy.float64)
+    radii = numpy.array([sample.radius for sample in samples], dtype=numpy.float64)
+    offsets = numpy.cumsum([0] + [len(section.samples) for section in sections])
 
-                # Compute the auxiliary sample point, use epsilon for floating point comparison
-                point = section.samples[i].point + (direction * extent)
+    # Resample
+    if mode == nmv.geometry.RESAMPLING_FIXED_STEP:
+        points, radii, offsets = nmv.geometry.resample_poly_line_profiles_at_fixed_step(
+            points=points, radii=radii, offsets=offsets, sampling_step=sampling_step)
+    else:
+        profiles = [nmv.geometry.resample_poly_line_profile(
+            points=points[offsets[i]:offsets[i + 1]], radii=radii[offsets[i]:offsets[i + 1]],
+            mode=mode) for i in range(len(sections))]
+        points = numpy.concatenate([profile[0] for profile in profiles])
+        radii = numpy.concatenate([profile[1] for profile in profiles])
+        offsets = numpy.cumsum([0] + [len(profile[1]) for profile in profiles])
 
-                # Add the auxiliary sample, the index of the sample is set to -1 (auxiliary sample)
-                auxiliary_sample = nmv.skeleton.Sample(
-                    point=point, radius=radius, index=-1, section=section,
-                    type=section.samples[i].type)
+    # Rebuild the samples lists
+    for i, section in enumerate(sections):
+        set_section_profile(section, points[offsets[i]:offsets[i + 1]],
+                            radii[offsets[i]:offsets[i + 1]])
 
-                # Update the samples list
-                section.samples.insert(i + 1, auxiliary_sample)
 
-                # Move to the nex sample
-                i += 1
+####################################################################################################
+# @simplify_morphology_sections
+####################################################################################################
+def simplify_morphology_sections(morphology,
+                                 simplification_method,
+                                 tolerance,
+                                 radius_tolerance):
+    """Simplifies all the sections of a morphology in bulk, while bounding the positional and
+    radial deviations of the removed samples from the simplified skeleton.
+
+    The profiles of all the sections are gathered into concatenated arrays once and simplified
+    with array operations at once. The first and last samples of every section are always kept,
+    so the connectivity of the skeleton is not affected.
+
+    :param morphology:
+        A given morphology.
+    :param simplification_method:
+        The simplification method, nmv.enums.Skeleton.Simplification.
+    :param tolerance:
+        The maximum positional deviation of a removed sample.
+    :param radius_tolerance:
+        The maximum radial deviation of a removed sample.
+    :return:
+        A boolean array, True for the kept samples of all the sections in the order of
+        get_morphology_sections, or None if the morphology is not simplified.
+    """
 
-                # Break if we reach the last sample
-                if i >= len(section.samples) - 1:
-                    break
+    import numpy
 
-        # After resampling the section, update the logical indexes of the samples
+    # Map the method to a simplification method of the profiles
+    if simplification_method == nmv.enums.Skeleton.Simplification.DOUGLAS_PEUCKER:
+        method = nmv.geometry.SIMPLIFICATION_DOUGLAS_PEUCKER
+    elif simplification_method == nmv.enums.Skeleton.Simplification.VISVALINGAM:
+        method = nmv.geometry.SIMPLIFICATION_VISVALINGAM
+    else:
+        return None
+
+    sections = get_morphology_sections(morphology)
+    if len(sections) == 0:
+        return None
+
+    # Gather the profiles of all the sections
+    samples = [sample for section in sections for sample in section.samples]
+    points = numpy.array([sample.point[:] for sample in samples], dtype=numpy.float64)
+    radii = numpy.array([sample.radius for sample in samples], dtype=numpy.float64)
+    offsets = numpy.cumsum([0] + [len(section.samples) for section in sections])
+
+    # Simplify
+    keep = nmv.geometry.simplify_poly_line_profiles(
+        points=points, radii=radii, offsets=offsets, tolerance=tolerance,
+        radius_tolerance=radius_tolerance, method=method)
+
+    # Rebuild the samples lists of the simplified sections only
+    for i, section in enumerate(sections):
+        section_keep = keep[offsets[i]:offsets[i + 1]]
+        if section_keep.all():
+            continue
+        section.samples = [sample for sample, kept in zip(section.samples, section_keep) if kept]
         section.reorder_samples()
 
+    return keep
+
 
 ####################################################################################################
 # @resample_section_based_on_smallest_segment
@@ -15,10 +15,16 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .sample import *
-from .section import *
-from .soma import *
-from .morphology import *
-from .spine import *
-from .random_spine import *
-from .spine_morphology import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
+
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'sample',
+    'section',
+    'soma',
+    'morphology',
+    'spine',
+    'random_spine',
+    'spine_morphology',
+))
@@ -15,13 +15,20 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .colors import *
-from .parser import *
-from .parser import *
-from .installation import *
-from .std_output import *
-from .time_line import *
-from .timer import *
-from .version import *
-from .system import *
+# Internal imports
+from nmv.utilities.lazy_imports import lazy_package
 
+# The submodules are only imported on the first access of their names
+__getattr__, __dir__ = lazy_package(__name__, (
+    'colors',
+    'parser',
+    'installation',
+    'std_output',
+    'progress',
+    'time_line',
+    'timer',
+    'version',
+    'system',
+    'jobs',
+    'pipeline',
+))
@@ -0,0 +1,469 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import time
+import types
+import threading
+
+
+# The states of a job
+JOB_PENDING = 'PENDING'
+JOB_RUNNING = 'RUNNING'
+JOB_FINISHED = 'FINISHED'
+JOB_CANCELLED = 'CANCELLED'
+JOB_FAILED = 'FAILED'
+
+
+####################################################################################################
+# @JobStep
+####################################################################################################
+class JobStep:
+    """A single step of a job.
+
+    Background steps run in a worker thread and must not access the Blender API. Main-thread
+    steps run on the main thread, and if their functions are generators, they are advanced in time
+    slices, where every yielded value is the fraction of the step that is done.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 label,
+                 function,
+                 args,
+                 background):
+        """Constructor
+
+        :param label:
+            The label of the step, used to access its result.
+        :param function:
+            The function of the step.
+        :param args:
+            The arguments of the function.
+        :param background:
+            If True, the step runs in a worker thread, otherwise on the main thread.
+        """
+
+        # Step data
+        self.label = label
+        self.function = function
+        self.args = args
+        self.background = background
+
+        # A running generator of a main-thread step
+        self.generator = None
+
+        # The worker thread of a background step
+        self.thread = None
+
+        # The result or the exception of the worker thread
+        self.thread_result = None
+        self.thread_error = None
+
+        # The fraction of the step that is done
+        self.progress = 0.0
+
+    ################################################################################################
+    # @run_in_thread
+    ################################################################################################
+    def run_in_thread(self):
+        """Runs the function of a background step and keeps its result or its exception.
+        """
+
+        try:
+            self.thread_result = self.function(*self.args)
+        except Exception as e:
+            self.thread_error = e
+
+
+####################################################################################################
+# @Job
+####################################################################################################
+class Job:
+    """A long-running operation split into steps that can run either synchronously, or
+    incrementally from a timer without blocking the user interface.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 name,
+                 time_slice=0.05):
+        """Constructor
+
+        :param name:
+            The name of the job, shown in the progress reports.
+        :param time_slice:
+            The maximum time in seconds that a main-thread step runs per tick.
+        """
+
+        # Job name
+        self.name = name
+
+        # Maximum time spent on the main thread per tick
+        self.time_slice = time_slice
+
+        # The steps and their results, indexed by their labels
+        self.steps = list()
+        self.results = dict()
+
+        # The index of the current step
+        self.current_step = 0
+
+        # Status
+        self.state = JOB_PENDING
+        self.message = ''
+        self.error = None
+
+        # The functions called when the job is finished, cancelled or failed
+        self.finished_callbacks = list()
+
+        # Cancellation is requested from the main thread and checked between the slices
+        self.cancellation_event = threading.Event()
+
+    ################################################################################################
+    # @add_background_step
+    ################################################################################################
+    def add_background_step(self,
+                            label,
+                            function,
+                            *args):
+        """Adds a step that runs in a worker thread, for example reading files or array work.
+
+        :param label:
+            The label of the step, used to access its result.
+        :param function:
+            The function of the step, it must not access the Blender API.
+        :param args:
+            The arguments of the function.
+        """
+
+        self.steps.append(JobStep(label, function, args, background=True))
+
+    ################################################################################################
+    # @add_main_thread_step
+    ################################################################################################
+    def add_main_thread_step(self,
+                             label,
+                             function,
+                             *args):
+        """Adds a step that runs on the main thread, for example creating Blender objects.
+
+        :param label:
+            The label of the step, used to access its result.
+        :param function:
+            The function of the step. If it is a generator, it is advanced in time slices and
+            its return value is the result of the step.
+        :param args:
+            The arguments of the function.
+        """
+
+        self.steps.append(JobStep(label, function, args, background=False))
+
+    ################################################################################################
+    # @add_finished_callback
+    ################################################################################################
+    def add_finished_callback(self,
+                              callback):
+        """Adds a function that is called with the job when it is finished, cancelled or failed.
+
+        :param callback:
+            A function that takes the job as its only argument.
+        """
+
+        self.finished_callbacks.append(callback)
+
+    ################################################################################################
+    # @get_result
+    ################################################################################################
+    def get_result(self,
+                   label):
+        """Gets the result of a step that has been already executed.
+
+        :param label:
+            The label of the step.
+        :return:
+            The result of the step, or None if the step has not been executed.
+        """
+
+        return self.results.get(label, None)
+
+    ################################################################################################
+    # @cancel
+    ################################################################################################
+    def cancel(self):
+        """Requests the cancellation of the job.
+
+        A running background step is not interrupted, but its result is discarded.
+        """
+
+        self.cancellation_event.set()
+
+    ################################################################################################
+    # @is_cancelled
+    ################################################################################################
+    def is_cancelled(self):
+        """Checks if the cancellation of the job has been requested.
+
+        :return:
+            True if the job is cancelled, otherwise False.
+        """
+
+        return self.cancellation_event.is_set()
+
+    ################################################################################################
+    # @is_running
+    ################################################################################################
+    def is_running(self):
+        """Checks if the job is still running.
+
+        :return:
+            True if the job is pending or running, otherwise False.
+        """
+
+        return self.state in [JOB_PENDING, JOB_RUNNING]
+
+    ################################################################################################
+    # @get_progress
+    ################################################################################################
+    def get_progress(self):
+        """Gets the fraction of the job that is done.
+
+        :return:
+            The progress of the job, between 0.0 and 1.0.
+        """
+
+        if len(self.steps) == 0 or self.state == JOB_FINISHED:
+            return 1.0
+
+        step_progress = 0.0
+        if self.current_step < len(self.steps):
+            step_progress = self.steps[self.current_step].progress
+        return min(1.0, (self.current_step + step_progress) / len(self.steps))
+
+    ################################################################################################
+    # @finish
+    ################################################################################################
+    def finish(self,
+               state,
+               error=None):
+        """Sets the final state of the job and calls the finished callbacks.
+
+        The generator of an interrupted main-thread step is closed, so its cleanup code runs.
+
+        :param state:
+            The final state of the job.
+        :param error:
+            The exception that made the job fail, if any.
+        """
+
+        if self.current_step < len(self.steps):
+            generator = self.steps[self.current_step].generator
+            if generator is not None:
+                generator.close()
+
+        self.state = state
+        self.error = error
+        if state == JOB_FINISHED:
+            self.message = '%s: Done' % self.name
+        elif state == JOB_CANCELLED:
+            self.message = '%s: Cancelled' % self.name
+        else:
+            self.message = '%s: Failed [%s]' % (self.name, str(error))
+
+        for callback in self.finished_callbacks:
+            callback(self)
+
+    ################################################################################################
+    # @complete_step
+    ################################################################################################
+    def complete_step(self,
+                      step,
+                      result):
+        """Stores the result of a step and moves to the next one.
+
+        :param step:
+            The completed step.
+        :param result:
+            The result of the step.
+        """
+
+        self.results[step.label] = result
+        step.progress = 1.0
+        self.current_step += 1
+
+    ################################################################################################
+    # @advance_main_thread_step
+    ################################################################################################
+    def advance_main_thread_step(self,
+                                 step,
+                                 deadline):
+        """Advances a main-thread step until it is done or the deadline is reached.
+
+        :param step:
+            The current step.
+        :param deadline:
+            The time at which the control must be returned to the caller, or None to run the
+            step to its end.
+        :return:
+            True if the step is done, otherwise False.
+        """
+
+        # Call the function for the first time
+        if step.generator is None:
+            result = step.function(*step.args)
+
+            # A plain function is done in a single call
+            if not isinstance(result, types.GeneratorType):
+                self.complete_step(step, result)
+                return True
+            step.generator = result
+
+        # Advance the generator slice by slice
+        while True:
+            try:
+                step_progress = next(step.generator)
+            except StopIteration as stop:
+                self.complete_step(step, stop.value)
+                return True
+
+            if step_progress is not None:
+                step.progress = float(step_progress)
+
+            if self.is_cancelled():
+                return False
+            if deadline is not None and time.time() >= deadline:
+                return False
+
+    ################################################################################################
+    # @tick
+    ################################################################################################
+    def tick(self):
+        """Advances the job by a single time slice, without blocking on the background steps.
+
+        This function must be called on the main thread, typically from a timer.
+
+        :return:
+            True if the job is still running and must be ticked again, otherwise False.
+        """
+
+        if not self.is_running():
+            return False
+        self.state = JOB_RUNNING
+
+        deadline = time.time() + self.time_slice
+        state = None
+        error = None
+        try:
+            while self.current_step < len(self.steps):
+
+                if self.is_cancelled():
+                    state = JOB_CANCELLED
+                    break
+
+                step = self.steps[self.current_step]
+                self.message = '%s: %s' % (self.name, step.label)
+
+                # Background steps are started once and then polled
+                if step.background:
+                    if step.thread is None:
+                        step.thread = threading.Thread(target=step.run_in_thread, daemon=True)
+                        step.thread.start()
+                    if step.thread.is_alive():
+                        return True
+                    if step.thread_error is not None:
+                        raise step.thread_error
+                    self.complete_step(step, step.thread_result)
+
+                # Main-thread steps run until the time slice is consumed
+                elif not self.advance_main_thread_step(step, deadline):
+                    return True
+
+                if time.time() >= deadline:
+                    break
+
+        except Exception as e:
+            state = JOB_FAILED
+            error = e
+
+        if state is None:
+            if self.current_step < len(self.steps):
+                return True
+            state = JOB_FINISHED
+
+        # The callbacks are called outside of the try, so a failing callback is not called twice
+        self.finish(state, error)
+        return False
+
+    ################################################################################################
+    # @run_synchronously
+    ################################################################################################
+    def run_synchronously(self):
+        """Runs all the steps of the job on the calling thread, for example in the command line
+        interface or for testing without Blender.
+
+        :return:
+            The final state of the job.
+        """
+
+        self.state = JOB_RUNNING
+        state = JOB_FINISHED
+        error = None
+        try:
+            while self.current_step < len(self.steps):
+
+                if self.is_cancelled():
+                    state = JOB_CANCELLED
+                    break
+
+                step = self.steps[self.current_step]
+                self.message = '%s: %s' % (self.name, step.label)
+                if step.background:
+                    self.complete_step(step, step.function(*step.args))
+                else:
+                    self.advance_main_thread_step(step, deadline=None)
+
+        except Exception as e:
+            state = JOB_FAILED
+            error = e
+
+        # The callbacks are called outside of the try, so a failing callback is not called twice
+        self.finish(state, error)
+        return self.state
+
+
+####################################################################################################
+# @run_generator
+####################################################################################################
+def run_generator(generator):
+    """Runs a generator that is used as an incremental main-thread step to its end, for the
+    callers that do not run it within a job.
+
+    :param generator:
+        A given generator, where every yielded value is the fraction of the work that is done.
+    :return:
+        The return value of the generator.
+    """
+
+    while True:
+        try:
+            next(generator)
+        except StopIteration as stop:
+            return stop.value
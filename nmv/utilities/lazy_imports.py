@@ -0,0 +1,310 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+import re
+import sys
+import importlib
+
+
+# The names defined at the top level of a module, i.e. functions, classes and global variables
+TOP_LEVEL_DEFINITION = re.compile(
+    r'^(?:def|class)\s+([A-Za-z]\w*)|^([A-Za-z]\w*)\s*(?::[^=\n]*)?=(?!=)', re.MULTILINE)
+
+# The relative star imports that re-export the names of another module of the same package
+RELATIVE_STAR_IMPORT = re.compile(r'^from\s+\.(\w+)\s+import\s+\*', re.MULTILINE)
+
+# The submodules listed in the __init__ of a lazy package
+LAZY_SUBMODULES = re.compile(r"^\s+'(\w+)',?\s*$", re.MULTILINE)
+
+# Marks a missing attribute, since None is a valid value
+MISSING = object()
+
+# The module-level __getattr__ (PEP 562) is only called from Python 3.7, i.e. not in Blender 2.79
+MODULE_GETATTR_SUPPORTED = sys.version_info >= (3, 7)
+
+
+####################################################################################################
+# @get_module_file_names
+####################################################################################################
+def get_module_file_names(directory,
+                          module_name,
+                          visited=None):
+    """Gets the public names that a module or a package defines, by scanning its source instead of
+    importing it.
+
+    The scan is approximate, a name that is not found by the scan is still found by importing the
+    submodules, see LazyPackage.search_attribute.
+
+    :param directory:
+        The directory of the parent package.
+    :param module_name:
+        The name of the module, or the sub-package, in the directory.
+    :param visited:
+        A set of the already scanned files to avoid cycles.
+    :return:
+        A list of the names in the order of their definition, and a list of the names that the
+        module only re-exports from its siblings or its submodules.
+    """
+
+    if visited is None:
+        visited = set()
+
+    # A module or a package
+    module_file = '%s/%s.py' % (directory, module_name)
+    if not os.path.isfile(module_file):
+        module_file = '%s/%s/__init__.py' % (directory, module_name)
+        if not os.path.isfile(module_file):
+            return list(), list()
+    if module_file in visited:
+        return list(), list()
+    visited.add(module_file)
+
+    with open(module_file, 'r', encoding='utf-8') as source_file:
+        source = source_file.read()
+
+    # The names that are re-exported from the siblings, or from the submodules of a package
+    imported_modules = RELATIVE_STAR_IMPORT.findall(source)
+
+    # The lazy packages list their submodules in a tuple of strings
+    if module_file.endswith('__init__.py'):
+        imported_modules.extend(LAZY_SUBMODULES.findall(source))
+
+    reexported_names = list()
+    module_directory = os.path.dirname(module_file)
+    for imported_module in imported_modules:
+        for imported_names in get_module_file_names(module_directory, imported_module, visited):
+            reexported_names.extend(imported_names)
+
+    # The names that are defined in the module itself
+    names = [definition[0] or definition[1] for definition in TOP_LEVEL_DEFINITION.findall(source)]
+    return names, reexported_names
+
+
+####################################################################################################
+# @LazyPackage
+####################################################################################################
+class LazyPackage:
+    """Loads the submodules of a package on the first access of their attributes.
+
+    This replaces a list of 'from .submodule import *' statements in the __init__ of a package.
+    The package exposes the same names, but a submodule is only imported when one of its names is
+    accessed for the first time, and therefore the heavy submodules, for example the ones that
+    need bpy or matplotlib, do not slow down or break the import of the light ones.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 package_name,
+                 submodules):
+        """Constructor
+
+        :param package_name:
+            The name of the package, i.e. __name__ in its __init__.
+        :param submodules:
+            A list of the names of the submodules, in the order of the original star imports.
+        """
+
+        # The package
+        self.package_name = package_name
+        self.directory = os.path.dirname(sys.modules[package_name].__file__)
+        self.submodules = list(submodules)
+
+        # Name -> submodule, built on the first access
+        self.index = None
+
+    ################################################################################################
+    # @get_index
+    ################################################################################################
+    def get_index(self):
+        """Gets the index that maps every public name to the submodule that defines it.
+
+        Similar to the star imports, the last submodule that defines a name wins. A name that a
+        submodule only re-exports is mapped to it if no other submodule defines that name, so
+        that accessing the name does not import the heavier module that re-exports it.
+
+        :return:
+            A dictionary of the names and the submodules.
+        """
+
+        if self.index is None:
+            self.index = dict()
+            reexports = dict()
+            for submodule in self.submodules:
+                names, reexported_names = get_module_file_names(self.directory, submodule)
+                for name in names:
+                    self.index[name] = submodule
+                for name in reexported_names:
+                    reexports.setdefault(name, submodule)
+            for name, submodule in reexports.items():
+                self.index.setdefault(name, submodule)
+        return self.index
+
+    ################################################################################################
+    # @import_submodule
+    ################################################################################################
+    def import_submodule(self,
+                         submodule):
+        """Imports a submodule of the package.
+
+        :param submodule:
+            The name of the submodule.
+        :return:
+            A reference to the imported submodule.
+        """
+
+        return importlib.import_module('%s.%s' % (self.package_name, submodule))
+
+    ################################################################################################
+    # @search_attribute
+    ################################################################################################
+    def search_attribute(self,
+                         name):
+        """Searches for an attribute that is not in the index by importing the submodules in order.
+
+        The submodules that cannot be imported are skipped, and their error is only raised if
+        the attribute is not found in any other submodule.
+
+        :param name:
+            The name of the attribute.
+        :return:
+            The value of the attribute.
+        """
+
+        import_error = None
+        for submodule in self.submodules:
+            try:
+                value = getattr(self.import_submodule(submodule), name, MISSING)
+            except ImportError as e:
+                import_error = import_error or e
+                continue
+            if value is not MISSING:
+                return value
+
+        if import_error is not None:
+            raise import_error
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.package_name, name))
+
+    ################################################################################################
+    # @get_attribute
+    ################################################################################################
+    def get_attribute(self,
+                      name):
+        """Gets an attribute of the package, importing the submodule that defines it if needed.
+
+        This function is the module-level __getattr__ of the package.
+
+        :param name:
+            The name of the attribute.
+        :return:
+            The value of the attribute.
+        """
+
+        # The star imports of the package resolve all the names
+        if name == '__all__':
+            return sorted(self.get_index().keys())
+
+        # Private and special names are never loaded
+        if name.startswith('_'):
+            raise AttributeError("module '%s' has no attribute '%s'" % (self.package_name, name))
+
+        # A submodule itself
+        if name in self.submodules:
+            return self.import_submodule(name)
+
+        # The submodule that defines the name, or a search over all the submodules
+        value = MISSING
+        submodule = self.get_index().get(name)
+        if submodule is not None:
+            value = getattr(self.import_submodule(submodule), name, MISSING)
+        if value is MISSING:
+            value = self.search_attribute(name)
+
+        # Cache the attribute in the package, as the star imports did
+        setattr(sys.modules[self.package_name], name, value)
+        return value
+
+    ################################################################################################
+    # @import_all_submodules
+    ################################################################################################
+    def import_all_submodules(self):
+        """Imports all the submodules of the package eagerly and copies their public names to the
+        package, exactly as the original star imports did.
+
+        This is the fallback for the Python versions that do not call the module-level
+        __getattr__ of a package.
+        """
+
+        package = sys.modules[self.package_name]
+        for submodule in self.submodules:
+            module = self.import_submodule(submodule)
+            names = getattr(module, '__all__', None)
+            if names is None:
+                names = [name for name in vars(module).keys() if not name.startswith('_')]
+            for name in names:
+                setattr(package, name, getattr(module, name))
+
+    ################################################################################################
+    # @get_names
+    ################################################################################################
+    def get_names(self):
+        """Gets the names of the package without importing its submodules.
+
+        This function is the module-level __dir__ of the package.
+
+        :return:
+            A sorted list of the names.
+        """
+
+        names = set(vars(sys.modules[self.package_name]).keys())
+        names.update(self.submodules)
+        names.update(self.get_index().keys())
+        return sorted(names)
+
+
+####################################################################################################
+# @lazy_package
+####################################################################################################
+def lazy_package(package_name,
+                 submodules):
+    """Makes a package load its submodules lazily.
+
+    Before Python 3.7, the module-level __getattr__ is never called, and therefore the
+    submodules are imported eagerly instead, as in the original star imports.
+
+    Usage, in the __init__ of a package:
+        from nmv.utilities.lazy_imports import lazy_package
+        __getattr__, __dir__ = lazy_package(__name__, (
+            'first_module',
+            'second_module',
+        ))
+
+    :param package_name:
+        The name of the package, i.e. __name__ in its __init__.
+    :param submodules:
+        A list of the names of the submodules, in the order of the original star imports.
+    :return:
+        The __getattr__ and __dir__ functions of the package.
+    """
+
+    package = LazyPackage(package_name, submodules)
+    if not MODULE_GETATTR_SUPPORTED:
+        package.import_all_submodules()
+    return package.get_attribute, package.get_names
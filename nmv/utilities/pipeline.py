@@ -0,0 +1,344 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import time
+import queue
+import threading
+
+# Internal imports
+from .progress import progress_reporter
+
+
+####################################################################################################
+# @PipelineItem
+####################################################################################################
+class PipelineItem:
+    """An item that flows through the stages of a pipeline.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 index,
+                 key):
+        """Constructor
+
+        :param index:
+            The index of the item in the input list.
+        :param key:
+            The input item, for example a morphology file or a GID.
+        """
+
+        # Input
+        self.index = index
+        self.key = key
+
+        # The result of the loading stage, or the exception that was raised while loading
+        self.data = None
+        self.error = None
+
+
+####################################################################################################
+# @Pipeline
+####################################################################################################
+class Pipeline:
+    """A bounded producer/consumer pipeline with three stages.
+
+    The loading stage runs in a pool of background threads that prepare the upcoming items while
+    the current one is processed on the calling (main) thread. The outputs that are submitted with
+    submit_output are written in a separate writer thread. Both queues are bounded, so the loaders
+    and the processing stage block when they are too far ahead of the next stage.
+
+    The loading and the writing functions run in background threads and must not access the
+    Blender API.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 load_function,
+                 process_function,
+                 queue_depth=2,
+                 number_loaders=1):
+        """Constructor
+
+        :param load_function:
+            A function that takes an input item and returns its loaded data.
+        :param process_function:
+            A function that takes the pipeline, an input item and its loaded data, and runs on the
+            calling thread.
+        :param queue_depth:
+            The maximum number of loaded items, and of pending outputs, that wait for the next
+            stage.
+        :param number_loaders:
+            The number of the loading threads.
+        """
+
+        # Stage functions
+        self.load_function = load_function
+        self.process_function = process_function
+
+        # Bounds
+        self.queue_depth = max(1, int(queue_depth))
+        self.number_loaders = max(1, int(number_loaders))
+
+        # Queues
+        self.input_queue = None
+        self.loaded_queue = None
+        self.output_queue = None
+
+        # Stops the loaders if the processing is interrupted
+        self.stop_event = threading.Event()
+
+        # The accumulated time of every stage, and the time the stages were blocked
+        self.timings = {'load': 0.0, 'process': 0.0, 'write': 0.0,
+                        'load_wait': 0.0, 'write_wait': 0.0, 'total': 0.0}
+
+        # Counters
+        self.counters = {'loaded': 0, 'processed': 0, 'written': 0,
+                         'load_failures': 0, 'process_failures': 0, 'write_failures': 0}
+
+        # Protects the counters that are updated by the background threads
+        self.lock = threading.Lock()
+
+    ################################################################################################
+    # @add_timing
+    ################################################################################################
+    def add_timing(self,
+                   stage,
+                   duration,
+                   counter=None):
+        """Adds a duration to the timing of a stage, and optionally increments a counter.
+
+        :param stage:
+            The name of the stage.
+        :param duration:
+            The duration in seconds.
+        :param counter:
+            The name of a counter to increment, if any.
+        """
+
+        with self.lock:
+            self.timings[stage] += duration
+            if counter is not None:
+                self.counters[counter] += 1
+
+    ################################################################################################
+    # @put_loaded_item
+    ################################################################################################
+    def put_loaded_item(self,
+                        item):
+        """Puts a loaded item in the queue of the processing stage. This function blocks while the
+        queue is full, unless the pipeline is stopped.
+
+        :param item:
+            A loaded item, or None to notify the end of a loader.
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                self.loaded_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    ################################################################################################
+    # @run_loader
+    ################################################################################################
+    def run_loader(self):
+        """The loop of a loading thread, it loads the items until the input queue is empty.
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                item = self.input_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            start = time.time()
+            try:
+                item.data = self.load_function(item.key)
+                self.add_timing('load', time.time() - start, 'loaded')
+            except Exception as e:
+                item.error = e
+                self.add_timing('load', time.time() - start, 'load_failures')
+
+            self.put_loaded_item(item)
+
+        # Notify the consumer that this loader is done
+        self.put_loaded_item(None)
+
+    ################################################################################################
+    # @run_writer
+    ################################################################################################
+    def run_writer(self):
+        """The loop of the writing thread, it writes the outputs until it receives None.
+        """
+
+        while True:
+            output = self.output_queue.get()
+            if output is None:
+                break
+
+            function, args = output
+            start = time.time()
+            try:
+                function(*args)
+                self.add_timing('write', time.time() - start, 'written')
+            except Exception as e:
+                print('ERROR: Pipeline output [%s] failed [%s]' % (function.__name__, str(e)))
+                self.add_timing('write', time.time() - start, 'write_failures')
+
+    ################################################################################################
+    # @submit_output
+    ################################################################################################
+    def submit_output(self,
+                      function,
+                      *args):
+        """Hands an output to the writing thread, this function blocks if the writer is behind.
+
+        If the pipeline is not running, the output is written immediately.
+
+        :param function:
+            The function that writes the output, it must not access the Blender API.
+        :param args:
+            The arguments of the function.
+        """
+
+        if self.output_queue is None:
+            function(*args)
+            return
+
+        start = time.time()
+        self.output_queue.put((function, args))
+        self.add_timing('write_wait', time.time() - start)
+
+    ################################################################################################
+    # @run
+    ################################################################################################
+    def run(self,
+            keys):
+        """Runs the pipeline on a list of input items.
+
+        :param keys:
+            A list of the input items, for example morphology files or GIDs.
+        :return:
+            A list of the input items that could not be loaded or processed.
+        """
+
+        pipeline_start = time.time()
+
+        # Fill the input queue
+        self.input_queue = queue.Queue()
+        for i, key in enumerate(keys):
+            self.input_queue.put(PipelineItem(i, key))
+        number_items = self.input_queue.qsize()
+        self.loaded_queue = queue.Queue(maxsize=self.queue_depth)
+        self.output_queue = queue.Queue(maxsize=self.queue_depth)
+        self.stop_event.clear()
+
+        # Start the stages
+        loaders = [threading.Thread(target=self.run_loader, daemon=True)
+                   for _ in range(self.number_loaders)]
+        writer = threading.Thread(target=self.run_writer, daemon=True)
+        for thread in loaders + [writer]:
+            thread.start()
+
+        failures = list()
+        finished_items = 0
+        try:
+            finished_loaders = 0
+            while finished_loaders < len(loaders):
+
+                # Wait for the next loaded item
+                start = time.time()
+                item = self.loaded_queue.get()
+                self.add_timing('load_wait', time.time() - start)
+
+                if item is None:
+                    finished_loaders += 1
+                    continue
+
+                # Show the progress of the items that reached the processing stage
+                finished_items += 1
+                progress_reporter.report('Batch', finished_items, number_items)
+
+                if item.error is not None:
+                    print('ERROR: Cannot load [%s], [%s]' % (str(item.key), str(item.error)))
+                    failures.append(item.key)
+                    progress_reporter.emit_event(
+                        'item', key=item.key, status='load_failed', error=str(item.error))
+                    continue
+
+                # Process the item on this thread
+                start = time.time()
+                try:
+                    self.process_function(self, item.key, item.data)
+                    self.add_timing('process', time.time() - start, 'processed')
+                    progress_reporter.emit_event(
+                        'item', key=item.key, status='processed', duration=time.time() - start)
+                except Exception as e:
+                    print('ERROR: Cannot process [%s], [%s]' % (str(item.key), str(e)))
+                    self.add_timing('process', time.time() - start, 'process_failures')
+                    failures.append(item.key)
+                    progress_reporter.emit_event(
+                        'item', key=item.key, status='process_failed', error=str(e))
+
+                # Release the loaded data before waiting for the next item
+                item.data = None
+
+        finally:
+
+            # Stop the loaders and flush the pending outputs
+            self.stop_event.set()
+            self.output_queue.put(None)
+            writer.join()
+            for thread in loaders:
+                thread.join()
+            self.output_queue = None
+            self.timings['total'] = time.time() - pipeline_start
+
+        # The summary of the run
+        progress_reporter.report('Batch', number_items, number_items, done=True)
+        progress_reporter.emit_event('batch', timings=self.timings, counters=self.counters,
+                                     failures=failures)
+
+        return failures
+
+    ################################################################################################
+    # @get_report
+    ################################################################################################
+    def get_report(self):
+        """Gets a report of the counters and the timings of the stages.
+
+        :return:
+            A list of strings, one line per stage.
+        """
+
+        return ['Loaded [%d], failed [%d] in [%.3f] seconds, processing waited [%.3f] seconds' %
+                (self.counters['loaded'], self.counters['load_failures'],
+                 self.timings['load'], self.timings['load_wait']),
+                'Processed [%d], failed [%d] in [%.3f] seconds' %
+                (self.counters['processed'], self.counters['process_failures'],
+                 self.timings['process']),
+                'Written [%d], failed [%d] in [%.3f] seconds, processing waited [%.3f] seconds' %
+                (self.counters['written'], self.counters['write_failures'],
+                 self.timings['write'], self.timings['write_wait']),
+                'Total [%.3f] seconds' % self.timings['total']]
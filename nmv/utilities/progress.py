@@ -0,0 +1,297 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import sys
+import json
+import time
+import threading
+
+
+# The environment variables that configure the reporting of the workers of a batch run, they are
+# inherited by the child processes, e.g. the Blender instances that run the CLI interfaces
+ENV_PROGRESS_INTERVAL = 'NMV_PROGRESS_INTERVAL'
+ENV_PROGRESS_EVENTS = 'NMV_PROGRESS_EVENTS'
+ENV_QUIET = 'NMV_QUIET'
+
+# The default minimum time between two progress updates of the same task, in seconds
+DEFAULT_PROGRESS_INTERVAL = 0.5
+
+
+####################################################################################################
+# @ProgressReporter
+####################################################################################################
+class ProgressReporter:
+    """Reports the progress of the loops and the events of a process.
+
+    The progress updates are rate-limited in time rather than printed at every iteration, and
+    optionally written as JSON lines to an events file for the batch runners to consume. When both
+    the text output and the events are disabled, a progress update returns immediately.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 interval=DEFAULT_PROGRESS_INTERVAL,
+                 quiet=False,
+                 events_file=None):
+        """Constructor
+
+        :param interval:
+            The minimum time between two progress updates of the same task, in seconds.
+        :param quiet:
+            If True, the progress is not printed to the standard output.
+        :param events_file:
+            The path to a file where the events are appended as JSON lines, '-' to write them to
+            the standard output, or None to disable the events. If the events are written to the
+            standard output, the progress is printed to the standard error instead.
+        """
+
+        self.interval = interval
+        self.quiet = quiet
+        self.events_file = events_file
+
+        # The opened events stream
+        self.events_stream = None
+
+        # Task message -> time of its last update
+        self.last_updates = dict()
+
+        # The events may be emitted from the threads of a pipeline
+        self.lock = threading.Lock()
+
+    ################################################################################################
+    # @configure
+    ################################################################################################
+    def configure(self,
+                  interval=None,
+                  quiet=None,
+                  events_file=None):
+        """Updates the configuration of the reporter, None keeps the current value.
+
+        :param interval:
+            The minimum time between two progress updates of the same task, in seconds.
+        :param quiet:
+            If True, the progress is not printed to the standard output.
+        :param events_file:
+            The path to the events file, or '-' for the standard output.
+        """
+
+        if interval is not None:
+            self.interval = interval
+        if quiet is not None:
+            self.quiet = quiet
+        if events_file is not None and events_file != self.events_file:
+            self.close()
+            self.events_file = events_file
+
+    ################################################################################################
+    # @is_enabled
+    ################################################################################################
+    def is_enabled(self):
+        """Checks if any progress output is enabled.
+
+        :return:
+            True if the progress is printed or emitted as events, otherwise False.
+        """
+
+        return not self.quiet or self.events_file is not None
+
+    ################################################################################################
+    # @get_text_stream
+    ################################################################################################
+    def get_text_stream(self):
+        """Gets the stream where the progress is printed, such that it never mixes with the JSON
+        lines of the events.
+
+        :return:
+            The standard error if the events are written to the standard output, otherwise the
+            standard output.
+        """
+
+        return sys.stderr if self.events_file == '-' else sys.stdout
+
+    ################################################################################################
+    # @emit_event
+    ################################################################################################
+    def emit_event(self,
+                   event,
+                   **fields):
+        """Writes a structured event as a single JSON line to the events file, if enabled.
+
+        :param event:
+            The type of the event, e.g. 'progress' or 'item'.
+        :param fields:
+            The data of the event, must be serializable to JSON.
+        """
+
+        if self.events_file is None:
+            return
+
+        record = {'event': event, 'time': time.time(), 'pid': os.getpid()}
+        record.update(fields)
+        line = json.dumps(record, default=str) + '\n'
+
+        with self.lock:
+            if self.events_stream is None:
+                if self.events_file == '-':
+                    self.events_stream = sys.__stdout__
+                else:
+                    # Line-buffered append, the events of several processes can share one file
+                    self.events_stream = open(self.events_file, 'a', buffering=1)
+            self.events_stream.write(line)
+
+    ################################################################################################
+    # @report
+    ################################################################################################
+    def report(self,
+               message,
+               current,
+               total,
+               done=False,
+               text=None):
+        """Reports the progress of a task, at most once per interval unless it is done.
+
+        :param message:
+            The message of the task, which identifies it.
+        :param current:
+            The current step.
+        :param total:
+            Total number of steps.
+        :param done:
+            Is it the last step or not?
+        :param text:
+            The text that is printed, by default '<message>: [i/n]', see get_text_stream.
+        """
+
+        if self.quiet and self.events_file is None:
+            return
+
+        # Rate-limit the intermediate updates, the reporter is shared by the worker threads
+        now = time.monotonic()
+        with self.lock:
+            if not done:
+                last_update = self.last_updates.get(message)
+                if last_update is not None and now - last_update < self.interval:
+                    return
+                self.last_updates[message] = now
+            else:
+                self.last_updates.pop(message, None)
+
+        if not self.quiet:
+            if text is None:
+                text = '%s: [%d/%d]' % (message, current, total)
+            text_stream = self.get_text_stream()
+            text_stream.write(text + ('\n' if done else '\r'))
+            text_stream.flush()
+
+        self.emit_event('progress', task=message.strip(), current=current, total=total, done=done)
+
+    ################################################################################################
+    # @close
+    ################################################################################################
+    def close(self):
+        """Closes the events file.
+        """
+
+        with self.lock:
+            if self.events_stream is not None and self.events_stream is not sys.__stdout__:
+                self.events_stream.close()
+            self.events_stream = None
+
+
+####################################################################################################
+# @create_progress_reporter_from_environment
+####################################################################################################
+def create_progress_reporter_from_environment():
+    """Creates a progress reporter that is configured by the environment of the process.
+
+    :return:
+        A new ProgressReporter.
+    """
+
+    try:
+        interval = float(os.environ.get(ENV_PROGRESS_INTERVAL, DEFAULT_PROGRESS_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_PROGRESS_INTERVAL
+
+    return ProgressReporter(interval=interval,
+                            quiet=os.environ.get(ENV_QUIET, '0') not in ('', '0'),
+                            events_file=os.environ.get(ENV_PROGRESS_EVENTS) or None)
+
+
+# A single reporter shared by all the modules of the process
+progress_reporter = create_progress_reporter_from_environment()
+
+
+####################################################################################################
+# @get_progress_reporter
+####################################################################################################
+def get_progress_reporter():
+    """Gets the progress reporter that is shared by all the modules of the process.
+
+    :return:
+        A reference to the shared ProgressReporter.
+    """
+
+    return progress_reporter
+
+
+####################################################################################################
+# @configure_progress
+####################################################################################################
+def configure_progress(interval=None,
+                       quiet=None,
+                       events_file=None):
+    """Configures the shared progress reporter, and exports the configuration to the environment
+    so that the child processes, e.g. the workers of a batch run, report in the same way.
+
+    :param interval:
+        The minimum time between two progress updates of the same task, in seconds.
+    :param quiet:
+        If True, the progress is not printed to the standard output.
+    :param events_file:
+        The path to the events file, or '-' for the standard output.
+    """
+
+    progress_reporter.configure(interval=interval, quiet=quiet, events_file=events_file)
+
+    if interval is not None:
+        os.environ[ENV_PROGRESS_INTERVAL] = str(interval)
+    if quiet is not None:
+        os.environ[ENV_QUIET] = '1' if quiet else '0'
+    if events_file is not None:
+        os.environ[ENV_PROGRESS_EVENTS] = os.path.abspath(events_file) \
+            if events_file != '-' else events_file
+
+
+####################################################################################################
+# @emit_event
+####################################################################################################
+def emit_event(event,
+               **fields):
+    """Writes a structured event to the events file of the shared progress reporter, if enabled.
+
+    :param event:
+        The type of the event.
+    :param fields:
+        The data of the event.
+    """
+
+    progress_reporter.emit_event(event, **fields)
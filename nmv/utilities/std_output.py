@@ -16,12 +16,35 @@
 ####################################################################################################
 
 # System imports
+import os
 import sys
+import atexit
 import tempfile
 
 stdout_hook = None
 stderr_hook = None
 
+# The output files are truncated when they are first opened by this process
+std_output_mode = 'w'
+
+
+####################################################################################################
+# @get_std_output_files
+####################################################################################################
+def get_std_output_files():
+    """Gets the paths of the files that receive the standard output and error streams of this
+    process while they are disabled.
+
+    The files are named after the process ID, so that the parallel workers on the same node do not
+    overwrite the output of each other.
+
+    :return:
+        The paths of the stdout and the stderr files.
+    """
+
+    prefix = '%s/nmv-%d' % (tempfile.gettempdir(), os.getpid())
+    return '%s-stdout.output' % prefix, '%s-stderr.output' % prefix
+
 
 ####################################################################################################
 # @disable_std_output
@@ -33,14 +56,24 @@ def disable_std_output():
     # Hooks the stdout until further notice
     global stdout_hook
     global stderr_hook
+    global std_output_mode
+
+    # Already disabled, keep the original streams
+    if stdout_hook is not None:
+        return
 
     stdout_hook = sys.stdout
     stderr_hook = sys.stderr
 
-    temporary_directory = tempfile.gettempdir()
+    # The files are removed when the process exits
+    if std_output_mode == 'w':
+        atexit.register(remove_std_output_files)
 
-    sys.stdout = open('%s/nmv-stdout.output' % temporary_directory, 'w')
-    sys.stderr = open('%s/nmv-stderr.output' % temporary_directory, 'w')
+    # Then appended, the output may be disabled several times during the run
+    stdout_file, stderr_file = get_std_output_files()
+    sys.stdout = open(stdout_file, std_output_mode)
+    sys.stderr = open(stderr_file, std_output_mode)
+    std_output_mode = 'a'
 
 
 ####################################################################################################
@@ -56,5 +89,23 @@ def enable_std_output():
     if stdout_hook is None:
         return
     else:
+        sys.stdout.close()
+        sys.stderr.close()
         sys.stdout = stdout_hook
         sys.stderr = stderr_hook
+        stdout_hook = None
+        stderr_hook = None
+
+
+####################################################################################################
+# @remove_std_output_files
+####################################################################################################
+def remove_std_output_files():
+    """Restores the standard streams and removes the files that received them while they were
+    disabled. This function is registered to run at exit by @disable_std_output.
+    """
+
+    enable_std_output()
+    for output_file in get_std_output_files():
+        if os.path.isfile(output_file):
+            os.remove(output_file)
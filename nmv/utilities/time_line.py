@@ -15,15 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import sys
-
-# Blender imports
-import bpy
-
 # Internal imports
 import nmv.consts
 import nmv.utilities
+from .progress import progress_reporter
 
 
 ####################################################################################################
@@ -35,6 +30,8 @@ def show_progress(message,
                   done=False):
     """Show the progress of a process in a loop.
 
+    The intermediate steps are rate-limited by the shared progress reporter.
+
     :param message:
         The output message.
     :param current:
@@ -45,15 +42,21 @@ def show_progress(message,
         Is it the last step or not?
     """
 
+    # Nothing to report, avoid formatting the message
+    if not progress_reporter.is_enabled():
+        return
+
     if done:
 
         # Done message
-        sys.stdout.write('\t%s: [100 %%]%s\n' % (message, nmv.consts.Messages.SPACES))
+        text = '\t%s: [100 %%]%s' % (message, nmv.consts.Messages.SPACES)
     else:
 
         # In progress message
         progress = 100.0 * (float(current) / float(total))
-        sys.stdout.write('\t%s: [%2.2f %%]\r' % (message, progress))
+        text = '\t%s: [%2.2f %%]' % (message, progress)
+
+    progress_reporter.report(message, current, total, done=done, text=text)
 
 
 ####################################################################################################
@@ -65,6 +68,8 @@ def show_iteration_progress(message,
                             done=False):
     """Show the progress of a process in a loop.
 
+    The intermediate steps are rate-limited by the shared progress reporter.
+
     :param message:
         The output message.
     :param current:
@@ -75,15 +80,7 @@ def show_iteration_progress(message,
         Is it the last step or not?
     """
 
-    if done:
-
-        # Done message
-        sys.stdout.write('%s: [%d/%d]\n' % (message, current, total))
-
-    else:
-
-        # In progress message
-        sys.stdout.write('%s: [%d/%d]\r' % (message, current, total))
+    progress_reporter.report(message, current, total, done=done)
 
 
 ####################################################################################################
@@ -99,6 +96,9 @@ def play_simulation(first_frame_index=1,
         The index of the last frame in the simulation.
     """
 
+    # Blender is only needed to update the time-line
+    import bpy
+
     # Set the time-line frame, one by one, where the simulation will be activated
     simulation_timer = nmv.utilities.timer.Timer()
     simulation_timer.start()
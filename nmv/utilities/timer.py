@@ -96,3 +96,39 @@ def profile_function(function, *args):
     # Construct the profiling string
     profiling_string = '\t* Stats. @%s: [%.3f]\n' % (function.__name__, execution_time)
     return function_return, profiling_string
+
+
+####################################################################################################
+# @profile_generator
+####################################################################################################
+def profile_generator(function, *args):
+    """Runs a generator function and profiles it, like profile_function, while passing its yielded
+    values to the caller. The pauses between the yields are not counted.
+
+    :param function:
+        Generator function object.
+    :param args:
+        Arguments to the function
+    :return:
+        A generator that yields the values of the function, and returns the function result and
+        the profiling string.
+    """
+
+    generator = function(*args)
+    execution_time = 0.0
+    while True:
+
+        # Advance the generator and accumulate the time spent in it
+        starting_time = time.time()
+        try:
+            value = next(generator)
+        except StopIteration as stop:
+            execution_time += time.time() - starting_time
+            function_return = stop.value
+            break
+        execution_time += time.time() - starting_time
+        yield value
+
+    # Construct the profiling string
+    profiling_string = '\t* Stats. @%s: [%.3f]\n' % (function.__name__, execution_time)
+    return function_return, profiling_string
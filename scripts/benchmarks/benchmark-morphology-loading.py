@@ -0,0 +1,202 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys, os, time, tempfile, multiprocessing
+sys.path.append(('%s/../../' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+
+# NeuroMorphoVis imports
+import nmv.file
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the loading of .h5 and .swc morphologies against their compact ' \
+                  'binary (.nmvb) versions'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'A list of .h5 or .swc morphologies, separated by commas'
+    parser.add_argument('--morphologies',
+                        action='store', dest='morphologies', help=arg_help)
+
+    arg_help = 'The number of times every morphology is loaded'
+    parser.add_argument('--repetitions',
+                        action='store', type=int, default=5, dest='repetitions', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @get_resident_memory
+####################################################################################################
+def get_resident_memory():
+    """Gets the resident memory of the current process.
+
+    :return:
+        The resident memory in bytes.
+    """
+
+    with open('/proc/self/statm') as statm_file:
+        return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+####################################################################################################
+# @measure_loading
+####################################################################################################
+def measure_loading(loading_function,
+                    morphology_file,
+                    results_queue):
+    """Loads a morphology in a fresh process and reports the loading time and the increase of the
+    resident memory of the process.
+
+    :param loading_function:
+        A function that loads the morphology file.
+    :param morphology_file:
+        The morphology file.
+    :param results_queue:
+        A queue where the results are put.
+    """
+
+    memory = get_resident_memory()
+    start = time.time()
+    result = loading_function(morphology_file)
+    loading_time = time.time() - start
+    results_queue.put((loading_time, get_resident_memory() - memory))
+
+    # Keep the result alive until the memory is measured
+    del result
+
+
+####################################################################################################
+# @benchmark_loading
+####################################################################################################
+def benchmark_loading(loading_function,
+                      morphology_file,
+                      repetitions):
+    """Measures the loading of a morphology several times, each in a fresh process, so that the
+    caches of the previous loads do not affect the measurements.
+
+    :param loading_function:
+        A function that loads the morphology file.
+    :param morphology_file:
+        The morphology file.
+    :param repetitions:
+        The number of measurements.
+    :return:
+        The median loading time in seconds and the median increase of the resident memory in bytes.
+    """
+
+    times = list()
+    memories = list()
+    for i in range(repetitions):
+        results_queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=measure_loading, args=(loading_function, morphology_file, results_queue))
+        process.start()
+        loading_time, memory = results_queue.get()
+        process.join()
+        times.append(loading_time)
+        memories.append(memory)
+
+    times.sort()
+    memories.sort()
+    return times[len(times) // 2], memories[len(memories) // 2]
+
+
+####################################################################################################
+# @load_morphology
+####################################################################################################
+def load_morphology(morphology_file):
+    """Loads a morphology object from a file of any supported format.
+
+    :param morphology_file:
+        The morphology file.
+    :return:
+        The morphology object.
+    """
+
+    return nmv.file.readers.read_morphology_from_file_naively(morphology_file)[1]
+
+
+####################################################################################################
+# @map_binary_morphology_tables
+####################################################################################################
+def map_binary_morphology_tables(morphology_file):
+    """Maps the tables of a binary morphology and touches all of them, without building the
+    morphology object.
+
+    :param morphology_file:
+        The binary morphology file.
+    :return:
+        The mapped tables.
+    """
+
+    tables = nmv.file.map_binary_morphology(morphology_file)
+    tables['points'].sum()
+    tables['radii'].sum()
+    return tables
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # Convert the morphologies into a temporary directory
+    output_directory = tempfile.mkdtemp()
+    print('%40s %16s %12s %14s %12s' % ('Morphology', 'Format', 'Time (s)', 'Memory (MB)',
+                                        'Size (MB)'))
+    for morphology_file in args.morphologies.split(','):
+        loading_flag, morphology_object = \
+            nmv.file.readers.read_morphology_from_file_naively(morphology_file)
+        if not loading_flag:
+            print('ERROR: Cannot load [%s]' % morphology_file)
+            continue
+        binary_file = nmv.file.write_morphology_to_nmvb_file(morphology_object, output_directory)
+
+        label = os.path.basename(morphology_file)
+        for format_name, loading_function, input_file in [
+                (os.path.splitext(morphology_file)[1], load_morphology, morphology_file),
+                ('.nmvb', load_morphology, binary_file),
+                ('.nmvb (tables)', map_binary_morphology_tables, binary_file)]:
+            loading_time, memory = benchmark_loading(
+                loading_function, input_file, args.repetitions)
+            print('%40s %16s %12.4f %14.2f %12.2f' %
+                  (label, format_name, loading_time, memory / 1e6,
+                   os.path.getsize(input_file) / 1e6))
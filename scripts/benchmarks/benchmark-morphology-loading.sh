@@ -0,0 +1,31 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# Blender executable
+BLENDER='blender'
+
+# A list of .h5 or .swc morphologies, separated by commas
+MORPHOLOGIES='../brava-swc-to-h5/BG001.CNG.swc'
+
+# The number of times every morphology is loaded
+REPETITIONS=5
+
+####################################################################################################
+$BLENDER -b --verbose 0 --python benchmark-morphology-loading.py --                                \
+    --morphologies=$MORPHOLOGIES                                                                   \
+    --repetitions=$REPETITIONS
@@ -0,0 +1,143 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys, os, time
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+
+# Blender imports
+import bpy
+
+# NeuroMorphoVis imports
+import nmv.file
+import nmv.physics
+import nmv.scene
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the particle simulation of the particle remesher'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The input mesh. If not given, an ico-sphere is used'
+    parser.add_argument('--input-mesh',
+                        action='store', default=None, dest='input_mesh', help=arg_help)
+
+    arg_help = 'The subdivisions of the ico-sphere, if no input mesh is given'
+    parser.add_argument('--subdivisions',
+                        action='store', type=int, default=5, dest='subdivisions', help=arg_help)
+
+    arg_help = 'The resolution of the particles, relative to the size of the mesh'
+    parser.add_argument('--resolution',
+                        action='store', type=int, default=40, dest='resolution', help=arg_help)
+
+    arg_help = 'A list of the simulation methods, e.g. SEQUENTIAL,VECTORIZED'
+    parser.add_argument('--methods',
+                        action='store', default='SEQUENTIAL,VECTORIZED', dest='methods',
+                        help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @load_input_mesh
+####################################################################################################
+def load_input_mesh(input_mesh,
+                    subdivisions):
+    """Loads the input mesh on a clean scene, so that all the methods get the same input.
+
+    :param input_mesh:
+        The path to the input mesh, or None to create an ico-sphere.
+    :param subdivisions:
+        The subdivisions of the ico-sphere.
+    :return:
+        The mesh object.
+    """
+
+    nmv.scene.clear_scene()
+    if input_mesh is not None:
+        mesh_object = nmv.file.import_mesh(input_mesh)
+    else:
+        bpy.ops.mesh.primitive_ico_sphere_add(subdivisions=subdivisions, radius=10.0)
+        mesh_object = bpy.context.active_object
+    nmv.scene.select_object(mesh_object)
+    nmv.scene.set_active_object(mesh_object)
+    return mesh_object
+
+
+####################################################################################################
+# @benchmark_remesher
+####################################################################################################
+def benchmark_remesher(mesh_object,
+                       resolution,
+                       simulation_method):
+    """Runs the particle remesher on a given mesh with a given simulation method.
+
+    :param mesh_object:
+        A given mesh object.
+    :param resolution:
+        The resolution of the particles.
+    :param simulation_method:
+        The simulation method, 'SEQUENTIAL' or 'VECTORIZED'.
+    :return:
+        The time of the remeshing, the number of vertices and faces of the result.
+    """
+
+    remesher = nmv.physics.ParticleRemesher(resolution=resolution, mask_resolution=resolution,
+                                            simulation_method=simulation_method)
+
+    start = time.time()
+    for finished in remesher.run(mesh_object=mesh_object, context=bpy.context, interactive=True):
+        if finished:
+            break
+    remeshing_time = time.time() - start
+
+    return remeshing_time, len(mesh_object.data.vertices), len(mesh_object.data.polygons)
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    print('%12s %12s %10s %10s' % ('Method', 'Time (s)', 'Vertices', 'Faces'))
+    for method in args.methods.split(','):
+        mesh_object = load_input_mesh(args.input_mesh, args.subdivisions)
+        remeshing_time, vertices, faces = benchmark_remesher(mesh_object, args.resolution, method)
+        print('%12s %12.3f %10d %10d' % (method, remeshing_time, vertices, faces))
@@ -0,0 +1,154 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys, os, time, importlib, multiprocessing
+sys.path.append(('%s/../../' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+
+# NOTE: NeuroMorphoVis is never imported in this process, every entry point is imported in a
+# fresh child process to measure its cold startup
+
+
+# The default entry points, a module optionally followed by an attribute that is accessed
+ENTRY_POINTS = ['nmv',
+                'nmv.file',
+                'nmv.file:read_morphology_from_file_naively',
+                'nmv.skeleton:Morphology',
+                'nmv.analysis:kernel_total_number_samples',
+                'nmv.options:NeuroMorphoVisOptions',
+                'nmv.interface.cli:parse_command_line_arguments',
+                'nmv.interface.cli.morphology_analysis',
+                'nmv.interface.cli.neuron_morphology_reconstruction',
+                'nmv.interface.cli.neuron_mesh_reconstruction',
+                'nmv.interface.cli.sequence_rendering']
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the startup time of the NeuroMorphoVis entry points'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'A list of entry points, separated by commas, each is a module optionally ' \
+               'followed by :attribute, e.g. nmv.skeleton:Morphology'
+    parser.add_argument('--entry-points',
+                        action='store', dest='entry_points', default=','.join(ENTRY_POINTS),
+                        help=arg_help)
+
+    arg_help = 'The number of times every entry point is imported'
+    parser.add_argument('--repetitions',
+                        action='store', type=int, default=5, dest='repetitions', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @measure_import
+####################################################################################################
+def measure_import(entry_point,
+                   results_queue):
+    """Imports an entry point in a fresh process and reports the import time and the number of
+    the NeuroMorphoVis modules that were loaded.
+
+    :param entry_point:
+        The entry point, a module optionally followed by :attribute.
+    :param results_queue:
+        A queue where the results are put.
+    """
+
+    module_name, _, attribute = entry_point.partition(':')
+    try:
+        start = time.time()
+        module = importlib.import_module(module_name)
+        if attribute:
+            getattr(module, attribute)
+        import_time = time.time() - start
+    except (ImportError, AttributeError) as e:
+        results_queue.put((None, '%s: %s' % (type(e).__name__, e)))
+        return
+
+    number_modules = len([name for name in sys.modules if name.split('.')[0] == 'nmv'])
+    results_queue.put((import_time, number_modules))
+
+
+####################################################################################################
+# @benchmark_import
+####################################################################################################
+def benchmark_import(entry_point,
+                     repetitions):
+    """Measures the import of an entry point several times, each in a fresh process, so that the
+    modules that were imported before do not affect the measurements.
+
+    :param entry_point:
+        The entry point, a module optionally followed by :attribute.
+    :param repetitions:
+        The number of measurements.
+    :return:
+        The median import time in seconds and the number of loaded modules, or None and the
+        error if the entry point cannot be imported.
+    """
+
+    times = list()
+    number_modules = 0
+    for i in range(repetitions):
+        results_queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=measure_import, args=(entry_point, results_queue))
+        process.start()
+        import_time, result = results_queue.get()
+        process.join()
+        if import_time is None:
+            return None, result
+        times.append(import_time)
+        number_modules = result
+
+    times.sort()
+    return times[len(times) // 2], number_modules
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--', if running from Blender
+    args = sys.argv
+    arguments = args[args.index("--") + 1:] if '--' in args else args[1:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments(arguments)
+
+    print('%56s %12s %10s' % ('Entry point', 'Time (s)', 'Modules'))
+    for entry_point in args.entry_points.split(','):
+        import_time, result = benchmark_import(entry_point, args.repetitions)
+        if import_time is None:
+            print('%56s %12s %10s  %s' % (entry_point, '-', '-', result))
+        else:
+            print('%56s %12.4f %10d' % (entry_point, import_time, result))
@@ -0,0 +1,174 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys, os, time, math, random
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+
+# Blender imports
+import bpy
+import bmesh
+from mathutils import Vector
+
+# NeuroMorphoVis imports
+import nmv.mesh
+import nmv.scene
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the union of the sections of an arbor'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'A list of the numbers of sections, e.g. 8,16,32,64'
+    parser.add_argument('--sections',
+                        action='store', default='8,16,32,64', dest='sections', help=arg_help)
+
+    arg_help = 'The number of processes used for the balanced union'
+    parser.add_argument('--processes',
+                        action='store', type=int, default=1, dest='processes', help=arg_help)
+
+    arg_help = 'Also run the sequential union for comparison'
+    parser.add_argument('--sequential',
+                        action='store_true', default=False, dest='sequential', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @create_synthetic_arbor
+####################################################################################################
+def create_synthetic_arbor(number_sections,
+                           seed=0):
+    """Creates a random branching arbor of overlapping tubes, one per section.
+
+    :param number_sections:
+        The number of sections of the arbor.
+    :param seed:
+        Random seed, to create the same arbor for all the methods.
+    :return:
+        A list of the mesh objects of the sections.
+    """
+
+    random.seed(seed)
+    tips = [(Vector((0.0, 0.0, 0.0)), Vector((0.0, 1.0, 0.0)))]
+    sections = list()
+    for i in range(number_sections):
+
+        # Grow a new section from a random tip
+        start, direction = tips[random.randint(0, len(tips) - 1)]
+        direction = (direction + Vector((random.uniform(-0.5, 0.5),
+                                         random.uniform(-0.2, 0.2),
+                                         random.uniform(-0.5, 0.5)))).normalized()
+        end = start + direction * 5.0
+        tips.append((end, direction))
+
+        # A tube along the section, extended slightly to overlap its parent
+        bpy.ops.mesh.primitive_cylinder_add(vertices=16, radius=0.5, depth=5.5,
+                                            location=(start + end) * 0.5)
+        tube = bpy.context.active_object
+        tube.rotation_mode = 'QUATERNION'
+        tube.rotation_quaternion = Vector((0.0, 0.0, 1.0)).rotation_difference(direction)
+        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+        tube.name = 'section_%d' % i
+        sections.append(tube)
+
+    return sections
+
+
+####################################################################################################
+# @count_non_manifold_edges
+####################################################################################################
+def count_non_manifold_edges(mesh_object):
+    """Counts the non-manifold edges of a mesh, zero for a watertight mesh.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        The number of non-manifold edges.
+    """
+
+    mesh = bmesh.new()
+    mesh.from_mesh(mesh_object.data)
+    count = sum(1 for edge in mesh.edges if not edge.is_manifold)
+    mesh.free()
+    return count
+
+
+####################################################################################################
+# @benchmark_union
+####################################################################################################
+def benchmark_union(number_sections,
+                    union_function):
+    """Runs a single union benchmark on a clean scene.
+
+    :param number_sections:
+        The number of sections of the arbor.
+    :param union_function:
+        The union function, that takes a list of mesh objects.
+    :return:
+        The time of the union, the number of faces and non-manifold edges of the result.
+    """
+
+    nmv.scene.clear_scene()
+    sections = create_synthetic_arbor(number_sections)
+
+    start = time.time()
+    mesh_object = union_function(sections)
+    union_time = time.time() - start
+
+    return union_time, len(mesh_object.data.polygons), count_non_manifold_edges(mesh_object)
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    methods = [('balanced', lambda objects: nmv.mesh.ops.union_mesh_objects_in_list(
+        objects, number_processes=args.processes))]
+    if args.sequential:
+        methods.append(('sequential', nmv.mesh.ops.union_mesh_objects_in_list_sequentially))
+
+    print('%10s %12s %12s %10s %14s' % ('Sections', 'Method', 'Time (s)', 'Faces', 'Non-manifold'))
+    for number_sections in [int(n) for n in args.sections.split(',')]:
+        for method_name, method in methods:
+            union_time, faces, non_manifold = benchmark_union(number_sections, method)
+            print('%10d %12s %12.3f %10d %14d' %
+                  (number_sections, method_name, union_time, faces, non_manifold))
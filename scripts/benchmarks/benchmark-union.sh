@@ -0,0 +1,32 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Blender executable
+BLENDER='blender'
+
+# The numbers of sections of the synthetic arbors
+SECTIONS='8,16,32,64,128'
+
+# The number of processes used for the balanced union
+PROCESSES=1
+
+####################################################################################################
+$BLENDER -b --verbose 0 --python benchmark-union.py --                                             \
+    --sections=$SECTIONS                                                                           \
+    --processes=$PROCESSES                                                                         \
+    --sequential
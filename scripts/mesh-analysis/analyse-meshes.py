@@ -0,0 +1,135 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys
+import os
+import csv
+import time
+import argparse
+import multiprocessing
+
+# Internal imports
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+import analysis_engine
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments():
+    """Parser
+
+    :return:
+        Parsed arguments.
+    """
+
+    # Create an argument parser, and then add the options one by one
+    parser = argparse.ArgumentParser(
+        description='Analysing the quality of all the .ply and .obj meshes in a directory, '
+                    'without Blender')
+
+    # Input directory
+    arg_help = 'Input directory that contains the meshes'
+    parser.add_argument('--input-directory', action='store', help=arg_help)
+
+    # Output report
+    arg_help = 'The aggregated .csv report of all the meshes'
+    parser.add_argument('--output-report', action='store', default='mesh-analysis.csv',
+                        help=arg_help)
+
+    # Number of processes
+    arg_help = 'The number of processes, by default all the cores'
+    parser.add_argument('--processes', action='store', type=int,
+                        default=multiprocessing.cpu_count(), help=arg_help)
+
+    # Parse the arguments, and return a list of them
+    return parser.parse_args()
+
+
+####################################################################################################
+# @get_mesh_files
+####################################################################################################
+def get_mesh_files(directory):
+    """Gets all the .ply and .obj meshes in a directory and its sub-directories.
+
+    :param directory:
+        The input directory.
+    :return:
+        A sorted list of the paths of the meshes.
+    """
+
+    mesh_files = list()
+    for root, _, files in os.walk(directory):
+        for file_name in files:
+            if os.path.splitext(file_name)[1].lower() in ('.ply', '.obj'):
+                mesh_files.append(os.path.join(root, file_name))
+    return sorted(mesh_files)
+
+
+####################################################################################################
+# @write_report
+####################################################################################################
+def write_report(reports,
+                 file_path):
+    """Writes the reports of all the meshes into a single .csv file.
+
+    :param reports:
+        A list of the reports of the meshes.
+    :param file_path:
+        The path of the .csv file.
+    """
+
+    with open(file_path, 'w', newline='') as report_file:
+        writer = csv.DictWriter(report_file, fieldnames=analysis_engine.REPORT_FIELDS,
+                                restval='')
+        writer.writeheader()
+        for report in sorted(reports, key=lambda item: item['mesh']):
+            writer.writerow(report)
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse arguments
+    args = parse_command_line_arguments()
+
+    # Analyse all the meshes in parallel, the largest meshes are not known in advance, so every
+    # process takes a single mesh at a time
+    mesh_files = get_mesh_files(args.input_directory)
+    print('Analysing [%d] meshes with [%d] processes' % (len(mesh_files), args.processes))
+    start = time.time()
+    reports = list()
+    with multiprocessing.Pool(processes=max(1, args.processes)) as pool:
+        for i, report in enumerate(pool.imap_unordered(analysis_engine.analyse_mesh_file,
+                                                       mesh_files)):
+            reports.append(report)
+            print('[%d/%d] %s' % (i + 1, len(mesh_files), report['mesh']))
+
+    # Write the aggregated report
+    write_report(reports, args.output_report)
+
+    # Summary
+    failed = [report for report in reports if report['error']]
+    watertight = [report for report in reports if report.get('watertight', False)]
+    print('Analysed [%d] meshes in [%f] seconds' % (len(reports), time.time() - start))
+    print('\t* Watertight      | [%d]' % len(watertight))
+    print('\t* Not Watertight  | [%d]' % (len(reports) - len(watertight) - len(failed)))
+    print('\t* Failed          | [%d]' % len(failed))
+    print('\t* Report          | [%s]' % args.output_report)
@@ -0,0 +1,36 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# The directory that contains the meshes that will be analyzed
+INPUT_DIRECTORY=''
+
+# The aggregated report of all the meshes
+OUTPUT_REPORT='mesh-analysis.csv'
+
+# The number of processes
+PROCESSES=8
+
+####################################################################################################
+echo 'ANALYZING MESHES ...'
+
+python3 analyse-meshes.py                                                                           \
+    --input-directory=$INPUT_DIRECTORY                                                              \
+    --output-report=$OUTPUT_REPORT                                                                  \
+    --processes=$PROCESSES
+
+echo 'ANALYSIS DONE ...'
@@ -0,0 +1,506 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import os
+import sys
+import numpy
+
+# Internal imports, the parsers of the meshes are shared with the other scripts
+sys.path.append('%s/../..' % os.path.dirname(os.path.realpath(__file__)))
+import nmv.file
+
+
+# The fields of the report of a mesh, in order
+REPORT_FIELDS = ['mesh', 'vertices', 'polygons', 'triangles',
+                 'bounding_box_x', 'bounding_box_y', 'bounding_box_z', 'bounding_box_diagonal',
+                 'partitions', 'surface_area', 'volume', 'watertight',
+                 'non_manifold_edges', 'non_manifold_vertices', 'non_contiguous_edges',
+                 'self_intersections', 'self_intersecting_pairs', 'analysis_time', 'error']
+
+
+####################################################################################################
+# @read_mesh_arrays
+####################################################################################################
+def read_mesh_arrays(file_path):
+    """Reads a PLY or an OBJ mesh into arrays, without Blender.
+
+    :param file_path:
+        The path to the mesh file.
+    :return:
+        An Nx3 array of vertices, a Tx3 array of triangles and the number of polygons.
+    """
+
+    mesh = nmv.file.read_mesh_arrays(file_path)
+    return mesh.vertices.astype(numpy.float64), mesh.get_triangles(), len(mesh.face_sizes)
+
+
+####################################################################################################
+# @compute_connected_labels
+####################################################################################################
+def compute_connected_labels(number_nodes,
+                             pairs):
+    """Labels the connected components of a graph with array operations, by hooking the roots of
+    the linked nodes to each other and then compressing the paths to the roots, until all the
+    linked nodes share the same root.
+
+    :param number_nodes:
+        The number of nodes of the graph.
+    :param pairs:
+        An Mx2 array of the linked nodes.
+    :return:
+        An array of the label of every node, which is the smallest node of its component.
+    """
+
+    labels = numpy.arange(number_nodes)
+    pairs = numpy.asarray(pairs, dtype=numpy.int64).reshape(-1, 2)
+    first, second = pairs[:, 0], pairs[:, 1]
+
+    while True:
+        first_labels, second_labels = labels[first], labels[second]
+        different = first_labels != second_labels
+        if not different.any():
+            break
+
+        # Hook the larger roots to the smaller ones
+        numpy.minimum.at(labels,
+                         numpy.maximum(first_labels, second_labels)[different],
+                         numpy.minimum(first_labels, second_labels)[different])
+
+        # Compress the paths, so every node points to its root
+        while True:
+            jumped_labels = labels[labels]
+            if numpy.array_equal(jumped_labels, labels):
+                break
+            labels = jumped_labels
+
+        # Only the pairs that were not linked yet are needed
+        first, second = first[different], second[different]
+
+    return labels
+
+
+####################################################################################################
+# @compute_surface_area
+####################################################################################################
+def compute_surface_area(vertices,
+                         triangles):
+    """Computes the surface area of a triangular mesh.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        A Tx3 array of triangles.
+    :return:
+        The surface area.
+    """
+
+    a, b, c = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    return 0.5 * float(numpy.linalg.norm(numpy.cross(b - a, c - a), axis=1).sum())
+
+
+####################################################################################################
+# @compute_volume
+####################################################################################################
+def compute_volume(vertices,
+                   triangles):
+    """Computes the volume of a closed triangular mesh from the signed volumes of the tetrahedra
+    of its triangles with the origin.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        A Tx3 array of triangles.
+    :return:
+        The volume.
+    """
+
+    a, b, c = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    return abs(float(numpy.einsum('ij,ij->i', a, numpy.cross(b, c)).sum()) / 6.0)
+
+
+####################################################################################################
+# @compute_bounding_box
+####################################################################################################
+def compute_bounding_box(vertices):
+    """Computes the dimensions of the bounding box of a mesh.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :return:
+        The dimensions of the bounding box along the X, Y and Z axes and its diagonal.
+    """
+
+    if len(vertices) == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    dimensions = vertices.max(axis=0) - vertices.min(axis=0)
+    return (float(dimensions[0]), float(dimensions[1]), float(dimensions[2]),
+            float(numpy.linalg.norm(dimensions)))
+
+
+####################################################################################################
+# @compute_number_partitions
+####################################################################################################
+def compute_number_partitions(number_vertices,
+                              edges):
+    """Computes the number of partitions (or islands) of a mesh.
+
+    :param number_vertices:
+        The number of vertices of the mesh.
+    :param edges:
+        An Ex2 array of the edges of the mesh.
+    :return:
+        The number of partitions, where every loose vertex is a partition.
+    """
+
+    labels = compute_connected_labels(number_vertices, edges)
+    return int(numpy.count_nonzero(labels == numpy.arange(number_vertices)))
+
+
+####################################################################################################
+# @get_mesh_edges
+####################################################################################################
+def get_mesh_edges(number_vertices,
+                   triangles):
+    """Gets the edges of a triangular mesh and the half-edges of its triangles.
+
+    :param number_vertices:
+        The number of vertices of the mesh.
+    :param triangles:
+        A Tx3 array of triangles.
+    :return:
+        An Ex2 array of the unique edges, the edge of every half-edge, the number of the
+        half-edges of every edge, and the number of the half-edges of every edge that run from its
+        smaller vertex to its larger one. The half-edge 3 * t + k runs from the corner k of the
+        triangle t to its next corner.
+    """
+
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    lows = numpy.minimum(starts, ends)
+    highs = numpy.maximum(starts, ends)
+
+    keys, half_edges_edges, counts = numpy.unique(
+        lows * number_vertices + highs, return_inverse=True, return_counts=True)
+    half_edges_edges = half_edges_edges.reshape(-1)
+    forward_counts = numpy.bincount(half_edges_edges, weights=(starts < ends),
+                                    minlength=len(keys)).astype(numpy.int64)
+    edges = numpy.stack([keys // number_vertices, keys % number_vertices], axis=1)
+    return edges, half_edges_edges, counts, forward_counts
+
+
+####################################################################################################
+# @compute_non_manifold_vertices
+####################################################################################################
+def compute_non_manifold_vertices(number_vertices,
+                                  triangles,
+                                  edges,
+                                  half_edges_edges,
+                                  counts):
+    """Finds the non-manifold vertices of a triangular mesh.
+
+    A vertex is non-manifold if it is loose, if it lies on a non-manifold edge, or if its
+    triangles do not form a single fan, e.g. two cones touching at their tips. The fans are found
+    by linking the corners of the vertex in the triangles that share a manifold edge.
+
+    :param number_vertices:
+        The number of vertices of the mesh.
+    :param triangles:
+        A Tx3 array of triangles.
+    :param edges:
+        An Ex2 array of the unique edges.
+    :param half_edges_edges:
+        The edge of every half-edge.
+    :param counts:
+        The number of the half-edges of every edge.
+    :return:
+        A boolean array, True for the non-manifold vertices.
+    """
+
+    non_manifold = numpy.ones(number_vertices, dtype=bool)
+    non_manifold[triangles.reshape(-1)] = False
+    non_manifold[edges[counts != 2].reshape(-1)] = True
+
+    # The corners of the two triangles of every manifold edge, sorted by edge
+    half_edges = numpy.flatnonzero(counts[half_edges_edges] == 2)
+    half_edges = half_edges[numpy.argsort(half_edges_edges[half_edges], kind='stable')]
+    first_half_edges, second_half_edges = half_edges[0::2], half_edges[1::2]
+
+    # The corners at the start and end of every half-edge
+    def get_corners(half_edge, vertex):
+        triangle = half_edge // 3
+        start_corner = half_edge
+        end_corner = triangle * 3 + (half_edge % 3 + 1) % 3
+        return numpy.where(triangles.reshape(-1)[start_corner] == vertex, start_corner,
+                           end_corner)
+
+    shared_edges = edges[half_edges_edges[first_half_edges]]
+    pairs = list()
+    for i in range(2):
+        pairs.append(numpy.stack([get_corners(first_half_edges, shared_edges[:, i]),
+                                  get_corners(second_half_edges, shared_edges[:, i])], axis=1))
+    labels = compute_connected_labels(len(triangles) * 3, numpy.concatenate(pairs))
+
+    # A vertex whose corners form more than one fan is non-manifold
+    fans = numpy.unique(triangles.reshape(-1) * (len(triangles) * 3) + labels)
+    number_fans = numpy.bincount(fans // (len(triangles) * 3), minlength=number_vertices)
+    non_manifold |= number_fans > 1
+    return non_manifold
+
+
+####################################################################################################
+# @are_triangles_separated
+####################################################################################################
+def are_triangles_separated(first_triangles,
+                            second_triangles,
+                            tolerance):
+    """Tests pairs of triangles for separation along the axes of the separating axis theorem,
+    i.e. the normals of the triangles, the cross products of their edges, and the in-plane normals
+    of their edges for the coplanar triangles.
+
+    :param first_triangles:
+        A Px3x3 array of the corners of the first triangles.
+    :param second_triangles:
+        A Px3x3 array of the corners of the second triangles.
+    :param tolerance:
+        The overlap of the projections below which the triangles are considered separated.
+    :return:
+        A boolean array, True for the separated pairs.
+    """
+
+    first_edges = numpy.roll(first_triangles, -1, axis=1) - first_triangles
+    second_edges = numpy.roll(second_triangles, -1, axis=1) - second_triangles
+    first_normals = numpy.cross(first_edges[:, 0], first_edges[:, 1])
+    second_normals = numpy.cross(second_edges[:, 0], second_edges[:, 1])
+
+    axes = [first_normals[:, None, :], second_normals[:, None, :],
+            numpy.cross(first_edges[:, :, None, :], second_edges[:, None, :, :]).reshape(-1, 9, 3),
+            numpy.cross(first_normals[:, None, :], first_edges),
+            numpy.cross(second_normals[:, None, :], second_edges)]
+    axes = numpy.concatenate(axes, axis=1)
+
+    # Degenerate axes do not separate anything
+    lengths = numpy.linalg.norm(axes, axis=2)
+    valid = lengths > 1e-12 * numpy.max(lengths, axis=1, initial=0.0)[:, None]
+    axes = axes / numpy.maximum(lengths, 1e-30)[:, :, None]
+
+    first_projections = numpy.einsum('pak,pvk->pav', axes, first_triangles)
+    second_projections = numpy.einsum('pak,pvk->pav', axes, second_triangles)
+    separated = (first_projections.max(axis=2) < second_projections.min(axis=2) + tolerance) | \
+                (second_projections.max(axis=2) < first_projections.min(axis=2) + tolerance)
+    return numpy.any(separated & valid, axis=1)
+
+
+####################################################################################################
+# @find_self_intersection_candidates
+####################################################################################################
+def find_self_intersection_candidates(vertices,
+                                      triangles,
+                                      cell_size=None,
+                                      epsilon=1e-7,
+                                      block_size=65536):
+    """Finds the pairs of triangles that may intersect each other.
+
+    The triangles are binned into a uniform spatial grid. The pairs of triangles in the same cells
+    whose bounding boxes overlap, that do not share any vertex and that are not separated by any
+    axis are reported. The cheap tests run first, so only a few pairs reach the exact test.
+    Triangles that only touch each other within the tolerance are ignored.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        A Tx3 array of triangles.
+    :param cell_size:
+        The size of the cells of the grid. By default, twice the median size of the triangles.
+    :param epsilon:
+        The tolerance of the tests, relative to the size of the mesh.
+    :param block_size:
+        The number of the pairs that are tested for separation at once, to bound the memory.
+    :return:
+        A Px2 array of the candidate pairs of triangles.
+    """
+
+    number_triangles = len(triangles)
+    if number_triangles < 2:
+        return numpy.zeros((0, 2), dtype=numpy.int64)
+
+    corners = vertices[triangles]
+    lows, highs = corners.min(axis=1), corners.max(axis=1)
+    if cell_size is None:
+        cell_size = 2.0 * float(numpy.median((highs - lows).max(axis=1)))
+    cell_size = max(cell_size, 1e-6)
+
+    # Bin every triangle into all the cells that its bounding box overlaps
+    origin = lows.min(axis=0)
+    first_cells = numpy.floor((lows - origin) / cell_size).astype(numpy.int64)
+    spans = numpy.floor((highs - origin) / cell_size).astype(numpy.int64) - first_cells + 1
+    number_cells = spans.prod(axis=1)
+    triangle_ids = numpy.repeat(numpy.arange(number_triangles), number_cells)
+    local = numpy.arange(int(number_cells.sum())) - numpy.repeat(
+        numpy.cumsum(number_cells) - number_cells, number_cells)
+    span_x, span_y = spans[triangle_ids, 0], spans[triangle_ids, 1]
+    cells = first_cells[triangle_ids] + numpy.stack(
+        [local % span_x, (local // span_x) % span_y, local // (span_x * span_y)], axis=1)
+    dimensions = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dimensions[1] + cells[:, 1]) * dimensions[2] + cells[:, 2]
+
+    # The pairs of triangles in the same cells, the runs of equal keys are contiguous once sorted
+    order = numpy.argsort(keys, kind='stable')
+    keys, triangle_ids, cells = keys[order], triangle_ids[order], cells[order]
+
+    # The planes of the triangles
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals /= numpy.maximum(numpy.linalg.norm(normals, axis=1), 1e-30)[:, None]
+    offsets = numpy.einsum('ij,ij->i', normals, corners[:, 0])
+    tolerance = epsilon * max(float(numpy.linalg.norm(highs.max(axis=0) - origin)), 1e-12)
+
+    pairs = list()
+    distance = 1
+    while distance < len(keys):
+        same = numpy.flatnonzero(keys[:-distance] == keys[distance:])
+        distance += 1
+        if len(same) == 0:
+            break
+        first, second = triangle_ids[same], triangle_ids[same + distance - 1]
+
+        # A pair that shares several cells is only kept in the first one of them
+        first_shared_cells = numpy.maximum(first_cells[first], first_cells[second])
+        unique = numpy.all(cells[same] == first_shared_cells, axis=1)
+        first, second = first[unique], second[unique]
+
+        # Overlapping bounding boxes
+        overlap = numpy.all((lows[first] <= highs[second]) & (lows[second] <= highs[first]),
+                            axis=1)
+        first, second = first[overlap], second[overlap]
+
+        # Triangles that share a vertex touch each other by construction
+        shared = numpy.zeros(len(first), dtype=bool)
+        for i in range(3):
+            shared |= numpy.any(triangles[first][:, i:i + 1] == triangles[second], axis=1)
+        first, second = first[~shared], second[~shared]
+
+        # Triangles that are separated by the plane of either triangle do not intersect
+        for plane_of_first in (True, False):
+            planes, others = (first, second) if plane_of_first else (second, first)
+            distances = numpy.einsum('ijk,ik->ij', corners[others], normals[planes]) - \
+                offsets[planes][:, None]
+            separated = numpy.all(distances > tolerance, axis=1) | \
+                numpy.all(distances < -tolerance, axis=1)
+            first, second = first[~separated], second[~separated]
+
+        pairs.append(numpy.stack([first, second], axis=1))
+
+    if len(pairs) == 0:
+        return numpy.zeros((0, 2), dtype=numpy.int64)
+    pairs = numpy.concatenate(pairs)
+    first, second = pairs[:, 0], pairs[:, 1]
+
+    # The remaining pairs are tested against all the separating axes
+    intersecting = numpy.zeros(len(first), dtype=bool)
+    for i in range(0, len(first), block_size):
+        intersecting[i:i + block_size] = ~are_triangles_separated(
+            corners[first[i:i + block_size]], corners[second[i:i + block_size]], tolerance)
+    first, second = first[intersecting], second[intersecting]
+
+    return numpy.stack([first, second], axis=1)
+
+
+####################################################################################################
+# @analyse_mesh_arrays
+####################################################################################################
+def analyse_mesh_arrays(vertices,
+                        triangles,
+                        number_polygons=None):
+    """Computes the quality report of a triangular mesh.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param triangles:
+        A Tx3 array of triangles.
+    :param number_polygons:
+        The number of polygons of the mesh before the triangulation, if known.
+    :return:
+        A dictionary of the fields of the report, see REPORT_FIELDS.
+    """
+
+    vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+    triangles = numpy.asarray(triangles, dtype=numpy.int64).reshape(-1, 3)
+    number_vertices = len(vertices)
+
+    report = dict()
+    report['vertices'] = number_vertices
+    report['triangles'] = len(triangles)
+    report['polygons'] = len(triangles) if number_polygons is None else number_polygons
+
+    x, y, z, diagonal = compute_bounding_box(vertices)
+    report['bounding_box_x'] = x
+    report['bounding_box_y'] = y
+    report['bounding_box_z'] = z
+    report['bounding_box_diagonal'] = diagonal
+
+    report['surface_area'] = compute_surface_area(vertices, triangles)
+    report['volume'] = compute_volume(vertices, triangles)
+
+    edges, half_edges_edges, counts, forward_counts = get_mesh_edges(number_vertices, triangles)
+    report['partitions'] = compute_number_partitions(number_vertices, edges)
+    report['non_manifold_edges'] = int(numpy.count_nonzero(counts != 2))
+    report['non_contiguous_edges'] = int(numpy.count_nonzero(
+        (counts != 2) | (forward_counts != 1)))
+    report['non_manifold_vertices'] = int(numpy.count_nonzero(compute_non_manifold_vertices(
+        number_vertices, triangles, edges, half_edges_edges, counts)))
+
+    pairs = find_self_intersection_candidates(vertices, triangles)
+    report['self_intersecting_pairs'] = len(pairs)
+    report['self_intersections'] = len(numpy.unique(pairs))
+
+    # Same criteria as check_watertightness in core.py
+    if report['non_manifold_edges'] > 0 or report['non_contiguous_edges'] > 0 or \
+            report['non_manifold_vertices'] > 0:
+        report['watertight'] = False
+    elif report['self_intersections'] > 0:
+        report['watertight'] = report['partitions'] == 1
+    else:
+        report['watertight'] = True
+
+    return report
+
+
+####################################################################################################
+# @analyse_mesh_file
+####################################################################################################
+def analyse_mesh_file(file_path):
+    """Reads a PLY or an OBJ mesh and computes its quality report.
+
+    :param file_path:
+        The path to the mesh file.
+    :return:
+        A dictionary of the fields of the report, see REPORT_FIELDS. If the mesh cannot be
+        analysed, the error field describes the problem.
+    """
+
+    import time
+
+    start = time.time()
+    try:
+        vertices, triangles, number_polygons = read_mesh_arrays(file_path)
+        report = analyse_mesh_arrays(vertices, triangles, number_polygons)
+        report['error'] = ''
+    except Exception as error:
+        report = {'error': str(error)}
+    report['mesh'] = file_path
+    report['analysis_time'] = time.time() - start
+    return report
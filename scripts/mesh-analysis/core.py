@@ -21,12 +21,17 @@ import os
 import sys
 import argparse
 import math
+import numpy
 
 # Blender imports
 import bpy
 import bmesh
 import mathutils
 
+# Internal imports
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+import analysis_engine
+
 
 ####################################################################################################
 # @WatertightCheck
@@ -213,40 +218,13 @@ def compute_number_partitions(mesh_object):
         A given mesh object to process.
     """
 
-    # Get the paths along the edges of the mesh
-    paths = {v.index: set() for v in mesh_object.data.vertices}
-    for e in mesh_object.data.edges:
-        paths[e.vertices[0]].add(e.vertices[1])
-        paths[e.vertices[1]].add(e.vertices[0])
-
-    # A list that will contain the different partitions in the mesh. Each partition will be
-    # represented by a list of indices of the vertices of that partition.
-    partitions_vertices_indices = list()
-
-    # Search
-    while True:
-
-        # Get the next path
-        try:
-            iterator = next(iter(paths.keys()))
-        except StopIteration:
-            break
-        partition = {iterator}
-        current = {iterator}
-        while True:
-            eligible = {sc for sc in current if sc in paths}
-            if not eligible:
-                break
-            current = {ve for sc in eligible for ve in paths[sc]}
-            partition.update(current)
-            for key in eligible:
-                paths.pop(key)
-
-        # Add
-        partitions_vertices_indices.append(partition)
+    # Read all the edges of the mesh at once
+    edges = numpy.empty(len(mesh_object.data.edges) * 2, dtype=numpy.int32)
+    mesh_object.data.edges.foreach_get('vertices', edges)
 
-    # Convert the set to a list
-    return len(list(partitions_vertices_indices))
+    # Label the connected components with array operations
+    return analysis_engine.compute_number_partitions(len(mesh_object.data.vertices),
+                                                     edges.reshape(-1, 2))
 
 
 ####################################################################################################
@@ -507,7 +485,7 @@ if __name__ == "__main__":
 
     # Is it watertight
     print('\tWatertightness')
-    watertight_check = check_watertightness(bm)
+    watertight_check = check_watertightness(bm, number_partitions)
     
     # Free the bmesh 
     bm.free()
@@ -0,0 +1,138 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This library is free software; you can redistribute it and/or modify it under the terms of the
+# GNU Lesser General Public License version 3.0 as published by the Free Software Foundation.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along with this library;
+# if not, write to the Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA.
+
+# System imports
+import sys, os, time, multiprocessing
+sys.path.append(('%s/../../' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+
+# NeuroMorphoVis imports
+import nmv.consts
+import nmv.file
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Converting directories of .h5 and .swc morphologies into compact binary ' \
+                  'morphologies (.nmvb) that are mapped into memory when they are loaded'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The input directory that contains the .h5 and .swc morphologies'
+    parser.add_argument('--input-directory',
+                        action='store', dest='input_directory', help=arg_help)
+
+    arg_help = 'Output directory where the binary morphologies will be written'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'The number of processes used for the conversion, by default all the cores'
+    parser.add_argument('--processes',
+                        action='store', type=int, default=multiprocessing.cpu_count(),
+                        dest='processes', help=arg_help)
+
+    arg_help = 'Convert the morphologies even if their binary files are up to date'
+    parser.add_argument('--overwrite',
+                        action='store_true', default=False, dest='overwrite', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @convert_morphology
+####################################################################################################
+def convert_morphology(arguments):
+    """Converts a single morphology file into a binary morphology file.
+
+    :param arguments:
+        A tuple of the morphology file, the output directory and the overwrite flag.
+    :return:
+        A tuple of the morphology file and the status of the conversion, 'converted', 'skipped'
+        or 'failed'.
+    """
+
+    morphology_file, output_directory, overwrite = arguments
+
+    # Skip the morphologies that are already converted and up to date
+    output_file = '%s/%s%s' % (output_directory,
+                               nmv.file.ops.get_file_name_from_path(morphology_file),
+                               nmv.consts.Skeleton.NMVB_EXTENSION)
+    if not overwrite and os.path.isfile(output_file) and \
+            os.path.getmtime(output_file) >= os.path.getmtime(morphology_file):
+        return morphology_file, 'skipped'
+
+    try:
+        loading_flag, morphology_object = \
+            nmv.file.readers.read_morphology_from_file_naively(morphology_file)
+        if not loading_flag:
+            return morphology_file, 'failed'
+        nmv.file.write_morphology_to_nmvb_file(morphology_object, output_directory)
+    except Exception as error:
+        print('ERROR: Cannot convert [%s]: %s' % (morphology_file, str(error)))
+        return morphology_file, 'failed'
+
+    return morphology_file, 'converted'
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # Get the morphologies
+    morphology_files = list()
+    for extension in ['.h5', '.swc']:
+        morphology_files.extend(['%s/%s' % (args.input_directory, morphology_file)
+                                 for morphology_file in nmv.file.ops.get_files_in_directory(
+                                     args.input_directory, file_extension=extension)])
+    morphology_files.sort()
+    if not os.path.exists(args.output_directory):
+        os.makedirs(args.output_directory)
+
+    # Convert the morphologies in parallel
+    start = time.time()
+    statuses = {'converted': 0, 'skipped': 0, 'failed': 0}
+    tasks = [(morphology_file, args.output_directory, args.overwrite)
+             for morphology_file in morphology_files]
+    with multiprocessing.Pool(processes=max(1, args.processes)) as pool:
+        for i, (morphology_file, status) in enumerate(
+                pool.imap_unordered(convert_morphology, tasks, chunksize=4)):
+            statuses[status] += 1
+            print('[%d/%d] %s: %s' % (i + 1, len(tasks), status, morphology_file))
+
+    print('Converted [%d], skipped [%d] and failed [%d] morphologies in [%f] seconds' %
+          (statuses['converted'], statuses['skipped'], statuses['failed'], time.time() - start))
@@ -18,8 +18,20 @@
 # System imports
 import os
 
+# External imports
+import numpy
+
 # Blender imports
 import bpy
+from mathutils import Vector
+
+# Internal imports
+import nmv.bbox
+import nmv.lod
+import nmv.mesh
+import nmv.rendering
+import nmv.scene
+import mesh_parsing
 
 
 ####################################################################################################
@@ -194,5 +206,272 @@ def load_neurons_membrane_meshes_into_scene(input_directory,
         print('Transforming')
         for i_neuron in neurons_list:
             for i_object in i_neuron.membrane_meshes:
-                for vertex in i_object.data.vertices:
-                    vertex.co = i_neuron.transform * vertex.co
\ No newline at end of file
+                if i_object is None:
+                    continue
+
+                # Transform all the vertices of the mesh at once
+                i_object.data.transform(i_neuron.transform)
+
+
+################################################################################
+# @ create_mesh_object_from_arrays
+################################################################################
+def create_mesh_object_from_arrays(name,
+                                   mesh_arrays):
+    """Creates a mesh object in the scene from flat vertex and face arrays in bulk.
+
+    :param name:
+        The name of the mesh object.
+    :param mesh_arrays:
+        A MeshArrays object with the geometry of the mesh.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    return nmv.mesh.create_mesh_from_arrays(
+        vertices=mesh_arrays.vertices, faces=mesh_arrays.face_indices,
+        face_sizes=mesh_arrays.face_sizes, name=name)
+
+
+################################################################################
+# @ load_circuit_membrane_meshes_into_scene
+################################################################################
+def load_circuit_membrane_meshes_into_scene(input_directory,
+                                            neurons_list,
+                                            input_type,
+                                            transform=False,
+                                            merge_by_material=False,
+                                            number_processes=None):
+    """Loads the meshes of the membranes of a large number of neurons into the scene.
+
+    The .ply and .obj files are parsed in parallel worker processes into flat arrays, the
+    transformation of every neuron is applied to its vertices with a single matrix multiplication
+    and the meshes are created in bulk. The .blend files are loaded with the default loader.
+
+    :param input_directory:
+        The input directory where the meshes are located.
+    :param neurons_list:
+        A list of all the neurons parsed from the configuration file.
+    :param input_type:
+        The types of the input meshes, 'blend', 'ply' or 'obj' .
+    :param transform:
+        Transform the neurons to their positions in the circuit.
+    :param merge_by_material:
+        Merge all the neurons that share the same tag, and therefore the same material, into a
+        single object.
+    :param number_processes:
+        The number of worker processes, by default the number of the cores of the machine.
+    :return:
+        A dictionary of the merged objects per tag if merge_by_material is set, otherwise None.
+    """
+
+    # The .blend files can not be parsed outside Blender
+    if input_type not in ['ply', 'obj']:
+        load_neurons_membrane_meshes_into_scene(
+            input_directory, neurons_list, input_type, transform)
+        return None
+
+    # Parse all the files in parallel
+    tasks = list()
+    for neuron in neurons_list:
+        file_path = '%s/neuron_%s.%s' % (input_directory, str(neuron.gid), input_type)
+        matrix = None
+        if transform and neuron.transform is not None:
+            matrix = [list(row) for row in neuron.transform]
+        tasks.append((file_path, matrix))
+
+    print('Parsing [%d] meshes' % len(tasks))
+    meshes = mesh_parsing.parse_mesh_files(tasks, number_processes)
+
+    # Report the missing files
+    for task, mesh in zip(tasks, meshes):
+        if mesh is None:
+            print('WARNING: File [%s] could NOT be loaded, Skipping ...' % task[0])
+
+    # A single object per neuron
+    if not merge_by_material:
+        print('Creating [%d] meshes' % len(meshes))
+        for neuron, mesh in zip(neurons_list, meshes):
+            if mesh is None:
+                neuron.membrane_meshes = [None]
+                continue
+            neuron.membrane_meshes = [
+                create_mesh_object_from_arrays('neuron_%s' % str(neuron.gid), mesh)]
+        return None
+
+    # Group the meshes by tag
+    tag_meshes = dict()
+    tag_neurons = dict()
+    for neuron, mesh in zip(neurons_list, meshes):
+        if mesh is None:
+            neuron.membrane_meshes = [None]
+            continue
+        tag_meshes.setdefault(neuron.tag, list()).append(mesh)
+        tag_neurons.setdefault(neuron.tag, list()).append(neuron)
+
+    # A single object per tag
+    tag_objects = dict()
+    for tag in tag_meshes.keys():
+        print('Creating the merged mesh of tag [%s] from [%d] neurons' %
+              (str(tag), len(tag_meshes[tag])))
+        merged_mesh = mesh_parsing.merge_mesh_arrays(tag_meshes[tag])
+        tag_objects[tag] = create_mesh_object_from_arrays('tag_%s' % str(tag), merged_mesh)
+        for neuron in tag_neurons[tag]:
+            neuron.membrane_meshes = [tag_objects[tag]]
+
+    return tag_objects
+
+
+################################################################################
+# @ load_circuit_membrane_meshes_with_lod
+################################################################################
+def load_circuit_membrane_meshes_with_lod(input_directory,
+                                          neurons_list,
+                                          input_type,
+                                          camera_views,
+                                          camera_projection,
+                                          image_resolution,
+                                          transform=False,
+                                          cache_directory=None,
+                                          number_processes=None):
+    """Loads the meshes of the membranes of a large number of neurons into the scene, where every
+    neuron is loaded at the level of detail that its footprint in the rendered images requires.
+
+    The tiers are selected from the bounding spheres of the neurons, which are computed from the
+    vertices of the files only, or read from the cache. The neurons that are outside all the
+    views are not loaded, the small ones are drawn as soma proxies that are merged per tag, and
+    only the others are parsed and either loaded at full resolution or decimated. The bounding
+    spheres and the decimated meshes are cached on the disk to be reused by the next renders.
+
+    :param input_directory:
+        The input directory where the meshes are located.
+    :param neurons_list:
+        A list of all the neurons parsed from the configuration file.
+    :param input_type:
+        The types of the input meshes, 'ply' or 'obj'.
+    :param camera_views:
+        A list of the views that will be rendered.
+    :param camera_projection:
+        The projection of the camera.
+    :param image_resolution:
+        The base resolution of the images.
+    :param transform:
+        Transform the neurons to their positions in the circuit.
+    :param cache_directory:
+        The directory where the bounding spheres and the decimated meshes are cached, or None to
+        disable the cache.
+    :param number_processes:
+        The number of worker processes, by default the number of the cores of the machine.
+    """
+
+    cache = None
+    if cache_directory is not None:
+        cache = nmv.lod.LODCache(cache_directory)
+
+    tasks = list()
+    for neuron in neurons_list:
+        file_path = '%s/neuron_%s.%s' % (input_directory, str(neuron.gid), input_type)
+        matrix = None
+        if transform and neuron.transform is not None:
+            matrix = [list(row) for row in neuron.transform]
+        tasks.append((file_path, matrix))
+
+    # The bounding spheres in the coordinates of the files, from the cache if possible
+    spheres = [None] * len(tasks)
+    signatures = [None] * len(tasks)
+    if cache is not None:
+        for i, (neuron, task) in enumerate(zip(neurons_list, tasks)):
+            signatures[i] = cache.compute_signature(task[0], 'bounds')
+            arrays = cache.load_arrays('neuron_%s' % str(neuron.gid), 'bounds', signatures[i])
+            if arrays is not None:
+                spheres[i] = (arrays['center'], float(arrays['radius']))
+
+    # Compute the missing ones in parallel from the vertices of the files only
+    missing = [i for i, sphere in enumerate(spheres) if sphere is None]
+    print('Computing the bounds of [%d] meshes' % len(missing))
+    computed_spheres = mesh_parsing.compute_mesh_files_bounding_spheres(
+        [tasks[i][0] for i in missing], number_processes)
+    for i, sphere in zip(missing, computed_spheres):
+        spheres[i] = sphere
+        if cache is not None and sphere is not None:
+            cache.save_arrays('neuron_%s' % str(neurons_list[i].gid), 'bounds', signatures[i],
+                              center=sphere[0], radius=numpy.array(sphere[1]))
+
+    # Report the missing files
+    loaded = list()
+    for task, neuron, sphere in zip(tasks, neurons_list, spheres):
+        if sphere is None:
+            print('WARNING: File [%s] could NOT be loaded, Skipping ...' % task[0])
+            neuron.membrane_meshes = [None]
+        else:
+            loaded.append((task, neuron, sphere))
+    if len(loaded) == 0:
+        return
+
+    # The bounding spheres of the neurons in the circuit
+    centers = numpy.zeros((len(loaded), 3))
+    radii = numpy.zeros(len(loaded))
+    for i, (task, _, (center, radius)) in enumerate(loaded):
+        if task[1] is not None:
+            center, radius = mesh_parsing.transform_bounding_sphere(center, radius, task[1])
+        centers[i], radii[i] = center, radius
+
+    # Setup the cameras of all the views to select the tiers
+    p_min = (centers - radii[:, numpy.newaxis]).min(axis=0)
+    p_max = (centers + radii[:, numpy.newaxis]).max(axis=0)
+    bounding_box = nmv.bbox.BoundingBox(p_min=Vector(p_min.tolist()), p_max=Vector(p_max.tolist()))
+    views = list()
+    for camera_view in camera_views:
+        camera = nmv.rendering.Camera('lod_camera')
+        camera.setup(bounding_box=bounding_box, camera_view=camera_view,
+                     image_resolution=image_resolution, camera_projection=camera_projection)
+        views.append(nmv.lod.create_lod_view_from_camera(camera.camera))
+        nmv.scene.ops.delete_object_in_scene(camera.camera)
+
+    settings = nmv.lod.LODSettings()
+    tiers = nmv.lod.select_lod_tiers(views, centers, radii, settings)
+    for tier in range(len(nmv.lod.LOD_TIER_NAMES)):
+        print('LOD [%s]: [%d] neurons' %
+              (nmv.lod.LOD_TIER_NAMES[tier], int(numpy.count_nonzero(tiers == tier))))
+
+    # Parse in parallel only the meshes that are drawn at full resolution or decimated
+    drawn = [i for i, tier in enumerate(tiers.tolist())
+             if tier not in (nmv.lod.LOD_PROXY, nmv.lod.LOD_CULLED)]
+    print('Parsing [%d] meshes' % len(drawn))
+    meshes = [None] * len(loaded)
+    for i, mesh in zip(drawn, mesh_parsing.parse_mesh_files(
+            [loaded[i][0] for i in drawn], number_processes)):
+        meshes[i] = mesh
+
+    # Create the meshes
+    proxies = dict()
+    for (task, neuron, _), mesh, tier, center in zip(loaded, meshes, tiers.tolist(), centers):
+
+        if tier == nmv.lod.LOD_CULLED:
+            neuron.membrane_meshes = [None]
+
+        # Group the proxies per tag, to be styled as a single object
+        elif tier == nmv.lod.LOD_PROXY:
+            position = center
+            if neuron.position is not None and transform:
+                position = numpy.array(neuron.position[:])
+            proxies.setdefault(neuron.tag, list()).append(
+                (neuron, position, neuron.soma_mean_radius))
+
+        elif mesh is None:
+            print('WARNING: File [%s] could NOT be loaded, Skipping ...' % task[0])
+            neuron.membrane_meshes = [None]
+
+        else:
+            name = 'neuron_%s' % str(neuron.gid)
+            neuron.membrane_meshes = [nmv.lod.create_lod_mesh_object(
+                name=name, tier=tier, settings=settings, cache=cache, source_file=task[0],
+                create_mesh_object=lambda: create_mesh_object_from_arrays(name, mesh))]
+
+    for tag, tag_proxies in proxies.items():
+        proxies_object = nmv.lod.create_proxies_mesh_object(
+            centers=[proxy[1] for proxy in tag_proxies],
+            radii=[proxy[2] for proxy in tag_proxies],
+            settings=settings, name='proxies_%s' % str(tag))
+        for proxy in tag_proxies:
+            proxy[0].membrane_meshes = [proxies_object]
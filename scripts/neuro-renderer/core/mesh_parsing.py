@@ -0,0 +1,230 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import multiprocessing
+
+# External imports
+import numpy
+
+# Internal imports
+import nmv.file
+import nmv.lod
+
+
+####################################################################################################
+# @apply_transform
+####################################################################################################
+def apply_transform(vertices,
+                    transform):
+    """Applies a 4x4 affine transformation to all the vertices of a mesh with a single matrix
+    multiplication.
+
+    :param vertices:
+        An Nx3 array of vertices.
+    :param transform:
+        A 4x4 transformation matrix, as nested lists or an array.
+    :return:
+        The transformed Nx3 array.
+    """
+
+    matrix = numpy.array(transform, dtype=numpy.float64)
+    transformed = vertices.astype(numpy.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    return transformed.astype(numpy.float32)
+
+
+####################################################################################################
+# @transform_bounding_sphere
+####################################################################################################
+def transform_bounding_sphere(center,
+                              radius,
+                              transform):
+    """Applies a 4x4 affine transformation to a bounding sphere, conservatively.
+
+    The center is transformed and the radius is scaled by the largest scale of the
+    transformation, so the sphere still bounds the transformed vertices.
+
+    :param center:
+        The center of the sphere.
+    :param radius:
+        The radius of the sphere.
+    :param transform:
+        A 4x4 transformation matrix, as nested lists or an array.
+    :return:
+        The transformed center and radius.
+    """
+
+    matrix = numpy.array(transform, dtype=numpy.float64)
+    center = matrix[:3, :3] @ numpy.asarray(center, dtype=numpy.float64) + matrix[:3, 3]
+    return center, radius * float(numpy.linalg.norm(matrix[:3, :3], axis=0).max())
+
+
+####################################################################################################
+# @map_tasks
+####################################################################################################
+def map_tasks(function,
+              tasks,
+              number_processes=None):
+    """Runs a function on a list of tasks in parallel worker processes.
+
+    The workers are forked, so they do not import Blender again. On platforms without fork, the
+    tasks are run in the current process.
+
+    :param function:
+        A function of a single task, defined at the top level of a module.
+    :param tasks:
+        A list of tasks.
+    :param number_processes:
+        The number of worker processes, by default the number of the cores of the machine.
+    :return:
+        A list of the results in the same order of the tasks.
+    """
+
+    if number_processes is None:
+        number_processes = multiprocessing.cpu_count()
+
+    # Serial execution
+    if number_processes < 2 or len(tasks) < 2 or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        return [function(task) for task in tasks]
+
+    # Parallel execution
+    context = multiprocessing.get_context('fork')
+    chunk_size = max(1, len(tasks) // (number_processes * 4))
+    with context.Pool(processes=min(number_processes, len(tasks))) as pool:
+        return pool.map(function, tasks, chunksize=chunk_size)
+
+
+####################################################################################################
+# @compute_mesh_file_bounding_sphere
+####################################################################################################
+def compute_mesh_file_bounding_sphere(file_path):
+    """Computes the bounding sphere of a mesh file from its vertices only, without parsing its
+    faces. This function runs in the worker processes.
+
+    :param file_path:
+        The path to the mesh file.
+    :return:
+        The center and the radius of the sphere in the coordinates of the file, or None if the
+        file does not exist or can not be parsed.
+    """
+
+    if not os.path.isfile(file_path):
+        return None
+
+    try:
+        vertices = nmv.file.read_mesh_vertices(file_path)
+    except (ValueError, IndexError, UnicodeDecodeError) as error:
+        print('WARNING: Cannot parse [%s]: %s' % (file_path, str(error)))
+        return None
+
+    return nmv.lod.compute_bounding_sphere(vertices)
+
+
+####################################################################################################
+# @compute_mesh_files_bounding_spheres
+####################################################################################################
+def compute_mesh_files_bounding_spheres(file_paths,
+                                        number_processes=None):
+    """Computes the bounding spheres of a list of mesh files in parallel worker processes.
+
+    :param file_paths:
+        A list of the paths to the mesh files.
+    :param number_processes:
+        The number of worker processes, by default the number of the cores of the machine.
+    :return:
+        A list of tuples of the center and the radius of every sphere (or None for the missing
+        files) in the same order of the files.
+    """
+
+    return map_tasks(compute_mesh_file_bounding_sphere, file_paths, number_processes)
+
+
+####################################################################################################
+# @parse_mesh_file
+####################################################################################################
+def parse_mesh_file(task):
+    """Parses a single mesh file and transforms it. This function runs in the worker processes.
+
+    :param task:
+        A tuple of the path to the mesh file and an optional 4x4 transformation matrix.
+    :return:
+        A MeshArrays object, or None if the file does not exist or can not be parsed.
+    """
+
+    file_path, transform = task
+
+    if not os.path.isfile(file_path):
+        return None
+
+    try:
+        if file_path.lower().endswith('.ply'):
+            mesh = nmv.file.read_ply_mesh_arrays(file_path)
+        else:
+            mesh = nmv.file.read_obj_mesh_arrays(file_path)
+    except (ValueError, IndexError, UnicodeDecodeError) as error:
+        print('WARNING: Cannot parse [%s]: %s' % (file_path, str(error)))
+        return None
+
+    if transform is not None:
+        mesh.vertices = apply_transform(mesh.vertices, transform)
+
+    return mesh
+
+
+####################################################################################################
+# @parse_mesh_files
+####################################################################################################
+def parse_mesh_files(tasks,
+                     number_processes=None):
+    """Parses a list of mesh files in parallel worker processes.
+
+    :param tasks:
+        A list of tuples of the path to the mesh file and an optional 4x4 transformation matrix.
+    :param number_processes:
+        The number of worker processes, by default the number of the cores of the machine.
+    :return:
+        A list of MeshArrays objects (or None for the missing files) in the same order of the
+        tasks.
+    """
+
+    return map_tasks(parse_mesh_file, tasks, number_processes)
+
+
+####################################################################################################
+# @merge_mesh_arrays
+####################################################################################################
+def merge_mesh_arrays(meshes):
+    """Merges a list of meshes into a single one by concatenating their arrays.
+
+    :param meshes:
+        A list of MeshArrays objects.
+    :return:
+        A single MeshArrays object.
+    """
+
+    # Offset the indices of every mesh by the number of the vertices that precede it
+    vertex_counts = numpy.array([len(mesh.vertices) for mesh in meshes], dtype=numpy.int64)
+    vertex_offsets = numpy.concatenate(([0], numpy.cumsum(vertex_counts)[:-1]))
+
+    vertices = numpy.concatenate([mesh.vertices for mesh in meshes])
+    face_indices = numpy.concatenate(
+        [mesh.face_indices + offset for mesh, offset in zip(meshes, vertex_offsets)])
+    face_sizes = numpy.concatenate([mesh.face_sizes for mesh in meshes])
+
+    return nmv.file.MeshArrays(vertices, face_indices.astype(numpy.int32), face_sizes)
@@ -79,6 +79,22 @@ def parse_command_line_arguments(arguments=None):
     parser.add_argument('--transform',
                         action='store_true', default=False, dest='transform', help=arg_help)
 
+    arg_help = 'Merge the neurons that share the same tag into a single object per material'
+    parser.add_argument('--merge-by-material',
+                        action='store_true', default=False, dest='merge_by_material', help=arg_help)
+
+    arg_help = 'Number of processes used to parse the meshes, by default all the cores'
+    parser.add_argument('--processes',
+                        action='store', type=int, default=None, dest='processes', help=arg_help)
+
+    arg_help = 'Load every neuron at the level of detail required by its size in the images'
+    parser.add_argument('--lod',
+                        action='store_true', default=False, dest='lod', help=arg_help)
+
+    arg_help = 'Directory where the level-of-detail meshes are cached across renders'
+    parser.add_argument('--lod-cache-directory',
+                        action='store', default=None, dest='lod_cache_directory', help=arg_help)
+
     arg_help = 'Image and scene prefix'
     parser.add_argument('--prefix',
                         action='store', default='image', dest='prefix', help=arg_help)
@@ -119,10 +119,10 @@ def apply_style(neurons,
         # Alpha
         alpha = get_tag_alpha(tag, styles)
 
-        style_name = 'style_%s_%s' % (str(tag),  str(neuron.gid))
+        style_name = 'style_%s' % str(tag)
 
-        # Create the shader from the shader library
-        material = nmv.shading.create_material(style_name, color, shader)
+        # Get the shared material of the tag from the material registry
+        material = nmv.shading.create_material(style_name, color, shader, alpha=alpha)
 
         # Apply the shader to the membrane object
         for membrane_mesh in neuron.membrane_meshes:
@@ -130,6 +130,39 @@ def apply_style(neurons,
             nmv.shading.set_material_to_object(membrane_mesh, material)
 
 
+####################################################################################################
+# @apply_style_to_merged_meshes
+####################################################################################################
+def apply_style_to_merged_meshes(tag_objects,
+                                 styles):
+    """Apply a style given from the configuration to the meshes that are merged by tag, using a
+    single material per tag.
+
+    :param tag_objects:
+        A dictionary of the merged mesh objects per tag.
+    :param styles:
+        A style configuration.
+    """
+
+    print('* Applying style to merged meshes')
+    for tag, mesh_object in tag_objects.items():
+
+        # Color
+        color = get_tag_rgb_color(tag, styles)
+
+        # Shader
+        shader = nmv.enums.Shader.get_enum(get_tag_shader(tag, styles))
+
+        # Alpha
+        alpha = get_tag_alpha(tag, styles)
+
+        # Get the shared material of the tag from the material registry
+        material = nmv.shading.create_material('style_%s' % str(tag), color, shader, alpha=alpha)
+
+        # Apply the shader to the merged object
+        nmv.shading.set_material_to_object(mesh_object, material)
+
+
 ####################################################################################################
 # @apply_style
 ####################################################################################################
@@ -161,10 +194,10 @@ def draw_spheres(neurons,
         # Alpha
         alpha = get_tag_alpha(tag, styles)
 
-        style_name = 'style_%s_%s' % (str(tag), str(neuron.gid))
+        style_name = 'style_%s' % str(tag)
 
-        # Create the shader from the shader library
-        material = nmv.shading.create_material(style_name, color, shader)
+        # Get the shared material of the tag from the material registry
+        material = nmv.shading.create_material(style_name, color, shader, alpha=alpha)
 
         # Draw the sphere
         neuron_sphere = nmv.geometry.create_uv_sphere(location=neuron.position,
@@ -62,12 +62,27 @@ if __name__ == "__main__":
     else:
         print('Importing [%d] neurons' % len(neurons))
 
+        # Load the neurons into the scene at the level of detail of the rendered views
+        if args.lod and args.input_type in ['ply', 'obj']:
+            loading.load_circuit_membrane_meshes_with_lod(
+                args.input_directory, neurons, args.input_type,
+                camera_views=[nmv.enums.Camera.View.SIDE, nmv.enums.Camera.View.FRONT],
+                camera_projection=nmv.enums.Camera.Projection.get_enum(args.projection),
+                image_resolution=int(args.resolution), transform=args.transform,
+                cache_directory=args.lod_cache_directory, number_processes=args.processes)
+            tag_objects = None
+
         # Load the neurons into the scene
-        neuron_objects = loading.load_neurons_membrane_meshes_into_scene(
-            args.input_directory, neurons, args.input_type, args.transform)
+        else:
+            tag_objects = loading.load_circuit_membrane_meshes_into_scene(
+                args.input_directory, neurons, args.input_type, args.transform,
+                merge_by_material=args.merge_by_material, number_processes=args.processes)
 
         # Apply the style
-        styling.apply_style(neurons, styles)
+        if tag_objects is not None:
+            styling.apply_style_to_merged_meshes(tag_objects, styles)
+        else:
+            styling.apply_style(neurons, styles)
 
     # Setup the camera
     camera = nmv.rendering.Camera('%s_camera' % args.prefix)
@@ -53,6 +53,15 @@ USE_SPHERES='no'
 # Transform the neurons to their local positions
 TRANSFORM_NEURONS='no'
 
+# Merge the neurons that share the same material into a single object
+MERGE_BY_MATERIAL='no'
+
+# Load every neuron at the level of detail required by its size in the images
+USE_LOD='no'
+
+# The directory where the level-of-detail meshes are cached across renders, empty to disable
+LOD_CACHE_DIRECTORY=''
+
 # Prefix
 PREFIX='scene'
 
@@ -62,6 +71,12 @@ if [ "$USE_SPHERES" == "yes" ];
     then BOOL_ARGS+=' --use-spheres'; fi
 if [ "$TRANSFORM_NEURONS" == "yes" ];
     then BOOL_ARGS+=' --transform'; fi
+if [ "$MERGE_BY_MATERIAL" == "yes" ];
+    then BOOL_ARGS+=' --merge-by-material'; fi
+if [ "$USE_LOD" == "yes" ];
+    then BOOL_ARGS+=' --lod'; fi
+if [ -n "$LOD_CACHE_DIRECTORY" ];
+    then BOOL_ARGS+=" --lod-cache-directory=$LOD_CACHE_DIRECTORY"; fi
 
 ####################################################################################################
 echo 'RENDERING ...'
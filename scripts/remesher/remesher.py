@@ -45,16 +45,31 @@ class MetaBuilderRemesher:
     # @__init__
     ################################################################################################
     def __init__(self,
-                 input_mesh):
+                 input_mesh,
+                 max_iterations=10000,
+                 propagation_steps=1000,
+                 convergence_tolerance=1e-3):
         """Constructor
 
         :param input_mesh:
             A given mesh to get remeshed.
+        :param max_iterations:
+            The maximum number of steps of the particle simulation.
+        :param propagation_steps:
+            The maximum number of steps to propagate the front of the particles on the surface.
+        :param convergence_tolerance:
+            The repulsion of the particles stops once their mean displacement in an iteration,
+            relative to their radii, drops below this tolerance.
         """
 
         # Morphology
         self.input_mesh = input_mesh
 
+        # The budget and the convergence criteria of the particle simulation
+        self.max_iterations = max_iterations
+        self.propagation_steps = propagation_steps
+        self.convergence_tolerance = convergence_tolerance
+
         # Meta object skeleton, used to build the skeleton of the morphology
         self.meta_skeleton = None
 
@@ -90,13 +105,23 @@ class MetaBuilderRemesher:
         nmv.scene.select_object(scene_object=self.input_mesh)
 
         # Run the particles simulation remesher
-        mesher = nmv.physics.ParticleRemesher(resolution=20, mask_resolution=20)
+        mesher = nmv.physics.ParticleRemesher(resolution=20, mask_resolution=20,
+                                              repulsion_tolerance=self.convergence_tolerance,
+                                              propagation_steps=self.propagation_steps)
         stepper = mesher.run(mesh_object=self.input_mesh, context=bpy.context, interactive=True)
 
-        for i in range(1000000):
+        for i in range(self.max_iterations):
             finished = next(stepper)
             if finished:
                 break
+        else:
+            nmv.logger.info('The particle simulation did not finish in [%d] steps, '
+                            'creating the mesh from the current particles' % self.max_iterations)
+
+            # Skip the rest of the simulation, but still tessellate the mesh
+            mesher.finish()
+            for _ in stepper:
+                pass
 
     ################################################################################################
     # @build_meta_field_with_meta_balls
@@ -105,25 +130,24 @@ class MetaBuilderRemesher:
         """Builds the meta filed with meta balls
         """
 
-        # Build the soma profile from the soft-body mesh
-        for face in self.input_mesh.data.polygons:
-
-            # Add a new meta element
-            meta_element = self.meta_skeleton.elements.new()
-
-            # Compute the largest radius in the triangle, but since we re-mesh the soma, we will
-            # get almost equi-sides faces
-            radius = nmv.mesh.get_largest_radius_in_face(
-                mesh_object=self.input_mesh, face_index=face.index)
-
-            # Compute the radius of the meta-element by trial-and-error
-            meta_element.radius = radius * 2 * self.magic_scale_factor
-
-            if meta_element.radius < self.smallest_radius:
-                self.smallest_radius = meta_element.radius
-
-            # Update its coordinates
-            meta_element.co = face.center - (face.normal * radius * self.magic_scale_factor)
+        # Compute the largest radius in every face in bulk, but since we re-mesh the soma, we will
+        # get almost equi-sides faces
+        radii = nmv.mesh.get_largest_radii_in_faces(mesh_object=self.input_mesh)
+        if len(radii) == 0:
+            return
+        centers = nmv.mesh.get_faces_centers(mesh_object=self.input_mesh)
+        normals = nmv.mesh.get_faces_normals(mesh_object=self.input_mesh)
+
+        # Compute the radii of the meta-elements by trial-and-error, and their coordinates
+        elements_radii = radii * 2 * self.magic_scale_factor
+        elements_centers = centers - normals * (radii * self.magic_scale_factor)[:, None]
+        self.smallest_radius = min(self.smallest_radius, float(elements_radii.min()))
+
+        # Add the meta elements, and then set their attributes in bulk
+        for i in range(len(radii)):
+            self.meta_skeleton.elements.new()
+        self.meta_skeleton.elements.foreach_set('radius', elements_radii.astype('float32'))
+        self.meta_skeleton.elements.foreach_set('co', elements_centers.astype('float32').ravel())
 
     ################################################################################################
     # @initialize_meta_object
@@ -68,6 +68,21 @@ def parse_command_line_arguments(arguments=None):
                         action='store', dest='decimation_factor', type=float, default=1.0,
                         help=arg_help)
 
+    arg_help = 'The maximum number of steps of the particle simulation'
+    parser.add_argument('--max-iterations',
+                        action='store', dest='max_iterations', type=int, default=10000,
+                        help=arg_help)
+
+    arg_help = 'The maximum number of steps to propagate the particles on the surface'
+    parser.add_argument('--propagation-steps',
+                        action='store', dest='propagation_steps', type=int, default=1000,
+                        help=arg_help)
+
+    arg_help = 'The relative displacement of the particles below which their repulsion stops'
+    parser.add_argument('--convergence-tolerance',
+                        action='store', dest='convergence_tolerance', type=float, default=1e-3,
+                        help=arg_help)
+
     # Parse the arguments
     return parser.parse_args()
 
@@ -102,7 +117,10 @@ if __name__ == "__main__":
     nmv.scene.select_object(input_mesh)
 
     # Generate the astrocyte
-    builder = remesher.MetaBuilderRemesher(input_mesh=input_mesh)
+    builder = remesher.MetaBuilderRemesher(input_mesh=input_mesh,
+                                           max_iterations=args.max_iterations,
+                                           propagation_steps=args.propagation_steps,
+                                           convergence_tolerance=args.convergence_tolerance)
     builder.reconstruct_mesh()
 
     # Export the mesh to a .BLEND file
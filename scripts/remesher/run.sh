@@ -30,6 +30,15 @@ OUTPUT_DIRECTORY='/projects-data/2020.12.25-remeshing/output-meshes'
 # generated for the visualization purposes.
 DECIMATION_FACTOR='0.1'
 
+# The maximum number of steps of the particle simulation
+MAX_ITERATIONS='10000'
+
+# The maximum number of steps to propagate the particles on the surface of the mesh
+PROPAGATION_STEPS='1000'
+
+# The repulsion of the particles stops once their relative displacement drops below this value
+CONVERGENCE_TOLERANCE='0.001'
+
 # Export the final mesh in a .OBJ file, 'yes' or 'no'
 EXPORT_OBJ='yes'
 
@@ -47,5 +56,8 @@ if [ "$EXPORT_BLEND" == "yes" ];
 $BLENDER -b --verbose 0 --python run.py --                                                         \
     --input-mesh=$INPUT_MESH                                                                        \
     --decimation-factor=$DECIMATION_FACTOR                                                          \
+    --max-iterations=$MAX_ITERATIONS                                                                \
+    --propagation-steps=$PROPAGATION_STEPS                                                          \
+    --convergence-tolerance=$CONVERGENCE_TOLERANCE                                                  \
     --output-directory=$OUTPUT_DIRECTORY                                                            \
     $BOOL_ARGS
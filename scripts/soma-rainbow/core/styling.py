@@ -119,10 +119,10 @@ def apply_style(neurons,
         # Alpha
         alpha = get_tag_alpha(tag, styles)
 
-        style_name = 'style_%s_%s' % (str(tag),  str(neuron.gid))
+        style_name = 'style_%s' % str(tag)
 
-        # Create the shader from the shader library
-        material = nmv.shading.create_material(style_name, color, shader)
+        # Get the shared material of the tag from the material registry
+        material = nmv.shading.create_material(style_name, color, shader, alpha=alpha)
 
         # Apply the shader to the membrane object
         for membrane_mesh in neuron.membrane_meshes:
@@ -161,10 +161,10 @@ def draw_spheres(neurons,
         # Alpha
         alpha = get_tag_alpha(tag, styles)
 
-        style_name = 'style_%s_%s' % (str(tag), str(neuron.gid))
+        style_name = 'style_%s' % str(tag)
 
-        # Create the shader from the shader library
-        material = nmv.shading.create_material(style_name, color, shader)
+        # Get the shared material of the tag from the material registry
+        material = nmv.shading.create_material(style_name, color, shader, alpha=alpha)
 
         # Draw the sphere
         neuron_sphere = nmv.geometry.create_uv_sphere(location=neuron.position,
@@ -303,8 +303,8 @@ def apply_rainbow_style(neurons,
 
         style_name = 'style_%s_%s' % (str(tag),  str(neuron.gid))
 
-        # Create the shader from the shader library
-        material = nmv.shading.create_material(style_name, color, shader)
+        # Get the material of the color from the material registry
+        material = nmv.shading.create_material(style_name, color, shader, alpha=alpha)
 
         # Apply the shader to the membrane object
         for membrane_mesh in neuron.membrane_meshes:
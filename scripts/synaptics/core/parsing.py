@@ -47,6 +47,16 @@ def parse_synaptome_command_line_arguments(arguments=None):
     parser.add_argument('--gid',
                         action='store', dest='gid', type=int, help=arg_help)
 
+    arg_help = 'A local .h5 or .csv synapses file, used instead of the circuit if given with ' \
+               'the cells file'
+    parser.add_argument('--synapses-file',
+                        action='store', dest='synapses_file', default=None, help=arg_help)
+
+    arg_help = 'A local .h5 or .csv cells file, used instead of the circuit if given with ' \
+               'the synapses file'
+    parser.add_argument('--cells-file',
+                        action='store', dest='cells_file', default=None, help=arg_help)
+
     arg_help = 'The percentage of synapses to be drawn in the rendering'
     parser.add_argument('--synapse-percentage',
                         action='store', dest='synapse_percentage', type=float, help=arg_help)
@@ -0,0 +1,552 @@
+####################################################################################################
+# Copyright (c) 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import csv
+import os
+
+# External imports
+import numpy
+
+
+# The columns of a synapse table
+SYNAPSE_COLUMNS = ['post_x', 'post_y', 'post_z', 'pre_x', 'pre_y', 'pre_z',
+                   'pre_gid', 'pre_mtype', 'type']
+
+# The columns of a cells table
+CELL_COLUMNS = ['gid', 'mtype', 'x', 'y', 'z',
+                'o00', 'o01', 'o02', 'o10', 'o11', 'o12', 'o20', 'o21', 'o22', 'morphology']
+
+# The synapse types below this value are inhibitory
+INHIBITORY_TYPE_THRESHOLD = 100
+
+
+####################################################################################################
+# @SynapseTable
+####################################################################################################
+class SynapseTable:
+    """A columnar table of synapses, where every column is a numpy array with one entry per synapse.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 post_positions,
+                 pre_positions,
+                 pre_gids,
+                 pre_mtypes,
+                 types):
+        """Constructor
+
+        :param post_positions:
+            An Nx3 array of the positions of the synapses on the post-synaptic side.
+        :param pre_positions:
+            An Nx3 array of the positions of the synapses on the pre-synaptic side.
+        :param pre_gids:
+            An array of the GIDs of the pre-synaptic cells.
+        :param pre_mtypes:
+            An array of the mtypes (strings) of the pre-synaptic cells.
+        :param types:
+            An array of the types of the synapses.
+        """
+
+        self.post_positions = numpy.asarray(post_positions, dtype=numpy.float64).reshape(-1, 3)
+        self.pre_positions = numpy.asarray(pre_positions, dtype=numpy.float64).reshape(-1, 3)
+        self.pre_gids = numpy.asarray(pre_gids, dtype=numpy.int64)
+        self.pre_mtypes = numpy.asarray(pre_mtypes, dtype=str)
+        self.types = numpy.asarray(types, dtype=numpy.int64)
+
+    ################################################################################################
+    # @__len__
+    ################################################################################################
+    def __len__(self):
+        """The number of synapses in the table.
+        """
+
+        return len(self.types)
+
+    ################################################################################################
+    # @select
+    ################################################################################################
+    def select(self,
+               selection):
+        """Selects a subset of the synapses.
+
+        :param selection:
+            A boolean mask or an array of indices.
+        :return:
+            A new SynapseTable with the selected synapses.
+        """
+
+        return SynapseTable(self.post_positions[selection], self.pre_positions[selection],
+                            self.pre_gids[selection], self.pre_mtypes[selection],
+                            self.types[selection])
+
+    ################################################################################################
+    # @sample
+    ################################################################################################
+    def sample(self,
+               percentage,
+               seed=None):
+        """Randomly selects a given percentage of the synapses.
+
+        :param percentage:
+            The percentage of the synapses to keep, between 0 and 100.
+        :param seed:
+            An optional seed of the random generator.
+        :return:
+            A new SynapseTable with the selected synapses.
+        """
+
+        if percentage >= 100:
+            return self
+        random_state = numpy.random.RandomState(seed)
+        return self.select(random_state.uniform(0, 100, len(self)) < percentage)
+
+    ################################################################################################
+    # @is_inhibitory
+    ################################################################################################
+    def is_inhibitory(self):
+        """Gets a mask of the inhibitory synapses.
+
+        :return:
+            A boolean array, True for the inhibitory synapses.
+        """
+
+        return self.types < INHIBITORY_TYPE_THRESHOLD
+
+    ################################################################################################
+    # @transform
+    ################################################################################################
+    def transform(self,
+                  matrix):
+        """Transforms the positions of the synapses with a given affine matrix.
+
+        :param matrix:
+            A 4x4 transformation matrix, numpy array or Blender Matrix.
+        :return:
+            A new transformed SynapseTable.
+        """
+
+        matrix = numpy.array(matrix, dtype=numpy.float64)
+        rotation = matrix[:3, :3].T
+        translation = matrix[:3, 3]
+        return SynapseTable(self.post_positions @ rotation + translation,
+                            self.pre_positions @ rotation + translation,
+                            self.pre_gids, self.pre_mtypes, self.types)
+
+
+####################################################################################################
+# @SynapseSource
+####################################################################################################
+class SynapseSource:
+    """The interface of a source of synapse and cell data.
+    """
+
+    ################################################################################################
+    # @get_afferent_synapses
+    ################################################################################################
+    def get_afferent_synapses(self,
+                              gid):
+        """Gets all the afferent synapses of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A SynapseTable.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_cell_transformation
+    ################################################################################################
+    def get_cell_transformation(self,
+                                gid):
+        """Gets the transformation of a given cell from its local to the global coordinates.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A 4x4 numpy array.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_cell_mtype
+    ################################################################################################
+    def get_cell_mtype(self,
+                       gid):
+        """Gets the mtype of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The mtype string.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_morphology_path
+    ################################################################################################
+    def get_morphology_path(self,
+                            gid):
+        """Gets the path to the morphology file of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The path to the morphology file.
+        """
+
+        raise NotImplementedError
+
+
+####################################################################################################
+# @CircuitSynapseSource
+####################################################################################################
+class CircuitSynapseSource(SynapseSource):
+    """A synapse source that reads the data from a BBP circuit with bluepy, where every column is
+    fetched with a single connectome query.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 circuit_config):
+        """Constructor
+
+        :param circuit_config:
+            BBP circuit config.
+        """
+
+        from bluepy.v2 import Circuit
+        self.circuit = Circuit(circuit_config)
+
+    ################################################################################################
+    # @get_afferent_synapses
+    ################################################################################################
+    def get_afferent_synapses(self,
+                              gid):
+        """Gets all the afferent synapses of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A SynapseTable.
+        """
+
+        import bluepy
+
+        connectome = self.circuit.connectome
+        synapse_ids = connectome.afferent_synapses(gid)
+
+        # All the properties in a single query
+        properties = connectome.synapse_properties(
+            synapse_ids, [bluepy.v2.enums.Synapse.TYPE, bluepy.v2.enums.Synapse.PRE_GID])
+        types = properties[bluepy.v2.enums.Synapse.TYPE].values
+        pre_gids = properties[bluepy.v2.enums.Synapse.PRE_GID].values
+
+        # Positions
+        post_positions = connectome.synapse_positions(synapse_ids, 'post', 'center').values
+        pre_positions = connectome.synapse_positions(synapse_ids, 'pre', 'contour').values
+
+        # The mtypes of the unique pre-synaptic cells only
+        unique_gids, inverse = numpy.unique(pre_gids, return_inverse=True)
+        unique_mtypes = self.circuit.cells.get(unique_gids.tolist())['mtype'].values
+        pre_mtypes = numpy.asarray(unique_mtypes, dtype=str)[inverse]
+
+        return SynapseTable(post_positions, pre_positions, pre_gids, pre_mtypes, types)
+
+    ################################################################################################
+    # @get_cell_transformation
+    ################################################################################################
+    def get_cell_transformation(self,
+                                gid):
+        """Gets the transformation of a given cell from its local to the global coordinates.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A 4x4 numpy array.
+        """
+
+        neuron = self.circuit.cells.get(gid)
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = numpy.array(neuron['orientation'], dtype=numpy.float64)
+        matrix[:3, 3] = [neuron['x'], neuron['y'], neuron['z']]
+        return matrix
+
+    ################################################################################################
+    # @get_cell_mtype
+    ################################################################################################
+    def get_cell_mtype(self,
+                       gid):
+        """Gets the mtype of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The mtype string.
+        """
+
+        return self.circuit.cells.get(gid).mtype
+
+    ################################################################################################
+    # @get_morphology_path
+    ################################################################################################
+    def get_morphology_path(self,
+                            gid):
+        """Gets the path to the morphology file of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The path to the morphology file.
+        """
+
+        return self.circuit.morph.get_filepath(int(gid))
+
+
+####################################################################################################
+# @read_table_file
+####################################################################################################
+def read_table_file(file_path,
+                    columns):
+    """Reads a columnar table from an .h5 or a .csv file.
+
+    In .h5 files every column is a dataset at the root of the file, and in .csv files the first
+    row is a header with the names of the columns.
+
+    :param file_path:
+        The path to the file.
+    :param columns:
+        The names of the columns to read.
+    :return:
+        A dictionary of numpy arrays, one per column.
+    """
+
+    if os.path.splitext(file_path)[1].lower() in ['.h5', '.hdf5']:
+        import h5py
+        with h5py.File(file_path, 'r') as h5_file:
+            table = dict()
+            for column in columns:
+                data = h5_file[column][()]
+                if data.dtype.kind in ['S', 'O']:
+                    data = numpy.array([value.decode() if isinstance(value, bytes) else value
+                                        for value in data], dtype=str)
+                table[column] = data
+            return table
+
+    with open(file_path, 'r', newline='') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    return {column: numpy.array([row[column] for row in rows]) for column in columns}
+
+
+####################################################################################################
+# @write_table_file
+####################################################################################################
+def write_table_file(file_path,
+                     table):
+    """Writes a columnar table to an .h5 or a .csv file.
+
+    :param file_path:
+        The path to the file.
+    :param table:
+        A dictionary of equally sized arrays, one per column.
+    """
+
+    columns = list(table.keys())
+    if os.path.splitext(file_path)[1].lower() in ['.h5', '.hdf5']:
+        import h5py
+        with h5py.File(file_path, 'w') as h5_file:
+            for column in columns:
+                data = numpy.asarray(table[column])
+                if data.dtype.kind == 'U':
+                    data = data.astype('S')
+                h5_file.create_dataset(column, data=data)
+        return
+
+    with open(file_path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(columns)
+        writer.writerows(zip(*[numpy.asarray(table[column]).tolist() for column in columns]))
+
+
+####################################################################################################
+# @LocalSynapseSource
+####################################################################################################
+class LocalSynapseSource(SynapseSource):
+    """A synapse source that reads the data from local .h5 or .csv files, for offline use.
+
+    The synapses file has the SYNAPSE_COLUMNS plus a 'post_gid' column, and the cells file has the
+    CELL_COLUMNS, one row per cell.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 synapses_file,
+                 cells_file):
+        """Constructor
+
+        :param synapses_file:
+            The path to the synapses file.
+        :param cells_file:
+            The path to the cells file.
+        """
+
+        self.synapses = read_table_file(synapses_file, ['post_gid'] + SYNAPSE_COLUMNS)
+        self.synapses['post_gid'] = self.synapses['post_gid'].astype(numpy.int64)
+
+        cells = read_table_file(cells_file, CELL_COLUMNS)
+        self.cells = dict()
+        for i, gid in enumerate(cells['gid'].astype(numpy.int64).tolist()):
+            self.cells[gid] = {column: cells[column][i] for column in CELL_COLUMNS}
+
+    ################################################################################################
+    # @get_afferent_synapses
+    ################################################################################################
+    def get_afferent_synapses(self,
+                              gid):
+        """Gets all the afferent synapses of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A SynapseTable.
+        """
+
+        selection = self.synapses['post_gid'] == gid
+
+        def get_columns(names):
+            return numpy.stack([self.synapses[name][selection].astype(numpy.float64)
+                                for name in names], axis=1)
+
+        return SynapseTable(post_positions=get_columns(['post_x', 'post_y', 'post_z']),
+                            pre_positions=get_columns(['pre_x', 'pre_y', 'pre_z']),
+                            pre_gids=self.synapses['pre_gid'][selection].astype(numpy.int64),
+                            pre_mtypes=self.synapses['pre_mtype'][selection],
+                            types=self.synapses['type'][selection].astype(numpy.int64))
+
+    ################################################################################################
+    # @get_cell_transformation
+    ################################################################################################
+    def get_cell_transformation(self,
+                                gid):
+        """Gets the transformation of a given cell from its local to the global coordinates.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            A 4x4 numpy array.
+        """
+
+        cell = self.cells[gid]
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = numpy.array(
+            [[float(cell['o%d%d' % (i, j)]) for j in range(3)] for i in range(3)])
+        matrix[:3, 3] = [float(cell['x']), float(cell['y']), float(cell['z'])]
+        return matrix
+
+    ################################################################################################
+    # @get_cell_mtype
+    ################################################################################################
+    def get_cell_mtype(self,
+                       gid):
+        """Gets the mtype of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The mtype string.
+        """
+
+        return str(self.cells[gid]['mtype'])
+
+    ################################################################################################
+    # @get_morphology_path
+    ################################################################################################
+    def get_morphology_path(self,
+                            gid):
+        """Gets the path to the morphology file of a given cell.
+
+        :param gid:
+            Neuron GID.
+        :return:
+            The path to the morphology file.
+        """
+
+        return str(self.cells[gid]['morphology'])
+
+
+####################################################################################################
+# @export_synapse_source
+####################################################################################################
+def export_synapse_source(source,
+                          gids,
+                          synapses_file,
+                          cells_file):
+    """Exports the afferent synapses of a list of cells, and the data of these post-synaptic
+    cells, from a given source into local files that can be loaded by a LocalSynapseSource.
+
+    The pre-synaptic cells are not written to the cells file, only their GIDs and mtypes are
+    stored with every synapse.
+
+    :param source:
+        A given SynapseSource, typically a CircuitSynapseSource.
+    :param gids:
+        A list of post-synaptic GIDs.
+    :param synapses_file:
+        The path to the output synapses file, .h5 or .csv.
+    :param cells_file:
+        The path to the output cells file, .h5 or .csv.
+    """
+
+    synapses = {column: list() for column in ['post_gid'] + SYNAPSE_COLUMNS}
+    cells = {column: list() for column in CELL_COLUMNS}
+
+    for gid in gids:
+        table = source.get_afferent_synapses(gid)
+        synapses['post_gid'].append(numpy.full(len(table), gid, dtype=numpy.int64))
+        for i, axis in enumerate(['x', 'y', 'z']):
+            synapses['post_%s' % axis].append(table.post_positions[:, i])
+            synapses['pre_%s' % axis].append(table.pre_positions[:, i])
+        synapses['pre_gid'].append(table.pre_gids)
+        synapses['pre_mtype'].append(table.pre_mtypes)
+        synapses['type'].append(table.types)
+
+        # The post-synaptic cell
+        matrix = source.get_cell_transformation(gid)
+        cells['gid'].append(gid)
+        cells['mtype'].append(source.get_cell_mtype(gid))
+        for i, axis in enumerate(['x', 'y', 'z']):
+            cells[axis].append(matrix[i, 3])
+        for i in range(3):
+            for j in range(3):
+                cells['o%d%d' % (i, j)].append(matrix[i, j])
+        cells['morphology'].append(source.get_morphology_path(gid))
+
+    write_table_file(synapses_file, {column: numpy.concatenate(values)
+                                     for column, values in synapses.items()})
+    write_table_file(cells_file, {column: numpy.array(values)
+                                  for column, values in cells.items()})
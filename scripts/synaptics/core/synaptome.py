@@ -16,7 +16,6 @@
 ####################################################################################################
 
 # System imports
-import random
 import os
 import sys
 
@@ -25,21 +24,19 @@ import_paths = ['core']
 for import_path in import_paths:
     sys.path.append(('%s/%s' % (os.path.dirname(os.path.realpath(__file__)), import_path)))
 
-import circuit_data
+import synapse_data
 
-# BBP imports
-import bluepy
-from bluepy.v2 import Circuit
-
-# Blender
-from mathutils import Vector, Matrix
+# External imports
+import numpy
 
 # Internal imports
 import nmv.bbox
 import nmv.builders
 import nmv.consts
 import nmv.enums
+import nmv.file
 import nmv.geometry
+import nmv.logger
 import nmv.options
 import nmv.mesh
 import nmv.rendering
@@ -49,289 +46,297 @@ import nmv.utilities
 
 
 ####################################################################################################
-# @create_mtype_based_synapses_mesh
+# @create_ico_sphere_template
 ####################################################################################################
-def create_mtype_based_synapses_mesh(circuit,
-                                     gid,
-                                     synapse_size,
-                                     synapse_percentage,
-                                     inverted_transformation,
-                                     color_map_materials):
-    """Creates a mesh of all the synapses based on their mtypes
-    :param circuit:
-        BBP circuit.
-    :param gid:
-        Neuron GID.
-    :param synapse_size:
-        The size of the synapses.
-    :param synapse_percentage:
-        The percentage of the syanpses to be drawn.
-    :param inverted_transformation:
-        The inverted transformation that will take the synapses to the origin.
-    :param color_map_materials:
-        A dictionary of all the mtype materials.
+def create_ico_sphere_template(subdivisions=3):
+    """Creates the arrays of a unit ico-sphere that is instanced at every synapse.
+
+    :param subdivisions:
+        Number of sphere subdivisions, 3 by default.
     :return:
-        A reference to the created synapse mesh.
+        An Nx3 array of vertices and an Mx3 array of triangles.
     """
 
-    # Get the IDs of the afferent synapses of a given GID
-    afferent_synapses_ids = circuit.connectome.afferent_synapses(gid)
+    sphere = nmv.geometry.create_ico_sphere(radius=1.0, subdivisions=subdivisions,
+                                            name='synapse_template')
+    vertices, triangles = nmv.mesh.get_mesh_arrays(sphere)
+    nmv.scene.delete_object_in_scene(sphere)
+    return vertices, triangles
 
-    # Get the synapse type
-    synapse_types = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.TYPE]).values
 
-    # Get the positions of the incoming synapses at the post synaptic side
-    post_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'post', 'center').values.tolist()
-    pre_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'pre', 'contour').values.tolist()
+####################################################################################################
+# @compute_alignment_rotations
+####################################################################################################
+def compute_alignment_rotations(directions,
+                                axis=(0.0, 0.0, -1.0)):
+    """Computes the rotation matrices that align a given axis with a list of directions.
+
+    :param directions:
+        An Nx3 array of directions.
+    :param axis:
+        The axis of the template that is aligned with the directions.
+    :return:
+        An Nx3x3 array of rotation matrices.
+    """
 
-    # Get the GIDs of the pre-synaptic cells
-    pre_gids = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values
-    pre_synaptic_gids = [gid[0] for gid in pre_gids]
+    axis = numpy.asarray(axis, dtype=numpy.float64)
+    lengths = numpy.linalg.norm(directions, axis=1, keepdims=True)
+    directions = numpy.where(lengths > 0.0, directions / numpy.maximum(lengths, 1e-12), axis)
 
-    # Get the pre-synaptic mtypes
-    pre_synaptic_mtypes = circuit.cells.get(pre_synaptic_gids)['mtype'].values.tolist()
+    # Rodrigues' formula, R = I + [v] + [v]^2 / (1 + c)
+    v = numpy.cross(axis, directions)
+    c = directions @ axis
+    skew = numpy.zeros((len(directions), 3, 3))
+    skew[:, 0, 1], skew[:, 0, 2] = -v[:, 2], v[:, 1]
+    skew[:, 1, 0], skew[:, 1, 2] = v[:, 2], -v[:, 0]
+    skew[:, 2, 0], skew[:, 2, 1] = -v[:, 1], v[:, 0]
+    factor = 1.0 / numpy.maximum(1.0 + c, 1e-12)
+    rotations = numpy.identity(3) + skew + (skew @ skew) * factor[:, None, None]
 
-    # We need the color and the position to draw the synaptome
-    synapse_objects = list()
-    synapse_groups = list()
+    # Opposite directions, rotate by 180 degrees around an axis that is normal to the given one
+    opposite = c < -1.0 + 1e-9
+    if numpy.any(opposite):
+        normal = numpy.cross(axis, [1.0, 0.0, 0.0])
+        if numpy.linalg.norm(normal) < 1e-6:
+            normal = numpy.cross(axis, [0.0, 1.0, 0.0])
+        normal /= numpy.linalg.norm(normal)
+        rotations[opposite] = 2.0 * numpy.outer(normal, normal) - numpy.identity(3)
 
-    # Do it for all the synapses
-    for i in range(len(post_synaptic_positions)):
+    return rotations
 
-        # Show progress
-        nmv.utilities.time_line.show_iteration_progress('Synapses', i, len(post_synaptic_positions))
 
-        # Random selection
-        if synapse_percentage < random.uniform(0, 100):
-            continue
+####################################################################################################
+# @instance_template
+####################################################################################################
+def instance_template(template_vertices,
+                      template_triangles,
+                      positions,
+                      scale,
+                      rotations=None):
+    """Instances a template mesh at a list of positions, with array operations.
+
+    :param template_vertices:
+        An Nx3 array of the vertices of the template.
+    :param template_triangles:
+        An Mx3 array of the triangles of the template.
+    :param positions:
+        A Kx3 array of the positions of the instances.
+    :param scale:
+        The uniform scale of the instances.
+    :param rotations:
+        An optional Kx3x3 array of the rotations of the instances.
+    :return:
+        A (K*N)x3 array of vertices and a (K*M)x3 array of triangles.
+    """
 
-            # Material
-        if not (pre_synaptic_mtypes[i] in color_map_materials):
-            continue
+    vertices = numpy.broadcast_to(template_vertices * scale,
+                                  (len(positions),) + template_vertices.shape)
+    if rotations is not None:
+        vertices = numpy.einsum('kij,knj->kni', rotations, vertices)
+    vertices = (vertices + positions[:, None, :]).reshape(-1, 3)
 
-        material = color_map_materials[pre_synaptic_mtypes[i]]
+    offsets = numpy.arange(len(positions)) * len(template_vertices)
+    triangles = (template_triangles[None, :, :] + offsets[:, None, None]).reshape(-1, 3)
+    return vertices, triangles
 
-        # Position
-        post_synaptic_position = Vector((post_synaptic_positions[i][0],
-                                         post_synaptic_positions[i][1],
-                                         post_synaptic_positions[i][2]))
-        position = inverted_transformation @ post_synaptic_position
 
-        # A synapse sphere object
-        synapse_sphere = nmv.geometry.create_ico_sphere(
-            radius=synapse_size, location=position, subdivisions=3, name='synapse_%d' % i)
+####################################################################################################
+# @create_instanced_mesh
+####################################################################################################
+def create_instanced_mesh(parts,
+                          materials,
+                          name):
+    """Creates a single mesh object from a list of instanced parts, and assigns the materials of
+    all the triangles in bulk.
+
+    :param parts:
+        A list of (vertices, triangles, material_indices) tuples, where material_indices is an
+        array with the material index of every triangle of the part.
+    :param materials:
+        A list of materials, indexed by the material indices.
+    :param name:
+        The name of the mesh object.
+    :return:
+        A reference to the created mesh object, or None if the parts have no triangles.
+    """
 
-        # Add the sphere to the group
-        synapse_objects.append(synapse_sphere)
+    # Nothing to draw, e.g. none of the synapses has a material
+    parts = [part for part in parts if len(part[1]) > 0]
+    if len(parts) == 0:
+        return None
 
-        # Material
-        nmv.shading.set_material_to_object(mesh_object=synapse_sphere, material_reference=material)
+    vertex_offsets = numpy.cumsum([0] + [len(part[0]) for part in parts[:-1]])
+    vertices = numpy.concatenate([part[0] for part in parts])
+    triangles = numpy.concatenate([part[1] + offset for part, offset in zip(parts, vertex_offsets)])
+    material_indices = numpy.concatenate([part[2] for part in parts])
 
-        # Group every 100 objects into a single group
-        if i % 50 == 0:
-            # Join the meshes into a group
-            synapse_group = nmv.mesh.join_mesh_objects(
-                mesh_list=synapse_objects, name='group_%d' % (i % 100))
+    mesh_object = nmv.mesh.create_mesh_from_arrays(
+        vertices=vertices, triangles=triangles, name=name)
 
-            # Add the group to the list
-            synapse_groups.append(synapse_group)
+    # Materials
+    for material in materials:
+        mesh_object.data.materials.append(material)
+    mesh_object.data.polygons.foreach_set(
+        'material_index', numpy.ascontiguousarray(material_indices, dtype=numpy.int32))
 
-            # Clear the object list
-            synapse_objects.clear()
+    return mesh_object
 
-    # Join the meshes into a group
-    synapse_group = nmv.mesh.join_mesh_objects(
-        mesh_list=synapse_objects, name='group_%d' % (i % 100))
 
-    # Add the group to the list
-    synapse_groups.append(synapse_group)
+####################################################################################################
+# @get_synapses_material_indices
+####################################################################################################
+def get_synapses_material_indices(keys,
+                                  color_map_materials):
+    """Maps the keys of the synapses, e.g. their pre-synaptic mtypes, to material indices.
 
-    # Done
-    nmv.utilities.time_line.show_iteration_progress(
-        'Synapses', len(post_synaptic_positions), len(post_synaptic_positions), done=True)
+    :param keys:
+        An array of the keys of the synapses.
+    :param color_map_materials:
+        A dictionary of all the materials.
+    :return:
+        A list of the materials that are used and an array of the material index of every
+        synapse, -1 if the key has no material.
+    """
 
-    # Join the meshes into a group
-    synapses_mesh = nmv.mesh.join_mesh_objects(mesh_list=synapse_groups, name='synapses')
+    unique_keys, inverse = numpy.unique(keys, return_inverse=True)
 
-    # Return a reference to the synapse mesh
-    return synapses_mesh
+    materials = list()
+    key_indices = numpy.full(len(unique_keys), -1, dtype=numpy.int64)
+    for i, key in enumerate(unique_keys.tolist()):
+        if key in color_map_materials:
+            key_indices[i] = len(materials)
+            materials.append(color_map_materials[key])
+
+    return materials, key_indices[inverse]
 
 
 ####################################################################################################
-# @create_excitatory_inhibitory_synapses_mesh
+# @create_mtype_based_synapses_mesh
 ####################################################################################################
-def create_excitatory_inhibitory_synapses_mesh(circuit,
-                                               gid,synapse_size,
-                                               synapse_percentage,
-                                               inverted_transformation,
-                                               color_map_materials):
-    """Creates a mesh of all the synapses with excitatory and inhibitory ones.
+def create_mtype_based_synapses_mesh(synapses,
+                                     synapse_size,
+                                     color_map_materials):
+    """Creates a mesh of all the synapses based on their mtypes
 
-    :param circuit:
-        BBP circuit.
-    :param gid:
-        Neuron GID.
+    All the synapses are instanced from a single ico-sphere into a single mesh, and the material
+    of every synapse is selected by its pre-synaptic mtype.
+
+    :param synapses:
+        The synapses in the local coordinates of the neuron, SynapseTable.
     :param synapse_size:
         The size of the synapses.
-    :param synapse_percentage:
-        The percentage of the syanpses to be drawn.
-    :param inverted_transformation:
-        The inverted transformation that will take the synapses to the origin.
     :param color_map_materials:
         A dictionary of all the mtype materials.
     :return:
-        A reference to the created synapse mesh.
+        A reference to the created synapse mesh, or None if no synapse is drawn.
     """
 
-    spine_meshes = nmv.file.load_spines(nmv.consts.Paths.SPINES_MESHES_LQ_DIRECTORY)
-
-    # Get the IDs of the afferent synapses of a given GID
-    afferent_synapses_ids = circuit.connectome.afferent_synapses(gid)
-
-    # Get the synapse type
-    synapse_types = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.TYPE]).values
-
-    # Get the positions of the incoming synapses at the post synaptic side
-    post_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'post', 'center').values.tolist()
-    pre_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'pre', 'contour').values.tolist()
-
-    # Get the GIDs of the pre-synaptic cells
-    pre_gids = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values
-    pre_synaptic_gids = [gid[0] for gid in pre_gids]
-
-    # Get the pre-synaptic mtypes
-    pre_synaptic_mtypes = circuit.cells.get(pre_synaptic_gids)['mtype'].values.tolist()
-
-    # We need the color and the position to draw the synaptome
-    synapse_objects = list()
-    synapse_groups = list()
-
-    x = list()
-    # Do it for all the synapses
-    for i in range(len(post_synaptic_positions)):
-
-        # Show progress
-        nmv.utilities.time_line.show_iteration_progress('Synapses', i, len(post_synaptic_positions))
-
-        # Random selection
-        if synapse_percentage < random.uniform(0, 100):
-            continue
-
-        # Material, only for afferent synapses, efferent ones should be create as spheres
-        if not (pre_synaptic_mtypes[i] in color_map_materials):
-            continue
-
-        # Inhibitory synapse
-        if synapse_types[i] < 100:
-
-            # Post-synaptic position
-            post_synaptic_position = Vector((post_synaptic_positions[i][0],
-                                             post_synaptic_positions[i][1],
-                                             post_synaptic_positions[i][2]))
-            post_synaptic_position = inverted_transformation @ post_synaptic_position
-
-            # A synapse sphere object
-            spine_object = nmv.geometry.create_ico_sphere(
-                radius=synapse_size, location=post_synaptic_position, subdivisions=3,
-                name='synapse_%d' % i)
-
-            # Material
-            material = color_map_materials['INH']
-            nmv.shading.set_material_to_object(mesh_object=spine_object,
-                                               material_reference=material)
-        # Excitatory
-        else:
-
-            material = color_map_materials[pre_synaptic_mtypes[i]]
-
-            # Pre-synaptic position
-            pre_synaptic_position = Vector((pre_synaptic_positions[i][0],
-                                            pre_synaptic_positions[i][1],
-                                            pre_synaptic_positions[i][2]))
-            pre_synaptic_position = inverted_transformation @ pre_synaptic_position
-
-            # Post-synaptic position
-            post_synaptic_position = Vector((post_synaptic_positions[i][0],
-                                             post_synaptic_positions[i][1],
-                                             post_synaptic_positions[i][2]))
-            post_synaptic_position = inverted_transformation @ post_synaptic_position
-
-            # Select a random spine from the spines list
-            spine_template = random.choice(spine_meshes)
-
-            # Get a copy of the template and update it
-            spine_object = nmv.scene.ops.duplicate_object(spine_template, i, link_to_scene=True)
+    # Only the synapses that have a material are drawn
+    materials, material_indices = get_synapses_material_indices(
+        synapses.pre_mtypes, color_map_materials)
+    selection = material_indices >= 0
+    synapses = synapses.select(selection)
+    material_indices = material_indices[selection]
 
-            # Get the spine extent
-            spine_extent = (post_synaptic_position - pre_synaptic_position).length
+    nmv.logger.info('Creating [%d] synapses' % len(synapses))
+    vertices, triangles = create_ico_sphere_template()
+    synapse_vertices, synapse_triangles = instance_template(
+        vertices, triangles, synapses.post_positions, synapse_size)
 
-            # Scale the spine
-            nmv.scene.ops.scale_object_uniformly(spine_object, synapse_size * 2)
-
-            # Translate the spine to the post synaptic position
-            nmv.scene.ops.set_object_location(spine_object, post_synaptic_position)
-
-            # Rotate the spine towards the pre-synaptic point
-            # We assume that the normal is heading towards to -Z axis for computing the rotation
-            nmv.scene.ops.rotate_object_towards_target(
-                spine_object, Vector((0, 0, -1)), pre_synaptic_position)
-
-            # Material
-            nmv.shading.set_material_to_object(mesh_object=spine_object,
-                                               material_reference=material)
-
-        # Add the sphere to the group
-        synapse_objects.append(spine_object)
-
-        # Group every 100 objects into a single group
-        if i % 50 == 0:
-
-            # Join the meshes into a group
-            synapse_group = nmv.mesh.join_mesh_objects(
-                mesh_list=synapse_objects, name='group_%d' % (i % 100))
-
-            # Add the group to the list
-            synapse_groups.append(synapse_group)
+    # Return a reference to the synapse mesh
+    return create_instanced_mesh(
+        parts=[(synapse_vertices, synapse_triangles, numpy.repeat(material_indices,
+                                                                  len(triangles)))],
+        materials=materials, name='synapses')
 
-            # Clear the object list
-            synapse_objects.clear()
 
-    # Join the meshes into a group
-    synapse_group = nmv.mesh.join_mesh_objects(
-        mesh_list=synapse_objects, name='group_%d' % (i % 100))
+####################################################################################################
+# @create_excitatory_inhibitory_synapses_mesh
+####################################################################################################
+def create_excitatory_inhibitory_synapses_mesh(synapses,
+                                               synapse_size,
+                                               color_map_materials,
+                                               seed=None):
+    """Creates a mesh of all the synapses with excitatory and inhibitory ones.
 
-    # Add the group to the list
-    synapse_groups.append(synapse_group)
+    The inhibitory synapses are instanced from a single ico-sphere and the excitatory synapses are
+    instanced from randomly selected spine templates that are oriented towards the pre-synaptic
+    positions. All the instances are created in a single mesh.
 
-    # Done
-    nmv.utilities.time_line.show_iteration_progress(
-        'Synapses', len(post_synaptic_positions), len(post_synaptic_positions), done=True)
+    :param synapses:
+        The synapses in the local coordinates of the neuron, SynapseTable.
+    :param synapse_size:
+        The size of the synapses.
+    :param color_map_materials:
+        A dictionary of all the mtype materials.
+    :param seed:
+        An optional seed for the random selection of the spines.
+    :return:
+        A reference to the created synapse mesh, or None if no synapse is drawn.
+    """
 
-    # Join the meshes into a group
-    synapses_mesh = nmv.mesh.join_mesh_objects(mesh_list=synapse_groups, name='synapses')
+    # Material, only for afferent synapses, efferent ones should be create as spheres
+    mtype_materials, material_indices = get_synapses_material_indices(
+        synapses.pre_mtypes, color_map_materials)
+    selection = material_indices >= 0
+    synapses = synapses.select(selection)
+    material_indices = material_indices[selection]
+
+    # The inhibitory material is the last one
+    materials = mtype_materials + [color_map_materials['INH']]
+    inhibitory = synapses.is_inhibitory()
+    parts = list()
+
+    # Inhibitory synapses
+    vertices, triangles = create_ico_sphere_template()
+    number_inhibitory = int(numpy.count_nonzero(inhibitory))
+    if number_inhibitory > 0:
+        inhibitory_vertices, inhibitory_triangles = instance_template(
+            vertices, triangles, synapses.post_positions[inhibitory], synapse_size)
+        parts.append((inhibitory_vertices, inhibitory_triangles,
+                      numpy.full(len(inhibitory_triangles), len(materials) - 1)))
+
+    # Excitatory synapses, a random spine per synapse
+    excitatory = numpy.nonzero(~inhibitory)[0]
+    if len(excitatory) > 0:
+        spine_objects = nmv.file.load_spines(nmv.consts.Paths.SPINES_MESHES_LQ_DIRECTORY)
+        spine_templates = [nmv.mesh.get_mesh_arrays(spine_object) for spine_object in spine_objects]
+        nmv.scene.delete_list_objects(spine_objects)
+
+        # Orient the spines towards the pre-synaptic positions
+        rotations = compute_alignment_rotations(
+            synapses.pre_positions[excitatory] - synapses.post_positions[excitatory])
+
+        random_state = numpy.random.RandomState(seed)
+        choices = random_state.randint(0, len(spine_templates), len(excitatory))
+        for i, (spine_vertices, spine_triangles) in enumerate(spine_templates):
+            selected = choices == i
+            if not numpy.any(selected):
+                continue
+            indices = excitatory[selected]
+            excitatory_vertices, excitatory_triangles = instance_template(
+                spine_vertices, spine_triangles, synapses.post_positions[indices],
+                synapse_size * 2, rotations[selected])
+            parts.append((excitatory_vertices, excitatory_triangles,
+                          numpy.repeat(material_indices[indices], len(spine_triangles))))
+
+    nmv.logger.info('Creating [%d] inhibitory and [%d] excitatory synapses' %
+                    (number_inhibitory, len(excitatory)))
 
     # Return a reference to the synapse mesh
-    return synapses_mesh
+    return create_instanced_mesh(parts=parts, materials=materials, name='synapses')
 
 
 ####################################################################################################
 # @create_neuron_mesh
 ####################################################################################################
-def create_neuron_mesh(circuit,
+def create_neuron_mesh(synapse_source,
                        gid,
                        neuron_material):
     """Creates the mesh of the neuron.
 
-    :param circuit:
-        BBP circuit.
+    :param synapse_source:
+        The source of the synapse and cell data, SynapseSource.
     :param gid:
         Neuron GID.
     :param neuron_material:
@@ -340,7 +345,7 @@ def create_neuron_mesh(circuit,
     """
     # Get the morphology file path from its GID
     # We must ensure that the GID is integer, that's why the cast is there
-    h5_morphology_path = circuit.morph.get_filepath(int(gid))
+    h5_morphology_path = synapse_source.get_morphology_path(int(gid))
 
     # Use the H5 morphology loader to load this file
     # Don't center the morphology, as it is assumed to be cleared and reviewed by the team
@@ -382,11 +387,12 @@ def create_synaptome(circuit_config,
                      synapse_percentage,
                      synaptome_color_map_materials,
                      neuron_material,
-                     show_excitatory_inhibitory=True):
+                     show_excitatory_inhibitory=True,
+                     synapse_source=None):
     """Creates the synaptome mesh.
 
     :param circuit_config:
-        BBP circuit config.
+        BBP circuit config, used if no synapse source is given.
     :param gid:
         Neuron GID.
     :param synapse_size:
@@ -400,41 +406,45 @@ def create_synaptome(circuit_config,
     :param show_excitatory_inhibitory:
         If this flag is set to true, we will show the excitatory and inhibitory synapses, otherwise
         we will show the synaptic map according to the mtype of the pre-synaptic pairs.
+    :param synapse_source:
+        The source of the synapse and cell data, SynapseSource. If None, the data is read from
+        the circuit.
     :return:
         THe synaptome mesh.
     """
 
     # Loading a circuit
-    circuit = Circuit(circuit_config)
+    if synapse_source is None:
+        synapse_source = synapse_data.CircuitSynapseSource(circuit_config)
 
-    # Get the cell transformation matrix
-    transformation = circuit_data.get_cell_transformation(circuit=circuit, gid=gid)
-
-    # Invert the transformation matrix
-    inverted_transformation = transformation.inverted()
+    # Get the cell transformation matrix and invert it
+    inverted_transformation = numpy.linalg.inv(synapse_source.get_cell_transformation(gid))
 
     # Neuron mtype
-    mtype = circuit.cells.get(gid).mtype
+    mtype = synapse_source.get_cell_mtype(gid)
 
     # Create neuron mesh
-    neuron_mesh = create_neuron_mesh(circuit=circuit, gid=gid,
+    neuron_mesh = create_neuron_mesh(synapse_source=synapse_source, gid=gid,
                                      neuron_material=neuron_material)
 
+    # Get the synapses and take them to the local coordinates of the neuron
+    synapses = synapse_source.get_afferent_synapses(gid).sample(synapse_percentage)
+    synapses = synapses.transform(inverted_transformation)
+
     # Create synapse mesh
     if show_excitatory_inhibitory:
         synapses_mesh = create_excitatory_inhibitory_synapses_mesh(
-            circuit=circuit, gid=gid, synapse_size=synapse_size,
-            synapse_percentage=synapse_percentage, inverted_transformation=inverted_transformation,
+            synapses=synapses, synapse_size=synapse_size,
             color_map_materials=synaptome_color_map_materials)
     else:
         synapses_mesh = create_mtype_based_synapses_mesh(
-            circuit=circuit, gid=gid, synapse_size=synapse_size,
-            synapse_percentage=synapse_percentage, inverted_transformation=inverted_transformation,
+            synapses=synapses, synapse_size=synapse_size,
             color_map_materials=synaptome_color_map_materials)
 
     # Merge
+    mesh_list = [neuron_mesh] if synapses_mesh is None else [neuron_mesh, synapses_mesh]
     synaptome_mesh = nmv.mesh.join_mesh_objects(
-        mesh_list=[neuron_mesh, synapses_mesh], name='synaptome_%s_%d' % (mtype, gid))
+        mesh_list=mesh_list, name='synaptome_%s_%d' % (mtype, gid))
 
     # Returns a reference to the synaptome mesh
     return synaptome_mesh
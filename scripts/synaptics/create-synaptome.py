@@ -26,6 +26,7 @@ sys.path.append(('%s/core' % (os.path.dirname(os.path.realpath(__file__)))))
 import parsing
 import color_map
 import synaptome
+import synapse_data
 import rendering
 
 # Blender imports
@@ -63,6 +64,12 @@ if __name__ == "__main__":
     synaptome_color_map_materials = color_map.create_color_map(color_map_file=args.color_map_file,
                                                                material_type=shader)
 
+    # Use the local synapse data if given, otherwise the circuit
+    synapse_source = None
+    if args.synapses_file is not None and args.cells_file is not None:
+        synapse_source = synapse_data.LocalSynapseSource(synapses_file=args.synapses_file,
+                                                         cells_file=args.cells_file)
+
     # Create the synaptome
     synaptome_mesh = synaptome.create_synaptome(
         circuit_config=args.circuit_config,
@@ -71,7 +78,8 @@ if __name__ == "__main__":
         synapse_percentage=args.synapse_percentage,
         synaptome_color_map_materials=synaptome_color_map_materials,
         neuron_material=neuron_material,
-        show_excitatory_inhibitory=args.show_exc_inh)
+        show_excitatory_inhibitory=args.show_exc_inh,
+        synapse_source=synapse_source)
 
     # Compute the mesh bounding box
     synaptome_bounding_box = nmv.bbox.compute_scene_bounding_box_for_meshes()
@@ -30,6 +30,10 @@ OUTPUT_DIRECTORY='/gpfs/bbp.cscs.ch/project/proj83/visualization-SSCXDIS-178/syn
 OUTPUT_DIRECTORY='/hdd1/projects-data/11.25.2020-synaptomes-with-spines'
 OUTPUT_DIRECTORY='/hdd1/projects-data/2021.01.12-synaptomes-final/sample'
 
+# Local synapses and cells files (.h5 or .csv), if both are given they are used instead of the circuit
+SYNAPSES_FILE=''
+CELLS_FILE=''
+
 # Show excitatory and inhibitory synapses, yes or no
 SHOW_EXC_INH='no'
 
@@ -71,6 +75,8 @@ if [ "$RENDER_MOVIES" == "yes" ];
     then BOOL_ARGS+=' --render-movies '; fi
 if [ "$RENDER_FRAMES" == "yes" ];
     then BOOL_ARGS+=' --render-frames '; fi
+if [ -n "$SYNAPSES_FILE" ] && [ -n "$CELLS_FILE" ];
+    then BOOL_ARGS+=" --synapses-file=$SYNAPSES_FILE --cells-file=$CELLS_FILE "; fi
 
 ####################################################################################################
 echo 'CREATING SYNAPTOME ...'